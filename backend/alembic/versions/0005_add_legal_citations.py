@@ -0,0 +1,43 @@
+"""Add legal_citations — canonical reporter citation keys per judgment.
+
+One row per (citation key, document): the judgment's own reported and
+equivalent citations, parsed from legal_documents.citation and the header of
+its full text by app/services/citation_resolver.py. Loaded into the
+in-process citation index so citation queries resolve without vector search.
+
+Revision ID: 0005_add_legal_citations
+Revises: 0004_add_chunk_cols
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+revision: str = "0005_add_legal_citations"
+down_revision: Union[str, None] = "0004_add_chunk_cols"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # source: 'metadata' (legal_documents.citation) or 'header' (full-text header)
+    op.create_table(
+        "legal_citations",
+        sa.Column("citation_key", sa.Text(), nullable=False),
+        sa.Column("document_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("source", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["document_id"],
+            ["legal_documents.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("citation_key", "document_id"),
+    )
+    op.create_index("idx_legal_citations_document_id", "legal_citations", ["document_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_legal_citations_document_id", table_name="legal_citations")
+    op.drop_table("legal_citations")
@@ -0,0 +1,45 @@
+"""Add legal_documents.statute_keys — canonical statute/section references.
+
+Canonical keys such as 'IPC:302', 'CRPC:482', 'CONSTITUTION:21' and the
+act-level 'IPC' (see app/services/statute_index.py), written at ingestion by
+metadata_extractor.py and back-filled by
+scripts/statutes/build_statute_index.py. A GIN index serves the containment
+lookup of GET /api/search/statute (statute_keys @> ARRAY['IPC:302']).
+
+Revision ID: 0006_add_statute_keys
+Revises: 0005_add_legal_citations
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+revision: str = "0006_add_statute_keys"
+down_revision: Union[str, None] = "0005_add_legal_citations"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "legal_documents",
+        sa.Column(
+            "statute_keys",
+            postgresql.ARRAY(sa.Text()),
+            server_default="{}",
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_legal_documents_statute_keys",
+        "legal_documents",
+        ["statute_keys"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_legal_documents_statute_keys", table_name="legal_documents")
+    op.drop_column("legal_documents", "statute_keys")
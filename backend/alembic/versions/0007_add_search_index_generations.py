@@ -0,0 +1,33 @@
+"""Add search_index_generations — per-collection write counter for the search indexes.
+
+The ingestion scripts (qdrant_ingestor.py, hybrid_ingestor.py,
+build_statute_index.py) bump a collection's generation after writing points
+or payloads; API workers poll it (app/services/index_generation.py) and drop
+their search result cache when it moves.
+
+Revision ID: 0007_add_search_index_generations
+Revises: 0006_add_statute_keys
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007_add_search_index_generations"
+down_revision: Union[str, None] = "0006_add_statute_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_index_generations",
+        sa.Column("collection", sa.Text(), primary_key=True),
+        sa.Column("generation", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("search_index_generations")
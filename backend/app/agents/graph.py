@@ -9,6 +9,10 @@ Graph topology:
                 ──► document_chat  ──► END
                 ──► corpus_search  ──► END
                 ──► END  (blocked — non-legal question)
+
+With SPECULATIVE_RETRIEVAL on, corpus retrieval runs alongside the classifier's
+LLM call (nodes/_speculation.py); corpus_search reuses it via
+state["speculative_chunks"].
 """
 import logging
 
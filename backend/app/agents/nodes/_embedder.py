@@ -2,7 +2,9 @@
 Shared embedding helper for all agent nodes.
 
 Delegates to the project-wide EmbeddingService so the SentenceTransformer
-model is only ever loaded ONCE across the entire process (singleton).
+model is only ever loaded ONCE across the entire process (singleton), and
+agent turns are micro-batched together with /api/search queries by the
+shared query dispatcher.
 """
 from app.services.embedding_service import embed_query as _embed_query
 
@@ -0,0 +1,168 @@
+"""
+Local intent model — nearest-centroid classifier on the question's mpnet vector.
+
+The labelled examples in app/agents/data/intent_examples.jsonl
+("general", "corpus_search", "document_chat", "not_legal") are embedded once
+per process with the shared embedder, and each label's centroid is the
+unit-normalised mean of its examples. A question is scored by cosine
+similarity to every centroid; a softmax over those similarities gives the
+confidence.
+
+The softmax temperature is fitted on held-out data: every example is scored
+against centroids built without it (leave-one-out), and the temperature
+with the lowest held-out log loss is kept. The same held-out predictions
+report the accuracy and coverage of a confidence threshold (held_out()),
+logged when the model is built. INTENT_LOCAL_TEMPERATURE overrides the fit.
+
+The question vector comes from embed_query, i.e. the query-vector cache. The
+retrieval nodes embed the same question later in the turn and get it from
+the turn's L1 memo, so the local decision itself is a (4 × 768) matmul.
+"document_chat" is only a candidate when documents are attached — the same
+rule the LLM classifier applies.
+"""
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.embedding_service import embed_queries, l2_normalize
+
+logger = logging.getLogger(__name__)
+
+EXAMPLES_PATH = Path(__file__).resolve().parents[1] / "data" / "intent_examples.jsonl"
+LABELS = ("general", "corpus_search", "document_chat", "not_legal")
+
+# Candidate softmax temperatures for the held-out fit
+_TEMPERATURES = np.geomspace(0.005, 0.5, 41)
+
+
+class IntentPrediction(NamedTuple):
+    label: str          # one of LABELS
+    confidence: float   # softmax probability of `label`
+
+
+def load_examples(path: Path = EXAMPLES_PATH) -> List[Dict[str, str]]:
+    with open(path, encoding="utf-8") as f:
+        examples = [json.loads(line) for line in f if line.strip()]
+    unknown = {e["label"] for e in examples} - set(LABELS)
+    if unknown:
+        raise ValueError(f"unknown intent labels in {path}: {sorted(unknown)}")
+    return examples
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    probs = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return probs / probs.sum(axis=-1, keepdims=True)
+
+
+def _held_out_scores(vectors: np.ndarray, targets: np.ndarray, n_labels: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cosine scores of every example against centroids built without it, and
+    the examples' label indices. Examples that are the only one of their
+    label are left out.
+    """
+    sums = np.stack([vectors[targets == i].sum(axis=0) for i in range(n_labels)])
+    counts = np.bincount(targets, minlength=n_labels)
+    scores, kept = [], []
+    for vector, target in zip(vectors, targets):
+        if counts[target] < 2:
+            continue
+        loo = sums.copy()
+        loo[target] -= vector
+        scores.append(l2_normalize(loo) @ vector)
+        kept.append(target)
+    return np.asarray(scores, dtype=np.float32).reshape(-1, n_labels), np.asarray(kept, dtype=int)
+
+
+def fit_temperature(scores: np.ndarray, targets: np.ndarray) -> float:
+    """Temperature in _TEMPERATURES with the lowest log loss on held-out (scores, targets)."""
+    if len(targets) == 0:
+        return float(np.median(_TEMPERATURES))
+    rows = np.arange(len(targets))
+    losses = [-np.log(_softmax(scores / t)[rows, targets] + 1e-12).mean() for t in _TEMPERATURES]
+    return float(_TEMPERATURES[int(np.argmin(losses))])
+
+
+class IntentModel:
+    """Label centroids built from labelled examples, with a held-out calibrated temperature."""
+
+    def __init__(
+        self,
+        examples: Sequence[Dict[str, str]],
+        embed_many: Callable[[List[str]], Sequence[np.ndarray]],
+        *,
+        temperature: Optional[float] = None,
+    ) -> None:
+        vectors = l2_normalize(np.asarray(embed_many([e["text"] for e in examples]), dtype=np.float32))
+        labels = np.array([e["label"] for e in examples])
+        self.labels = [label for label in LABELS if (labels == label).any()]
+        self.centroids = l2_normalize(np.stack([vectors[labels == label].mean(axis=0) for label in self.labels]))
+        targets = np.array([self.labels.index(label) for label in labels])
+        self._held_out_scores, self._held_out_targets = _held_out_scores(vectors, targets, len(self.labels))
+        self.temperature = (
+            temperature if temperature is not None
+            else fit_temperature(self._held_out_scores, self._held_out_targets)
+        )
+
+    def held_out(self, min_confidence: float, label: Optional[str] = None) -> Tuple[float, float]:
+        """
+        (accuracy, coverage) of the held-out predictions at or above
+        `min_confidence` — optionally only those predicting `label`.
+        Accuracy is 1.0 when nothing is covered.
+        """
+        if len(self._held_out_targets) == 0:
+            return 1.0, 0.0
+        probs = _softmax(self._held_out_scores / self.temperature)
+        predicted = probs.argmax(axis=1)
+        covered = probs.max(axis=1) >= min_confidence
+        if label is not None:
+            covered &= predicted == self.labels.index(label)
+        if not covered.any():
+            return 1.0, 0.0
+        correct = predicted[covered] == self._held_out_targets[covered]
+        return float(correct.mean()), float(covered.mean())
+
+    def predict(self, vector: np.ndarray, *, has_documents: bool) -> IntentPrediction:
+        """Most likely label for a question vector, with its softmax confidence."""
+        scores = self.centroids @ l2_normalize(np.asarray(vector, dtype=np.float32))
+        candidates = [i for i, label in enumerate(self.labels) if has_documents or label != "document_chat"]
+        probs = _softmax(scores[candidates] / self.temperature)
+        best = int(np.argmax(probs))
+        return IntentPrediction(self.labels[candidates[best]], float(probs[best]))
+
+
+# ── Singleton accessor ─────────────────────────────────────────────────────────
+
+_model: Optional[IntentModel] = None
+_model_failed = False
+_lock = threading.Lock()
+
+
+def get_intent_model(temperature: Optional[float] = None, min_confidence: float = 0.8) -> Optional[IntentModel]:
+    """
+    The model built from EXAMPLES_PATH (once per process), or None if it
+    cannot be built. `temperature` None fits it on held-out examples; the
+    held-out accuracy at `min_confidence` is logged with the build.
+    """
+    global _model, _model_failed
+    if _model is not None or _model_failed:
+        return _model
+    with _lock:
+        if _model is None and not _model_failed:
+            try:
+                examples = load_examples()
+                _model = IntentModel(examples, lambda texts: np.stack(embed_queries(texts)), temperature=temperature)
+                accuracy, coverage = _model.held_out(min_confidence)
+                logger.info(
+                    "Local intent model built from %d examples (%s), temperature %.3g; "
+                    "held out at p >= %.2f: %.0f%% accurate, %.0f%% covered",
+                    len(examples), ", ".join(_model.labels), _model.temperature,
+                    min_confidence, 100 * accuracy, 100 * coverage,
+                )
+            except Exception as exc:
+                logger.warning("Local intent model unavailable: %s", exc)
+                _model_failed = True
+    return _model
@@ -0,0 +1,96 @@
+"""
+Speculative corpus retrieval — start corpus_search's retrieval while the
+classifier is still waiting for the LLM.
+
+When the classifier falls back to its Groq call (auto mode, local intent
+model not confident) and SPECULATIVE_RETRIEVAL is on, start() submits
+corpus_search.retrieve_corpus_chunks(question) — embed, Qdrant, chunk
+texts — to a small thread pool with a copy of the turn's context (so it
+shares the turn's vector memo). Once the intent is known:
+
+  corpus_search   resolve() waits for the retrieval and its chunks go into
+                  state["speculative_chunks"]; corpus_search_node answers
+                  from them without retrieving again. A speculation still
+                  queued behind others on the pool is cancelled instead, and
+                  one running longer than SPECULATIVE_RETRIEVAL_WAIT_SECONDS
+                  is abandoned; either way corpus_search retrieves inline
+                  rather than wait on a busy pool.
+  anything else   discard() cancels the retrieval if it has not started yet,
+                  otherwise lets it finish and drops the result.
+
+Outcomes (hit / queued / timeout / discarded / cancelled / failed) and the
+retrieval seconds spent on speculations that were not used are exported as
+metrics.
+"""
+import contextvars
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional
+
+from app.agents.nodes.corpus_search import retrieve_corpus_chunks
+from app.core.metrics import SPECULATIVE_RETRIEVALS, SPECULATIVE_WASTED_SECONDS
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv("SPECULATIVE_RETRIEVAL", "false").lower() == "true"
+_WORKERS = int(os.getenv("SPECULATIVE_RETRIEVAL_WORKERS", "4"))
+_WAIT_SECONDS = float(os.getenv("SPECULATIVE_RETRIEVAL_WAIT_SECONDS", "2"))
+
+_pool = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="speculative-retrieval")
+
+
+def _timed_retrieval(question: str) -> tuple[list[dict], float]:
+    started = time.perf_counter()
+    chunks = retrieve_corpus_chunks(question)
+    return chunks, time.perf_counter() - started
+
+
+def start(question: str) -> Optional[Future]:
+    """Begin corpus retrieval for `question` in the background (None when disabled)."""
+    if not ENABLED:
+        return None
+    return _pool.submit(contextvars.copy_context().run, _timed_retrieval, question)
+
+
+def _record_waste(done: Future) -> None:
+    if not done.cancelled() and done.exception() is None:
+        SPECULATIVE_WASTED_SECONDS.inc(done.result()[1])
+
+
+def resolve(speculation: Future) -> Optional[list[dict]]:
+    """
+    Chunks of a speculation whose intent turned out to be corpus_search, or
+    None — it failed, never got a worker, or ran past _WAIT_SECONDS — in
+    which case corpus_search retrieves inline.
+    """
+    if speculation.cancel():
+        SPECULATIVE_RETRIEVALS.labels("queued").inc()
+        logger.debug("Speculative retrieval still queued, corpus_search retrieves inline")
+        return None
+    try:
+        chunks, seconds = speculation.result(timeout=_WAIT_SECONDS)
+    except FutureTimeoutError:
+        SPECULATIVE_RETRIEVALS.labels("timeout").inc()
+        logger.warning("Speculative retrieval still running after %.1f s, corpus_search retrieves inline",
+                       _WAIT_SECONDS)
+        speculation.add_done_callback(_record_waste)
+        return None
+    except Exception as exc:
+        SPECULATIVE_RETRIEVALS.labels("failed").inc()
+        logger.warning("Speculative retrieval failed, corpus_search will retry: %s", exc)
+        return None
+    SPECULATIVE_RETRIEVALS.labels("hit").inc()
+    logger.debug("Speculative retrieval used (%d chunks, %.0f ms)", len(chunks), seconds * 1000)
+    return chunks
+
+
+def discard(speculation: Future) -> None:
+    """Drop a speculation the classifier routed away from; its cost is recorded once it finishes."""
+    if speculation.cancel():
+        SPECULATIVE_RETRIEVALS.labels("cancelled").inc()
+        return
+    SPECULATIVE_RETRIEVALS.labels("discarded").inc()
+    speculation.add_done_callback(_record_waste)
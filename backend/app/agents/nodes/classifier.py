@@ -7,16 +7,38 @@ Single LLM call that simultaneously:
 
 If explicit_mode is "document" or "corpus", the LLM call is skipped entirely
 and the intent is set directly from the user's UI toggle — zero extra latency.
+
+In auto mode a local nearest-centroid model (_intent_model.py) classifies the
+question's mpnet vector first. Confident legal intents are used directly and
+skip the Groq round trip; below INTENT_LOCAL_MIN_CONFIDENCE the LLM decides.
+The local model never blocks a question: a confident "not_legal" is only a
+hint, and the LLM guardrail still decides before the graph refuses it.
+Local and LLM labels are compared on every fallback and on a sample
+(INTENT_SHADOW_RATE) of confident decisions, checked in the background, and
+the running agreement rate is logged.
+
+With SPECULATIVE_RETRIEVAL on, the LLM fallback also starts corpus retrieval
+in the background (_speculation.py); its chunks are handed to corpus_search
+when that is the intent, and discarded otherwise.
 """
 import json
 import logging
 import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
-from groq import Groq
 
+from app.agents.nodes import _speculation
+from app.agents.nodes._intent_model import IntentPrediction, get_intent_model
 from app.agents.state import JurisFindState
+from app.core.metrics import INTENT_AGREEMENT, INTENT_CLASSIFICATIONS, INTENT_LOCAL_SECONDS
+from app.services.embedding_service import embed_query
+from app.services.llm_gateway import llm_gateway
 
 # Load .env from backend/
 _dotenv_path = Path(__file__).resolve().parents[4] / ".env"
@@ -24,6 +46,12 @@ load_dotenv(dotenv_path=_dotenv_path, override=False)
 
 logger = logging.getLogger(__name__)
 
+_LOCAL_ENABLED = os.getenv("INTENT_LOCAL_CLASSIFIER", "true").lower() == "true"
+_LOCAL_MIN_CONFIDENCE = float(os.getenv("INTENT_LOCAL_MIN_CONFIDENCE", "0.8"))
+# Unset → fitted on held-out examples (_intent_model.fit_temperature)
+_LOCAL_TEMPERATURE = float(os.environ["INTENT_LOCAL_TEMPERATURE"]) if os.getenv("INTENT_LOCAL_TEMPERATURE") else None
+_SHADOW_RATE = float(os.getenv("INTENT_SHADOW_RATE", "0.05"))
+
 _CLASSIFIER_SYSTEM_PROMPT = """\
 You are a legal AI classifier for an Indian Supreme Court case search system.
 Analyse the user question and return a JSON object — nothing else.
@@ -56,19 +84,137 @@ Return JSON:
 """
 
 
-def _get_groq_client() -> Groq:
-    api_key = os.getenv("GROQ_API_KEY", "").strip().strip('"').strip("'")
-    if not api_key:
-        raise ValueError("GROQ_API_KEY is not set.")
-    return Groq(api_key=api_key)
+def _llm_classify(question: str, has_documents: bool, operation: str = "classifier") -> tuple[bool, str, str]:
+    """One JSON-mode Groq call → (is_legal, intent, reasoning)."""
+    response = llm_gateway.chat(
+        operation=operation,
+        messages=[
+            {"role": "system", "content": _CLASSIFIER_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": _CLASSIFIER_USER_TEMPLATE.format(
+                    question=question,
+                    has_documents=str(has_documents).lower(),
+                ),
+            },
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.0,  # deterministic classification
+        max_tokens=100,   # short JSON output only
+    )
+
+    raw = response.choices[0].message.content or "{}"
+    parsed = json.loads(raw)
+
+    is_legal = bool(parsed.get("is_legal", True))
+    intent   = str(parsed.get("intent", "general"))
+    reasoning = parsed.get("reasoning", "")
+
+    # Sanitise intent to known values
+    if intent not in {"general", "document_chat", "corpus_search"}:
+        intent = "general"
+
+    # If document_chat but no docs attached, fall back to corpus_search
+    if intent == "document_chat" and not has_documents:
+        intent = "corpus_search"
+
+    return is_legal, intent, reasoning
+
+
+# ── Local classification ──────────────────────────────────────────────────────
+
+def _label(is_legal: bool, intent: str) -> str:
+    return intent if is_legal else "not_legal"
+
+
+def _from_label(label: str) -> tuple[bool, str]:
+    """Local label → (is_legal, intent); non-legal questions keep intent "general"."""
+    return (False, "general") if label == "not_legal" else (True, label)
+
+
+def _decides_locally(local: Optional[IntentPrediction]) -> bool:
+    """A confident legal intent; "not_legal" always goes to the LLM guardrail."""
+    return local is not None and local.label != "not_legal" and local.confidence >= _LOCAL_MIN_CONFIDENCE
+
+
+def _local_classify(question: str, has_documents: bool) -> Optional[IntentPrediction]:
+    """Nearest-centroid prediction on the question's cached mpnet vector (None when disabled / unavailable)."""
+    if not _LOCAL_ENABLED:
+        return None
+    model = get_intent_model(_LOCAL_TEMPERATURE, _LOCAL_MIN_CONFIDENCE)
+    if model is None:
+        return None
+    started = time.perf_counter()
+    try:
+        prediction = model.predict(embed_query(question), has_documents=has_documents)
+    except Exception as exc:
+        logger.warning("Local intent classification failed: %s", exc)
+        return None
+    INTENT_LOCAL_SECONDS.observe(time.perf_counter() - started)
+    return prediction
+
+
+class _Agreement:
+    """Running local-vs-LLM agreement and LLM classifier latency, for the logs."""
 
+    def __init__(self) -> None:
+        self.compared = 0
+        self.agreed = 0
+        self.llm_ms = 0.0  # EWMA of the LLM classifier latency
+        self._lock = threading.Lock()
+
+    def record_llm_latency(self, ms: float) -> None:
+        with self._lock:
+            self.llm_ms = ms if self.llm_ms == 0.0 else 0.9 * self.llm_ms + 0.1 * ms
+
+    def record(self, path: str, local: str, llm: str) -> None:
+        result = "agree" if local == llm else "disagree"
+        INTENT_AGREEMENT.labels(path, result).inc()
+        with self._lock:
+            self.compared += 1
+            self.agreed += local == llm
+            rate = self.agreed / self.compared
+        log = logger.info if local == llm else logger.warning
+        log("Intent %s check: local=%s llm=%s — agreement %.1f%% over %d comparisons",
+            path, local, llm, 100 * rate, self.compared)
+
+
+_agreement = _Agreement()
+
+# Shadow LLM checks of confident local decisions run off the request path
+_shadow_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="intent-shadow")
+
+
+def _shadow_check(question: str, has_documents: bool, local_label: str) -> None:
+    try:
+        is_legal, intent, _ = _llm_classify(question, has_documents, operation="classifier_shadow")
+    except Exception as exc:
+        logger.debug("Shadow intent check failed: %s", exc)
+        return
+    _agreement.record("shadow", local_label, _label(is_legal, intent))
+
+
+def _settle(speculation: Optional[Future], is_legal: bool, intent: str) -> dict:
+    """State update for a speculative retrieval once the intent is known."""
+    if speculation is None:
+        return {}
+    if is_legal and intent == "corpus_search":
+        return {"speculative_chunks": _speculation.resolve(speculation)}
+    _speculation.discard(speculation)
+    return {}
+
+
+# ── Node ──────────────────────────────────────────────────────────────────────
 
 def classifier_node(state: JurisFindState) -> JurisFindState:
     """
     Classify the user's intent.
 
     Respects explicit_mode override from the frontend toggle — if set to
-    "document" or "corpus", no LLM call is made.
+    "document" or "corpus", no LLM call is made. In auto mode the local
+    intent model decides when it is at least INTENT_LOCAL_MIN_CONFIDENCE
+    sure of a legal intent; otherwise — including every local "not_legal" —
+    the LLM classifier does.
     """
     explicit_mode = (state.get("explicit_mode") or "auto").lower()
     question = state["question"]
@@ -77,59 +223,54 @@ def classifier_node(state: JurisFindState) -> JurisFindState:
     # ── Fast path: UI toggle override ─────────────────────────────────────────
     if explicit_mode == "document":
         logger.debug("Classifier skipped — explicit_mode=document")
+        INTENT_CLASSIFICATIONS.labels("override").inc()
         return {**state, "is_legal": True, "intent": "document_chat"}
 
     if explicit_mode == "corpus":
         logger.debug("Classifier skipped — explicit_mode=corpus")
+        INTENT_CLASSIFICATIONS.labels("override").inc()
         return {**state, "is_legal": True, "intent": "corpus_search"}
 
-    # ── LLM classification (auto mode) ────────────────────────────────────────
-    try:
-        client = _get_groq_client()
-        model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": _CLASSIFIER_SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": _CLASSIFIER_USER_TEMPLATE.format(
-                        question=question,
-                        has_documents=str(has_documents).lower(),
-                    ),
-                },
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.0,  # deterministic classification
-            max_tokens=100,   # short JSON output only
+    # ── Local classification (auto mode) ──────────────────────────────────────
+    local = _local_classify(question, has_documents)
+    if _decides_locally(local):
+        is_legal, intent = _from_label(local.label)
+        INTENT_CLASSIFICATIONS.labels("local").inc()
+        logger.info(
+            "Classifier (local) → is_legal=%s intent=%s p=%.2f — LLM call skipped (~%.0f ms)",
+            is_legal, intent, local.confidence, _agreement.llm_ms,
         )
+        if random.random() < _SHADOW_RATE:
+            _shadow_pool.submit(_shadow_check, question, has_documents, local.label)
+        return {**state, "is_legal": is_legal, "intent": intent}
 
-        raw = response.choices[0].message.content or "{}"
-        parsed = json.loads(raw)
-
-        is_legal = bool(parsed.get("is_legal", True))
-        intent   = str(parsed.get("intent", "general"))
-        reasoning = parsed.get("reasoning", "")
-
-        # Sanitise intent to known values
-        if intent not in {"general", "document_chat", "corpus_search"}:
-            intent = "general"
-
-        # If document_chat but no docs attached, fall back to corpus_search
-        if intent == "document_chat" and not has_documents:
-            intent = "corpus_search"
+    # ── LLM classification (auto mode, low confidence or local "not_legal") ────
+    # Corpus retrieval can run meanwhile; it is used only if the intent is corpus_search
+    speculation = _speculation.start(question)
+    try:
+        started = time.perf_counter()
+        is_legal, intent, reasoning = _llm_classify(question, has_documents)
+        _agreement.record_llm_latency((time.perf_counter() - started) * 1000)
+        INTENT_CLASSIFICATIONS.labels("llm").inc()
+        if local is not None:
+            _agreement.record("fallback", local.label, _label(is_legal, intent))
 
         logger.info(
             "Classifier → is_legal=%s intent=%s reason=%r",
             is_legal, intent, reasoning,
         )
-        return {**state, "is_legal": is_legal, "intent": intent}
+        return {**state, "is_legal": is_legal, "intent": intent,
+                **_settle(speculation, is_legal, intent)}
 
     except Exception as exc:
         logger.error("Classifier error: %s", exc)
-        # On failure, default to general legal answer (safe fallback)
-        return {**state, "is_legal": True, "intent": "general",
+        # The LLM is unavailable; a local legal guess beats a blind default.
+        # Otherwise default to general legal answer (safe fallback) — the
+        # local model alone never blocks a question
+        is_legal = True
+        intent = local.label if local is not None and local.label != "not_legal" else "general"
+        return {**state, "is_legal": is_legal, "intent": intent,
+                **_settle(speculation, is_legal, intent),
                 "error": f"Classifier failed: {exc}"}
 
 
@@ -6,20 +6,18 @@ deduplicates to the top 5 unique documents, and synthesises a
 multi-case answer. Citations come from Qdrant payload — no LLM extraction.
 """
 import logging
-import os
 import re
 from pathlib import Path
 
 from dotenv import load_dotenv
-from groq import Groq
 from qdrant_client.http.models import Fusion, FusionQuery, Prefetch, SparseVector
 
 from app.agents.nodes._embedder import embed
-from app.services.qdrant_search_service import _embed_sparse
+from app.services.qdrant_search_service import _embed_sparse, _fetch_chunk_texts_batch
 from app.agents.nodes._qdrant import COLLECTION_NAME, get_qdrant
 from app.agents.state import JurisFindState
+from app.agents.streaming import emit, stream_completion
 from app.db.session import DatabaseSession
-from sqlalchemy import text
 
 _dotenv_path = Path(__file__).resolve().parents[4] / ".env"
 load_dotenv(dotenv_path=_dotenv_path, override=False)
@@ -112,71 +110,85 @@ def _build_context(chunks: list[dict]) -> str:
     return "\n\n---\n\n".join(parts)
 
 
-# ── Node ──────────────────────────────────────────────────────────────────────
+# ── Retrieval ─────────────────────────────────────────────────────────────────
 
-def corpus_search_node(state: JurisFindState) -> JurisFindState:
+def retrieve_corpus_chunks(question: str) -> list[dict]:
     """
-    Search the full Qdrant legal corpus and synthesise a multi-case answer.
+    Hybrid (RRF) corpus retrieval for a question: embed, query Qdrant,
+    deduplicate to TOP_DOCS documents and load their chunk texts. Raises when
+    the Qdrant query fails; chunk-text failures leave the texts empty.
+    Also run speculatively while the classifier decides (_speculation.py).
     """
-    question = state["question"]
-    history  = state.get("history", [])
-
-    # ── Embed and search ───────────────────────────────────────────────────────
-    try:
-        dense_vec = embed(question)
-        sparse_vec: SparseVector = _embed_sparse(question)
-        client = get_qdrant()
-
-        result = client.query_points(
-            collection_name=COLLECTION_NAME,
-            prefetch=[
-                Prefetch(
-                    query=dense_vec,
-                    using="dense",
-                    limit=SEARCH_LIMIT * 3,
-                ),
-                Prefetch(
-                    query=sparse_vec,
-                    using="sparse",
-                    limit=SEARCH_LIMIT * 3,
-                ),
-            ],
-            query=FusionQuery(fusion=Fusion.RRF),
-            limit=SEARCH_LIMIT,
-            with_payload=True,
-        )
-        raw_results = result.points
-        logger.debug("Qdrant returned %d raw results", len(raw_results))
-
-    except Exception as exc:
-        logger.error("CorpusSearch Qdrant error: %s", exc)
-        return {
-            **state,
-            "answer": "Search failed. Please try again.",
-            "citations": [],
-            "retrieved_chunks": [],
-            "error": str(exc),
-        }
+    dense_vec = embed(question)
+    sparse_vec: SparseVector = _embed_sparse(question)
+    client = get_qdrant()
+
+    result = client.query_points(
+        collection_name=COLLECTION_NAME,
+        prefetch=[
+            Prefetch(
+                query=dense_vec,
+                using="dense",
+                limit=SEARCH_LIMIT * 3,
+            ),
+            Prefetch(
+                query=sparse_vec,
+                using="sparse",
+                limit=SEARCH_LIMIT * 3,
+            ),
+        ],
+        query=FusionQuery(fusion=Fusion.RRF),
+        limit=SEARCH_LIMIT,
+        with_payload=True,
+    )
+    raw_results = result.points
+    logger.debug("Qdrant returned %d raw results", len(raw_results))
 
     # Deduplicate to top unique documents
-    top_results   = _deduplicate(raw_results)
-    
-    # Fetch chunk_text from PostgreSQL
+    top_results = _deduplicate(raw_results)
+
+    # Fetch chunk_text (chunk text store, PostgreSQL for misses)
     chunk_ids = [r.payload.get("chunk_id") for r in top_results if r.payload.get("chunk_id")]
     chunk_texts = {}
     if chunk_ids:
         try:
             with DatabaseSession() as db:
-                rows = db.execute(
-                    text("SELECT id::text, chunk_text FROM legal_chunks WHERE id = ANY(CAST(:ids AS uuid[]))"),
-                    {"ids": chunk_ids}
-                ).fetchall()
-                chunk_texts = {r[0]: r[1] for r in rows}
+                chunk_texts = _fetch_chunk_texts_batch(db, chunk_ids)
         except Exception as exc:
-            logger.error("Failed to fetch chunk texts from postgres: %s", exc)
+            logger.error("Failed to fetch chunk texts: %s", exc)
+
+    return _build_chunks(top_results, chunk_texts)
 
-    top_chunks    = _build_chunks(top_results, chunk_texts)
-    citations     = _build_citations(top_chunks)
+
+# ── Node ──────────────────────────────────────────────────────────────────────
+
+def corpus_search_node(state: JurisFindState) -> JurisFindState:
+    """
+    Search the full Qdrant legal corpus and synthesise a multi-case answer.
+
+    Chunks retrieved speculatively during classification
+    (state["speculative_chunks"]) are used as they are.
+    """
+    question = state["question"]
+    history  = state.get("history", [])
+
+    # ── Embed and search ───────────────────────────────────────────────────────
+    top_chunks = state.get("speculative_chunks")
+    if top_chunks is None:
+        try:
+            top_chunks = retrieve_corpus_chunks(question)
+        except Exception as exc:
+            logger.error("CorpusSearch Qdrant error: %s", exc)
+            return {
+                **state,
+                "answer": "Search failed. Please try again.",
+                "citations": [],
+                "retrieved_chunks": [],
+                "error": str(exc),
+            }
+
+    citations = _build_citations(top_chunks)
+    emit("citations", citations)  # the client shows sources while the answer streams
 
     if not top_chunks:
         return {
@@ -198,19 +210,14 @@ def corpus_search_node(state: JurisFindState) -> JurisFindState:
 
     # ── LLM call ──────────────────────────────────────────────────────────────
     try:
-        api_key = os.getenv("GROQ_API_KEY", "").strip().strip('"').strip("'")
-        model   = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-        groq    = Groq(api_key=api_key)
-
-        response = groq.chat.completions.create(
-            model=model,
+        raw_answer = stream_completion(
+            node="corpus_search",
             messages=messages,
             temperature=0.2,
             max_tokens=1800,
-            stream=False,
         )
 
-        answer = _clean(response.choices[0].message.content or "")
+        answer = _clean(raw_answer)
         logger.info(
             "CorpusSearch answered (%d chars, %d unique cases)",
             len(answer), len(top_chunks),
@@ -230,4 +237,5 @@ def corpus_search_node(state: JurisFindState) -> JurisFindState:
             "citations":        citations,
             "retrieved_chunks": top_chunks,
             "error":            str(exc),
+            "stream_failed":    True,
         }
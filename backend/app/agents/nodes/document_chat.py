@@ -6,16 +6,21 @@ Routes retrieval based on document source type:
   - source_type = "legal_case"  → Qdrant (filtered by document_id)
   - source_type = "uploaded"    → pgvector via raw SQL
 
+All attached documents are loaded in one query; the corpus cases share one
+batched Qdrant call (a query per document) and the uploads one pgvector
+query, and the two backends are searched concurrently.
+
 Citations are built directly from Qdrant payload / pgvector row data.
 """
+import contextvars
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
-from groq import Groq
 from qdrant_client.http.models import (
     FieldCondition,
     Filter,
@@ -23,6 +28,7 @@ from qdrant_client.http.models import (
     FusionQuery,
     MatchValue,
     Prefetch,
+    QueryRequest,
     SparseVector,
 )
 from sqlalchemy import text
@@ -31,9 +37,10 @@ from sqlalchemy.orm import Session
 from app.agents.nodes._embedder import embed
 from app.agents.nodes._qdrant import COLLECTION_NAME, get_qdrant
 from app.agents.state import JurisFindState
+from app.agents.streaming import emit, stream_completion
 from app.db.models import Document
 from app.db.session import DatabaseSession
-from app.services.qdrant_search_service import _embed_sparse
+from app.services.qdrant_search_service import _embed_sparse, _fetch_chunk_texts_batch
 
 _dotenv_path = Path(__file__).resolve().parents[4] / ".env"
 load_dotenv(dotenv_path=_dotenv_path, override=False)
@@ -51,6 +58,9 @@ _SYSTEM_PROMPT = (
 TOP_K_QDRANT  = 8
 TOP_K_PGVECTOR = 8
 
+# Runs the pgvector query while the node's own thread queries Qdrant
+_retrieval_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="doc-chat-retrieval")
+
 
 def _clean(text: str) -> str:
     text = text.strip()
@@ -62,24 +72,14 @@ def _clean(text: str) -> str:
 
 # ── Retrieval helpers ─────────────────────────────────────────────────────────
 
-def _search_qdrant_by_doc(db: Session, doc_id: str, question: str, query_vector: list[float]) -> list[dict]:
-    """
-    Search Qdrant filtered to a single document_id using Hybrid RRF (Dense + BM25).
-
-    Dense vectors find semantically similar chunks; BM25 ensures exact legal
-    terms in the question (section numbers, case names, citations) are matched.
-    Combined via Reciprocal Rank Fusion for the best possible RAG context.
-    """
-    client = get_qdrant()
-
+def _qdrant_doc_request(doc_id: str, query_vector: list[float],
+                        sparse_vec: SparseVector) -> QueryRequest:
+    """Hybrid RRF (Dense + BM25) query restricted to one document."""
     doc_filter = Filter(
         must=[FieldCondition(key="document_id", match=MatchValue(value=doc_id))]
     )
-    sparse_vec: SparseVector = _embed_sparse(question)
     limit = TOP_K_QDRANT * 3  # prefetch more, RRF re-ranks down to TOP_K_QDRANT
-
-    result = client.query_points(
-        collection_name=COLLECTION_NAME,
+    return QueryRequest(
         prefetch=[
             Prefetch(
                 query=query_vector,
@@ -99,72 +99,154 @@ def _search_qdrant_by_doc(db: Session, doc_id: str, question: str, query_vector:
         with_payload=True,
     )
 
-    # Fetch chunk texts from PostgreSQL
-    chunk_ids = [r.payload.get("chunk_id") for r in result.points if r.payload.get("chunk_id")]
-    chunk_texts = {}
-    if chunk_ids:
-        rows = db.execute(
-            text("SELECT id::text, chunk_text FROM legal_chunks WHERE id = ANY(CAST(:ids AS uuid[]))"),
-            {"ids": chunk_ids}
-        ).fetchall()
-        chunk_texts = {r[0]: r[1] for r in rows}
-
-    return [
-        {
-            "chunk_text":  chunk_texts.get(r.payload.get("chunk_id", ""), "") or "",
-            "document_id": r.payload.get("document_id") or doc_id,
-            "chunk_id":    r.payload.get("chunk_id") or "",
-            "title":       r.payload.get("title") or "Unknown",
-            "court":       r.payload.get("court") or "",
-            "year":        r.payload.get("year") or "",
-            "citation":    r.payload.get("citation") or "",
-            "score":       r.score,
-            "source":      "qdrant",
-        }
-        for r in result.points
-    ]
 
+def _search_qdrant_docs(db: Session, doc_ids: list[str], question: str,
+                        query_vector: list[float]) -> dict[str, list[dict]]:
+    """
+    Search Qdrant across all attached corpus documents using Hybrid RRF (Dense + BM25).
+
+    Dense vectors find semantically similar chunks; BM25 ensures exact legal
+    terms in the question (section numbers, case names, citations) are matched.
+    One query_batch_points() call carries a query per document, each with its
+    own prefetch pool, so every document gets up to TOP_K_QDRANT chunks however
+    well a longer one matches. Returns {document_id: chunk dicts, best first}.
+    """
+    client = get_qdrant()
+    sparse_vec: SparseVector = _embed_sparse(question)
 
-def _search_pgvector_by_doc(db: Session, doc_id: str,
-                             query_vector: list[float]) -> list[dict]:
-    """Search pgvector for a single uploaded document. Returns raw dicts."""
+    responses = client.query_batch_points(
+        collection_name=COLLECTION_NAME,
+        requests=[_qdrant_doc_request(doc_id, query_vector, sparse_vec) for doc_id in doc_ids],
+    )
+
+    # Fetch chunk texts (chunk text store, PostgreSQL for misses) for all documents at once
+    chunk_ids = [
+        hit.payload.get("chunk_id")
+        for response in responses for hit in response.points
+        if hit.payload.get("chunk_id")
+    ]
+    chunk_texts = _fetch_chunk_texts_batch(db, chunk_ids)
+
+    return {
+        doc_id: [
+            {
+                "chunk_text":  chunk_texts.get(r.payload.get("chunk_id", ""), "") or "",
+                "document_id": r.payload.get("document_id") or doc_id,
+                "chunk_id":    r.payload.get("chunk_id") or "",
+                "title":       r.payload.get("title") or "Unknown",
+                "court":       r.payload.get("court") or "",
+                "year":        r.payload.get("year") or "",
+                "citation":    r.payload.get("citation") or "",
+                "score":       r.score,
+                "source":      "qdrant",
+            }
+            for r in response.points
+        ]
+        for doc_id, response in zip(doc_ids, responses)
+    }
+
+
+def _search_pgvector_docs(db: Session, doc_ids: list[str],
+                          query_vector: list[float]) -> dict[str, list[dict]]:
+    """
+    Search pgvector across all uploaded documents in one query — a LATERAL
+    nearest-neighbour scan per document, TOP_K_PGVECTOR chunks each.
+    Returns {document_id: chunk dicts, best first}.
+    """
     vector_str = "[" + ",".join(f"{v:.6f}" for v in query_vector) + "]"
     sql = text("""
         SELECT
-            dc.id          AS chunk_id,
-            dc.document_id,
+            hit.chunk_id,
+            hit.document_id,
             d.title        AS title,
             d.blob_path    AS blob_path,
-            dc.page_number,
-            dc.chunk_text,
-            1 - (de.embedding <=> CAST(:query_vec AS vector)) AS score
-        FROM document_embeddings de
-        JOIN document_chunks dc ON dc.id = de.chunk_id
-        JOIN documents d        ON d.id  = de.document_id
-        WHERE de.document_id = CAST(:doc_id AS uuid)
-        ORDER BY de.embedding <=> CAST(:query_vec AS vector) ASC
-        LIMIT :top_k
+            hit.page_number,
+            hit.chunk_text,
+            hit.score
+        FROM unnest(CAST(:doc_ids AS uuid[])) AS ids(doc_id)
+        JOIN documents d ON d.id = ids.doc_id
+        CROSS JOIN LATERAL (
+            SELECT
+                dc.id          AS chunk_id,
+                dc.document_id,
+                dc.page_number,
+                dc.chunk_text,
+                1 - (de.embedding <=> CAST(:query_vec AS vector)) AS score
+            FROM document_embeddings de
+            JOIN document_chunks dc ON dc.id = de.chunk_id
+            WHERE de.document_id = ids.doc_id
+            ORDER BY de.embedding <=> CAST(:query_vec AS vector) ASC
+            LIMIT :top_k
+        ) AS hit
+        ORDER BY hit.document_id, hit.score DESC
     """)
     rows = db.execute(sql, {
         "query_vec": vector_str,
-        "doc_id":    doc_id,
+        "doc_ids":   doc_ids,
         "top_k":     TOP_K_PGVECTOR,
     }).fetchall()
 
-    import os as _os
-    return [
-        {
+    by_doc: dict[str, list[dict]] = {}
+    for row in rows:
+        by_doc.setdefault(str(row.document_id), []).append({
             "chunk_text":  row.chunk_text,
             "document_id": str(row.document_id),
             "chunk_id":    str(row.chunk_id),
             "title":       row.title,
             "page_number": row.page_number,
-            "blob_path":   _os.path.basename(row.blob_path),
+            "blob_path":   os.path.basename(row.blob_path),
             "score":       float(row.score),
             "source":      "pgvector",
-        }
-        for row in rows
-    ]
+        })
+    return by_doc
+
+
+def _search_pgvector_in_own_session(doc_ids: list[str], query_vector: list[float]) -> dict[str, list[dict]]:
+    """_search_pgvector_docs on a session of its own (runs on the retrieval pool)."""
+    with DatabaseSession() as db:
+        return _search_pgvector_docs(db, doc_ids, query_vector)
+
+
+def _retrieve(db: Session, doc_ids: list[str], question: str,
+              query_vector: list[float]) -> list[dict]:
+    """
+    Chunks from every attached document, in attachment order: one Document
+    lookup, then the Qdrant query (corpus cases) and the pgvector query
+    (uploaded PDFs) concurrently.
+    """
+    docs = {
+        str(doc.id): doc
+        for doc in db.query(Document).filter(Document.id.in_(doc_ids)).all()
+    }
+    corpus_ids: list[str] = []
+    uploaded_ids: list[str] = []
+    for doc_id in map(str, doc_ids):
+        doc = docs.get(doc_id)
+        if not doc:
+            logger.warning("Document %s not found — skipping.", doc_id)
+        elif doc.source_type == "legal_case":
+            corpus_ids.append(doc_id)
+        else:  # "uploaded"
+            uploaded_ids.append(doc_id)
+
+    uploaded_future = None
+    if uploaded_ids:
+        uploaded_future = _retrieval_pool.submit(
+            contextvars.copy_context().run,
+            _search_pgvector_in_own_session, uploaded_ids, query_vector,
+        )
+    by_doc: dict[str, list[dict]] = {}
+    if corpus_ids:
+        by_doc = _search_qdrant_docs(db, corpus_ids, question, query_vector)
+        logger.debug("Qdrant (RRF hybrid) returned %d chunks for %d docs",
+                     sum(map(len, by_doc.values())), len(corpus_ids))
+    if uploaded_future is not None:
+        uploaded = uploaded_future.result()
+        logger.debug("pgvector returned %d chunks for %d docs",
+                     sum(map(len, uploaded.values())), len(uploaded_ids))
+        by_doc.update(uploaded)
+
+    return [chunk for doc_id in map(str, doc_ids) for chunk in by_doc.get(doc_id, [])]
 
 
 def _build_citations(chunks: list[dict]) -> list[dict]:
@@ -214,8 +296,9 @@ def document_chat_node(state: JurisFindState) -> JurisFindState:
     """
     Retrieve chunks from all attached documents and generate a RAG answer.
 
-    Corpus cases    → Qdrant (filtered by document_id)
-    Uploaded PDFs   → pgvector (filtered by document_id)
+    Corpus cases    → one batched Qdrant call (a query per attached case)
+    Uploaded PDFs   → one pgvector query (per-document nearest chunks)
+    The two run concurrently.
     """
     question    = state["question"]
     history     = state.get("history", [])
@@ -230,27 +313,10 @@ def document_chat_node(state: JurisFindState) -> JurisFindState:
         }
 
     query_vector = embed(question)
-    all_chunks: list[dict] = []
 
     try:
         with DatabaseSession() as db:
-            for doc_id in doc_ids:
-                doc = db.query(Document).filter(
-                    Document.id == doc_id
-                ).first()
-
-                if not doc:
-                    logger.warning("Document %s not found — skipping.", doc_id)
-                    continue
-
-                if doc.source_type == "legal_case":
-                    chunks = _search_qdrant_by_doc(db, str(doc_id), question, query_vector)
-                    logger.debug("Qdrant (RRF hybrid) returned %d chunks for doc %s", len(chunks), doc_id)
-                else:  # "uploaded"
-                    chunks = _search_pgvector_by_doc(db, str(doc_id), query_vector)
-                    logger.debug("pgvector returned %d chunks for doc %s", len(chunks), doc_id)
-
-                all_chunks.extend(chunks)
+            all_chunks = _retrieve(db, doc_ids, question, query_vector)
 
     except Exception as exc:
         logger.error("DocumentChat retrieval error: %s", exc)
@@ -267,6 +333,7 @@ def document_chat_node(state: JurisFindState) -> JurisFindState:
 
     context   = _build_context(all_chunks)
     citations = _build_citations(all_chunks)
+    emit("citations", citations)  # the client shows sources while the answer streams
 
     # ── LLM call ──────────────────────────────────────────────────────────────
     user_prompt = f"Context:\n\n{context}\n\nQuestion: {question}\n\nAnswer:"
@@ -275,19 +342,14 @@ def document_chat_node(state: JurisFindState) -> JurisFindState:
     messages.append({"role": "user", "content": user_prompt})
 
     try:
-        api_key = os.getenv("GROQ_API_KEY", "").strip().strip('"').strip("'")
-        model   = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-        client  = Groq(api_key=api_key)
-
-        response = client.chat.completions.create(
-            model=model,
+        raw_answer = stream_completion(
+            node="document_chat",
             messages=messages,
             temperature=0.1,
             max_tokens=1500,
-            stream=False,
         )
 
-        answer = _clean(response.choices[0].message.content or "")
+        answer = _clean(raw_answer)
         logger.info("DocumentChat answered (%d chars, %d citations)", len(answer), len(citations))
         return {**state, "answer": answer,
                 "citations": citations, "retrieved_chunks": all_chunks}
@@ -295,4 +357,5 @@ def document_chat_node(state: JurisFindState) -> JurisFindState:
     except Exception as exc:
         logger.error("DocumentChat LLM error: %s", exc)
         return {**state, "answer": "The AI encountered an error. Please try again.",
-                "citations": citations, "retrieved_chunks": all_chunks, "error": str(exc)}
+                "citations": citations, "retrieved_chunks": all_chunks, "error": str(exc),
+                "stream_failed": True}
@@ -6,14 +6,13 @@ Uses the Groq LLM directly with conversation history for context.
 No vector search — no citations.
 """
 import logging
-import os
 import re
 from pathlib import Path
 
 from dotenv import load_dotenv
-from groq import Groq
 
 from app.agents.state import JurisFindState
+from app.agents.streaming import stream_completion
 
 _dotenv_path = Path(__file__).resolve().parents[4] / ".env"
 load_dotenv(dotenv_path=_dotenv_path, override=False)
@@ -53,19 +52,14 @@ def general_chat_node(state: JurisFindState) -> JurisFindState:
     messages.append({"role": "user", "content": question})
 
     try:
-        api_key = os.getenv("GROQ_API_KEY", "").strip().strip('"').strip("'")
-        model   = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-        client  = Groq(api_key=api_key)
-
-        response = client.chat.completions.create(
-            model=model,
+        raw_answer = stream_completion(
+            node="general_chat",
             messages=messages,
             temperature=0.3,
             max_tokens=1024,
-            stream=False,  # streaming is handled at the FastAPI layer via astream_events
         )
 
-        answer = _clean(response.choices[0].message.content or "")
+        answer = _clean(raw_answer)
         logger.info("GeneralChat answered (%d chars)", len(answer))
         return {**state, "answer": answer, "citations": [], "retrieved_chunks": []}
 
@@ -77,4 +71,5 @@ def general_chat_node(state: JurisFindState) -> JurisFindState:
             "citations": [],
             "retrieved_chunks": [],
             "error": str(exc),
+            "stream_failed": True,
         }
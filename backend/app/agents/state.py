@@ -23,8 +23,10 @@ class JurisFindState(TypedDict):
 
     # ── Retrieval output ──────────────────────────────────────────────────────
     retrieved_chunks: list[dict]    # raw results from Qdrant or pgvector
+    speculative_chunks: Optional[list[dict]]  # corpus chunks retrieved during classification
     citations:        list[dict]    # built directly from chunk payloads
 
     # ── Final output ──────────────────────────────────────────────────────────
     answer:           str
     error:            Optional[str]
+    stream_failed:    bool          # the answer LLM call failed, possibly after streaming tokens
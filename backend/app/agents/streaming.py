@@ -0,0 +1,91 @@
+"""
+Turn streaming — forwards tokens and citations from the graph's nodes to the
+SSE response while the graph is still running.
+
+The nodes are sync and run in LangGraph's executor threads with a copy of
+the caller's context (the same mechanism turn_scope() relies on).
+stream_turn() binds an event sink to that context and runs the graph as a
+task; nodes call emit("citations", ...) as soon as retrieval is done and
+stream_completion() for their Groq call (through the LLM gateway), which
+emits every token delta as it arrives. The route drains the events in order
+and receives the graph's end state last.
+
+Outside stream_turn() (scripts, tests, a plain ainvoke) emit() is a no-op and
+the nodes behave exactly as before.
+"""
+import asyncio
+import contextvars
+import time
+from typing import Any, AsyncIterator, Callable, Optional, Tuple
+
+from app.core.metrics import LLM_TIME_TO_FIRST_TOKEN_SECONDS
+from app.services.llm_gateway import llm_gateway
+from app.services.query_vector_cache import turn_scope
+
+_sink: contextvars.ContextVar[Optional[Callable[[str, Any], None]]] = contextvars.ContextVar(
+    "jurisfind_turn_stream_sink", default=None
+)
+
+_END = object()
+
+
+def emit(event: str, data: Any) -> None:
+    """Send one event ("token" | "citations") to the streaming turn, if any."""
+    sink = _sink.get()
+    if sink is not None:
+        sink(event, data)
+
+
+def stream_completion(*, node: str, **kwargs: Any) -> str:
+    """
+    Streaming chat completion through the LLM gateway. Emits each content
+    delta as a "token" event and returns the full text; records the node's
+    time to first token.
+    """
+    started = time.perf_counter()
+    parts: list[str] = []
+    for chunk in llm_gateway.stream_chat(operation=node, **kwargs):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        if not parts:
+            LLM_TIME_TO_FIRST_TOKEN_SECONDS.labels(node).observe(time.perf_counter() - started)
+        parts.append(delta)
+        emit("token", delta)
+    return "".join(parts)
+
+
+async def stream_turn(graph: Any, state: dict) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Run `graph` on `state` within one turn_scope(), yielding ("token", text)
+    and ("citations", list) events as the nodes emit them, then
+    ("end", final state). Closing the iterator early cancels the graph.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def sink(event: str, data: Any) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+
+    # The task copies the current context: the sink and the turn's vector memo
+    token = _sink.set(sink)
+    try:
+        with turn_scope():
+            task = asyncio.ensure_future(graph.ainvoke(state))
+    finally:
+        _sink.reset(token)
+    # Scheduled after every event the nodes queued before finishing
+    task.add_done_callback(lambda _: queue.put_nowait(_END))
+
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            yield item
+        yield "end", task.result()
+    finally:
+        if not task.done():
+            task.cancel()
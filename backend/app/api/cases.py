@@ -7,6 +7,7 @@ GET  /api/v1/health            – system health check
 """
 
 import os
+import asyncio
 import logging
 from typing import Optional
 
@@ -14,6 +15,8 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
+from app.services.query_vector_cache import normalize_query
+from app.services.search_coalescer import search_coalescer
 from app.services.search_service import get_searcher
 from sqlalchemy.orm import Session
 from app.db.session import get_db
@@ -77,6 +80,18 @@ def _filename_to_title(filename: str) -> str:
     )
 
 
+async def _search_corpus(query_text: str, top_k: int) -> list:
+    """
+    FAISS case search, off the event loop. Identical queries arriving together
+    (a shared link) run once and reuse the result for a few seconds.
+    """
+    searcher = get_searcher()
+    result, _ = await search_coalescer.run(
+        ("cases", normalize_query(query_text), top_k),
+        lambda: asyncio.to_thread(searcher.search, query_text, top_k=top_k),
+    )
+    return result
+
 
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
@@ -124,8 +139,7 @@ async def search_cases(request: CaseSearchRequest):
     top_k = max(1, min(request.top_k or 10, 50))
 
     try:
-        searcher = get_searcher()
-        raw_results = searcher.search(query_text, top_k=top_k)
+        raw_results = await _search_corpus(query_text, top_k)
     except Exception as exc:
         logger.error("Search failed: %s", exc)
         raise HTTPException(status_code=500, detail=f"Search failed: {exc}")
@@ -166,8 +180,7 @@ async def search_cases_get(
         raise HTTPException(status_code=400, detail="Query cannot be empty.")
 
     try:
-        searcher = get_searcher()
-        raw_results = searcher.search(query_text, top_k=top_k)
+        raw_results = await _search_corpus(query_text, top_k)
     except Exception as exc:
         logger.error("Search failed: %s", exc)
         raise HTTPException(status_code=500, detail=f"Search failed: {exc}")
@@ -5,35 +5,56 @@ FastAPI routes for the Qdrant-powered legal corpus search layer.
 
 Endpoints:
   POST /api/search                      – full semantic search with filters
+  POST /api/search/batch                – many searches in one call
   POST /api/search/by-name              – search by party / case name
+  GET  /api/search/suggest?q=           – typeahead over titles, parties, citations
+  GET  /api/search/statute?q=           – cases under a statute section ("Section 302 IPC")
   GET  /api/search/case/{document_id}   – full case metadata + all chunks
   GET  /api/search/similar/{document_id}– cases similar to a given document
   POST /api/search/ask                  – RAG context fetch for a document
 
 All routes require authentication (Bearer JWT).
 All routes use dependency injection for DB session and search service.
+Routes are non-blocking end to end: AsyncQdrantSearchService runs inference
+in its own bounded thread pool, the heavier in-process lookups (chunk text
+store, case-name index, similar graph) in threads, and talks to Qdrant and
+PostgreSQL (asyncpg) asynchronously.
+
+Every search route sends a `Server-Timing` header with the per-stage latency
+breakdown; the same breakdown is returned in the body as `timings` when the
+request opts in (include_timings).
 """
 
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 import os
 
 from app.api.dependencies.auth import get_current_user
-from app.db.session import get_db
+from app.core.timing import server_timing_header
+from app.db.session import get_async_db
 from app.schemas.search_schemas import (
     AskRequest,
     AskResponse,
+    BatchSearchRequest,
+    BatchSearchResponse,
     CaseDetailResponse,
     SearchRequest,
     SearchResponse,
     SimilarCasesResponse,
+    StatuteSearchResponse,
+    SuggestResponse,
 )
-from app.services.qdrant_search_service import QdrantSearchService, get_search_service
+from app.services.async_qdrant_search_service import (
+    AsyncQdrantSearchService,
+    get_async_search_service,
+)
+from app.services.statute_index import extract_statutes, parse_statute
+from app.services.suggest_index import suggest_index
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +64,35 @@ router = APIRouter(
 )
 
 
+def _expose_timings(result, response: Response, include: bool):
+    """Copy the service's timings into Server-Timing; keep them in the body only on request."""
+    if result.timings is not None:
+        response.headers["Server-Timing"] = server_timing_header(result.timings.model_dump())
+        if not include:
+            result.timings = None
+    return result
+
+
+def _statute_key(statute: Optional[str]) -> Optional[str]:
+    """Canonical key of a statute filter / query; 422 when it names no single section or act."""
+    if statute is None:
+        return None
+    key = parse_statute(statute)
+    sections = extract_statutes(statute) if key is None else []
+    if len(sections) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{statute!r} names {len(sections)} sections ({', '.join(sections)}) — only one section "
+                   f"per query is supported, e.g. '{sections[0]}'.",
+        )
+    if key is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unrecognised statute {statute!r} — use e.g. 'Section 302 IPC', 'Article 21' or 'IPC:302'.",
+        )
+    return key
+
+
 # ── POST /api/search ───────────────────────────────────────────────────────────
 
 @router.post(
@@ -53,9 +103,10 @@ router = APIRouter(
 )
 async def search(
     request: SearchRequest,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     _user: str = Depends(get_current_user),
-    service: QdrantSearchService = Depends(get_search_service),
+    service: AsyncQdrantSearchService = Depends(get_async_search_service),
 ):
     """
     Semantic search over the full JurisFind legal corpus (46k cases, 1.1M chunks).
@@ -70,6 +121,8 @@ async def search(
     - **case_type**: e.g. `"Writ Petition"`, `"Criminal Appeal"`, `"SLP"`
     - **section_type**: restrict to a specific legal section — `"held"`, `"facts"`,
       `"judgment"`, `"headnote"`, `"issues"`, `"order"`, etc.
+    - **statute**: only cases referring to a statute section, e.g.
+      `"Section 302 IPC"`, `"Article 21"`, `"IPC:302"`
     """
     query_text = request.query.strip()
     if not query_text:
@@ -79,9 +132,10 @@ async def search(
         )
 
     top_k = max(1, min(request.top_k, 50))
+    statute = _statute_key(request.statute)
 
     try:
-        return service.search(
+        result = await service.search(
             db,
             query_text,
             court=request.court,
@@ -90,9 +144,13 @@ async def search(
             state=request.state,
             case_type=request.case_type,
             section_type=request.section_type,
+            statute=statute,
             top_k=top_k,
             search_mode=request.search_mode,
+            chunks=request.chunks,
+            snippet_length=request.snippet_length,
         )
+        return _expose_timings(result, response, request.include_timings)
     except Exception as exc:
         logger.exception("Search failed for query=%r: %s", query_text, exc)
         raise HTTPException(
@@ -101,6 +159,44 @@ async def search(
         )
 
 
+# ── POST /api/search/batch ─────────────────────────────────────────────────────
+
+@router.post(
+    "/batch",
+    response_model=BatchSearchResponse,
+    summary="Run many searches in one call",
+    status_code=status.HTTP_200_OK,
+)
+async def search_batch(
+    request: BatchSearchRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    _user: str = Depends(get_current_user),
+    service: AsyncQdrantSearchService = Depends(get_async_search_service),
+):
+    """
+    Run up to 32 searches (same fields as `POST /api/search`) in one request.
+
+    All queries are embedded together (one dense and one BM25 pass), sent to
+    Qdrant in a single batch call and hydrated with one metadata and one
+    chunk-text fetch. `responses` are in the order of `searches`, each with
+    its own `timings`.
+    """
+    for search_request in request.searches:
+        search_request.statute = _statute_key(search_request.statute)
+
+    try:
+        result = await service.search_batch(db, request.searches)
+    except Exception as exc:
+        logger.exception("Batch search failed (%d queries): %s", len(request.searches), exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch search failed: {exc}",
+        )
+
+    return _expose_timings(result, response, include=True)
+
+
 # ── POST /api/search/by-name ───────────────────────────────────────────────────
 
 @router.post(
@@ -111,15 +207,20 @@ async def search(
 )
 async def search_by_name(
     request: SearchRequest,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     _user: str = Depends(get_current_user),
-    service: QdrantSearchService = Depends(get_search_service),
+    service: AsyncQdrantSearchService = Depends(get_async_search_service),
 ):
     """
     Search for cases by petitioner/respondent name or partial case title.
 
-    Uses Qdrant's `MatchText` payload filter combined with semantic similarity,
-    so partial names and abbreviations work well (e.g. *"Puttaswamy"*).
+    Answered from the in-process case-name index (fuzzy token and trigram
+    match on title, petitioner and respondent), so partial and misspelt names
+    work without an embedding call (e.g. *"Puttasway"*). Index hits carry, under
+    `chunks`, each case's opening chunks (cause title and parties) scored with
+    the name-match score. Names the index cannot place fall back to Qdrant's
+    `MatchText` title filter combined with semantic similarity.
     """
     case_name = request.query.strip()
     if not case_name:
@@ -131,7 +232,14 @@ async def search_by_name(
     top_k = max(1, min(request.top_k, 50))
 
     try:
-        return service.search_by_case_name(db, case_name, top_k=top_k)
+        result = await service.search_by_case_name(
+            db,
+            case_name,
+            top_k=top_k,
+            chunks=request.chunks,
+            snippet_length=request.snippet_length,
+        )
+        return _expose_timings(result, response, request.include_timings)
     except Exception as exc:
         logger.exception("Name search failed for name=%r: %s", case_name, exc)
         raise HTTPException(
@@ -140,6 +248,74 @@ async def search_by_name(
         )
 
 
+# ── GET /api/search/suggest ────────────────────────────────────────────────────
+
+@router.get(
+    "/suggest",
+    response_model=SuggestResponse,
+    summary="Typeahead suggestions for case titles, parties and citations",
+    status_code=status.HTTP_200_OK,
+)
+async def suggest(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="What the user has typed so far"),
+    limit: int = Query(8, ge=1, le=20, description="Maximum number of suggestions"),
+    include_timings: bool = Query(False, description="Return the per-stage latency breakdown"),
+    _user: str = Depends(get_current_user),
+):
+    """
+    Prefix-match `q` against case titles (from any of their first words),
+    petitioner / respondent names and citations, and return at most `limit`
+    cases, most popular first.
+
+    Served from an in-process sorted index over the corpus metadata — no
+    embedding, Qdrant or database call. Prefixes shorter than two characters
+    return no suggestions.
+    """
+    return _expose_timings(suggest_index.suggest(q, limit), response, include_timings)
+
+
+# ── GET /api/search/statute ────────────────────────────────────────────────────
+
+@router.get(
+    "/statute",
+    response_model=StatuteSearchResponse,
+    summary="Cases under a statute section",
+    status_code=status.HTTP_200_OK,
+)
+async def search_by_statute(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="e.g. 'Section 302 IPC', 'Article 21', 'IPC:302'"),
+    top_k: int = Query(20, ge=1, le=100, description="Number of cases to return"),
+    offset: int = Query(0, ge=0, le=10000, description="Cases to skip (paging)"),
+    include_timings: bool = Query(False, description="Return the per-stage latency breakdown"),
+    db: AsyncSession = Depends(get_async_db),
+    _user: str = Depends(get_current_user),
+    service: AsyncQdrantSearchService = Depends(get_async_search_service),
+):
+    """
+    Exact lookup of every judgment that refers to one statute section (or,
+    for a bare act such as `"IPC"`, to the act), newest first.
+
+    `q` is normalised to a canonical key (`"u/s 302 I.P.C."` → `IPC:302`,
+    `"Article 21"` → `CONSTITUTION:21`) and looked up in the GIN-indexed
+    `legal_documents.statute_keys` — no embedding or Qdrant call. Results
+    carry metadata only; `total_results` counts every matching case. A list
+    such as `"Sections 302/34 IPC"` is a 422 naming the sections to query
+    one at a time.
+    """
+    statute = _statute_key(q)
+    try:
+        result = await service.search_by_statute(db, statute, top_k=top_k, offset=offset)
+        return _expose_timings(result, response, include_timings)
+    except Exception as exc:
+        logger.exception("Statute search failed for q=%r: %s", q, exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Statute search failed: {exc}",
+        )
+
+
 # ── GET /api/search/case/{document_id} ────────────────────────────────────────
 
 @router.get(
@@ -150,9 +326,9 @@ async def search_by_name(
 )
 async def get_case(
     document_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: str = Depends(get_current_user),
-    service: QdrantSearchService = Depends(get_search_service),
+    service: AsyncQdrantSearchService = Depends(get_async_search_service),
 ):
     """
     Retrieve complete metadata and every text chunk for a single case.
@@ -161,7 +337,7 @@ async def get_case(
     This is a direct PostgreSQL lookup — no Qdrant call is made.
     """
     try:
-        detail = service.get_case_detail(db, document_id)
+        detail = await service.get_case_detail(db, document_id)
     except Exception as exc:
         logger.exception("get_case_detail failed for doc=%s: %s", document_id, exc)
         raise HTTPException(
@@ -188,20 +364,25 @@ async def get_case(
 )
 async def get_similar(
     document_id: str,
+    response: Response,
     top_k: int = Query(10, ge=1, le=50, description="Number of similar cases to return"),
-    db: Session = Depends(get_db),
+    include_timings: bool = Query(False, description="Return the per-stage latency breakdown"),
+    db: AsyncSession = Depends(get_async_db),
     _user: str = Depends(get_current_user),
-    service: QdrantSearchService = Depends(get_search_service),
+    service: AsyncQdrantSearchService = Depends(get_async_search_service),
 ):
     """
     Return the `top_k` cases most similar to the given document.
 
     Similarity is computed by averaging all chunk embeddings of the source
     document into a single centroid vector, then searching Qdrant for the
-    nearest neighbours (excluding the source document itself).
+    nearest neighbours (excluding the source document itself). Documents in
+    the precomputed similar graph are answered from it, with each neighbour's
+    opening chunks instead of its chunks nearest the centroid.
     """
     try:
-        return service.get_similar_cases(db, document_id, top_k=top_k)
+        result = await service.get_similar_cases(db, document_id, top_k=top_k)
+        return _expose_timings(result, response, include_timings)
     except Exception as exc:
         logger.exception("get_similar_cases failed for doc=%s: %s", document_id, exc)
         raise HTTPException(
@@ -220,9 +401,10 @@ async def get_similar(
 )
 async def ask(
     request: AskRequest,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     _user: str = Depends(get_current_user),
-    service: QdrantSearchService = Depends(get_search_service),
+    service: AsyncQdrantSearchService = Depends(get_async_search_service),
 ):
     """
     Fetch the most relevant text chunks from a *specific* document for a question.
@@ -241,12 +423,13 @@ async def ask(
         )
 
     try:
-        return service.ask(
+        result = await service.ask(
             db,
             request.document_id,
             question,
             top_k=request.top_k,
         )
+        return _expose_timings(result, response, request.include_timings)
     except Exception as exc:
         logger.exception(
             "ask() failed for doc=%s question=%r: %s",
@@ -267,15 +450,15 @@ async def ask(
 )
 async def serve_pdf(
     document_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Serve a PDF file from the data/pdfs directory using its document_id (UUID).
     """
-    row = db.execute(
+    row = (await db.execute(
         text("SELECT filename FROM legal_documents WHERE id = CAST(:doc_id AS uuid)"),
         {"doc_id": document_id}
-    ).fetchone()
+    )).fetchone()
 
     if not row or not row[0]:
         raise HTTPException(status_code=404, detail="PDF file not found in database.")
@@ -6,6 +6,7 @@ and attaching/detaching Documents.
 """
 import json
 import logging
+import time
 import uuid
 from typing import List
 from uuid import UUID
@@ -21,6 +22,8 @@ from app.db.crud import message_repository as message_repo
 from app.db.crud import document_repository as doc_repo
 from app.db.crud import session_document_repository as sd_repo
 from app.agents import juris_graph, JurisFindState
+from app.agents.streaming import stream_turn
+from app.core.metrics import CHAT_TIME_TO_FIRST_TOKEN_SECONDS
 from app.schemas.sessions import (
     SessionCreate,
     SessionListItem,
@@ -152,8 +155,8 @@ async def send_message(
     Send a message and receive an SSE-streamed AI response via LangGraph.
 
     The graph classifies the intent, routes to the correct retrieval path,
-    and returns the answer. Citations (if any) are emitted as a separate
-    SSE event after [DONE].
+    and streams the answer token by token. Citations (if any) are emitted as
+    a separate SSE event as soon as retrieval finishes.
     """
     session = session_repo.get_session_for_user(db, session_id, uuid.UUID(user_id))
     if not session:
@@ -189,50 +192,85 @@ async def send_message(
         "is_legal":         False,
         "intent":           "",
         "retrieved_chunks": [],
+        "speculative_chunks": None,
         "citations":        [],
         "answer":           "",
         "error":            None,
+        "stream_failed":    False,
     }
 
     # ── Run graph and stream result ───────────────────────────────────────────
-    # Nodes use the raw Groq SDK (stream=False), not LangChain ChatGroq.
-    # astream_events does NOT emit on_chat_model_stream in this setup.
-    # ainvoke runs the full graph and returns the final state, then we emit
-    # the complete answer as a single SSE chunk.
+    # The answer nodes stream their Groq completion token by token
+    # (app/agents/streaming.py); each delta is forwarded as its own SSE chunk
+    # and the citations as soon as retrieval has finished. Answers that are
+    # not generated by the LLM (blocked question, retrieval failure) arrive
+    # with the end state and are sent as one chunk. The reply persisted is
+    # exactly the text the client received, so a stream cut short by an LLM
+    # failure is stored as the partial answer plus the fallback notice.
     async def generate():
-        final_answer    = ""
+        sent            = []    # content chunks the client received
+        answered        = False
         final_citations = []
+        sent_citations  = False
+        streamed        = False
+        started         = time.perf_counter()
+
+        def content(text: str) -> str:
+            sent.append(text)
+            return f"data: {json.dumps({'content': text})}\n\n"
 
         try:
-            final_state     = await juris_graph.ainvoke(initial_state)
+            final_state = {}
+            async for event, data in stream_turn(juris_graph, initial_state):
+                if event == "token":
+                    if not streamed:
+                        CHAT_TIME_TO_FIRST_TOKEN_SECONDS.observe(time.perf_counter() - started)
+                        streamed = answered = True
+                    yield content(data)
+                elif event == "citations" and data:
+                    yield f"event: citations\ndata: {json.dumps(data)}\n\n"
+                    sent_citations = True
+                elif event == "end":
+                    final_state = data
             final_answer    = final_state.get("answer", "")
             final_citations = final_state.get("citations", [])
 
-            if final_answer:
-                yield f"data: {json.dumps({'content': final_answer})}\n\n"
-            else:
-                yield f"data: {json.dumps({'content': 'No response was generated. Please try again.'})}\n\n"
+            if not streamed:
+                if final_answer:
+                    answered = True
+                    yield content(final_answer)
+                else:
+                    yield content("No response was generated. Please try again.")
+            elif final_state.get("stream_failed"):
+                # The LLM failed part-way through; append the node's fallback message.
+                # (Not `error`: a classifier failure also sets it on a good answer.)
+                yield content("\n\n" + final_answer)
 
         except Exception as exc:
             logger.error("Graph error: %s", exc)
-            yield f"data: {json.dumps({'content': '[Server busy. Please try again in a moment.]'})}\n\n"
+            yield content("[Server busy. Please try again in a moment.]")
 
         # Signal stream complete
         yield "data: [DONE]\n\n"
 
-        # Emit citations as a separate SSE event if present
-        if final_citations:
+        # Emit citations as a separate SSE event if not already sent
+        if final_citations and not sent_citations:
             yield f"event: citations\ndata: {json.dumps(final_citations)}\n\n"
 
         # ── Persist assistant reply to DB ─────────────────────────────────────
-        if final_answer:
+        if answered:
             with DatabaseSession() as write_db:
                 message_repo.append_message(
                     write_db,
                     session.id,
                     "assistant",
-                    final_answer,
+                    "".join(sent),
                     citations=final_citations or None,
                 )
 
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    # Proxies must pass each token through rather than buffer the response
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,54 @@
+"""
+System Router — operational endpoints for JurisFind.
+
+Endpoints:
+  GET /api/system/metrics   – Prometheus scrape (text exposition format)
+  GET /api/system/models    – models held by the ModelRegistry and their memory
+  GET /api/system/caches    – query-vector cache sizes and hit/miss counters
+
+No authentication: these are meant for the scraper / ops tooling and are
+expected to be restricted at the Nginx layer.
+"""
+
+from typing import List
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import render_latest
+from app.schemas.system import ModelMemoryResponse, VectorCacheStats
+from app.services.model_registry import memory_report
+from app.services.query_vector_cache import cache_stats
+
+router = APIRouter(prefix="/system", tags=["System"])
+
+
+@router.get("/metrics", summary="Prometheus metrics scrape")
+async def metrics():
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
+
+
+@router.get(
+    "/models",
+    response_model=ModelMemoryResponse,
+    summary="Loaded ML models and their resident size",
+)
+async def loaded_models():
+    """
+    List every model loaded into this worker process.
+
+    Each model appears at most once — all services share the ModelRegistry.
+    Models that have not been requested yet are not listed (lazy loading).
+    """
+    return memory_report()
+
+
+@router.get(
+    "/caches",
+    response_model=List[VectorCacheStats],
+    summary="Query-vector cache statistics",
+)
+async def vector_caches():
+    """Process-wide (L2) dense and sparse query-vector cache statistics."""
+    return cache_stats()
@@ -0,0 +1,217 @@
+"""
+Prometheus metrics for the JurisFind API process.
+
+All metric objects are defined here (and only here) so that importing a
+service twice — e.g. from a Celery worker and the API in the same test run —
+never registers the same metric name twice.
+
+Scraped via GET /api/system/metrics (see app/api/system.py).
+"""
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# ── Query-embedding dispatcher ────────────────────────────────────────────────
+
+EMBED_QUEUE_DEPTH = Gauge(
+    "jurisfind_embed_queue_depth",
+    "Query-embedding requests waiting for the dispatcher worker.",
+    ["dispatcher"],
+)
+
+EMBED_BATCH_SIZE = Histogram(
+    "jurisfind_embed_batch_size",
+    "Number of texts encoded per dispatcher forward pass.",
+    ["dispatcher"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+EMBED_BATCH_SECONDS = Histogram(
+    "jurisfind_embed_batch_seconds",
+    "Wall-clock time of one dispatcher forward pass.",
+    ["dispatcher"],
+)
+
+EMBED_QUEUE_WAIT_SECONDS = Histogram(
+    "jurisfind_embed_queue_wait_seconds",
+    "Time a query-embedding request spent queued before its batch started.",
+    ["dispatcher"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+# ── Query vector cache (dense / sparse) ───────────────────────────────────────
+
+QUERY_CACHE_REQUESTS = Counter(
+    "jurisfind_query_cache_requests_total",
+    "Query-vector cache lookups by cache, level (l1 = per turn, l2 = process) and result.",
+    ["cache", "level", "result"],
+)
+
+QUERY_CACHE_ENTRIES = Gauge(
+    "jurisfind_query_cache_entries",
+    "Entries currently held in the process-wide query-vector cache.",
+    ["cache"],
+)
+
+QUERY_CACHE_BYTES = Gauge(
+    "jurisfind_query_cache_bytes",
+    "Approximate bytes held in the process-wide query-vector cache.",
+    ["cache"],
+)
+
+# ── Corpus metadata store ─────────────────────────────────────────────────────
+
+CORPUS_METADATA_DOCUMENTS = Gauge(
+    "jurisfind_corpus_metadata_documents",
+    "Documents held in the in-process corpus metadata store.",
+)
+
+CORPUS_METADATA_LOOKUPS = Counter(
+    "jurisfind_corpus_metadata_lookups_total",
+    "Document metadata lookups served by the in-process store (hit) or left to PostgreSQL (miss).",
+    ["result"],
+)
+
+# ── Chunk text store ──────────────────────────────────────────────────────────
+
+CHUNK_STORE_LOOKUPS = Counter(
+    "jurisfind_chunk_store_lookups_total",
+    "Chunk-text lookups served by the memory-mapped store (hit) or left to PostgreSQL (miss).",
+    ["result"],
+)
+
+# ── Case name index ───────────────────────────────────────────────────────────
+
+CASE_NAME_INDEX_LOOKUPS = Counter(
+    "jurisfind_case_name_index_lookups_total",
+    "Case-name lookups answered by the in-process name index (hit), left to semantic search (miss), "
+    "or made before the index was built (unavailable).",
+    ["result"],
+)
+
+# ── Citation resolver ─────────────────────────────────────────────────────────
+
+CITATION_LOOKUPS = Counter(
+    "jurisfind_citation_lookups_total",
+    "Citation-shaped queries resolved exactly from the citation index (hit) or left to search (miss).",
+    ["result"],
+)
+
+# ── Typeahead suggest index ───────────────────────────────────────────────────
+
+SUGGEST_LOOKUPS = Counter(
+    "jurisfind_suggest_lookups_total",
+    "Typeahead prefix lookups with suggestions (hit), without (miss), or made before the index was built "
+    "(unavailable).",
+    ["result"],
+)
+
+# ── Similar-documents graph ───────────────────────────────────────────────────
+
+SIMILAR_GRAPH_LOOKUPS = Counter(
+    "jurisfind_similar_graph_lookups_total",
+    "Similar-case lookups served by the precomputed graph (hit) or computed live (miss).",
+    ["result"],
+)
+
+# ── Search result cache / singleflight ───────────────────────────────────────
+
+SEARCH_RESULT_CACHE_REQUESTS = Counter(
+    "jurisfind_search_result_cache_requests_total",
+    "Searches answered from the result cache (hit), by an identical in-flight search (coalesced) or computed (miss).",
+    ["result"],
+)
+
+# ── LLM gateway ───────────────────────────────────────────────────────────────
+
+LLM_REQUEST_SECONDS = Histogram(
+    "jurisfind_llm_request_seconds",
+    "Wall-clock time of one LLM gateway call (retries and queueing included), by outcome (ok / error / rejected).",
+    ["model", "operation", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 40.0, 60.0),
+)
+
+LLM_RETRIES = Counter(
+    "jurisfind_llm_retries_total",
+    "LLM calls retried after a rate limit, server error, timeout or connection error.",
+    ["model", "operation"],
+)
+
+LLM_TOKENS = Counter(
+    "jurisfind_llm_tokens_total",
+    "Tokens reported by the LLM provider, by kind (prompt / completion).",
+    ["model", "kind"],
+)
+
+# ── Intent classifier ─────────────────────────────────────────────────────────
+
+INTENT_CLASSIFICATIONS = Counter(
+    "jurisfind_intent_classifications_total",
+    "Chat turns classified by the local intent model, the LLM classifier or the UI override.",
+    ["source"],
+)
+
+INTENT_AGREEMENT = Counter(
+    "jurisfind_intent_agreement_total",
+    "Local-vs-LLM intent comparisons, by path (fallback / shadow) and result (agree / disagree).",
+    ["path", "result"],
+)
+
+INTENT_LOCAL_SECONDS = Histogram(
+    "jurisfind_intent_local_seconds",
+    "Time of one local intent classification (question embedding included).",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+# ── Speculative corpus retrieval ──────────────────────────────────────────────
+
+SPECULATIVE_RETRIEVALS = Counter(
+    "jurisfind_speculative_retrievals_total",
+    "Corpus retrievals started during classification, by outcome "
+    "(hit / queued / timeout / discarded / cancelled / failed).",
+    ["result"],
+)
+
+SPECULATIVE_WASTED_SECONDS = Counter(
+    "jurisfind_speculative_wasted_seconds_total",
+    "Retrieval time spent on speculations that were not used (other intent, or abandoned after a timeout).",
+)
+
+# ── Assistant chat streaming ──────────────────────────────────────────────────
+
+_TTFT_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 20.0)
+
+CHAT_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "jurisfind_chat_time_to_first_token_seconds",
+    "Time from the start of a chat turn's graph run to the first answer token sent over SSE.",
+    buckets=_TTFT_BUCKETS,
+)
+
+LLM_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "jurisfind_llm_time_to_first_token_seconds",
+    "Time from a node's streaming Groq request to its first content token.",
+    ["node"],
+    buckets=_TTFT_BUCKETS,
+)
+
+# ── Search pipeline stages ────────────────────────────────────────────────────
+
+_STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+SEARCH_STAGE_SECONDS = Histogram(
+    "jurisfind_search_stage_seconds",
+    "Wall-clock time of one search pipeline stage (see app/core/timing.py).",
+    ["operation", "stage"],
+    buckets=_STAGE_BUCKETS,
+)
+
+SEARCH_TOTAL_SECONDS = Histogram(
+    "jurisfind_search_total_seconds",
+    "End-to-end service time of one search operation.",
+    ["operation"],
+    buckets=_STAGE_BUCKETS + (5.0, 10.0),
+)
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Return (body, content_type) for a Prometheus scrape."""
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,76 @@
+"""
+Per-stage latency accounting for search requests.
+
+A StageTimer is created per search call; each pipeline step runs inside
+`with timer.stage("name"):`. When the call finishes the timer:
+
+  - feeds every stage into the jurisfind_search_stage_seconds histogram
+    (labelled by operation and stage),
+  - renders a `Server-Timing` header value for the browser devtools, and
+  - becomes the optional `timings` object of the response.
+
+Stages may overlap (dense and BM25 encoding run concurrently in the async
+service), so the stages do not necessarily add up to total_ms. A search may
+also attach its query plan (app/services/search_planner.py) as `timer.plan`.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from app.core.metrics import SEARCH_STAGE_SECONDS, SEARCH_TOTAL_SECONDS
+
+
+class StageTimer:
+    """Collects wall-clock durations of named stages within one operation."""
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.stages: Dict[str, float] = {}
+        self.plan: Optional[Dict[str, Any]] = None
+        self._t0 = time.perf_counter()
+        self._total: Optional[float] = None
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            # a stage entered twice (e.g. several scroll pages) accumulates
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - t0)
+
+    def finish(self) -> "StageTimer":
+        """Freeze total time and export everything to Prometheus (idempotent)."""
+        if self._total is None:
+            self._total = time.perf_counter() - self._t0
+            for name, seconds in self.stages.items():
+                SEARCH_STAGE_SECONDS.labels(self.operation, name).observe(seconds)
+            SEARCH_TOTAL_SECONDS.labels(self.operation).observe(self._total)
+        return self
+
+    @property
+    def total_ms(self) -> float:
+        total = self._total if self._total is not None else time.perf_counter() - self._t0
+        return round(total * 1000, 2)
+
+    def stages_ms(self) -> Dict[str, float]:
+        return {name: round(seconds * 1000, 2) for name, seconds in self.stages.items()}
+
+    def as_dict(self) -> dict:
+        """Shape of the `timings` response field (SearchTimings)."""
+        timings: Dict[str, Any] = {"stages": self.stages_ms(), "total_ms": self.total_ms}
+        if self.plan is not None:
+            timings["plan"] = self.plan
+        return timings
+
+
+def server_timing_header(timings: dict) -> str:
+    """Render a SearchTimings dict as a Server-Timing header value."""
+    parts = [f"{name};dur={ms}" for name, ms in timings.get("stages", {}).items()]
+    if timings.get("plan"):
+        parts.append(f'plan;desc="{timings["plan"]["strategy"]}"')
+    if timings.get("cache"):
+        parts.append(f'cache;desc="{timings["cache"]}"')
+    parts.append(f"total;dur={timings.get('total_ms', 0.0)}")
+    return ", ".join(parts)
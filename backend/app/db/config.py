@@ -6,7 +6,10 @@ and provides the SQLAlchemy engine and session factory.
 """
 
 import os
+from typing import Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
@@ -47,6 +50,73 @@ SessionLocal = sessionmaker(
 )
 
 
+def _async_url(url: str) -> str:
+    """Rewrite a sync PostgreSQL URL to use the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Async engine for the non-blocking read paths (corpus search hydration).
+# Defaults to DATABASE_URL with the asyncpg driver; override with ASYNC_DATABASE_URL.
+# Created on first use so processes that never touch it (Celery workers,
+# scripts) do not need asyncpg installed.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_url(DATABASE_URL)
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async SQLAlchemy engine (asyncpg), creating it on first call.
+
+    Returns:
+        AsyncEngine: Async engine with the same pool settings as `engine`
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            echo=False,
+        )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Get the async session factory.
+
+    expire_on_commit=False: sessions are used for reads, so loaded rows stay
+    usable after the request finishes.
+
+    Returns:
+        async_sessionmaker: Factory for AsyncSession objects
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections (no-op if it was never created)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+
 def get_engine():
     """
     Get the SQLAlchemy engine instance.
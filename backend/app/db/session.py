@@ -5,9 +5,10 @@ This module provides database session management with automatic cleanup
 and dependency injection for FastAPI route handlers.
 """
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from .config import SessionLocal
+from .config import SessionLocal, get_async_session_factory
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -46,6 +47,24 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that provides an async database session (asyncpg).
+
+    Used by routes that must not block the event loop, such as corpus search.
+
+    Usage in FastAPI routes:
+        @app.get("/example")
+        async def example_route(db: AsyncSession = Depends(get_async_db)):
+            rows = (await db.execute(text("SELECT 1"))).fetchall()
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
 class DatabaseSession:
     """
     Context manager for database sessions outside of FastAPI routes.
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import sys
@@ -33,13 +34,30 @@ async def lifespan(app: FastAPI):
 
     Or via Docker Compose:
         docker compose up celery_worker
+
+    The corpus-search embedding model is loaded here, in a worker thread, so
+    the first /api/search request neither pays the load nor blocks the loop.
+    The corpus metadata store loads (and then refreshes) in a background task;
+    until it is ready, searches hydrate from PostgreSQL as before. Another
+    task polls the search index version that keys the search result cache.
     """
+    from app.db.config import dispose_async_engine
+    from app.services.async_qdrant_search_service import get_async_search_service
+    from app.services.corpus_metadata_store import run_refresh_loop
+    from app.services.index_generation import run_poll_loop
+
     logger.info(
         "JurisFind API starting up. "
         "Document processing offloaded to Celery worker (RabbitMQ broker)."
     )
+    metadata_refresh = asyncio.create_task(run_refresh_loop())
+    index_poll = asyncio.create_task(run_poll_loop())
+    await asyncio.to_thread(get_async_search_service().warm_up)
     yield  # Application runs here
     logger.info("JurisFind API shutting down.")
+    metadata_refresh.cancel()
+    index_poll.cancel()
+    await dispose_async_engine()
 
 
 # ── App factory ───────────────────────────────────────────────────────────────
@@ -99,12 +117,14 @@ def create_app() -> FastAPI:
     from app.api.sessions import router as sessions_router
     from app.api.documents import router as documents_router
     from app.api.search import router as search_router
+    from app.api.system import router as system_router
 
     app.include_router(auth_router, prefix="/api")
     app.include_router(cases_router, prefix="/api")
     app.include_router(sessions_router, prefix="/api")
     app.include_router(documents_router, prefix="/api")
     app.include_router(search_router, prefix="/api")
+    app.include_router(system_router, prefix="/api")
 
     # ── Root endpoint ─────────────────────────────────────────────────────────
     @app.get("/", tags=["Root"])
@@ -120,12 +140,18 @@ def create_app() -> FastAPI:
             "storage_backend": storage_info,
             "api_endpoints": {
                 "search_semantic": "/api/search (POST)",
+                "search_batch": "/api/search/batch (POST)",
                 "search_by_name": "/api/search/by-name (POST)",
+                "search_suggest": "/api/search/suggest?q= (GET)",
+                "search_statute": "/api/search/statute?q= (GET)",
                 "search_case_detail": "/api/search/case/{document_id} (GET)",
                 "search_similar": "/api/search/similar/{document_id} (GET)",
                 "search_ask": "/api/search/ask (POST)",
                 "docs": "/docs",
                 "health": "/api/health (GET)",
+                "system_metrics": "/api/system/metrics (GET)",
+                "system_models": "/api/system/models (GET)",
+                "system_caches": "/api/system/caches (GET)",
                 "auth_register": "/api/auth/register (POST)",
                 "auth_login": "/api/auth/login (POST)",
                 "cases_search": "/api/cases/search (POST/GET)",
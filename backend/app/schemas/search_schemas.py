@@ -5,7 +5,7 @@ Pydantic request/response models for the Qdrant-backed corpus search layer.
 These schemas are entirely separate from the user-upload document schemas.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -24,11 +24,23 @@ class SearchRequest(BaseModel):
         None,
         description="Restrict chunks to a legal section: 'held', 'facts', 'judgment', 'headnote', 'issues', 'order', etc."
     )
+    statute: Optional[str] = Field(
+        None,
+        description="Only cases referring to this statute section, e.g. 'Section 302 IPC', 'Article 21' or 'IPC:302'",
+    )
     search_mode: str = Field(
         "hybrid",
         description="Search strategy: 'hybrid' (Dense + BM25 RRF, best for concepts) or 'keyword' (BM25 only, best for exact names/citations)"
     )
     top_k: int = Field(10, ge=1, le=50, description="Number of unique cases to return")
+    chunks: Literal["none", "top", "all"] = Field(
+        "all",
+        description="Chunks per case: 'all' (top_chunk + all_chunks), 'top' (top_chunk only) or 'none' (metadata only)"
+    )
+    snippet_length: Optional[int] = Field(
+        None, ge=50, le=20000, description="Cut each returned chunk_text to at most this many characters"
+    )
+    include_timings: bool = Field(False, description="Return the per-stage latency breakdown in `timings`")
 
     model_config = {"json_schema_extra": {
         "example": {
@@ -40,12 +52,21 @@ class SearchRequest(BaseModel):
     }}
 
 
+class BatchSearchRequest(BaseModel):
+    """Payload for POST /api/search/batch — many searches answered in one call."""
+
+    searches: List[SearchRequest] = Field(
+        ..., min_length=1, max_length=32, description="Searches to run, answered in the same order"
+    )
+
+
 class AskRequest(BaseModel):
     """Payload for POST /api/search/ask — RAG context fetch."""
 
     question: str = Field(..., min_length=1, max_length=2000)
     document_id: str = Field(..., description="UUID of a legal_documents row")
     top_k: int = Field(5, ge=1, le=20, description="Number of relevant chunks to return")
+    include_timings: bool = Field(False, description="Return the per-stage latency breakdown in `timings`")
 
 
 # ── Result atoms ───────────────────────────────────────────────────────────────
@@ -69,6 +90,9 @@ class CaseResult(BaseModel):
     'top_chunk' is the single highest-scoring chunk.
     'all_chunks' contains every chunk from this document that appeared in the
     raw Qdrant results.
+
+    SearchRequest.chunks trims this: 'top' leaves all_chunks empty, 'none'
+    also leaves top_chunk null.
     """
 
     document_id: str
@@ -82,10 +106,35 @@ class CaseResult(BaseModel):
     case_type: Optional[str] = None
     state: Optional[str] = None
     score: float
-    top_chunk: ChunkResult
+    top_chunk: Optional[ChunkResult] = None
     all_chunks: List[ChunkResult] = Field(default_factory=list)
 
 
+class SearchTimings(BaseModel):
+    """
+    Per-stage latency breakdown of one search call, in milliseconds.
+
+    Stages: dense_encode, sparse_encode, qdrant, metadata, chunk_text,
+    assemble (plus scroll / centroid for similar cases). Encodes may run
+    concurrently, so the stages need not add up to total_ms. The same values
+    are always sent in the `Server-Timing` response header.
+
+    `plan` is set by hybrid searches: the strategy of the dense prefetch
+    ("exact", "filtered", "hnsw"), its prefetch_limit and hnsw_ef, and the
+    estimated number of documents passing the filters.
+
+    `cache` says how POST /api/search got its result: "miss" (computed for
+    this request), "coalesced" (shared with an identical search already in
+    flight) or "hit" (a result cached a few seconds ago). For the last two the
+    stages are those of the search that computed the result.
+    """
+
+    stages: Dict[str, float] = Field(default_factory=dict)
+    total_ms: float
+    plan: Optional[Dict[str, Any]] = None
+    cache: Optional[str] = None
+
+
 # ── Top-level responses ────────────────────────────────────────────────────────
 
 class SearchResponse(BaseModel):
@@ -95,6 +144,52 @@ class SearchResponse(BaseModel):
     total_results: int
     results: List[CaseResult]
     search_time_ms: float
+    timings: Optional[SearchTimings] = None
+
+
+class StatuteSearchResponse(BaseModel):
+    """Response for GET /api/search/statute — newest judgments first."""
+
+    statute: str
+    total_results: int
+    results: List[CaseResult]
+    search_time_ms: float
+    timings: Optional[SearchTimings] = None
+
+
+class BatchSearchResponse(BaseModel):
+    """
+    Response for POST /api/search/batch.
+
+    `responses[i]` answers `searches[i]`. Every response carries its timings
+    (include_timings is implied): the shared batch stages plus its own
+    assembly time.
+    """
+
+    total_queries: int
+    responses: List[SearchResponse]
+    search_time_ms: float
+    timings: Optional[SearchTimings] = None
+
+
+class Suggestion(BaseModel):
+    """One typeahead suggestion: enough to label the entry and open the case."""
+
+    document_id: str
+    title: Optional[str] = None
+    citation: Optional[str] = None
+    court: Optional[str] = None
+    year: Optional[int] = None
+    matched: Literal["title", "party", "citation"]
+
+
+class SuggestResponse(BaseModel):
+    """Response for GET /api/search/suggest — most popular matches first."""
+
+    query: str
+    suggestions: List[Suggestion]
+    search_time_ms: float
+    timings: Optional[SearchTimings] = None
 
 
 class CaseDetailResponse(BaseModel):
@@ -121,6 +216,7 @@ class SimilarCasesResponse(BaseModel):
     source_document_id: str
     total_results: int
     results: List[CaseResult]
+    timings: Optional[SearchTimings] = None
 
 
 class AskResponse(BaseModel):
@@ -130,3 +226,4 @@ class AskResponse(BaseModel):
     question: str
     context_chunks: List[ChunkResult]
     total_chunks: int
+    timings: Optional[SearchTimings] = None
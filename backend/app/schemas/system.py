@@ -0,0 +1,32 @@
+"""
+Pydantic schemas for the System API endpoints.
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class LoadedModelInfo(BaseModel):
+    name: str
+    kind: str
+    tensor_bytes: Optional[int] = None      # parameters + buffers (torch models only)
+    rss_delta_bytes: Optional[int] = None   # process RSS growth observed while loading
+    load_seconds: float
+
+
+class ModelMemoryResponse(BaseModel):
+    process_rss_bytes: Optional[int] = None
+    models: List[LoadedModelInfo]
+
+
+class VectorCacheStats(BaseModel):
+    name: str
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
@@ -0,0 +1,698 @@
+"""
+JurisFind — Async Qdrant Search Service
+========================================
+Non-blocking twin of QdrantSearchService, used by the /api/search routes.
+
+The sync service runs model inference, a blocking QdrantClient call and the
+PostgreSQL hydration queries directly on whatever thread calls it — from an
+`async def` route that is the event loop, so one slow search stalled every
+other request on the worker. Here:
+
+  - Query embedding (dense + BM25) runs in a dedicated, bounded thread pool
+    (SEARCH_INFERENCE_WORKERS), so CPU-bound inference can neither block the
+    loop nor starve the default executor that FastAPI uses for sync routes.
+  - Qdrant is queried through AsyncQdrantClient.
+  - Hydration runs on an AsyncSession (asyncpg) from app.db.session.get_async_db.
+  - The in-process lookups that can take real time — chunk text store reads
+    (mmap page faults, zstd), case-name index scoring and the similar graph's
+    first load — run in threads (asyncio.to_thread).
+
+Query construction, grouping and result assembly are the module-level helpers
+of qdrant_search_service, so both services return identical responses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointGroup
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.timing import StageTimer
+from app.db.config import get_async_session_factory
+from app.schemas.search_schemas import (
+    AskResponse,
+    BatchSearchResponse,
+    CaseDetailResponse,
+    CaseResult,
+    SearchRequest,
+    SearchResponse,
+    SimilarCasesResponse,
+    StatuteSearchResponse,
+)
+from app.services.case_name_index import case_name_index
+from app.services.chunk_text_store import lookup_chunk_texts
+from app.services.corpus_metadata_store import corpus_metadata
+from app.services.dense_projection import verify_collection
+from app.services.embedding_service import get_model
+from app.services.query_vector_cache import normalize_query
+from app.services.search_coalescer import search_coalescer
+from app.services.search_planner import search_planner
+from app.services.similar_graph import get_similar_graph
+from app.services.statute_index import STATUTE_DOCUMENTS_SQL
+from app.services.qdrant_search_service import (
+    _CASE_CHUNKS_SQL,
+    _CASE_DETAIL_SQL,
+    _CHUNK_TEXTS_SQL,
+    _METADATA_SQL,
+    _OPENING_CHUNKS_SQL,
+    QDRANT_COLLECTION,
+    QDRANT_HOST,
+    QDRANT_PORT,
+    _apply_citations,
+    _ask_chunk_ids,
+    _batch_cited_ids,
+    _batch_hydration_ids,
+    _batch_items,
+    _batch_opening_chunk_request,
+    _batch_query_request,
+    _batch_responses,
+    _build_case_detail,
+    _build_case_results,
+    _build_context_chunks,
+    _build_filter,
+    _build_name_results,
+    _build_scored_results,
+    _case_name_filter,
+    _centroid,
+    _chunk_ids_of,
+    _cited_documents,
+    _cited_hits,
+    _dense_groups_query,
+    _dense_vector_of,
+    _document_filter,
+    _embed,
+    _embed_many,
+    _embed_sparse,
+    _embed_sparse_many,
+    _exclude_document_filter,
+    _get_qdrant_client,
+    _group_points,
+    _group_size,
+    _groups_to_grouped,
+    _hybrid_query,
+    _metadata_rows_to_dict,
+    _scroll_vectors_query,
+    _search_query,
+    _stored_centroid_query,
+)
+
+logger = logging.getLogger(__name__)
+
+# Threads reserved for query-embedding work. Dense misses mostly wait on the
+# shared EmbeddingDispatcher; BM25 encodes run on these threads directly.
+_INFERENCE_WORKERS: int = max(1, int(os.getenv("SEARCH_INFERENCE_WORKERS", "4")))
+
+
+# ── Module-level singletons ────────────────────────────────────────────────────
+
+_async_client: Optional[AsyncQdrantClient] = None
+_inference_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_async_qdrant_client() -> AsyncQdrantClient:
+    """Return the cached AsyncQdrantClient, creating it on first call."""
+    global _async_client
+    if _async_client is None:
+        logger.info("Connecting (async) to Qdrant at %s:%d", QDRANT_HOST, QDRANT_PORT)
+        _async_client = AsyncQdrantClient(host=QDRANT_HOST, port=QDRANT_PORT, timeout=30)
+    return _async_client
+
+
+def _get_inference_executor() -> ThreadPoolExecutor:
+    """Return the bounded thread pool used for query inference."""
+    global _inference_executor
+    if _inference_executor is None:
+        _inference_executor = ThreadPoolExecutor(
+            max_workers=_INFERENCE_WORKERS,
+            thread_name_prefix="search-inference",
+        )
+    return _inference_executor
+
+
+async def _run_inference(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_inference_executor(), fn, *args)
+
+
+async def _embed_async(text_input: str) -> List[float]:
+    return await _run_inference(_embed, text_input)
+
+
+async def _embed_sparse_async(text_input: str):
+    return await _run_inference(_embed_sparse, text_input)
+
+
+async def _timed(timer: StageTimer, stage: str, awaitable):
+    """Await `awaitable` inside a named stage (used for the concurrent encodes)."""
+    with timer.stage(stage):
+        return await awaitable
+
+
+# ── Async PostgreSQL hydration ─────────────────────────────────────────────────
+
+async def _fetch_metadata_batch_async(db: AsyncSession, document_ids: List[str]) -> Dict[str, dict]:
+    """Async twin of qdrant_search_service._fetch_metadata_batch (store first, then PG)."""
+    if not document_ids:
+        return {}
+
+    meta_by_doc, missing = corpus_metadata.get_many(document_ids)
+    if missing:
+        result = await db.execute(_METADATA_SQL, {"ids": missing})
+        meta_by_doc.update(_metadata_rows_to_dict(result.fetchall()))
+    return meta_by_doc
+
+
+async def _fetch_chunk_texts_batch_async(db: AsyncSession, chunk_ids: List[str]) -> Dict[str, str]:
+    """Async twin of qdrant_search_service._fetch_chunk_texts_batch (store first, then PG)."""
+    if not chunk_ids:
+        return {}
+
+    text_by_chunk, missing = await asyncio.to_thread(lookup_chunk_texts, chunk_ids)
+    if missing:
+        result = await db.execute(_CHUNK_TEXTS_SQL, {"ids": missing})
+        text_by_chunk.update({row[0]: row[1] for row in result.fetchall()})
+    return text_by_chunk
+
+
+async def _groups_to_case_results_async(
+    groups: Sequence[PointGroup],
+    db: AsyncSession,
+    timer: StageTimer,
+    chunks: str = "all",
+    snippet_length: Optional[int] = None,
+) -> List[CaseResult]:
+    grouped = _groups_to_grouped(groups)
+    if not grouped:
+        return []
+
+    # One AsyncSession cannot run two statements at once — run them back to back
+    with timer.stage("metadata"):
+        meta_by_doc = await _fetch_metadata_batch_async(db, [doc_id for doc_id, _ in grouped])
+    text_by_chunk: Dict[str, str] = {}
+    if chunks != "none":
+        with timer.stage("chunk_text"):
+            text_by_chunk = await _fetch_chunk_texts_batch_async(db, _chunk_ids_of(grouped, chunks))
+    with timer.stage("assemble"):
+        return _build_case_results(grouped, meta_by_doc, text_by_chunk, chunks, snippet_length)
+
+
+async def _fetch_opening_chunks_async(db: AsyncSession, doc_ids: List[str], per_doc: int) -> Sequence:
+    """Async twin of qdrant_search_service._fetch_opening_chunks."""
+    if not doc_ids:
+        return []
+    result = await db.execute(_OPENING_CHUNKS_SQL, {"ids": doc_ids, "per_doc": per_doc})
+    return result.fetchall()
+
+
+async def _index_hit_results_async(
+    db: AsyncSession,
+    hits: List[Tuple[str, float]],
+    meta_by_doc: Dict[str, dict],
+    timer: StageTimer,
+    chunks: str = "all",
+    snippet_length: Optional[int] = None,
+) -> List[CaseResult]:
+    """Async twin of qdrant_search_service._index_hit_results (hits with their opening chunks)."""
+    chunk_rows: Sequence = []
+    text_by_chunk: Dict[str, str] = {}
+    if chunks != "none":
+        with timer.stage("chunk_text"):
+            chunk_rows = await _fetch_opening_chunks_async(db, [doc_id for doc_id, _ in hits], _group_size(chunks))
+            text_by_chunk = await _fetch_chunk_texts_batch_async(db, [row[1] for row in chunk_rows])
+    with timer.stage("assemble"):
+        return _build_name_results(hits, meta_by_doc, chunk_rows, text_by_chunk, chunks, snippet_length)
+
+
+# ── Public service class ───────────────────────────────────────────────────────
+
+class AsyncQdrantSearchService:
+    """
+    Stateless async search service. Each method accepts an AsyncSession and
+    mirrors the method of the same name on QdrantSearchService.
+    """
+
+    def warm_up(self) -> None:
+        """
+        Load the dense model and check the "dense_small" projection against
+        the collection (blocking — call from a worker thread at startup).
+        BM25 stays lazy, as in the sync service.
+        """
+        try:
+            get_model()
+            _get_async_qdrant_client()
+            verify_collection(_get_qdrant_client(), QDRANT_COLLECTION)
+        except Exception as exc:
+            logger.warning("Could not pre-warm async search service: %s", exc)
+
+    # ── search ─────────────────────────────────────────────────────────────────
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query: str,
+        *,
+        court: Optional[str] = None,
+        year_min: Optional[int] = None,
+        year_max: Optional[int] = None,
+        state: Optional[str] = None,
+        case_type: Optional[str] = None,
+        section_type: Optional[str] = None,
+        statute: Optional[str] = None,
+        top_k: int = 10,
+        search_mode: str = "hybrid",
+        chunks: str = "all",
+        snippet_length: Optional[int] = None,
+    ) -> SearchResponse:
+        """
+        Hybrid (RRF) or keyword-only corpus search — see QdrantSearchService.search.
+
+        Identical searches (same normalised query and parameters) share one
+        computation while in flight and reuse its result for a few seconds
+        (search_coalescer). The shared search hydrates on a session of its
+        own, so it outlives any one caller disconnecting; `db` serves the
+        uncoalesced path.
+        """
+        query = query.strip()
+        if not query:
+            return SearchResponse(query=query, total_results=0, results=[], search_time_ms=0.0)
+
+        params = dict(
+            court=court, year_min=year_min, year_max=year_max, state=state, case_type=case_type,
+            section_type=section_type, statute=statute, top_k=top_k, search_mode=search_mode,
+            chunks=chunks, snippet_length=snippet_length,
+        )
+        if not search_coalescer.enabled:
+            return await self._search(db, query, **params)
+
+        async def compute() -> SearchResponse:
+            async with get_async_session_factory()() as own_db:
+                return await self._search(own_db, query, **params)
+
+        key = ("search", normalize_query(query)) + tuple(params.items())
+        result, status = await search_coalescer.run(key, compute)
+        # Shared result: callers (_expose_timings) mutate their response, so each gets a copy
+        timings = result.timings.model_copy(update={"cache": status}) if result.timings else None
+        return result.model_copy(update={"query": query, "timings": timings})
+
+    async def _search(
+        self,
+        db: AsyncSession,
+        query: str,
+        *,
+        court: Optional[str],
+        year_min: Optional[int],
+        year_max: Optional[int],
+        state: Optional[str],
+        case_type: Optional[str],
+        section_type: Optional[str],
+        statute: Optional[str],
+        top_k: int,
+        search_mode: str,
+        chunks: str,
+        snippet_length: Optional[int],
+    ) -> SearchResponse:
+        timer = StageTimer("search")
+
+        with timer.stage("citation"):
+            cited = _cited_documents(query, section_type, statute)
+        if cited:
+            with timer.stage("metadata"):
+                meta_by_doc = await _fetch_metadata_batch_async(db, cited)
+            hits = _cited_hits(cited, meta_by_doc, top_k, court, year_min, year_max, state, case_type)
+            if hits:
+                results = await _index_hit_results_async(db, hits, meta_by_doc, timer, chunks, snippet_length)
+                timings = timer.finish().as_dict()
+                return SearchResponse(
+                    query=query,
+                    total_results=len(results),
+                    results=results,
+                    search_time_ms=timings["total_ms"],
+                    timings=timings,
+                )
+
+        qdrant_filter = _build_filter(
+            court=court,
+            year_min=year_min,
+            year_max=year_max,
+            state=state,
+            case_type=case_type,
+            section_type=section_type,
+            statute=statute,
+        )
+        plan = None
+        if search_mode != "keyword":
+            plan = search_planner.plan(
+                top_k, court=court, year_min=year_min, year_max=year_max, state=state,
+                case_type=case_type, section_type=section_type, statute=statute,
+            )
+            timer.plan = plan.as_dict()
+
+        try:
+            if search_mode == "keyword":
+                dense_vec = None
+                sparse_vec = await _timed(timer, "sparse_encode", _embed_sparse_async(query))
+            else:
+                dense_vec, sparse_vec = await asyncio.gather(
+                    _timed(timer, "dense_encode", _embed_async(query)),
+                    _timed(timer, "sparse_encode", _embed_sparse_async(query)),
+                )
+            with timer.stage("qdrant"):
+                response = await _get_async_qdrant_client().query_points_groups(
+                    **_search_query(search_mode, dense_vec, sparse_vec, qdrant_filter, top_k, chunks, plan)
+                )
+        except Exception as exc:
+            logger.error("Qdrant search failed (mode=%s): %s", search_mode, exc)
+            raise
+
+        results = await _groups_to_case_results_async(response.groups, db, timer, chunks, snippet_length)
+        timings = timer.finish().as_dict()
+
+        return SearchResponse(
+            query=query,
+            total_results=len(results),
+            results=results,
+            search_time_ms=timings["total_ms"],
+            timings=timings,
+        )
+
+    # ── search_batch ───────────────────────────────────────────────────────────
+
+    async def search_batch(
+        self,
+        db: AsyncSession,
+        requests: Sequence[SearchRequest],
+    ) -> BatchSearchResponse:
+        """Many searches in one pass each for encoding, Qdrant and hydration — see QdrantSearchService.search_batch."""
+        timer = StageTimer("search_batch")
+        items = _batch_items(requests)
+        meta_by_doc: Dict[str, dict] = {}
+        cited_ids = _batch_cited_ids(items)
+        if cited_ids:
+            with timer.stage("metadata"):
+                meta_by_doc = await _fetch_metadata_batch_async(db, cited_ids)
+            _apply_citations(items, meta_by_doc)
+        active = [i for i, item in enumerate(items) if item.query and not item.cited]
+        dense_idx = [i for i in active if items[i].search_mode != "keyword"]
+
+        dense_vecs, sparse_vecs = await asyncio.gather(
+            _timed(timer, "dense_encode", _run_inference(_embed_many, [items[i].query for i in dense_idx])),
+            _timed(timer, "sparse_encode", _run_inference(_embed_sparse_many, [items[i].query for i in active])),
+        )
+        dense_by_idx = dict(zip(dense_idx, dense_vecs))
+        sparse_by_idx = dict(zip(active, sparse_vecs))
+
+        grouped_per_item = [[] for _ in items]
+        if active:
+            try:
+                with timer.stage("qdrant"):
+                    batch = await _get_async_qdrant_client().query_batch_points(
+                        collection_name=QDRANT_COLLECTION,
+                        requests=[
+                            _batch_query_request(items[i], dense_by_idx.get(i), sparse_by_idx[i])
+                            for i in active
+                        ],
+                    )
+            except Exception as exc:
+                logger.error("Qdrant batch search failed (%d queries): %s", len(active), exc)
+                raise
+            for i, response in zip(active, batch):
+                grouped_per_item[i] = _group_points(response.points, items[i].top_k, items[i].chunks)
+
+        doc_ids, chunk_ids = _batch_hydration_ids(items, grouped_per_item)
+        with timer.stage("metadata"):
+            meta_by_doc.update(
+                await _fetch_metadata_batch_async(db, [doc_id for doc_id in doc_ids if doc_id not in meta_by_doc])
+            )
+        with timer.stage("chunk_text"):
+            opening_rows = await _fetch_opening_chunks_async(db, *_batch_opening_chunk_request(items))
+            text_by_chunk = await _fetch_chunk_texts_batch_async(db, chunk_ids + [row[1] for row in opening_rows])
+        return _batch_responses(items, grouped_per_item, meta_by_doc, text_by_chunk, timer, opening_rows)
+
+    # ── search_by_case_name ────────────────────────────────────────────────────
+
+    async def search_by_case_name(
+        self,
+        db: AsyncSession,
+        case_name: str,
+        *,
+        top_k: int = 10,
+        chunks: str = "all",
+        snippet_length: Optional[int] = None,
+    ) -> SearchResponse:
+        """In-process name index (with opening chunks), else semantic search pre-filtered by MatchText on the title."""
+        timer = StageTimer("search_by_case_name")
+
+        case_name = case_name.strip()
+        if not case_name:
+            return SearchResponse(query=case_name, total_results=0, results=[], search_time_ms=0.0)
+
+        with timer.stage("name_index"):
+            matches = await asyncio.to_thread(case_name_index.search, case_name, top_k)
+        if matches:
+            doc_ids = [doc_id for doc_id, _ in matches]
+            with timer.stage("metadata"):
+                meta_by_doc = await _fetch_metadata_batch_async(db, doc_ids)
+            results = await _index_hit_results_async(db, matches, meta_by_doc, timer, chunks, snippet_length)
+            timings = timer.finish().as_dict()
+            return SearchResponse(
+                query=case_name,
+                total_results=len(results),
+                results=results,
+                search_time_ms=timings["total_ms"],
+                timings=timings,
+            )
+
+        with timer.stage("dense_encode"):
+            vec = await _embed_async(case_name)
+        try:
+            with timer.stage("qdrant"):
+                response = await _get_async_qdrant_client().query_points_groups(
+                    **_dense_groups_query(vec, _case_name_filter(case_name), top_k, chunks)
+                )
+        except Exception as exc:
+            logger.error("Qdrant case-name search failed: %s", exc)
+            raise
+
+        results = await _groups_to_case_results_async(response.groups, db, timer, chunks, snippet_length)
+        timings = timer.finish().as_dict()
+
+        return SearchResponse(
+            query=case_name,
+            total_results=len(results),
+            results=results,
+            search_time_ms=timings["total_ms"],
+            timings=timings,
+        )
+
+    # ── get_similar_cases ──────────────────────────────────────────────────────
+
+    async def get_similar_cases(
+        self,
+        db: AsyncSession,
+        document_id: str,
+        *,
+        top_k: int = 10,
+    ) -> SimilarCasesResponse:
+        """Similar-graph neighbours (with opening chunks), else nearest neighbours of the document's chunk centroid."""
+        timer = StageTimer("similar_cases")
+
+        # First call loads the graph from disk
+        graph = await asyncio.to_thread(get_similar_graph)
+        if graph is not None:
+            with timer.stage("graph"):
+                neighbours = await asyncio.to_thread(graph.neighbours, document_id, top_k)
+            if neighbours is not None:
+                with timer.stage("metadata"):
+                    meta_by_doc = await _fetch_metadata_batch_async(db, [doc_id for doc_id, _ in neighbours])
+                results = await _index_hit_results_async(db, neighbours, meta_by_doc, timer)
+                return SimilarCasesResponse(
+                    source_document_id=document_id,
+                    total_results=len(results),
+                    results=results,
+                    timings=timer.finish().as_dict(),
+                )
+
+        client = _get_async_qdrant_client()
+
+        with timer.stage("centroid_fetch"):
+            centroid = await self._stored_centroid(client, document_id)
+        if centroid is None:
+            centroid = await self._live_centroid(client, document_id, timer)
+        if centroid is None:
+            logger.warning("No vectors found in Qdrant for document_id=%s", document_id)
+            return SimilarCasesResponse(
+                source_document_id=document_id,
+                total_results=0,
+                results=[],
+                timings=timer.finish().as_dict(),
+            )
+
+        try:
+            with timer.stage("qdrant"):
+                response = await client.query_points_groups(
+                    **_dense_groups_query(centroid, _exclude_document_filter(document_id), top_k)
+                )
+        except Exception as exc:
+            logger.error("Qdrant similar-cases search failed: %s", exc)
+            raise
+
+        results = await _groups_to_case_results_async(response.groups, db, timer)
+
+        return SimilarCasesResponse(
+            source_document_id=document_id,
+            total_results=len(results),
+            results=results,
+            timings=timer.finish().as_dict(),
+        )
+
+    @staticmethod
+    async def _stored_centroid(client: AsyncQdrantClient, document_id: str) -> Optional[List[float]]:
+        try:
+            points = await client.retrieve(**_stored_centroid_query(document_id))
+        except Exception as exc:
+            logger.debug("No stored centroid for document %s: %s", document_id, exc)
+            return None
+        return _dense_vector_of(points[0]) if points else None
+
+    @staticmethod
+    async def _live_centroid(
+        client: AsyncQdrantClient,
+        document_id: str,
+        timer: StageTimer,
+    ) -> Optional[List[float]]:
+        all_vectors: List[List[float]] = []
+        next_offset = None
+        while True:
+            try:
+                with timer.stage("scroll"):
+                    result, next_offset = await client.scroll(
+                        **_scroll_vectors_query(document_id, next_offset)
+                    )
+            except Exception as exc:
+                logger.error("Qdrant scroll for document %s failed: %s", document_id, exc)
+                raise
+
+            for point in result:
+                vector = _dense_vector_of(point)
+                if vector is not None:
+                    all_vectors.append(vector)
+
+            if next_offset is None:
+                break
+
+        with timer.stage("centroid"):
+            return _centroid(all_vectors)
+
+    # ── search_by_statute ──────────────────────────────────────────────────────
+
+    async def search_by_statute(
+        self,
+        db: AsyncSession,
+        statute_key: str,
+        *,
+        top_k: int = 20,
+        offset: int = 0,
+    ) -> StatuteSearchResponse:
+        """GIN lookup on legal_documents.statute_keys — see QdrantSearchService.search_by_statute."""
+        timer = StageTimer("search_by_statute")
+        with timer.stage("statute"):
+            rows = (await db.execute(
+                STATUTE_DOCUMENTS_SQL, {"statute_key": statute_key, "limit": top_k, "offset": offset}
+            )).fetchall()
+        with timer.stage("metadata"):
+            meta_by_doc = await _fetch_metadata_batch_async(db, [doc_id for doc_id, _ in rows])
+
+        results = _build_scored_results([(doc_id, 1.0) for doc_id, _ in rows], meta_by_doc)
+        timings = timer.finish().as_dict()
+        return StatuteSearchResponse(
+            statute=statute_key,
+            total_results=int(rows[0][1]) if rows else 0,
+            results=results,
+            search_time_ms=timings["total_ms"],
+            timings=timings,
+        )
+
+    # ── get_case_detail ────────────────────────────────────────────────────────
+
+    async def get_case_detail(
+        self, db: AsyncSession, document_id: str
+    ) -> Optional[CaseDetailResponse]:
+        """Full metadata + all chunks from PostgreSQL; None if the case does not exist."""
+        doc_row = (await db.execute(_CASE_DETAIL_SQL, {"doc_id": document_id})).fetchone()
+        if not doc_row:
+            return None  # Caller raises 404
+
+        chunk_rows = (await db.execute(_CASE_CHUNKS_SQL, {"doc_id": document_id})).fetchall()
+        return _build_case_detail(doc_row, chunk_rows)
+
+    # ── ask (RAG context fetch) ────────────────────────────────────────────────
+
+    async def ask(
+        self,
+        db: AsyncSession,
+        document_id: str,
+        question: str,
+        *,
+        top_k: int = 5,
+    ) -> AskResponse:
+        """Hybrid RRF context retrieval scoped to one document (no LLM call)."""
+        timer = StageTimer("ask")
+        question = question.strip()
+
+        dense_vec, sparse_vec = await asyncio.gather(
+            _timed(timer, "dense_encode", _embed_async(question)),
+            _timed(timer, "sparse_encode", _embed_sparse_async(question)),
+        )
+        try:
+            with timer.stage("qdrant"):
+                response = await _get_async_qdrant_client().query_points(
+                    **_hybrid_query(
+                        dense_vec,
+                        sparse_vec,
+                        _document_filter(document_id),
+                        prefetch_limit=top_k * 3,
+                        limit=top_k,
+                    )
+                )
+        except Exception as exc:
+            logger.error("Qdrant ask() hybrid search failed: %s", exc)
+            raise
+
+        raw = response.points
+        chunk_ids = _ask_chunk_ids(raw)
+        with timer.stage("chunk_text"):
+            text_by_chunk = await _fetch_chunk_texts_batch_async(db, chunk_ids)
+        with timer.stage("assemble"):
+            context_chunks = _build_context_chunks(raw, chunk_ids, text_by_chunk)
+
+        return AskResponse(
+            document_id=document_id,
+            question=question,
+            context_chunks=context_chunks,
+            total_chunks=len(context_chunks),
+            timings=timer.finish().as_dict(),
+        )
+
+
+# ── Singleton accessor ─────────────────────────────────────────────────────────
+
+_service_instance: Optional[AsyncQdrantSearchService] = None
+
+
+def get_async_search_service() -> AsyncQdrantSearchService:
+    """
+    FastAPI dependency for the AsyncQdrantSearchService singleton.
+
+    Cheap to construct — model loading happens in warm_up() (app lifespan)
+    or lazily on the first query, always off the event loop.
+    """
+    global _service_instance
+    if _service_instance is None:
+        _service_instance = AsyncQdrantSearchService()
+    return _service_instance
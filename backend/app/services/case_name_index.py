@@ -0,0 +1,207 @@
+"""
+Case Name Index — in-process fuzzy lookup of judgments by title and party names.
+
+search_by_case_name used to embed the name and walk HNSW under a MatchText
+filter on `title`, although "Puttaswamy" or "Kesavananda Bharati" is a pure
+lookup. This index answers it from memory, without the embedding model:
+
+  - titles, petitioners and respondents of every document in the corpus
+    metadata store are tokenised (ASCII-folded, lower-case, alphanumeric)
+  - token postings: vocabulary token → sorted array of document rows
+  - trigram postings: trigram → vocabulary tokens containing it, so a
+    misspelt or partial query token ("puttasway", "kesavanand") finds its
+    nearest vocabulary tokens by trigram Dice similarity; tokens the query
+    token is a prefix of count as near-exact matches
+
+A document's score is the IDF-weighted share of query tokens it matches,
+each at its best similarity (1.0 = exact), so rare name tokens dominate and
+"union", "india" or "state" barely count. Matches below CASE_NAME_MIN_SCORE
+are dropped; an empty answer sends the caller to the semantic path.
+
+The index is rebuilt (off the request path) whenever the metadata store
+swaps in a new snapshot.
+"""
+import bisect
+import logging
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.metrics import CASE_NAME_INDEX_LOOKUPS
+from app.services.corpus_metadata_store import corpus_metadata
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.getenv("CASE_NAME_INDEX", "true").lower() == "true"
+_MIN_SCORE = float(os.getenv("CASE_NAME_MIN_SCORE", "0.6"))
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Connectives of case titles ("A v. B and Ors.") — never worth matching on
+_STOPWORDS = frozenset({"v", "vs", "versus", "and", "the", "of", "ors", "anr", "others", "another"})
+_FUZZY_MIN_SIMILARITY = 0.45
+_PREFIX_SIMILARITY = 0.9
+_MAX_CANDIDATES = 50
+_NAME_COLUMNS = ("title", "petitioner", "respondent")
+
+
+def words(text: Optional[str]) -> List[str]:
+    """Lower-case ASCII word tokens of `text` (accents folded, punctuation dropped)."""
+    folded = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode()
+    return _WORD_RE.findall(folded.casefold())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """words() of `text` with title connectives dropped."""
+    return [t for t in words(text) if t not in _STOPWORDS]
+
+
+def _trigrams(token: str) -> List[str]:
+    padded = f"  {token} "
+    return sorted({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+class _IndexState:
+    """Immutable postings built from one metadata snapshot."""
+
+    def __init__(self, rows: Iterable[Sequence[Optional[str]]]) -> None:
+        postings: Dict[str, List[int]] = {}
+        self.doc_ids: List[str] = []
+        for doc_id, *names in rows:
+            row = len(self.doc_ids)
+            self.doc_ids.append(doc_id)
+            for token in {t for name in names for t in tokenize(name)}:
+                postings.setdefault(token, []).append(row)
+
+        self.vocab: List[str] = sorted(postings)
+        self.token_id: Dict[str, int] = {t: i for i, t in enumerate(self.vocab)}
+        self.postings: List[np.ndarray] = [np.asarray(postings[t], dtype=np.int32) for t in self.vocab]
+
+        n_docs = max(1, len(self.doc_ids))
+        self.idf = np.asarray([math.log(1 + n_docs / len(p)) for p in self.postings], dtype=np.float32)
+        self.max_idf = math.log(1 + n_docs)
+
+        trigram_postings: Dict[str, List[int]] = {}
+        self.trigram_count = np.zeros(len(self.vocab), dtype=np.int32)
+        for vid, token in enumerate(self.vocab):
+            grams = _trigrams(token)
+            self.trigram_count[vid] = len(grams)
+            for gram in grams:
+                trigram_postings.setdefault(gram, []).append(vid)
+        self.trigram_postings: Dict[str, np.ndarray] = {
+            g: np.asarray(v, dtype=np.int32) for g, v in trigram_postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def matches(self, token: str) -> List[Tuple[int, float]]:
+        """[(vocabulary id, similarity)] for one query token, best first."""
+        exact = self.token_id.get(token)
+        if len(token) < 3:
+            return [(exact, 1.0)] if exact is not None else []
+
+        grams = _trigrams(token)
+        lists = [self.trigram_postings[g] for g in grams if g in self.trigram_postings]
+        sims: Dict[int, float] = {}
+        if lists:
+            vids, shared = np.unique(np.concatenate(lists), return_counts=True)
+            dice = 2.0 * shared / (len(grams) + self.trigram_count[vids])
+            keep = dice >= _FUZZY_MIN_SIMILARITY
+            sims = dict(zip(vids[keep].tolist(), dice[keep].tolist()))
+
+        # Partial names: every vocabulary token starting with the query token
+        lo = bisect.bisect_left(self.vocab, token)
+        hi = bisect.bisect_left(self.vocab, token + "\x7f", lo)
+        for vid in range(lo, min(hi, lo + _MAX_CANDIDATES)):
+            sims[vid] = max(sims.get(vid, 0.0), _PREFIX_SIMILARITY)
+
+        if exact is not None:
+            sims[exact] = 1.0
+        ranked = sorted(sims.items(), key=lambda kv: kv[1], reverse=True)
+        return ranked[:_MAX_CANDIDATES]
+
+    def search(self, query: str, limit: int, min_score: float) -> List[Tuple[str, float]]:
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self.doc_ids:
+            return []
+
+        total = np.zeros(len(self.doc_ids), dtype=np.float32)
+        weight_sum = 0.0
+        for token in tokens:
+            matches = self.matches(token)
+            if not matches:
+                weight_sum += self.max_idf  # an unmatched token counts fully against every document
+                continue
+            weight = float(self.idf[matches[0][0]])
+            best = np.zeros(len(self.doc_ids), dtype=np.float32)
+            for vid, similarity in matches:
+                rows = self.postings[vid]
+                best[rows] = np.maximum(best[rows], similarity)
+            total += weight * best
+            weight_sum += weight
+
+        scores = total / weight_sum
+        limit = min(limit, len(scores))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (self.doc_ids[row], round(float(scores[row]), 6))
+            for row in top
+            if scores[row] >= min_score
+        ]
+
+
+class CaseNameIndex:
+    """Process-wide name index, kept in step with corpus_metadata."""
+
+    def __init__(self, *, enabled: bool = _ENABLED, min_score: float = _MIN_SCORE) -> None:
+        self.enabled = enabled
+        self.min_score = min_score
+        self._state: Optional[_IndexState] = None
+        self._version = -1
+        self._build_lock = threading.Lock()
+
+    def build(self, rows: Iterable[Sequence[Optional[str]]]) -> None:
+        """Replace the index with one built from (document_id, title, petitioner, respondent) rows."""
+        t0 = time.perf_counter()
+        self._state = _IndexState(rows)
+        logger.info(
+            "Case name index built: %d documents, %d tokens in %.2fs",
+            len(self._state), len(self._state.vocab), time.perf_counter() - t0,
+        )
+
+    def rebuild(self) -> None:
+        """Rebuild from the current metadata snapshot (metadata store listener)."""
+        if not self.enabled or not corpus_metadata.ready:
+            return
+        with self._build_lock:
+            version = corpus_metadata.version
+            if version != self._version:
+                self.build(corpus_metadata.iter_columns(*_NAME_COLUMNS))
+                self._version = version
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        [(document_id, score)] of the best-matching documents, best first.
+        Empty when nothing scores CASE_NAME_MIN_SCORE or the index is not
+        built yet — callers then fall back to semantic search.
+        """
+        state = self._state
+        if state is None:
+            CASE_NAME_INDEX_LOOKUPS.labels("unavailable").inc()
+            return []
+
+        results = state.search(query, limit, self.min_score)
+        CASE_NAME_INDEX_LOOKUPS.labels("hit" if results else "miss").inc()
+        return results
+
+
+# Module-level singleton, rebuilt after every metadata refresh
+case_name_index = CaseNameIndex()
+corpus_metadata.add_listener(case_name_index.rebuild)
@@ -0,0 +1,265 @@
+"""
+Chunk Text Store — read-only, memory-mapped chunk texts keyed by chunk UUID.
+
+Search, ask and both corpus agent nodes need the text of a handful of chunks
+per request. That used to be an `id = ANY(uuid[])` lookup against the 1.1M-row
+legal_chunks table every time. The texts never change after ingestion, so
+scripts/chunk_store/export_chunk_store.py writes them once into a directory:
+
+    manifest.json   format version, record count, compression settings
+    keys.npy        (N,) S16   — chunk UUID bytes, sorted
+    offsets.npy     (N,) uint64 — byte offset of each record in texts.bin
+    lengths.npy     (N,) uint32 — byte length of each record
+    texts.bin       concatenated records (UTF-8, optionally zstd-compressed)
+    zstd.dict       optional zstd dictionary, trained on a sample of chunks
+
+The reader memory-maps the arrays and texts.bin, so lookups cost a binary
+search plus one small read and decompress, with no copy of the corpus on the
+Python heap. Each record is compressed on its own, sharing one dictionary, so
+any chunk can be decoded without touching its neighbours.
+
+zstandard is optional: the exporter can write uncompressed stores, and a
+compressed store without the library installed is skipped with a warning.
+Chunks the store does not know (ingested after the export) are reported as
+missing; callers fall back to PostgreSQL.
+"""
+import itertools
+import json
+import logging
+import mmap
+import os
+import threading
+import uuid
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.metrics import CHUNK_STORE_LOOKUPS
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+_DEFAULT_DIR = Path(__file__).resolve().parents[2] / "data" / "chunk_store"
+CHUNK_STORE_DIR = Path(os.getenv("CHUNK_STORE_DIR", str(_DEFAULT_DIR)))
+
+
+def _key(chunk_id: str) -> Optional[bytes]:
+    try:
+        return uuid.UUID(chunk_id).bytes
+    except (ValueError, AttributeError, TypeError):
+        return None
+
+
+class ChunkTextStore:
+    """Read-only view over one exported chunk store directory."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path / "manifest.json") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"unsupported chunk store version {self.manifest.get('version')}")
+
+        self.compression = self.manifest.get("compression", "none")
+        self._dictionary = None
+        if self.compression == "zstd":
+            if zstandard is None:
+                raise RuntimeError("chunk store is zstd-compressed but zstandard is not installed")
+            dict_path = self.path / "zstd.dict"
+            if dict_path.exists():
+                self._dictionary = zstandard.ZstdCompressionDict(dict_path.read_bytes())
+        elif self.compression != "none":
+            raise ValueError(f"unknown chunk store compression {self.compression!r}")
+
+        self._keys = np.load(self.path / "keys.npy", mmap_mode="r")
+        self._offsets = np.load(self.path / "offsets.npy", mmap_mode="r")
+        self._lengths = np.load(self.path / "lengths.npy", mmap_mode="r")
+
+        self._file = open(self.path / "texts.bin", "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        # ZstdDecompressor objects are not thread-safe — one per thread
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return int(self._keys.shape[0])
+
+    def _decompressor(self):
+        d = getattr(self._local, "decompressor", None)
+        if d is None:
+            d = zstandard.ZstdDecompressor(dict_data=self._dictionary)
+            self._local.decompressor = d
+        return d
+
+    def _read(self, idx: int) -> str:
+        start = int(self._offsets[idx])
+        blob = self._data[start:start + int(self._lengths[idx])]
+        if self.compression == "zstd":
+            blob = self._decompressor().decompress(blob)
+        return bytes(blob).decode("utf-8")
+
+    def get_many(self, chunk_ids: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+        """Return ({chunk_id: text} for stored ids, [ids not in the store])."""
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        n = len(self)
+        for chunk_id in chunk_ids:
+            key = _key(chunk_id)
+            if key is None or n == 0:
+                missing.append(chunk_id)
+                continue
+            idx = int(np.searchsorted(self._keys, np.bytes_(key)))
+            # numpy drops trailing NUL bytes when reading an S16 element back
+            if idx < n and self._keys[idx] == key.rstrip(b"\x00"):
+                found[chunk_id] = self._read(idx)
+            else:
+                missing.append(chunk_id)
+
+        if found:
+            CHUNK_STORE_LOOKUPS.labels("hit").inc(len(found))
+        if missing:
+            CHUNK_STORE_LOOKUPS.labels("miss").inc(len(missing))
+        return found, missing
+
+
+# ── Writer (used by scripts/chunk_store/export_chunk_store.py) ─────────────────
+
+def write_chunk_store(
+    path: Path,
+    rows: Iterable[Tuple[str, str]],
+    *,
+    compression: str = "zstd",
+    level: int = 3,
+    dict_size: int = 112_640,
+    dict_samples: int = 20_000,
+) -> int:
+    """
+    Write (chunk_id, chunk_text) rows, sorted by chunk UUID, into a new store.
+
+    Rows are streamed straight to disk (the exporter reads legal_chunks
+    ORDER BY id, which is byte order for uuid). With zstd, the first
+    `dict_samples` rows — a random sample, since ids are random — train the
+    dictionary. The store is assembled in `<path>.tmp` and renamed into place,
+    so a running reader never sees a half-written store. Returns the number
+    of records.
+    """
+    if compression not in ("zstd", "none"):
+        raise ValueError(f"unknown compression {compression!r}")
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("zstd compression requested but zstandard is not installed")
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        _remove_tree(tmp)
+    tmp.mkdir(parents=True)
+
+    rows = iter(rows)
+    manifest = {"version": FORMAT_VERSION, "compression": compression}
+    encode = lambda b: b  # noqa: E731 — identity for uncompressed stores
+    head: List[Tuple[str, str]] = []
+
+    if compression == "zstd":
+        for row in rows:
+            head.append(row)
+            if len(head) >= dict_samples:
+                break
+        dictionary = None
+        samples = [(t or "").encode("utf-8") for _, t in head]
+        if len(samples) >= 8:
+            try:
+                dictionary = zstandard.train_dictionary(dict_size, samples)
+            except zstandard.ZstdError as exc:
+                logger.warning("zstd dictionary training failed, compressing without: %s", exc)
+        if dictionary is not None:
+            (tmp / "zstd.dict").write_bytes(dictionary.as_bytes())
+        encode = zstandard.ZstdCompressor(level=level, dict_data=dictionary).compress
+        manifest.update(level=level, dictionary=dictionary is not None)
+
+    keys = bytearray()
+    offsets = array("Q")
+    lengths = array("I")
+    position = 0
+    previous = b""
+    with open(tmp / "texts.bin", "wb") as f:
+        for chunk_id, chunk_text in itertools.chain(head, rows):
+            key = uuid.UUID(chunk_id).bytes
+            if key <= previous:
+                raise ValueError(f"rows must be sorted by chunk id (at {chunk_id})")
+            previous = key
+            blob = encode((chunk_text or "").encode("utf-8"))
+            f.write(blob)
+            keys += key
+            offsets.append(position)
+            lengths.append(len(blob))
+            position += len(blob)
+
+    count = len(offsets)
+    np.save(tmp / "keys.npy", np.frombuffer(bytes(keys), dtype="S16"))
+    np.save(tmp / "offsets.npy", np.frombuffer(offsets, dtype=np.uint64))
+    np.save(tmp / "lengths.npy", np.frombuffer(lengths, dtype=np.uint32))
+    manifest.update(count=count, bytes=position)
+    with open(tmp / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    if path.exists():
+        old = path.with_name(path.name + ".old")
+        if old.exists():
+            _remove_tree(old)
+        path.rename(old)
+        tmp.rename(path)
+        _remove_tree(old)
+    else:
+        tmp.rename(path)
+    return count
+
+
+def _remove_tree(path: Path) -> None:
+    for child in path.iterdir():
+        child.unlink()
+    path.rmdir()
+
+
+# ── Singleton accessor ─────────────────────────────────────────────────────────
+
+_store: Optional[ChunkTextStore] = None
+_store_checked = False
+_store_lock = threading.Lock()
+
+
+def get_chunk_text_store() -> Optional[ChunkTextStore]:
+    """
+    Return the store at CHUNK_STORE_DIR, or None when no usable export exists
+    (callers then read legal_chunks). Opened once per process.
+    """
+    global _store, _store_checked
+    if _store_checked:
+        return _store
+    with _store_lock:
+        if not _store_checked:
+            if (CHUNK_STORE_DIR / "manifest.json").exists():
+                try:
+                    _store = ChunkTextStore(CHUNK_STORE_DIR)
+                    logger.info("Chunk text store opened: %d chunks at %s", len(_store), CHUNK_STORE_DIR)
+                except Exception as exc:
+                    logger.warning("Chunk text store at %s unusable: %s", CHUNK_STORE_DIR, exc)
+            else:
+                logger.info("No chunk text store at %s — chunk texts come from PostgreSQL", CHUNK_STORE_DIR)
+            _store_checked = True
+    return _store
+
+
+def lookup_chunk_texts(chunk_ids: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    """Store-first lookup: ({chunk_id: text}, ids still to fetch from PostgreSQL)."""
+    store = get_chunk_text_store()
+    if store is None:
+        return {}, list(chunk_ids)
+    return store.get_many(chunk_ids)
@@ -0,0 +1,220 @@
+"""
+Citation Resolver — exact lookup of judgments by reporter citation.
+
+"AIR 1973 SC 1461" or "(2017) 10 SCC 1" names exactly one judgment, yet such
+queries used to go through BM25 and dense search and often missed. This
+module parses reporter citations into canonical keys and resolves them from
+an in-process hash index:
+
+    "(2017) 10 SCC 1", "2017 (10) SCC 1", "[2017] 10 S.C.C. 1" → "SCC 2017 10 1"
+    "AIR 1973 SC 1461", "1973 AIR 1461", "AIR 1973 Supreme Court 1461"
+                                                              → "AIR 1973 SC 1461"
+    "(1973) 4 SCR 1", "1973 SCR (4) 1", "[1973] Supp. SCR 1"  → "SCR 1973 4 1" / "SCR 1973 SUPP 1"
+
+Key format: "<reporter> <year> <volume or court> <page>" ("-" when a
+reporter has no volume). Supported reporters: AIR, SCC (and SCC (Cri),
+(L&S), (Tax)), SCC OnLine, SCR, SCALE, JT, MANU.
+
+The index holds, per key, the documents carrying that citation, from two
+sources:
+  - legal_documents.citation, via the corpus metadata store
+  - legal_citations, every citation found in a judgment's header (its
+    reported and equivalent citations), written at ingestion by
+    metadata_extractor.py and back-filled by
+    scripts/citations/build_citation_index.py
+
+It is rebuilt whenever the metadata store swaps in a new snapshot.
+"""
+import logging
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.metrics import CITATION_LOOKUPS
+from app.services.corpus_metadata_store import corpus_metadata
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.getenv("CITATION_RESOLVER", "true").lower() == "true"
+
+# Citations of the judgment itself sit in its header; later ones cite other cases
+HEADER_CHARS = 3000
+
+_TABLE_SQL = text("SELECT citation_key, document_id::text FROM legal_citations")
+
+_YEAR = r"[\[(]?(?P<year>(?:18|19|20)\d{2})[\])]?"
+_VOL = r"\(?(?P<vol>\d{1,2})\)?"
+_PAGE = r"(?P<page>\d{1,6})"
+_SUPP = r"(?P<supp>Supp|Supl)\.?(?:\s*\(?(?P<suppvol>\d)\)?)?"
+
+# (reporter, pattern) — reporter None means "taken from the match"
+_PATTERNS: List[Tuple[Optional[str], "re.Pattern[str]"]] = [
+    ("SCC ONLINE", re.compile(
+        rf"{_YEAR}\s+S\.?C\.?C\.?\s+On\s?Line\s+(?P<court>[A-Za-z]{{2,6}})\s+{_PAGE}", re.I)),
+    (None, re.compile(
+        rf"{_YEAR}\s+{_VOL}\s+S\.?C\.?C\.?(?:\s*\((?P<part>Cri|L\s?&\s?S|Tax)\))?\s+{_PAGE}", re.I)),
+    ("AIR", re.compile(
+        rf"A\.?I\.?R\.?\s+{_YEAR}\s+(?P<court>Supreme\s+Court|[A-Za-z][A-Za-z.]{{0,8}})\s+{_PAGE}", re.I)),
+    ("AIR", re.compile(rf"(?<![\w(\[]){_YEAR}\s+A\.?I\.?R\.?\s+{_PAGE}", re.I)),
+    ("SCR", re.compile(rf"{_YEAR}\s+(?:{_VOL}\s+|{_SUPP}\s+)?S\.?C\.?R\.?\s+{_PAGE}", re.I)),
+    ("SCR", re.compile(
+        rf"{_YEAR}\s+S\.?C\.?R\.?\s+(?:\((?P<vol>\d{{1,2}})\)|{_SUPP})\s+{_PAGE}", re.I)),
+    ("SCALE", re.compile(rf"{_YEAR}\s+{_VOL}\s+SCALE\s+{_PAGE}", re.I)),
+    ("JT", re.compile(rf"J\.?T\.?\s+{_YEAR}\s+{_VOL}\s+(?:S\.?C\.?\s+)?{_PAGE}", re.I)),
+    ("JT", re.compile(rf"{_YEAR}\s+{_VOL}\s+J\.?T\.?\s+{_PAGE}", re.I)),
+    ("MANU", re.compile(r"MANU\s*/\s*(?P<court>[A-Z]{2,4})\s*/\s*(?P<page>\d{1,5})\s*/\s*(?P<year>\d{4})", re.I)),
+]
+
+_SEPARATORS = " \t\r\n,.;:"
+
+
+def _court(raw: str) -> str:
+    court = re.sub(r"[\s.]", "", raw).upper()
+    return "SC" if court == "SUPREMECOURT" else court
+
+
+def _key(reporter: Optional[str], m: "re.Match[str]") -> str:
+    groups = m.groupdict()
+    year, page = groups["year"], str(int(groups["page"]))
+
+    if reporter is None:  # SCC and its (Cri) / (L&S) / (Tax) parts
+        part = groups.get("part")
+        reporter = "SCC" if not part else f"SCC ({part.replace(' ', '').upper()})"
+
+    if groups.get("court"):
+        middle = _court(groups["court"])
+    elif reporter == "AIR":
+        middle = "SC"  # "1973 AIR 1461" — the JUDIS form of AIR SC
+    elif groups.get("supp"):
+        middle = "SUPP" + (groups.get("suppvol") or "")
+    elif groups.get("vol"):
+        middle = str(int(groups["vol"]))
+    else:
+        middle = "-"
+    return f"{reporter} {year} {middle} {page}"
+
+
+def extract_citations(text: Optional[str]) -> List[str]:
+    """Canonical keys of every reporter citation found in `text`, in order, without duplicates."""
+    found: List[Tuple[int, str]] = []
+    for reporter, pattern in _PATTERNS:
+        for m in pattern.finditer(text or ""):
+            found.append((m.start(), _key(reporter, m)))
+    found.sort()
+    return list(dict.fromkeys(key for _, key in found))
+
+
+def parse_citation(query: Optional[str]) -> Optional[str]:
+    """The canonical key when `query` is nothing but one reporter citation, else None."""
+    query = (query or "").strip(_SEPARATORS)
+    if not query or not any(c.isdigit() for c in query):
+        return None
+    for reporter, pattern in _PATTERNS:
+        m = pattern.search(query)
+        if m and not query[:m.start()].strip(_SEPARATORS) and not query[m.end():].strip(_SEPARATORS):
+            return _key(reporter, m)
+    return None
+
+
+class CitationIndex:
+    """Process-wide citation key → document ids map, kept in step with corpus_metadata."""
+
+    def __init__(self, *, enabled: bool = _ENABLED) -> None:
+        self.enabled = enabled
+        self._documents: Dict[str, Tuple[str, ...]] = {}
+        self._version = -1
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def build(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Replace the index with one built from (citation key, document_id) pairs."""
+        documents: Dict[str, Dict[str, None]] = {}
+        for key, doc_id in pairs:
+            documents.setdefault(key, {})[doc_id] = None
+        self._documents = {key: tuple(ids) for key, ids in documents.items()}
+
+    def rebuild(self) -> None:
+        """Rebuild from the metadata snapshot and legal_citations (metadata store listener)."""
+        if not self.enabled or not corpus_metadata.ready:
+            return
+        version = corpus_metadata.version
+        if version == self._version:
+            return
+
+        t0 = time.perf_counter()
+        pairs = [
+            (key, doc_id)
+            for doc_id, citation in corpus_metadata.iter_columns("citation")
+            for key in extract_citations(citation)
+        ]
+        pairs.extend(self._load_table())
+        self.build(pairs)
+        self._version = version
+        logger.info("Citation index built: %d citations in %.2fs", len(self), time.perf_counter() - t0)
+
+    @staticmethod
+    def _load_table() -> List[Tuple[str, str]]:
+        from app.db.config import SessionLocal
+
+        db = SessionLocal()
+        try:
+            return [(key, doc_id) for key, doc_id in db.execute(_TABLE_SQL)]
+        except Exception as exc:
+            logger.warning("legal_citations not loaded (%s) — using legal_documents.citation only", exc)
+            return []
+        finally:
+            db.close()
+
+    def resolve(self, query: str) -> Optional[List[str]]:
+        """
+        Document ids for a query that is a single citation — empty when the
+        citation is unknown — or None when the query is not a citation (or
+        the index is disabled).
+        """
+        if not self.enabled:
+            return None
+        key = parse_citation(query)
+        if key is None:
+            return None
+        documents = list(self._documents.get(key, ()))
+        CITATION_LOOKUPS.labels("hit" if documents else "miss").inc()
+        return documents
+
+
+# ── Ingestion (metadata_extractor.py, scripts/citations/build_citation_index.py) ─
+
+_DELETE_SQL = text("DELETE FROM legal_citations WHERE document_id = CAST(:document_id AS uuid)")
+_INSERT_SQL = text("""
+    INSERT INTO legal_citations (citation_key, document_id, source)
+    VALUES (:citation_key, CAST(:document_id AS uuid), :source)
+    ON CONFLICT DO NOTHING
+""")
+
+
+def document_citations(citation: Optional[str], full_text: Optional[str]) -> List[Tuple[str, str]]:
+    """[(citation key, source)] of one judgment: its citation column, then its full-text header."""
+    keys = {key: "metadata" for key in extract_citations(citation)}
+    for key in extract_citations((full_text or "")[:HEADER_CHARS]):
+        keys.setdefault(key, "header")
+    return list(keys.items())
+
+
+def write_document_citations(conn, document_id: str, citation: Optional[str], full_text: Optional[str]) -> int:
+    """Replace the legal_citations rows of one document. Returns the number written."""
+    rows = [
+        {"citation_key": key, "document_id": document_id, "source": source}
+        for key, source in document_citations(citation, full_text)
+    ]
+    conn.execute(_DELETE_SQL, {"document_id": document_id})
+    if rows:
+        conn.execute(_INSERT_SQL, rows)
+    return len(rows)
+
+
+# Module-level singleton, rebuilt after every metadata refresh
+citation_index = CitationIndex()
+corpus_metadata.add_listener(citation_index.rebuild)
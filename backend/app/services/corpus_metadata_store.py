@@ -0,0 +1,333 @@
+"""
+Corpus Metadata Store — in-process, columnar copy of legal_documents metadata.
+
+Every search used to hydrate its results with a `legal_documents` lookup,
+even though the ~46k judgments change only when the ingestion pipeline runs.
+This store loads the search-relevant columns of the whole corpus once at
+startup and serves them from memory, keyed by document id.
+
+Layout (one row per document, row number found via a dict):
+  - free text (title, petitioner, respondent, citation): Python lists
+  - low-cardinality text (court, state, case_type, chunk_strategy):
+    dictionary-encoded — an int32 code array plus one shared vocabulary
+  - year, page_count: int32 arrays, -1 meaning NULL
+  - judges: tuple per row
+
+Refresh is incremental. A cheap signature query (row count, max ingested_at,
+synced count) runs every CORPUS_METADATA_REFRESH_SECONDS:
+  - unchanged               → nothing to do
+  - only new rows appended  → load rows with ingested_at > last seen
+  - anything else (a re-ingest flips qdrant_synced back to false and may
+    change chunk_strategy; deletions; clock skew) → full reload
+
+Each refresh builds a new immutable snapshot and swaps it in, so readers
+never lock. Derived in-memory indexes (case_name_index, suggest_index)
+register a listener and are rebuilt, on the refreshing thread, after every
+swap. Lookups that miss (store disabled, not loaded yet, or a brand new
+document) fall back to PostgreSQL in qdrant_search_service.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.metrics import CORPUS_METADATA_DOCUMENTS, CORPUS_METADATA_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.getenv("CORPUS_METADATA_STORE", "true").lower() == "true"
+_REFRESH_SECONDS = float(os.getenv("CORPUS_METADATA_REFRESH_SECONDS", "300"))
+
+_SELECT_COLUMNS = """
+    SELECT
+        id::text, title, petitioner, respondent, court, state,
+        year, citation, judges, case_type, page_count, chunk_strategy,
+        ingested_at
+    FROM legal_documents
+"""
+_FULL_SQL = text(_SELECT_COLUMNS)
+_DELTA_SQL = text(_SELECT_COLUMNS + " WHERE ingested_at > :since")
+_SIGNATURE_SQL = text("""
+    SELECT COUNT(*), MAX(ingested_at), COUNT(*) FILTER (WHERE qdrant_synced)
+    FROM legal_documents
+""")
+
+_NULL_INT = -1
+
+# (row count, max ingested_at, synced count)
+Signature = Tuple[int, Optional[datetime], int]
+
+
+class _Vocabulary:
+    """Dictionary encoding for one low-cardinality column (code 0 = NULL)."""
+
+    def __init__(self, values: Sequence[Optional[str]] = (None,)) -> None:
+        self.values: List[Optional[str]] = list(values)
+        self._codes: Dict[Optional[str], int] = {v: i for i, v in enumerate(self.values)}
+
+    def encode(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
+    def copy(self) -> "_Vocabulary":
+        return _Vocabulary(self.values)
+
+
+_TEXT_COLUMNS = ("title", "petitioner", "respondent", "citation")
+_CODED_COLUMNS = ("court", "state", "case_type", "chunk_strategy")
+_INT_COLUMNS = ("year", "page_count")
+
+
+class _Snapshot:
+    """Immutable columnar table of document metadata."""
+
+    def __init__(self) -> None:
+        self.row_of: Dict[str, int] = {}
+        self.text: Dict[str, List[Optional[str]]] = {c: [] for c in _TEXT_COLUMNS}
+        self.codes: Dict[str, np.ndarray] = {c: np.zeros(0, dtype=np.int32) for c in _CODED_COLUMNS}
+        self.vocab: Dict[str, _Vocabulary] = {c: _Vocabulary() for c in _CODED_COLUMNS}
+        self.ints: Dict[str, np.ndarray] = {c: np.zeros(0, dtype=np.int32) for c in _INT_COLUMNS}
+        self.judges: List[Tuple[str, ...]] = []
+        self.max_ingested_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self.judges)
+
+    def merged(self, rows: Iterable[Sequence[Any]]) -> "_Snapshot":
+        """Return a new snapshot with `rows` upserted (self is left untouched)."""
+        new = _Snapshot()
+        new.row_of = dict(self.row_of)
+        new.text = {c: list(v) for c, v in self.text.items()}
+        new.vocab = {c: v.copy() for c, v in self.vocab.items()}
+        new.judges = list(self.judges)
+        new.max_ingested_at = self.max_ingested_at
+
+        codes = {c: self.codes[c].tolist() for c in _CODED_COLUMNS}
+        ints = {c: self.ints[c].tolist() for c in _INT_COLUMNS}
+
+        for row in rows:
+            (doc_id, title, petitioner, respondent, court, state, year,
+             citation, judges, case_type, page_count, chunk_strategy, ingested_at) = row
+            values = {
+                "title": title, "petitioner": petitioner, "respondent": respondent,
+                "citation": citation, "court": court, "state": state,
+                "case_type": case_type, "chunk_strategy": chunk_strategy,
+                "year": year, "page_count": page_count,
+            }
+
+            idx = new.row_of.get(doc_id)
+            if idx is None:
+                idx = len(new.judges)
+                new.row_of[doc_id] = idx
+                new.judges.append(())
+                for c in _TEXT_COLUMNS:
+                    new.text[c].append(None)
+                for c in _CODED_COLUMNS:
+                    codes[c].append(0)
+                for c in _INT_COLUMNS:
+                    ints[c].append(_NULL_INT)
+
+            for c in _TEXT_COLUMNS:
+                new.text[c][idx] = values[c]
+            for c in _CODED_COLUMNS:
+                codes[c][idx] = new.vocab[c].encode(values[c])
+            for c in _INT_COLUMNS:
+                ints[c][idx] = _NULL_INT if values[c] is None else int(values[c])
+            new.judges[idx] = tuple(judges or ())
+
+            if ingested_at is not None and (
+                new.max_ingested_at is None or ingested_at > new.max_ingested_at
+            ):
+                new.max_ingested_at = ingested_at
+
+        new.codes = {c: np.asarray(v, dtype=np.int32) for c, v in codes.items()}
+        new.ints = {c: np.asarray(v, dtype=np.int32) for c, v in ints.items()}
+        return new
+
+    def row(self, idx: int) -> dict:
+        """Decode one row into the dict shape of qdrant_search_service._fetch_metadata_batch."""
+        record: Dict[str, Any] = {c: self.text[c][idx] for c in _TEXT_COLUMNS}
+        for c in _CODED_COLUMNS:
+            record[c] = self.vocab[c].values[self.codes[c][idx]]
+        for c in _INT_COLUMNS:
+            value = int(self.ints[c][idx])
+            record[c] = None if value == _NULL_INT else value
+        record["judges"] = list(self.judges[idx])
+        return record
+
+
+class CorpusMetadataStore:
+    """Process-wide holder of the current metadata snapshot."""
+
+    def __init__(self, *, enabled: bool = _ENABLED) -> None:
+        self.enabled = enabled
+        self._snapshot = _Snapshot()
+        self._signature: Optional[Signature] = None
+        self._refresh_lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+        self.loaded_at: Optional[float] = None
+        self.version = 0  # bumped on every snapshot swap
+
+    @property
+    def ready(self) -> bool:
+        return self.enabled and self.loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def get_many(self, document_ids: Iterable[str]) -> Tuple[Dict[str, dict], List[str]]:
+        """Return ({document_id: metadata} for known ids, [ids not in the store])."""
+        if not self.ready:
+            return {}, list(document_ids)
+
+        snapshot = self._snapshot
+        found: Dict[str, dict] = {}
+        missing: List[str] = []
+        for doc_id in document_ids:
+            idx = snapshot.row_of.get(doc_id)
+            if idx is None:
+                missing.append(doc_id)
+            else:
+                found[doc_id] = snapshot.row(idx)
+
+        if found:
+            CORPUS_METADATA_LOOKUPS.labels("hit").inc(len(found))
+        if missing:
+            CORPUS_METADATA_LOOKUPS.labels("miss").inc(len(missing))
+        return found, missing
+
+    def iter_columns(self, *columns: str) -> Iterator[Tuple[Any, ...]]:
+        """Yield (document_id, *values) of the given columns for every stored document (NULL → None)."""
+        snapshot = self._snapshot
+        readers = []
+        for c in columns:
+            if c in snapshot.text:
+                readers.append(snapshot.text[c].__getitem__)
+            elif c in snapshot.ints:
+                ints = snapshot.ints[c]
+                readers.append(lambda idx, ints=ints: None if ints[idx] == _NULL_INT else int(ints[idx]))
+            else:
+                codes, vocab = snapshot.codes[c], snapshot.vocab[c].values
+                readers.append(lambda idx, codes=codes, vocab=vocab: vocab[codes[idx]])
+        for doc_id, idx in snapshot.row_of.items():
+            yield (doc_id, *(read(idx) for read in readers))
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Call `callback()` after every snapshot swap (on the refreshing thread)."""
+        self._listeners.append(callback)
+
+    # ── Loading ───────────────────────────────────────────────────────────────
+
+    def load(self, db: Session) -> None:
+        """Full (re)load of every legal_documents row."""
+        t0 = time.perf_counter()
+        signature = self._read_signature(db)
+        rows = db.execute(_FULL_SQL).fetchall()
+        self._install(_Snapshot().merged(rows), signature)
+        logger.info(
+            "Corpus metadata store loaded %d documents in %.2fs",
+            len(self._snapshot), time.perf_counter() - t0,
+        )
+
+    def refresh(self, db: Session) -> str:
+        """
+        Bring the snapshot up to date. Returns "unchanged", "delta" or "full".
+        Concurrent callers skip while another refresh is running.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return "unchanged"
+        try:
+            if self._signature is None:
+                self.load(db)
+                return "full"
+
+            signature = self._read_signature(db)
+            if signature == self._signature:
+                return "unchanged"
+
+            old_count, old_max, old_synced = self._signature
+            new_count, new_max, new_synced = signature
+            appended = new_count - old_count
+            snapshot = self._snapshot
+
+            if (
+                appended > 0
+                and old_max is not None
+                and new_max is not None
+                and new_max > old_max
+                and new_synced >= old_synced
+            ):
+                rows = db.execute(_DELTA_SQL, {"since": old_max}).fetchall()
+                merged = snapshot.merged(rows)
+                if len(merged) == new_count:
+                    self._install(merged, signature)
+                    logger.info("Corpus metadata store: +%d documents (delta)", len(rows))
+                    return "delta"
+
+            self.load(db)
+            return "full"
+        finally:
+            self._refresh_lock.release()
+
+    def refresh_from_db(self) -> str:
+        """refresh() with a short-lived session of its own (startup / background loop)."""
+        from app.db.config import SessionLocal
+
+        db = SessionLocal()
+        try:
+            return self.refresh(db)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _read_signature(db: Session) -> Signature:
+        count, max_ingested, synced = db.execute(_SIGNATURE_SQL).fetchone()
+        return int(count or 0), max_ingested, int(synced or 0)
+
+    def _install(self, snapshot: _Snapshot, signature: Signature) -> None:
+        self._snapshot = snapshot
+        self._signature = signature
+        self.loaded_at = time.time()
+        self.version += 1
+        CORPUS_METADATA_DOCUMENTS.set(len(snapshot))
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning("Corpus metadata listener %r failed: %s", callback, exc)
+
+
+# Module-level singleton
+corpus_metadata = CorpusMetadataStore()
+
+
+async def run_refresh_loop() -> None:
+    """
+    Load the store, then keep it fresh every CORPUS_METADATA_REFRESH_SECONDS.
+    Started as a background task from the app lifespan; DB work runs in a thread.
+    """
+    if not corpus_metadata.enabled:
+        logger.info("Corpus metadata store disabled (CORPUS_METADATA_STORE=false)")
+        return
+
+    while True:
+        try:
+            await asyncio.to_thread(corpus_metadata.refresh_from_db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Corpus metadata refresh failed: %s", exc)
+        await asyncio.sleep(_REFRESH_SECONDS)
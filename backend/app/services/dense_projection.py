@@ -0,0 +1,212 @@
+"""
+Dense Projection — 768-d → 256-d PCA projection for a cheap first-stage vector.
+
+The first stage of hybrid retrieval only has to shortlist candidates, which
+all 768 dimensions are not needed for. scripts/hybrid/fit_projection.py fits
+a PCA on (a sample of) embeddings.npy and writes a directory:
+
+    manifest.json   format version, projection id, dims, explained variance, fit time
+    mean.npy        (768,) float32       — mean of the unit-normalised sample
+    components.npy  (256, 768) float32   — principal axes, one per row
+
+Chunks are stored with a second named vector, "dense_small" = the projection
+of their dense vector (hybrid_ingestor.py). A hybrid search then prefetches
+prefetch_limit × DENSE_SMALL_SHORTLIST_FACTOR candidates on "dense_small",
+and rescores that shortlist with the full "dense" vector inside the same
+query_points call (a nested Prefetch). The query-side projection is one
+(256 × 768) matmul.
+
+Versioning: the projection id is a hash of mean + components.
+recreate_collection.py stores it in the collection metadata under
+"dense_small_projection", and the search service uses "dense_small" only
+once it has verified that the id matches the loaded projection. A projection
+refitted without re-ingesting would shortlist with the wrong axes, so that
+case (and no projection or no "dense_small" vector) keeps the plain dense
+prefetch.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from app.services.chunk_text_store import _remove_tree
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+SMALL_VECTOR = "dense_small"
+METADATA_KEY = "dense_small_projection"
+
+_DEFAULT_DIR = Path(__file__).resolve().parents[2] / "data" / "dense_projection"
+DENSE_PROJECTION_DIR = Path(os.getenv("DENSE_PROJECTION_DIR", str(_DEFAULT_DIR)))
+_ENABLED = os.getenv("DENSE_SMALL_SEARCH", "true").lower() == "true"
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    x = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=-1, keepdims=True)
+    return np.divide(x, norms, out=np.zeros_like(x), where=norms > 0)
+
+
+def projection_id(mean: np.ndarray, components: np.ndarray) -> str:
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(mean, dtype=np.float32).tobytes())
+    digest.update(np.ascontiguousarray(components, dtype=np.float32).tobytes())
+    return digest.hexdigest()[:16]
+
+
+class DenseProjection:
+    """A fitted PCA projection, loaded from one projection directory."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path / "manifest.json") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"unsupported dense projection version {self.manifest.get('version')}")
+
+        self.mean = np.load(self.path / "mean.npy").astype(np.float32)
+        self.components = np.ascontiguousarray(np.load(self.path / "components.npy"), dtype=np.float32)
+        self.id = projection_id(self.mean, self.components)
+        if self.id != self.manifest.get("id"):
+            raise ValueError(f"projection files do not match manifest id {self.manifest.get('id')}")
+
+    @property
+    def dim(self) -> int:
+        return int(self.components.shape[0])
+
+    def project(self, vectors: np.ndarray) -> np.ndarray:
+        """Unit-normalised projections of one vector (dim,) or of rows (N, dim)."""
+        return _unit_rows((_unit_rows(vectors) - self.mean) @ self.components.T)
+
+
+# ── Fitting (used by scripts/hybrid/fit_projection.py) ─────────────────────────
+
+def fit_projection(vectors: np.ndarray, dim: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    PCA of the unit-normalised rows of `vectors`: (mean, components (dim × D),
+    explained variance ratio per component). Eigen-decomposition of the D × D
+    covariance, so memory does not grow with the sample size beyond the sample itself.
+    """
+    x = _unit_rows(vectors)
+    if x.ndim != 2 or dim > x.shape[1]:
+        raise ValueError(f"cannot project {x.shape} vectors to {dim} dimensions")
+    mean = x.mean(axis=0)
+    centred = x - mean
+    covariance = (centred.T @ centred) / max(1, x.shape[0] - 1)
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance.astype(np.float64))
+    order = np.argsort(eigenvalues)[::-1][:dim]
+    components = eigenvectors[:, order].T.astype(np.float32)
+    explained = (eigenvalues[order] / max(eigenvalues.sum(), 1e-12)).astype(np.float32)
+    return mean.astype(np.float32), components, explained
+
+
+def write_projection(
+    path: Path,
+    mean: np.ndarray,
+    components: np.ndarray,
+    explained: np.ndarray,
+    sample_size: int,
+) -> str:
+    """Write a projection directory (built in `<path>.tmp`, renamed into place). Returns its id."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        _remove_tree(tmp)
+    tmp.mkdir(parents=True)
+
+    pid = projection_id(mean, components)
+    np.save(tmp / "mean.npy", np.asarray(mean, dtype=np.float32))
+    np.save(tmp / "components.npy", np.asarray(components, dtype=np.float32))
+    with open(tmp / "manifest.json", "w") as f:
+        json.dump({
+            "version": FORMAT_VERSION,
+            "id": pid,
+            "input_dim": int(components.shape[1]),
+            "dim": int(components.shape[0]),
+            "explained_variance": round(float(np.sum(explained)), 6),
+            "sample_size": int(sample_size),
+            "fitted_at": int(time.time()),
+        }, f, indent=2)
+
+    if path.exists():
+        old = path.with_name(path.name + ".old")
+        if old.exists():
+            _remove_tree(old)
+        path.rename(old)
+        tmp.rename(path)
+        _remove_tree(old)
+    else:
+        tmp.rename(path)
+    return pid
+
+
+# ── Singleton accessors ────────────────────────────────────────────────────────
+
+_projection: Optional[DenseProjection] = None
+_projection_checked = False
+_active = False
+_lock = threading.Lock()
+
+
+def get_dense_projection() -> Optional[DenseProjection]:
+    """The projection at DENSE_PROJECTION_DIR, or None when none was fitted. Loaded once per process."""
+    global _projection, _projection_checked
+    if _projection_checked:
+        return _projection
+    with _lock:
+        if not _projection_checked:
+            if (DENSE_PROJECTION_DIR / "manifest.json").exists():
+                try:
+                    _projection = DenseProjection(DENSE_PROJECTION_DIR)
+                    logger.info("Dense projection %s loaded: %d → %d dims", _projection.id,
+                                _projection.components.shape[1], _projection.dim)
+                except Exception as exc:
+                    logger.warning("Dense projection at %s unusable: %s", DENSE_PROJECTION_DIR, exc)
+            _projection_checked = True
+    return _projection
+
+
+def collection_projection_id(info: Any) -> Optional[str]:
+    """Projection id a collection's "dense_small" vector was built with (None without one)."""
+    vectors = info.config.params.vectors
+    if not isinstance(vectors, dict) or SMALL_VECTOR not in vectors:
+        return None
+    return (info.config.metadata or {}).get(METADATA_KEY)
+
+
+def verify_collection(client: Any, collection_name: str) -> bool:
+    """
+    Enable the "dense_small" first stage when the collection's projection id
+    matches the loaded projection (sync client; call once at startup).
+    """
+    global _active
+    projection = get_dense_projection() if _ENABLED else None
+    if projection is None:
+        _active = False
+        return False
+    try:
+        stored = collection_projection_id(client.get_collection(collection_name))
+    except Exception as exc:
+        logger.warning("Could not read projection id of '%s': %s", collection_name, exc)
+        stored = None
+    _active = stored == projection.id
+    if _active:
+        logger.info("First-stage search on '%s' (projection %s)", SMALL_VECTOR, projection.id)
+    elif stored is not None:
+        logger.warning(
+            "'%s' was built with projection %s, loaded %s — using the full dense vector",
+            collection_name, stored, projection.id,
+        )
+    return _active
+
+
+def active_projection() -> Optional[DenseProjection]:
+    """The projection to shortlist with, once verify_collection() has matched it."""
+    return _projection if _active else None
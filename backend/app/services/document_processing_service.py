@@ -166,26 +166,22 @@ class DocumentProcessingService:
 
     @staticmethod
     def generate_summary(full_text: str) -> str:
-        import os
-        from groq import Groq
-        
+        from app.services.llm_gateway import llm_gateway
+
         truncated = full_text[:8000] if len(full_text) > 8000 else full_text
-        api_key = os.getenv("GROQ_API_KEY", "").strip().strip('"').strip("'")
-        model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-        
-        if not api_key:
+
+        if not llm_gateway.configured:
             return "Summary generation skipped (no API key configured)."
-            
+
         try:
-            client = Groq(api_key=api_key)
             prompt = (
                 "You are an expert legal analyst. Provide a brief, structured summary "
                 "of the following legal document excerpt. Highlight the main topic, "
                 "parties involved (if any), and the core issue or ruling.\n\n"
                 f"Document text:\n{truncated}"
             )
-            response = client.chat.completions.create(
-                model=model,
+            response = llm_gateway.chat(
+                operation="summary",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
                 max_tokens=300
@@ -0,0 +1,144 @@
+"""
+Embedding Dispatcher — cross-request micro-batching for query embeddings.
+
+Every search, ask and chat turn embeds exactly one short string. Run on their
+own, 30 concurrent users become 30 batch-of-one forward passes of
+all-mpnet-base-v2 fighting for the same CPU cores.
+
+The dispatcher sits between callers and the model:
+
+    caller ── submit(text) ──► queue ──► worker thread ── encode(batch) ──► futures
+
+The worker blocks for the first request, then keeps collecting for up to
+`max_wait_ms` (or until `max_batch_size` texts are queued) and runs them as a
+single `encode` call. Each caller receives its own row of the batch.
+
+Vectors are returned exactly as the encode function produces them, so callers
+that need unit-normalised vectors (Qdrant) and raw vectors (pgvector) can share
+the same batches.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.metrics import (
+    EMBED_BATCH_SECONDS,
+    EMBED_BATCH_SIZE,
+    EMBED_QUEUE_DEPTH,
+    EMBED_QUEUE_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# (text, future, enqueue time)
+_Request = Tuple[str, Future, float]
+
+
+class EmbeddingDispatcher:
+    """
+    Collects concurrent single-text embedding requests into batched encodes.
+
+    `encode_fn` receives a list of unique strings and must return an array of
+    shape (len(texts), dim). It is only ever called from the worker thread.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "query",
+    ) -> None:
+        self._encode = encode_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_s = max(0.0, float(max_wait_ms)) / 1000.0
+        self.name = name
+
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def submit(self, text: str) -> Future:
+        """Queue `text` for the next batch and return a Future for its vector."""
+        future: Future = Future()
+        self._ensure_worker()
+        self._queue.put((text, future, time.perf_counter()))
+        EMBED_QUEUE_DEPTH.labels(self.name).set(self._queue.qsize())
+        return future
+
+    def embed(self, text: str, timeout: Optional[float] = None) -> np.ndarray:
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(text).result(timeout=timeout)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    # ── Worker ────────────────────────────────────────────────────────────────
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use (and restart it if it died)."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name=f"embed-dispatcher-{self.name}",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _collect(self) -> List[_Request]:
+        """Block for one request, then gather more until the batch is full or the wait expires."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_s
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            EMBED_QUEUE_DEPTH.labels(self.name).set(self._queue.qsize())
+
+            # Drop callers that cancelled while queued
+            live = [(t, f, q) for t, f, q in batch if f.set_running_or_notify_cancel()]
+            if not live:
+                continue
+
+            started = time.perf_counter()
+            for _, _, queued_at in live:
+                EMBED_QUEUE_WAIT_SECONDS.labels(self.name).observe(started - queued_at)
+
+            # Identical strings in the same window are encoded once
+            unique_texts = list(dict.fromkeys(t for t, _, _ in live))
+            EMBED_BATCH_SIZE.labels(self.name).observe(len(unique_texts))
+
+            try:
+                vectors = self._encode(unique_texts)
+            except Exception as exc:
+                logger.error("Embedding batch of %d failed: %s", len(unique_texts), exc)
+                for _, future, _ in live:
+                    future.set_exception(exc)
+                continue
+
+            EMBED_BATCH_SECONDS.labels(self.name).observe(time.perf_counter() - started)
+
+            row_by_text = {t: vectors[i] for i, t in enumerate(unique_texts)}
+            for text_input, future, _ in live:
+                future.set_result(row_by_text[text_input])
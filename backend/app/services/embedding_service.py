@@ -8,28 +8,48 @@ Replaces the duplicate embedding code that existed in both:
 Both now import from here.
 
 Model: sentence-transformers/all-mpnet-base-v2 (768-dim, L2-normalized output)
+
+The model instance itself is owned by the process-wide ModelRegistry, so this
+module, qdrant_search_service, the agents and the legacy FAISS searcher all
+share a single copy.
+
+Single-query embeddings (embed_query) are looked up in the dense query-vector
+cache first; misses go through the EmbeddingDispatcher, which batches
+concurrent requests from every search route and agent node into one forward
+pass. Bulk document embedding (embed_texts) calls the model directly.
 """
 import logging
-from typing import List, Optional
+import os
+import threading
+from typing import List, Optional, Tuple
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+from app.services.embedding_dispatcher import EmbeddingDispatcher
+from app.services.model_registry import DENSE_MODEL_NAME, get_sentence_transformer
+from app.services.query_vector_cache import dense_cache, normalize_query
 
 logger = logging.getLogger(__name__)
 
-_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
+_MODEL_NAME = DENSE_MODEL_NAME
 _EMBEDDING_DIM = 768
-_model: Optional[SentenceTransformer] = None
+
+# Micro-batching window for query embeddings (see embedding_dispatcher.py)
+_BATCH_MAX_SIZE = int(os.getenv("EMBED_BATCH_MAX_SIZE", "32"))
+_BATCH_MAX_WAIT_MS = float(os.getenv("EMBED_BATCH_MAX_WAIT_MS", "5"))
+_dispatcher: Optional[EmbeddingDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_model():
+    """Return the shared SentenceTransformer (lazy-loaded once per process by the registry)."""
+    return get_sentence_transformer(_MODEL_NAME)
 
 
-def get_model() -> SentenceTransformer:
-    """Lazy-load the model once per process."""
-    global _model
-    if _model is None:
-        logger.info("Loading embedding model: %s", _MODEL_NAME)
-        _model = SentenceTransformer(_MODEL_NAME)
-        logger.info("Embedding model loaded (%d-dim).", _EMBEDDING_DIM)
-    return _model
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Unit-normalise a vector (or each row of a matrix); zero vectors are left as-is."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.array(vectors, dtype=np.float32), where=norms > 0)
 
 
 def embed_texts(texts: List[str], batch_size: int = 32) -> np.ndarray:
@@ -51,13 +71,70 @@ def embed_texts(texts: List[str], batch_size: int = 32) -> np.ndarray:
     return vectors.astype(np.float32)
 
 
+def get_query_dispatcher() -> EmbeddingDispatcher:
+    """Return the process-wide query-embedding dispatcher, creating it on first call."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = EmbeddingDispatcher(
+                    lambda texts: embed_texts(texts, batch_size=_BATCH_MAX_SIZE),
+                    max_batch_size=_BATCH_MAX_SIZE,
+                    max_wait_ms=_BATCH_MAX_WAIT_MS,
+                    name="query",
+                )
+    return _dispatcher
+
+
 def embed_query(text: str) -> np.ndarray:
     """
     Encode a single query string into a 768-dim float32 vector.
 
-    Returns np.ndarray of shape (768,).
+    The text is normalised (normalize_query) and served from the dense
+    query-vector cache when possible; concurrent misses are micro-batched by
+    the query dispatcher.
+
+    Returns a read-only np.ndarray of shape (768,), NOT normalised (same as
+    embed_texts). Copy it before modifying in place.
+    """
+    return dense_cache.get_or_compute(normalize_query(text), _encode_query, lambda v: v.nbytes)
+
+
+def _encode_query(key: str) -> np.ndarray:
+    vector = get_query_dispatcher().embed(key)
+    vector.setflags(write=False)  # shared through the cache
+    return vector
+
+
+def embed_queries(texts: List[str]) -> List[np.ndarray]:
+    """
+    Batch form of embed_query: one vector per text, in order.
+
+    Cache misses are queued on the dispatcher together, so up to
+    EMBED_BATCH_MAX_SIZE new queries are encoded in a single forward pass.
+    """
+    return dense_cache.get_or_compute_many(
+        [normalize_query(t) for t in texts], _encode_queries, lambda v: v.nbytes
+    )
+
+
+def _encode_queries(keys: List[str]) -> List[np.ndarray]:
+    dispatcher = get_query_dispatcher()
+    futures = [dispatcher.submit(key) for key in keys]
+    vectors = [future.result() for future in futures]
+    for vector in vectors:
+        vector.setflags(write=False)
+    return vectors
+
+
+def embed_query_pair(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (raw, unit-normalised) vectors for `text` from ONE forward pass.
+
+    For callers that feed both pgvector (raw) and Qdrant / FAISS (normalised).
     """
-    return embed_texts([text])[0]
+    raw = embed_query(text)
+    return raw, l2_normalize(raw)
 
 
 EMBEDDING_DIM = _EMBEDDING_DIM
@@ -0,0 +1,128 @@
+"""
+Index Generation — the version of the search indexes behind the result cache.
+
+search_coalescer reuses search results for a few seconds. corpus_metadata's
+version alone does not say when those results go stale: it only moves with
+the legal_documents signature (row count, max ingested_at, synced count), so
+re-embedding or re-upserting points into an existing collection, or a payload
+back-fill such as build_statute_index.py, leaves it unchanged. This module
+tracks the collection itself:
+
+  generation   search_index_generations.generation per collection — bumped
+               by the ingestion scripts (bump_index_generation) after they
+               write points or payloads
+  points       points_count of QDRANT_COLLECTION — also catches writes made
+               outside those scripts (recreate_collection.py, manual deletes)
+
+Both are read every SEARCH_INDEX_VERSION_SECONDS (default 5, well below the
+result cache TTL). When the fingerprint changes, `version` is bumped and the
+listeners run. A failed read keeps the last fingerprint.
+
+The FAISS index behind /api/v1/cases/search is loaded once per process, so it
+only changes with a restart, which starts with an empty cache anyway.
+"""
+import asyncio
+import logging
+import os
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = float(os.getenv("SEARCH_INDEX_VERSION_SECONDS", "5"))
+
+_GENERATIONS_SQL = text("""
+    SELECT collection, generation
+    FROM search_index_generations
+    ORDER BY collection
+""")
+
+_BUMP_SQL = text("""
+    INSERT INTO search_index_generations (collection, generation, updated_at)
+    VALUES (:collection, 1, now())
+    ON CONFLICT (collection) DO UPDATE
+    SET generation = search_index_generations.generation + 1, updated_at = now()
+""")
+
+# ((collection, generation), ...), points_count
+Fingerprint = Tuple[Tuple[Tuple[str, int], ...], Optional[int]]
+
+
+def bump_index_generation(conn, collection: str) -> None:
+    """Mark `collection` as changed (ingestion scripts; `conn` is a connection in a transaction)."""
+    conn.execute(_BUMP_SQL, {"collection": collection})
+
+
+class IndexGeneration:
+    """Polled fingerprint of the search collection; `version` moves whenever it changes."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._fingerprint: Optional[Fingerprint] = None
+        self._listeners: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Run `callback` (on the polling thread) after every version change."""
+        self._listeners.append(callback)
+
+    def update(self, fingerprint: Fingerprint) -> bool:
+        """Record a freshly read fingerprint; True (and listeners run) if it changed."""
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return False
+            if self._fingerprint is not None:
+                logger.info("Search index changed: %s → %s", self._fingerprint, fingerprint)
+            self._fingerprint = fingerprint
+            self.version += 1
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning("Index generation listener %r failed: %s", callback, exc)
+        return True
+
+    def refresh(self, db: Session, client) -> bool:
+        """Read the generations table and the collection's point count, then update()."""
+        from app.services.qdrant_search_service import QDRANT_COLLECTION
+
+        generations = tuple((row[0], int(row[1])) for row in db.execute(_GENERATIONS_SQL).fetchall())
+        points = client.get_collection(QDRANT_COLLECTION).points_count
+        return self.update((generations, points))
+
+    def refresh_from_sources(self) -> bool:
+        """refresh() with a short-lived session and the shared Qdrant client."""
+        from app.db.config import SessionLocal
+        from app.services.qdrant_search_service import _get_qdrant_client
+
+        db = SessionLocal()
+        try:
+            return self.refresh(db, _get_qdrant_client())
+        finally:
+            db.close()
+
+
+# Module-level singleton
+index_generation = IndexGeneration()
+
+
+async def run_poll_loop() -> None:
+    """
+    Keep index_generation current every SEARCH_INDEX_VERSION_SECONDS.
+    Started as a background task from the app lifespan; the reads run in a thread.
+    """
+    if _POLL_SECONDS <= 0:
+        logger.info("Search index version polling disabled (SEARCH_INDEX_VERSION_SECONDS=0)")
+        return
+
+    while True:
+        try:
+            await asyncio.to_thread(index_generation.refresh_from_sources)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Search index version check failed: %s", exc)
+        await asyncio.sleep(_POLL_SECONDS)
@@ -0,0 +1,385 @@
+"""
+LLM Gateway — the one place the backend talks to Groq.
+
+Every agent node and the document summariser used to build a fresh
+Groq(api_key=...) per call: a new connection pool and TLS handshake on every
+turn, and nothing between a burst of chat turns and the provider's rate
+limits. Calls now go through llm_gateway.chat() / llm_gateway.stream_chat():
+
+  client        one long-lived Groq client per process on a pooled
+                httpx.Client (LLM_MAX_CONNECTIONS). SDK retries are off —
+                the gateway retries itself.
+  concurrency   a semaphore per model (LLM_MAX_CONCURRENCY calls in flight).
+  token budget  a token bucket per model (LLM_TOKENS_PER_MINUTE, 0 = off).
+                A call reserves its prompt estimate + max_tokens before it is
+                sent and is refunded the unused part once usage is known.
+  retries       429, 5xx, connection errors and timeouts are retried up to
+                LLM_MAX_RETRIES times with full-jitter exponential backoff
+                (LLM_RETRY_BASE_SECONDS); a Retry-After header wins. A stream
+                is only retried before its first chunk.
+  breaker       LLM_CIRCUIT_FAILURES consecutive failed calls open the
+                model's circuit for LLM_CIRCUIT_RESET_SECONDS. Calls then fail
+                fast with LLMUnavailableError until one trial call closes it.
+                A stream counts once it has been read to the end: one that
+                breaks off part-way is a failed call.
+
+The gateway is synchronous on purpose. Every caller is sync code on a worker
+thread: the agent nodes run in LangGraph's executor (tokens reach the event
+loop through app/agents/streaming.py) and summaries run in the Celery worker.
+Nothing calls Groq from the event loop, so an AsyncGroq twin would have no
+caller. The per-model semaphore bounds how many of those threads wait on
+Groq at once.
+
+Latency, retries and prompt/completion tokens are exported per model and
+operation. GROQ_BASE_URL points the client elsewhere — a proxy, or the fake
+server in tests/test_llm_gateway.py.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+from groq import APIConnectionError, APIStatusError, Groq
+
+from app.core.metrics import LLM_REQUEST_SECONDS, LLM_RETRIES, LLM_TOKENS
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MODEL = "llama-3.3-70b-versatile"
+_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "32"))
+_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+_RETRY_BASE_SECONDS = float(os.getenv("LLM_RETRY_BASE_SECONDS", "0.5"))
+_CIRCUIT_FAILURES = int(os.getenv("LLM_CIRCUIT_FAILURES", "5"))
+_CIRCUIT_RESET_SECONDS = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30"))
+_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+
+
+class LLMUnavailableError(RuntimeError):
+    """The model's circuit is open — the provider has been failing."""
+
+
+def _env(name: str) -> str:
+    return os.getenv(name, "").strip().strip('"').strip("'")
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int) -> int:
+    """Budget reservation for one call: ~4 characters per prompt token + max_tokens."""
+    chars = sum(len(str(m.get("content") or "")) for m in messages)
+    return chars // 4 + max_tokens
+
+
+def _retryable(exc: Exception) -> bool:
+    # APITimeoutError is an APIConnectionError
+    if isinstance(exc, APIConnectionError):
+        return True
+    return isinstance(exc, APIStatusError) and (exc.status_code == 429 or exc.status_code >= 500)
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    if not isinstance(exc, APIStatusError):
+        return None
+    try:
+        return max(0.0, float(exc.response.headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+class _TokenBudget:
+    """Token bucket refilled at per_minute / 60 tokens a second (per_minute <= 0 → unlimited)."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.per_minute = per_minute
+        self._tokens = float(per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.per_minute, self._tokens + (now - self._updated) * self.per_minute / 60.0)
+        self._updated = now
+
+    def reserve(self, tokens: int) -> None:
+        """Block until `tokens` (capped at one minute's budget) are available, then take them."""
+        if self.per_minute <= 0:
+            return
+        tokens = min(tokens, self.per_minute)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) * 60.0 / self.per_minute
+            time.sleep(wait)
+
+    def refund(self, tokens: int) -> None:
+        if self.per_minute <= 0 or tokens <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.per_minute, self._tokens + tokens)
+
+
+class _Circuit:
+    """Consecutive-failure circuit breaker with a single half-open trial call."""
+
+    def __init__(self, model: str, failures: int, reset_seconds: float) -> None:
+        self.model = model
+        self.failures = failures
+        self.reset_seconds = reset_seconds
+        self._consecutive = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._trial or time.monotonic() - self._opened_at < self.reset_seconds:
+                raise LLMUnavailableError(f"LLM circuit for {self.model} is open")
+            self._trial = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("LLM circuit for %s closed", self.model)
+            self._consecutive = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive += 1
+            self._trial = False
+            if self._consecutive >= self.failures:
+                if self._opened_at is None:
+                    logger.warning("LLM circuit for %s opened after %d failed calls", self.model, self._consecutive)
+                self._opened_at = time.monotonic()
+
+
+class _ModelLimits:
+    def __init__(self, model: str, concurrency: int, tokens_per_minute: int, failures: int, reset_seconds: float):
+        self.semaphore = threading.BoundedSemaphore(max(1, concurrency))
+        self.budget = _TokenBudget(tokens_per_minute)
+        self.circuit = _Circuit(model, failures, reset_seconds)
+
+
+class _Call:
+    """Bookkeeping of one gateway call."""
+
+    def __init__(self, operation: str, model: str, limits: _ModelLimits, reserved: int) -> None:
+        self.operation = operation
+        self.model = model
+        self.limits = limits
+        self.reserved = reserved
+        self.used: Optional[int] = None
+        self.outcome = "error"
+
+    def record_usage(self, usage: Any) -> None:
+        if usage is None:
+            return
+        prompt = int(getattr(usage, "prompt_tokens", 0) or 0)
+        completion = int(getattr(usage, "completion_tokens", 0) or 0)
+        LLM_TOKENS.labels(self.model, "prompt").inc(prompt)
+        LLM_TOKENS.labels(self.model, "completion").inc(completion)
+        self.used = prompt + completion
+
+
+class LLMGateway:
+    """Process-wide Groq access: pooled client, per-model limits, retries, circuit breaker."""
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_connections: int = _MAX_CONNECTIONS,
+        max_concurrency: int = _MAX_CONCURRENCY,
+        tokens_per_minute: int = _TOKENS_PER_MINUTE,
+        max_retries: int = _MAX_RETRIES,
+        retry_base_seconds: float = _RETRY_BASE_SECONDS,
+        circuit_failures: int = _CIRCUIT_FAILURES,
+        circuit_reset_seconds: float = _CIRCUIT_RESET_SECONDS,
+        timeout_seconds: float = _TIMEOUT_SECONDS,
+    ) -> None:
+        # Key and URL are read when the client is first built, after .env is loaded
+        self._api_key = api_key
+        self._base_url = base_url
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.circuit_failures = circuit_failures
+        self.circuit_reset_seconds = circuit_reset_seconds
+        self.timeout_seconds = timeout_seconds
+        self._client: Optional[Groq] = None
+        self._limits: Dict[str, _ModelLimits] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def default_model(self) -> str:
+        return os.getenv("GROQ_MODEL", _DEFAULT_MODEL)
+
+    @property
+    def configured(self) -> bool:
+        return bool(self._api_key or _env("GROQ_API_KEY"))
+
+    @property
+    def client(self) -> Groq:
+        """The shared Groq client (built on first use). ValueError when no API key is set."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    api_key = self._api_key or _env("GROQ_API_KEY")
+                    if not api_key:
+                        raise ValueError("GROQ_API_KEY is not set.")
+                    http_client = httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections,
+                        ),
+                        timeout=self.timeout_seconds,
+                    )
+                    self._client = Groq(
+                        api_key=api_key,
+                        base_url=self._base_url or _env("GROQ_BASE_URL") or None,
+                        max_retries=0,
+                        timeout=self.timeout_seconds,
+                        http_client=http_client,
+                    )
+        return self._client
+
+    def _model_limits(self, model: str) -> _ModelLimits:
+        limits = self._limits.get(model)
+        if limits is None:
+            with self._lock:
+                limits = self._limits.setdefault(model, _ModelLimits(
+                    model, self.max_concurrency, self.tokens_per_minute,
+                    self.circuit_failures, self.circuit_reset_seconds,
+                ))
+        return limits
+
+    # ── Calls ──────────────────────────────────────────────────────────────────
+
+    def chat(
+        self,
+        *,
+        operation: str,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Chat completion (the SDK's ChatCompletion). `operation` labels the
+        metrics ("classifier", "summary", ...); other kwargs go to the SDK.
+        """
+        model = model or self.default_model
+        with self._admitted(operation, model, messages, max_tokens) as call:
+            response = self._create(call, dict(model=model, messages=messages, max_tokens=max_tokens, **kwargs))
+            call.record_usage(getattr(response, "usage", None))
+            call.outcome = "ok"
+            return response
+
+    def stream_chat(
+        self,
+        *,
+        operation: str,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """
+        Streaming chat completion: yields the SDK's ChatCompletionChunks. The
+        concurrency slot is held until the stream is exhausted or closed.
+        """
+        model = model or self.default_model
+        with self._admitted(operation, model, messages, max_tokens) as call:
+            circuit = call.limits.circuit
+            stream = self._create(call, dict(
+                model=model, messages=messages, max_tokens=max_tokens, stream=True, **kwargs,
+            ), opened_is_success=False)
+            try:
+                for chunk in stream:
+                    x_groq = getattr(chunk, "x_groq", None)
+                    call.record_usage(getattr(chunk, "usage", None) or getattr(x_groq, "usage", None))
+                    yield chunk
+            except GeneratorExit:
+                # Closed early by the consumer — the provider was answering
+                circuit.record_success()
+                raise
+            except Exception:
+                circuit.record_failure()
+                raise
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+            circuit.record_success()
+            call.outcome = "ok"
+
+    @contextmanager
+    def _admitted(self, operation: str, model: str, messages: List[Dict[str, Any]], max_tokens: int):
+        """Circuit check, token reservation and concurrency slot around one call."""
+        limits = self._model_limits(model)
+        call = _Call(operation, model, limits, _estimate_tokens(messages, max_tokens))
+        started = time.perf_counter()
+        try:
+            limits.circuit.before_call()
+        except LLMUnavailableError:
+            LLM_REQUEST_SECONDS.labels(model, operation, "rejected").observe(0.0)
+            raise
+        limits.budget.reserve(call.reserved)
+        try:
+            with limits.semaphore:
+                yield call
+        finally:
+            limits.budget.refund(call.reserved - (call.used or call.reserved))
+            LLM_REQUEST_SECONDS.labels(model, operation, call.outcome).observe(time.perf_counter() - started)
+
+    def _create(self, call: _Call, request: Dict[str, Any], opened_is_success: bool = True) -> Any:
+        """
+        client.chat.completions.create with jittered retries; feeds the circuit
+        breaker. With opened_is_success=False (streams) the caller records the
+        success once the response has been read.
+        """
+        circuit = call.limits.circuit
+        attempt = 0
+        while True:
+            try:
+                result = self.client.chat.completions.create(**request)
+            except Exception as exc:
+                if not _retryable(exc):
+                    # The provider answered (e.g. 400) — not a reason to open the circuit
+                    circuit.record_success()
+                    raise
+                if attempt >= self.max_retries:
+                    circuit.record_failure()
+                    raise
+                delay = _retry_after(exc)
+                if delay is None:
+                    delay = random.uniform(0, self.retry_base_seconds * 2 ** attempt)
+                attempt += 1
+                LLM_RETRIES.labels(call.model, call.operation).inc()
+                logger.warning(
+                    "LLM %s call failed (%s), retry %d/%d in %.2fs",
+                    call.operation, exc, attempt, self.max_retries, delay,
+                )
+                time.sleep(delay)
+                continue
+            if opened_is_success:
+                circuit.record_success()
+            return result
+
+
+# Module-level singleton — the client is built on first use
+llm_gateway = LLMGateway()
@@ -0,0 +1,159 @@
+"""
+Model Registry — one process-wide home for every ML model JurisFind loads.
+
+Before this module the API process could hold up to three copies of
+all-mpnet-base-v2 (~500 MB each): one in qdrant_search_service, one in
+embedding_service and one inside the legacy FAISS LegalCaseSearcher.
+Every caller now asks the registry, which:
+
+  - lazily loads each model on first request,
+  - guarantees a model is loaded at most once, even when several threads
+    ask for it at the same time (per-model lock, double-checked),
+  - remembers how much memory each model took so /api/system/models can
+    report it.
+
+Usage:
+    from app.services.model_registry import get_sentence_transformer
+    model = get_sentence_transformer()          # all-mpnet-base-v2
+"""
+import logging
+import os
+import resource
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DENSE_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
+SPARSE_MODEL_NAME = "Qdrant/bm25"
+
+
+@dataclass
+class LoadedModel:
+    """Bookkeeping for one registry entry."""
+
+    name: str
+    kind: str
+    instance: Any
+    load_seconds: float
+    rss_delta_bytes: Optional[int]
+
+
+def _process_rss_bytes() -> Optional[int]:
+    """Current resident set size of this process (Linux /proc, else peak RSS)."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        try:
+            # ru_maxrss is KiB on Linux — only a peak, but better than nothing
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        except Exception:
+            return None
+
+
+def _tensor_bytes(instance: Any) -> Optional[int]:
+    """Parameter + buffer bytes for torch modules; None for anything else."""
+    params = getattr(instance, "parameters", None)
+    buffers = getattr(instance, "buffers", None)
+    if not callable(params):
+        return None
+    total = sum(p.numel() * p.element_size() for p in params())
+    if callable(buffers):
+        total += sum(b.numel() * b.element_size() for b in buffers())
+    return total
+
+
+class ModelRegistry:
+    """Thread-safe, lazily-populated map of model name → loaded instance."""
+
+    def __init__(self) -> None:
+        self._models: Dict[str, LoadedModel] = {}
+        self._guard = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, name: str, loader: Callable[[], Any], *, kind: str = "model") -> Any:
+        """Return the model registered under `name`, calling `loader()` once if needed."""
+        entry = self._models.get(name)
+        if entry is not None:
+            return entry.instance
+
+        with self._guard:
+            key_lock = self._key_locks.setdefault(name, threading.Lock())
+
+        with key_lock:
+            entry = self._models.get(name)
+            if entry is not None:
+                return entry.instance
+
+            logger.info("Loading %s model: %s", kind, name)
+            rss_before = _process_rss_bytes()
+            t0 = time.perf_counter()
+            instance = loader()
+            elapsed = time.perf_counter() - t0
+            rss_after = _process_rss_bytes()
+
+            rss_delta = None
+            if rss_before is not None and rss_after is not None:
+                rss_delta = max(0, rss_after - rss_before)
+
+            self._models[name] = LoadedModel(
+                name=name,
+                kind=kind,
+                instance=instance,
+                load_seconds=elapsed,
+                rss_delta_bytes=rss_delta,
+            )
+            logger.info("Loaded %s model %s in %.1fs", kind, name, elapsed)
+            return instance
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def report(self) -> List[dict]:
+        """Describe every loaded model and its memory footprint."""
+        return [
+            {
+                "name": entry.name,
+                "kind": entry.kind,
+                "tensor_bytes": _tensor_bytes(entry.instance),
+                "rss_delta_bytes": entry.rss_delta_bytes,
+                "load_seconds": round(entry.load_seconds, 3),
+            }
+            for entry in list(self._models.values())
+        ]
+
+
+# Module-level singleton — shared by every service in the process
+registry = ModelRegistry()
+
+
+def get_sentence_transformer(name: str = DENSE_MODEL_NAME):
+    """Return the shared SentenceTransformer for `name` (default all-mpnet-base-v2)."""
+
+    def _load():
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(name)
+
+    return registry.get(name, _load, kind="dense")
+
+
+def get_sparse_model(name: str = SPARSE_MODEL_NAME):
+    """Return the shared FastEmbed sparse model (default Qdrant/bm25)."""
+
+    def _load():
+        from fastembed import SparseTextEmbedding
+        return SparseTextEmbedding(model_name=name)
+
+    return registry.get(name, _load, kind="sparse")
+
+
+def memory_report() -> dict:
+    """Loaded models plus the process-wide resident set size."""
+    return {
+        "process_rss_bytes": _process_rss_bytes(),
+        "models": registry.report(),
+    }
@@ -4,12 +4,25 @@ JurisFind — Qdrant Search Service
 Core search layer that replaces the legacy FAISS-based search_service.py.
 
 Responsibilities:
-  - Embed queries using sentence-transformers/all-mpnet-base-v2 (loaded once)
+  - Embed queries using sentence-transformers/all-mpnet-base-v2 (shared with
+    embedding_service and micro-batched across requests by its dispatcher)
   - Query Qdrant collection "legal_corpus" with optional payload filters
-  - Group chunk-level Qdrant results by document_id
-  - Hydrate results with full metadata from PostgreSQL (legal_documents + legal_chunks)
+  - Shortlist on the 256-d "dense_small" PCA vector and rescore with the full
+    dense vector in the same query, when a verified projection is loaded
+  - Pick per-query HNSW parameters from filter selectivity (search_planner:
+    exact search for tiny filtered sets, a wider hnsw_ef for selective ones)
+  - Group chunk-level hits by document_id server-side (Qdrant group-by query),
+    so every search returns exactly top_k unique cases
+  - Hydrate results with case metadata (in-process corpus_metadata_store, falling
+    back to legal_documents) and chunk texts (memory-mapped chunk_text_store,
+    falling back to legal_chunks)
   - Provide case-name search, similar-case discovery, and RAG context fetch
 
+The module-level helpers (query builders, SQL, grouping and assembly) do no
+I/O of their own, so the same pipeline is shared by this synchronous service
+and AsyncQdrantSearchService (async_qdrant_search_service.py), which serves
+the /api/search routes.
+
 This service touches ONLY the legal_documents and legal_chunks tables.
 It does NOT touch users, assistant_sessions, messages, documents, document_chunks,
 or document_embeddings.
@@ -20,11 +33,10 @@ from __future__ import annotations
 import logging
 import os
 import time
-from collections import defaultdict
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
-from fastembed import SparseTextEmbedding
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     FieldCondition,
@@ -33,23 +45,40 @@ from qdrant_client.models import (
     FusionQuery,
     MatchText,
     MatchValue,
+    PointGroup,
     Prefetch,
+    QueryRequest,
     Range,
     ScoredPoint,
+    SearchParams,
     SparseVector,
 )
-from sentence_transformers import SentenceTransformer
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.timing import StageTimer
 from app.schemas.search_schemas import (
     AskResponse,
+    BatchSearchResponse,
     CaseDetailResponse,
     CaseResult,
     ChunkResult,
+    SearchRequest,
     SearchResponse,
     SimilarCasesResponse,
+    StatuteSearchResponse,
 )
+from app.services.case_name_index import case_name_index
+from app.services.citation_resolver import citation_index
+from app.services.chunk_text_store import lookup_chunk_texts
+from app.services.corpus_metadata_store import corpus_metadata
+from app.services.dense_projection import SMALL_VECTOR, active_projection, verify_collection
+from app.services.embedding_service import embed_queries, embed_query, get_model, l2_normalize
+from app.services.model_registry import get_sparse_model
+from app.services.query_vector_cache import normalize_query, sparse_cache
+from app.services.search_planner import SearchPlan, search_planner
+from app.services.similar_graph import get_similar_graph
+from app.services.statute_index import STATUTE_DOCUMENTS_SQL, parse_statute
 
 logger = logging.getLogger(__name__)
 
@@ -57,37 +86,39 @@ logger = logging.getLogger(__name__)
 QDRANT_HOST: str = os.getenv("QDRANT_HOST", "localhost")
 QDRANT_PORT: int = int(os.getenv("QDRANT_PORT", "6333"))
 QDRANT_COLLECTION: str = os.getenv("QDRANT_COLLECTION", "legal_corpus")
-EMBEDDING_MODEL: str = "sentence-transformers/all-mpnet-base-v2"
 
-# Fetch more raw chunks than top_k documents so we have enough to group
+# One unit-normalised chunk-centroid per document, point id = document_id
+# (built by scripts/centroids/build_doc_centroids.py)
+QDRANT_DOC_COLLECTION: str = os.getenv("QDRANT_DOC_COLLECTION", "legal_corpus_docs")
+
+# Keyword-mode candidate pool per requested document in batch searches (hybrid
+# prefetch pools come from the SearchPlan; see search_planner.prefetch_limit)
 _CHUNK_FETCH_MULTIPLIER: int = 10
 
+# Chunks returned per document group (CaseResult.all_chunks)
+_GROUP_SIZE: int = max(1, int(os.getenv("QDRANT_GROUP_SIZE", "3")))
 
-# ── Module-level singletons (loaded once at first use) ─────────────────────────
+# Chunk inclusion modes for CaseResult (SearchRequest.chunks):
+#   all  — top_chunk + up to _GROUP_SIZE chunks in all_chunks (default)
+#   top  — top_chunk only, all_chunks empty
+#   none — metadata only; no chunk text is read at all
 
-_embedding_model: Optional[SentenceTransformer] = None
-_bm25_model: Optional[SparseTextEmbedding] = None
-_qdrant_client: Optional[QdrantClient] = None
+# Payload fields needed to build results — titles, parties etc. come from Postgres
+_HIT_PAYLOAD: List[str] = ["document_id", "chunk_id", "chunk_index", "section_type"]
 
+# Page size when scrolling a document's chunk vectors (similar-case centroid)
+_SCROLL_PAGE_SIZE: int = 200
 
-def _get_embedding_model() -> SentenceTransformer:
-    """Return the cached SentenceTransformer, loading it on first call."""
-    global _embedding_model
-    if _embedding_model is None:
-        logger.info("Loading dense embedding model: %s", EMBEDDING_MODEL)
-        _embedding_model = SentenceTransformer(EMBEDDING_MODEL)
-        logger.info("Dense embedding model loaded (dim=%d)", _embedding_model.get_sentence_embedding_dimension())
-    return _embedding_model
 
+# ── Module-level singletons (loaded once at first use) ─────────────────────────
+# Dense and BM25 models live in app.services.model_registry; only the client is local.
+
+_qdrant_client: Optional[QdrantClient] = None
 
-def _get_bm25_model() -> SparseTextEmbedding:
-    """Return the cached FastEmbed BM25 model, loading it on first call."""
-    global _bm25_model
-    if _bm25_model is None:
-        logger.info("Loading BM25 sparse model (fastembed) ...")
-        _bm25_model = SparseTextEmbedding(model_name="Qdrant/bm25")
-        logger.info("BM25 model loaded.")
-    return _bm25_model
+
+def _get_bm25_model():
+    """Return the shared FastEmbed BM25 model (loaded once by the model registry)."""
+    return get_sparse_model()
 
 
 def _get_qdrant_client() -> QdrantClient:
@@ -102,23 +133,62 @@ def _get_qdrant_client() -> QdrantClient:
 # ── Internal helpers ───────────────────────────────────────────────────────────
 
 def _embed(text_input: str) -> List[float]:
-    """Embed a single string into a dense vector (unit-normalised float list)."""
-    model = _get_embedding_model()
-    vec = model.encode([text_input], normalize_embeddings=True)
-    return vec[0].tolist()
+    """
+    Embed a single string into a dense vector (unit-normalised float list).
+
+    Served from the dense query-vector cache when possible; misses go through
+    the shared query dispatcher so concurrent searches are encoded in one
+    batch. Normalisation happens here, per caller.
+    """
+    return l2_normalize(embed_query(text_input)).tolist()
 
 
 def _embed_sparse(text_input: str) -> SparseVector:
-    """Embed a single string into a BM25 sparse vector for Qdrant."""
+    """
+    Embed a single string into a BM25 sparse vector for Qdrant.
+
+    Served from the sparse query-vector cache when possible. The returned
+    SparseVector is shared — do not mutate it.
+    """
+    return sparse_cache.get_or_compute(
+        normalize_query(text_input),
+        _encode_sparse,
+        lambda v: len(v.indices) * 16,
+    )
+
+
+def _encode_sparse(key: str) -> SparseVector:
     model = _get_bm25_model()
-    result = list(model.query_embed(text_input))
-    sparse = result[0]
+    sparse = next(iter(model.query_embed(key)))
     return SparseVector(
         indices=sparse.indices.tolist(),
         values=sparse.values.tolist(),
     )
 
 
+def _embed_many(texts: List[str]) -> List[List[float]]:
+    """Batch form of _embed: cache misses share one dispatcher forward pass."""
+    if not texts:
+        return []
+    return l2_normalize(np.stack(embed_queries(texts))).tolist()
+
+
+def _embed_sparse_many(texts: List[str]) -> List[SparseVector]:
+    """Batch form of _embed_sparse: cache misses share one BM25 pass."""
+    return sparse_cache.get_or_compute_many(
+        [normalize_query(t) for t in texts],
+        _encode_sparse_many,
+        lambda v: len(v.indices) * 16,
+    )
+
+
+def _encode_sparse_many(keys: List[str]) -> List[SparseVector]:
+    return [
+        SparseVector(indices=sparse.indices.tolist(), values=sparse.values.tolist())
+        for sparse in _get_bm25_model().query_embed(keys)
+    ]
+
+
 def _build_filter(
     court: Optional[str] = None,
     year_min: Optional[int] = None,
@@ -126,6 +196,7 @@ def _build_filter(
     state: Optional[str] = None,
     case_type: Optional[str] = None,
     section_type: Optional[str] = None,
+    statute: Optional[str] = None,
 ) -> Optional[Filter]:
     """Build a Qdrant Filter from optional field constraints."""
     conditions = []
@@ -138,6 +209,10 @@ def _build_filter(
         conditions.append(FieldCondition(key="case_type", match=MatchValue(value=case_type)))
     if section_type:
         conditions.append(FieldCondition(key="section_type", match=MatchValue(value=section_type)))
+    if statute:
+        # "Section 302 IPC" → "IPC:302"; matches chunks whose statute_keys list contains it
+        key = parse_statute(statute) or statute
+        conditions.append(FieldCondition(key="statute_keys", match=MatchValue(value=key)))
 
     if year_min is not None or year_max is not None:
         conditions.append(
@@ -155,35 +230,272 @@ def _build_filter(
     return Filter(must=conditions)
 
 
-def _fetch_metadata_batch(db: Session, document_ids: List[str]) -> Dict[str, dict]:
+def _document_filter(document_id: str) -> Filter:
+    """Filter matching every chunk of a single document."""
+    return Filter(
+        must=[
+            FieldCondition(
+                key="document_id",
+                match=MatchValue(value=document_id),
+            )
+        ]
+    )
+
+
+def _exclude_document_filter(document_id: str) -> Filter:
+    """Filter excluding every chunk of a single document."""
+    return Filter(
+        must_not=[
+            FieldCondition(
+                key="document_id",
+                match=MatchValue(value=document_id),
+            )
+        ]
+    )
+
+
+def _case_name_filter(case_name: str) -> Filter:
+    """Filter: title payload must contain the query text."""
+    return Filter(
+        must=[
+            FieldCondition(
+                key="title",
+                match=MatchText(text=case_name),
+            )
+        ]
+    )
+
+
+# ── Qdrant request builders (keyword arguments for the client) ─────────────────
+
+def _group_size(chunks: str) -> int:
+    """Hits needed per document: only the best one unless all_chunks is returned."""
+    return _GROUP_SIZE if chunks == "all" else 1
+
+
+def _grouped(query: Dict[str, Any], top_k: int, chunks: str = "all") -> Dict[str, Any]:
     """
-    Fetch legal_documents metadata for a list of document UUIDs in one query.
-    Returns a dict keyed by document_id (str).
+    Turn query_points() arguments into query_points_groups() arguments:
+    top_k distinct documents, up to _GROUP_SIZE best chunks each (one when
+    the caller does not want all_chunks).
     """
-    if not document_ids:
-        return {}
+    return dict(query, group_by="document_id", group_size=_group_size(chunks), limit=top_k)
+
+
+def _search_query(
+    search_mode: str,
+    dense_vec: Optional[List[float]],
+    sparse_vec: SparseVector,
+    qdrant_filter: Optional[Filter],
+    top_k: int,
+    chunks: str = "all",
+    plan: Optional[SearchPlan] = None,
+) -> Dict[str, Any]:
+    """
+    query_points_groups() arguments for search(): BM25-only for keyword,
+    else hybrid RRF with the prefetch limit and dense search parameters of
+    `plan` (search_planner defaults when not given).
+    """
+    if search_mode == "keyword":
+        query = dict(
+            collection_name=QDRANT_COLLECTION,
+            query=sparse_vec,
+            using="sparse",
+            query_filter=qdrant_filter,
+            with_payload=_HIT_PAYLOAD,
+        )
+    else:
+        plan = plan or search_planner.plan(top_k)
+        query = _hybrid_query(
+            dense_vec,
+            sparse_vec,
+            qdrant_filter,
+            prefetch_limit=plan.prefetch_limit,
+            limit=top_k,
+            search_params=plan.search_params,
+            small_vec=_small_vector(dense_vec, plan),
+            shortlist_limit=plan.shortlist_limit,
+        )
+    return _grouped(query, top_k, chunks)
+
+
+def _small_vector(dense_vec: Optional[List[float]], plan: SearchPlan) -> Optional[List[float]]:
+    """The "dense_small" projection of a query vector when `plan` shortlists on it."""
+    projection = active_projection()
+    if dense_vec is None or projection is None or plan.first_stage != SMALL_VECTOR:
+        return None
+    return projection.project(np.asarray(dense_vec, dtype=np.float32)).tolist()
+
+
+def _hybrid_query(
+    dense_vec: List[float],
+    sparse_vec: SparseVector,
+    qdrant_filter: Optional[Filter],
+    *,
+    prefetch_limit: int,
+    limit: int,
+    search_params: Optional[SearchParams] = None,
+    small_vec: Optional[List[float]] = None,
+    shortlist_limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Dense + BM25 prefetches fused with Reciprocal Rank Fusion (`search_params`
+    tunes the dense one). With `small_vec`, the dense prefetch shortlists
+    `shortlist_limit` points on "dense_small" and rescores them with the full
+    dense vector.
+    """
+    if small_vec is not None:
+        dense_prefetch = Prefetch(
+            prefetch=Prefetch(
+                query=small_vec,
+                using=SMALL_VECTOR,
+                filter=qdrant_filter,
+                params=search_params,
+                limit=shortlist_limit or prefetch_limit,
+            ),
+            query=dense_vec,
+            using="dense",
+            limit=prefetch_limit,
+        )
+    else:
+        dense_prefetch = Prefetch(
+            query=dense_vec,
+            using="dense",
+            filter=qdrant_filter,
+            params=search_params,
+            limit=prefetch_limit,
+        )
+    return dict(
+        collection_name=QDRANT_COLLECTION,
+        prefetch=[
+            dense_prefetch,
+            Prefetch(
+                query=sparse_vec,
+                using="sparse",
+                filter=qdrant_filter,
+                limit=prefetch_limit,
+            ),
+        ],
+        query=FusionQuery(fusion=Fusion.RRF),
+        limit=limit,
+        with_payload=_HIT_PAYLOAD,
+    )
+
+
+def _dense_groups_query(
+    vector: List[float],
+    qdrant_filter: Optional[Filter],
+    top_k: int,
+    chunks: str = "all",
+) -> Dict[str, Any]:
+    """Grouped nearest-neighbour query against the "dense" named vector."""
+    return _grouped(
+        dict(
+            collection_name=QDRANT_COLLECTION,
+            query=vector,
+            using="dense",
+            query_filter=qdrant_filter,
+            with_payload=_HIT_PAYLOAD,
+        ),
+        top_k,
+        chunks,
+    )
+
+
+def _scroll_vectors_query(document_id: str, offset: Any) -> Dict[str, Any]:
+    """scroll() arguments for one page of a document's dense chunk vectors."""
+    return dict(
+        collection_name=QDRANT_COLLECTION,
+        scroll_filter=_document_filter(document_id),
+        limit=_SCROLL_PAGE_SIZE,
+        offset=offset,
+        with_vectors=["dense"],
+        with_payload=False,
+    )
+
+
+def _stored_centroid_query(document_id: str) -> Dict[str, Any]:
+    """retrieve() arguments for a document's precomputed centroid."""
+    return dict(
+        collection_name=QDRANT_DOC_COLLECTION,
+        ids=[document_id],
+        with_vectors=True,
+        with_payload=False,
+    )
 
-    rows = db.execute(
-        text("""
-            SELECT
-                id::text,
-                title,
-                petitioner,
-                respondent,
-                court,
-                state,
-                year,
-                citation,
-                judges,
-                case_type,
-                page_count,
-                chunk_strategy
-            FROM legal_documents
-            WHERE id = ANY(CAST(:ids AS uuid[]))
-        """),
-        {"ids": document_ids},
-    ).fetchall()
 
+def _dense_vector_of(point: Any) -> Optional[List[float]]:
+    """The "dense" vector of a scrolled point (named-vector collections return a dict)."""
+    vector = point.vector
+    if isinstance(vector, dict):
+        return vector.get("dense")
+    return vector
+
+
+def _centroid(vectors: Sequence[List[float]]) -> Optional[List[float]]:
+    """Unit-normalised mean of a document's chunk vectors, or None if there are none."""
+    if not vectors:
+        return None
+    return l2_normalize(np.mean(np.asarray(vectors, dtype=np.float32), axis=0)).tolist()
+
+
+# ── PostgreSQL hydration ───────────────────────────────────────────────────────
+
+_METADATA_SQL = text("""
+    SELECT
+        id::text,
+        title,
+        petitioner,
+        respondent,
+        court,
+        state,
+        year,
+        citation,
+        judges,
+        case_type,
+        page_count,
+        chunk_strategy
+    FROM legal_documents
+    WHERE id = ANY(CAST(:ids AS uuid[]))
+""")
+
+_CHUNK_TEXTS_SQL = text("""
+    SELECT id::text, chunk_text
+    FROM legal_chunks
+    WHERE id = ANY(CAST(:ids AS uuid[]))
+""")
+
+# The opening chunks of each document (name-index hits have no query vector to
+# rank chunks by; the opening chunk carries the cause title and the parties)
+_OPENING_CHUNKS_SQL = text("""
+    SELECT d.id::text, c.id::text, c.chunk_index, c.section_type
+    FROM unnest(CAST(:ids AS uuid[])) AS d(id)
+    CROSS JOIN LATERAL (
+        SELECT id, chunk_index, section_type
+        FROM legal_chunks
+        WHERE document_id = d.id
+        ORDER BY chunk_index
+        LIMIT :per_doc
+    ) c
+""")
+
+_CASE_DETAIL_SQL = text("""
+    SELECT
+        id::text, title, petitioner, respondent, court, state,
+        year, citation, judges, case_type, page_count, chunk_strategy
+    FROM legal_documents
+    WHERE id = CAST(:doc_id AS uuid)
+""")
+
+_CASE_CHUNKS_SQL = text("""
+    SELECT id::text, chunk_text, chunk_index, section_type
+    FROM legal_chunks
+    WHERE document_id = CAST(:doc_id AS uuid)
+    ORDER BY chunk_index
+""")
+
+
+def _metadata_rows_to_dict(rows: Sequence[Sequence[Any]]) -> Dict[str, dict]:
     return {
         row[0]: {
             "title": row[1],
@@ -202,87 +514,103 @@ def _fetch_metadata_batch(db: Session, document_ids: List[str]) -> Dict[str, dic
     }
 
 
+def _fetch_metadata_batch(db: Session, document_ids: List[str]) -> Dict[str, dict]:
+    """
+    Fetch legal_documents metadata for a list of document UUIDs.
+    Served from the in-process corpus metadata store; only ids it does not
+    know (yet) cost one query. Returns a dict keyed by document_id (str).
+    """
+    if not document_ids:
+        return {}
+
+    meta_by_doc, missing = corpus_metadata.get_many(document_ids)
+    if missing:
+        rows = db.execute(_METADATA_SQL, {"ids": missing}).fetchall()
+        meta_by_doc.update(_metadata_rows_to_dict(rows))
+    return meta_by_doc
+
+
 def _fetch_chunk_texts_batch(db: Session, chunk_ids: List[str]) -> Dict[str, str]:
     """
-    Fetch chunk_text for a list of chunk UUIDs from legal_chunks in one query.
-    Returns a dict keyed by chunk_id (str).
+    Fetch chunk_text for a list of chunk UUIDs.
+    Served from the memory-mapped chunk text store when one is exported; ids
+    it does not hold cost one legal_chunks query. Returns a dict keyed by
+    chunk_id (str). Also used by the corpus agent nodes.
     """
     if not chunk_ids:
         return {}
 
-    rows = db.execute(
-        text("""
-            SELECT id::text, chunk_text
-            FROM legal_chunks
-            WHERE id = ANY(CAST(:ids AS uuid[]))
-        """),
-        {"ids": chunk_ids},
-    ).fetchall()
+    text_by_chunk, missing = lookup_chunk_texts(chunk_ids)
+    if missing:
+        rows = db.execute(_CHUNK_TEXTS_SQL, {"ids": missing}).fetchall()
+        text_by_chunk.update({row[0]: row[1] for row in rows})
+    return text_by_chunk
 
-    return {row[0]: row[1] for row in rows}
 
+# ── Result assembly ────────────────────────────────────────────────────────────
 
-def _qdrant_hits_to_case_results(
-    hits: List[ScoredPoint],
-    db: Session,
-    exclude_document_id: Optional[str] = None,
-    top_k: int = 10,
-) -> List[CaseResult]:
-    """
-    Group raw Qdrant chunk hits by document_id, hydrate with PG metadata,
-    and return up to top_k CaseResult objects.
+def _groups_to_grouped(groups: Sequence[PointGroup]) -> List[Tuple[str, List[ScoredPoint]]]:
+    """(document_id, chunk hits) pairs from a group-by result, best document first."""
+    return [(str(group.id), group.hits) for group in groups if group.hits]
 
-    Grouping logic:
-      - document score = max(chunk scores)
-      - top_chunk = highest-scoring chunk
-      - all_chunks = all chunks from that document in the hits list
-    """
-    # 1. Group hits by document_id ─────────────────────────────────────────────
-    doc_chunks: Dict[str, List[ScoredPoint]] = defaultdict(list)
-    for hit in hits:
-        payload = hit.payload or {}
-        doc_id = payload.get("document_id")
-        if not doc_id:
-            continue
-        if exclude_document_id and doc_id == exclude_document_id:
-            continue
-        doc_chunks[doc_id].append(hit)
-
-    # 2. Sort documents by their best chunk score, take top_k ──────────────────
-    sorted_docs = sorted(
-        doc_chunks.items(),
-        key=lambda kv: max(h.score for h in kv[1]),
-        reverse=True,
-    )[:top_k]
 
-    if not sorted_docs:
+def _returned_hits(hits_list: List[ScoredPoint], chunks: str) -> List[ScoredPoint]:
+    """The hits of one document that end up in its CaseResult, best first."""
+    if chunks == "none":
         return []
+    ranked = sorted(hits_list, key=lambda h: h.score, reverse=True)
+    return ranked if chunks == "all" else ranked[:1]
+
 
-    doc_ids = [doc_id for doc_id, _ in sorted_docs]
-    chunk_ids_needed = [
+def _chunk_ids_of(grouped: List[Tuple[str, List[ScoredPoint]]], chunks: str = "all") -> List[str]:
+    """Chunk ids whose text will actually be returned — nothing else is read."""
+    return [
         hit.payload.get("chunk_id")
-        for _, hits_list in sorted_docs
-        for hit in hits_list
+        for _, hits_list in grouped
+        for hit in _returned_hits(hits_list, chunks)
         if hit.payload.get("chunk_id")
     ]
 
-    # 3. Batch-fetch PG metadata ───────────────────────────────────────────────
-    meta_by_doc = _fetch_metadata_batch(db, doc_ids)
-    text_by_chunk = _fetch_chunk_texts_batch(db, chunk_ids_needed)
 
-    # 4. Assemble CaseResult objects ───────────────────────────────────────────
+def _snippet(chunk_text: str, limit: Optional[int]) -> str:
+    """Cut chunk_text to at most `limit` characters, preferring a word boundary."""
+    if limit is None or len(chunk_text) <= limit:
+        return chunk_text
+    cut = chunk_text[:limit]
+    space = cut.rfind(" ")
+    if space > limit * 0.6:
+        cut = cut[:space]
+    return cut.rstrip() + "…"
+
+
+def _build_case_results(
+    grouped: List[Tuple[str, List[ScoredPoint]]],
+    meta_by_doc: Dict[str, dict],
+    text_by_chunk: Dict[str, str],
+    chunks: str = "all",
+    snippet_length: Optional[int] = None,
+) -> List[CaseResult]:
+    """
+    Assemble CaseResult objects from grouped hits and hydrated rows.
+
+      - document score = max(chunk scores)
+      - top_chunk = highest-scoring chunk (None when chunks == "none")
+      - all_chunks = the document's best chunks (at most _GROUP_SIZE), only
+        when chunks == "all"
+      - chunk texts are cut to snippet_length characters when given
+    """
     results: List[CaseResult] = []
-    for doc_id, hits_list in sorted_docs:
+    for doc_id, hits_list in grouped:
         meta = meta_by_doc.get(doc_id, {})
 
         chunk_results: List[ChunkResult] = []
-        for hit in sorted(hits_list, key=lambda h: h.score, reverse=True):
+        for hit in _returned_hits(hits_list, chunks):
             p = hit.payload or {}
             c_id = p.get("chunk_id", str(hit.id))
             chunk_results.append(
                 ChunkResult(
                     chunk_id=c_id,
-                    chunk_text=text_by_chunk.get(c_id, p.get("chunk_text", "")),
+                    chunk_text=_snippet(text_by_chunk.get(c_id, p.get("chunk_text", "")), snippet_length),
                     chunk_index=p.get("chunk_index", 0),
                     section_type=p.get("section_type", "unknown"),
                     score=round(hit.score, 6),
@@ -290,26 +618,430 @@ def _qdrant_hits_to_case_results(
             )
 
         results.append(
-            CaseResult(
-                document_id=doc_id,
-                title=meta.get("title"),
-                petitioner=meta.get("petitioner"),
-                respondent=meta.get("respondent"),
-                court=meta.get("court"),
-                year=meta.get("year"),
-                citation=meta.get("citation"),
-                judges=meta.get("judges") or [],
-                case_type=meta.get("case_type"),
-                state=meta.get("state"),
+            _case_result(
+                doc_id,
+                meta,
                 score=round(max(h.score for h in hits_list), 6),
-                top_chunk=chunk_results[0],
-                all_chunks=chunk_results,
+                top_chunk=chunk_results[0] if chunk_results else None,
+                all_chunks=chunk_results if chunks == "all" else [],
             )
         )
 
     return results
 
 
+def _case_result(doc_id: str, meta: dict, **fields: Any) -> CaseResult:
+    """CaseResult for one document from its hydrated metadata dict."""
+    return CaseResult(
+        document_id=doc_id,
+        title=meta.get("title"),
+        petitioner=meta.get("petitioner"),
+        respondent=meta.get("respondent"),
+        court=meta.get("court"),
+        year=meta.get("year"),
+        citation=meta.get("citation"),
+        judges=meta.get("judges") or [],
+        case_type=meta.get("case_type"),
+        state=meta.get("state"),
+        **fields,
+    )
+
+
+def _passes_filters(
+    meta: dict,
+    court: Optional[str] = None,
+    year_min: Optional[int] = None,
+    year_max: Optional[int] = None,
+    state: Optional[str] = None,
+    case_type: Optional[str] = None,
+) -> bool:
+    """Document-level twin of _build_filter, for results that never went through Qdrant."""
+    year = meta.get("year")
+    return (
+        (not court or meta.get("court") == court)
+        and (not state or meta.get("state") == state)
+        and (not case_type or meta.get("case_type") == case_type)
+        and (year_min is None or (year is not None and year >= year_min))
+        and (year_max is None or (year is not None and year <= year_max))
+    )
+
+
+def _build_scored_results(
+    scored: List[Tuple[str, float]],
+    meta_by_doc: Dict[str, dict],
+) -> List[CaseResult]:
+    """Metadata-only CaseResults (no chunks) for (document_id, score) pairs from an in-process index."""
+    return [_case_result(doc_id, meta_by_doc.get(doc_id, {}), score=score) for doc_id, score in scored]
+
+
+def _build_name_results(
+    matches: List[Tuple[str, float]],
+    meta_by_doc: Dict[str, dict],
+    chunk_rows: Sequence[Sequence[Any]],
+    text_by_chunk: Dict[str, str],
+    chunks: str = "all",
+    snippet_length: Optional[int] = None,
+) -> List[CaseResult]:
+    """
+    CaseResults for case-name index hits, with the documents' opening chunks
+    (rows of _OPENING_CHUNKS_SQL) as top_chunk / all_chunks under `chunks`.
+    Chunks carry their document's name-match score.
+    """
+    rows_by_doc: Dict[str, List[Sequence[Any]]] = {}
+    for row in chunk_rows:
+        rows_by_doc.setdefault(row[0], []).append(row)
+
+    results: List[CaseResult] = []
+    for doc_id, score in matches:
+        chunk_results = [] if chunks == "none" else [
+            ChunkResult(
+                chunk_id=row[1],
+                chunk_text=_snippet(text_by_chunk.get(row[1], ""), snippet_length),
+                chunk_index=row[2],
+                section_type=row[3] or "unknown",
+                score=score,
+            )
+            for row in sorted(rows_by_doc.get(doc_id, []), key=lambda r: r[2])
+        ]
+        results.append(
+            _case_result(
+                doc_id,
+                meta_by_doc.get(doc_id, {}),
+                score=score,
+                top_chunk=chunk_results[0] if chunk_results else None,
+                all_chunks=chunk_results if chunks == "all" else [],
+            )
+        )
+    return results
+
+
+def _fetch_opening_chunks(db: Session, doc_ids: List[str], per_doc: int) -> Sequence[Sequence[Any]]:
+    """_OPENING_CHUNKS_SQL rows for `doc_ids`, at most `per_doc` per document."""
+    if not doc_ids:
+        return []
+    return db.execute(_OPENING_CHUNKS_SQL, {"ids": doc_ids, "per_doc": per_doc}).fetchall()
+
+
+def _index_hit_results(
+    db: Session,
+    hits: List[Tuple[str, float]],
+    meta_by_doc: Dict[str, dict],
+    timer: StageTimer,
+    chunks: str = "all",
+    snippet_length: Optional[int] = None,
+) -> List[CaseResult]:
+    """Hydrate (document_id, score) hits of an in-process index with their opening chunks."""
+    chunk_rows: Sequence[Sequence[Any]] = []
+    text_by_chunk: Dict[str, str] = {}
+    if chunks != "none":
+        with timer.stage("chunk_text"):
+            chunk_rows = _fetch_opening_chunks(db, [doc_id for doc_id, _ in hits], _group_size(chunks))
+            text_by_chunk = _fetch_chunk_texts_batch(db, [row[1] for row in chunk_rows])
+    with timer.stage("assemble"):
+        return _build_name_results(hits, meta_by_doc, chunk_rows, text_by_chunk, chunks, snippet_length)
+
+
+def _cited_documents(query: str, section_type: Optional[str] = None, statute: Optional[str] = None) -> List[str]:
+    """
+    Documents named by a query that is nothing but a reporter citation, else [].
+    Not under the chunk-level filters (section_type, statute): the cited
+    judgment's opening chunks need not match them, so Qdrant answers those.
+    """
+    if section_type or statute:
+        return []
+    return citation_index.resolve(query) or []
+
+
+def _cited_hits(
+    cited: List[str],
+    meta_by_doc: Dict[str, dict],
+    top_k: int,
+    court: Optional[str] = None,
+    year_min: Optional[int] = None,
+    year_max: Optional[int] = None,
+    state: Optional[str] = None,
+    case_type: Optional[str] = None,
+) -> List[Tuple[str, float]]:
+    """The cited documents passing the document-level filters, score 1.0, at most top_k."""
+    return [
+        (doc_id, 1.0) for doc_id in cited
+        if _passes_filters(meta_by_doc.get(doc_id, {}), court, year_min, year_max, state, case_type)
+    ][:top_k]
+
+
+def _groups_to_case_results(
+    groups: Sequence[PointGroup],
+    db: Session,
+    timer: StageTimer,
+    chunks: str = "all",
+    snippet_length: Optional[int] = None,
+) -> List[CaseResult]:
+    """Hydrate a Qdrant group-by result with PG metadata and the returned chunks' texts."""
+    grouped = _groups_to_grouped(groups)
+    if not grouped:
+        return []
+
+    with timer.stage("metadata"):
+        meta_by_doc = _fetch_metadata_batch(db, [doc_id for doc_id, _ in grouped])
+    text_by_chunk: Dict[str, str] = {}
+    if chunks != "none":
+        with timer.stage("chunk_text"):
+            text_by_chunk = _fetch_chunk_texts_batch(db, _chunk_ids_of(grouped, chunks))
+    with timer.stage("assemble"):
+        return _build_case_results(grouped, meta_by_doc, text_by_chunk, chunks, snippet_length)
+
+
+def _ask_chunk_ids(raw: List[ScoredPoint]) -> List[str]:
+    return [(hit.payload or {}).get("chunk_id", str(hit.id)) for hit in raw]
+
+
+def _build_context_chunks(
+    raw: List[ScoredPoint],
+    chunk_ids: List[str],
+    text_by_chunk: Dict[str, str],
+) -> List[ChunkResult]:
+    return [
+        ChunkResult(
+            chunk_id=cid,
+            chunk_text=text_by_chunk.get(cid, (hit.payload or {}).get("chunk_text", "")),
+            chunk_index=(hit.payload or {}).get("chunk_index", 0),
+            section_type=(hit.payload or {}).get("section_type", "unknown"),
+            score=round(hit.score, 6),
+        )
+        for cid, hit in zip(chunk_ids, raw)
+    ]
+
+
+def _build_case_detail(
+    doc_row: Sequence[Any],
+    chunk_rows: Sequence[Sequence[Any]],
+) -> CaseDetailResponse:
+    chunks = [
+        ChunkResult(
+            chunk_id=row[0],
+            chunk_text=row[1],
+            chunk_index=row[2],
+            section_type=row[3] or "unknown",
+            score=1.0,  # Not a search result — full doc fetch
+        )
+        for row in chunk_rows
+    ]
+
+    return CaseDetailResponse(
+        document_id=doc_row[0],
+        title=doc_row[1],
+        petitioner=doc_row[2],
+        respondent=doc_row[3],
+        court=doc_row[4],
+        state=doc_row[5],
+        year=doc_row[6],
+        citation=doc_row[7],
+        judges=doc_row[8] or [],
+        case_type=doc_row[9],
+        page_count=doc_row[10],
+        chunk_strategy=doc_row[11],
+        chunks=chunks,
+    )
+
+
+# ── Batch search (POST /api/search/batch) ──────────────────────────────────────
+# Qdrant has no batched group-by, so each batch entry asks query_batch_points()
+# for its whole candidate pool and is grouped by document_id here.
+
+@dataclass
+class _BatchItem:
+    """One entry of a batch search, with its filter already built."""
+
+    query: str
+    search_mode: str
+    qdrant_filter: Optional[Filter]
+    top_k: int
+    chunks: str
+    snippet_length: Optional[int]
+    plan: Optional[SearchPlan] = None  # hybrid entries only
+    doc_filters: Dict[str, Any] = field(default_factory=dict)  # document-level filters, for cited_ids
+    cited_ids: List[str] = field(default_factory=list)  # documents a citation-only query names
+    cited: List[Tuple[str, float]] = field(default_factory=list)  # cited_ids passing doc_filters
+
+
+def _request_plan(request: SearchRequest, top_k: int) -> Optional[SearchPlan]:
+    if request.search_mode == "keyword":
+        return None
+    return search_planner.plan(
+        top_k,
+        court=request.court,
+        year_min=request.year_min,
+        year_max=request.year_max,
+        state=request.state,
+        case_type=request.case_type,
+        section_type=request.section_type,
+        statute=request.statute,
+    )
+
+
+def _batch_items(requests: Sequence[SearchRequest]) -> List[_BatchItem]:
+    return [
+        _BatchItem(
+            query=request.query.strip(),
+            search_mode=request.search_mode,
+            qdrant_filter=_build_filter(
+                court=request.court,
+                year_min=request.year_min,
+                year_max=request.year_max,
+                state=request.state,
+                case_type=request.case_type,
+                section_type=request.section_type,
+                statute=request.statute,
+            ),
+            top_k=max(1, min(request.top_k, 50)),
+            chunks=request.chunks,
+            snippet_length=request.snippet_length,
+            plan=_request_plan(request, max(1, min(request.top_k, 50))),
+            doc_filters=dict(
+                court=request.court,
+                year_min=request.year_min,
+                year_max=request.year_max,
+                state=request.state,
+                case_type=request.case_type,
+            ),
+            cited_ids=_cited_documents(request.query.strip(), request.section_type, request.statute)
+            if request.query.strip() else [],
+        )
+        for request in requests
+    ]
+
+
+def _batch_cited_ids(items: List[_BatchItem]) -> List[str]:
+    """Union of the documents named by the batch's citation-only queries."""
+    return list(dict.fromkeys(doc_id for item in items for doc_id in item.cited_ids))
+
+
+def _apply_citations(items: List[_BatchItem], meta_by_doc: Dict[str, dict]) -> None:
+    """Answer each citation entry whose cited documents pass its filters from the citation index."""
+    for item in items:
+        if item.cited_ids:
+            item.cited = _cited_hits(item.cited_ids, meta_by_doc, item.top_k, **item.doc_filters)
+
+
+def _batch_opening_chunk_request(items: List[_BatchItem]) -> Tuple[List[str], int]:
+    """Documents whose opening chunks the citation entries return, and how many per document."""
+    wanting = [item for item in items if item.cited and item.chunks != "none"]
+    doc_ids = dict.fromkeys(doc_id for item in wanting for doc_id, _ in item.cited)
+    return list(doc_ids), max((_group_size(item.chunks) for item in wanting), default=0)
+
+
+def _batch_query_request(
+    item: _BatchItem,
+    dense_vec: Optional[List[float]],
+    sparse_vec: SparseVector,
+) -> QueryRequest:
+    """Ungrouped twin of _search_query() as one query_batch_points() entry."""
+    if item.search_mode == "keyword":
+        return QueryRequest(
+            query=sparse_vec,
+            using="sparse",
+            filter=item.qdrant_filter,
+            limit=item.top_k * _CHUNK_FETCH_MULTIPLIER,
+            with_payload=_HIT_PAYLOAD,
+        )
+    plan = item.plan or search_planner.plan(item.top_k)
+    pool = plan.prefetch_limit
+    hybrid = _hybrid_query(
+        dense_vec, sparse_vec, item.qdrant_filter,
+        prefetch_limit=pool, limit=pool, search_params=plan.search_params,
+        small_vec=_small_vector(dense_vec, plan), shortlist_limit=plan.shortlist_limit,
+    )
+    hybrid.pop("collection_name")
+    return QueryRequest(**hybrid)
+
+
+def _group_points(
+    points: Sequence[ScoredPoint],
+    top_k: int,
+    chunks: str,
+) -> List[Tuple[str, List[ScoredPoint]]]:
+    """Group ranked chunk hits by document_id (same shape as _groups_to_grouped)."""
+    group_size = _group_size(chunks)
+    grouped: Dict[str, List[ScoredPoint]] = {}
+    for point in points:
+        doc_id = (point.payload or {}).get("document_id")
+        if not doc_id:
+            continue
+        hits = grouped.get(str(doc_id))
+        if hits is None:
+            if len(grouped) >= top_k:
+                continue
+            hits = grouped[str(doc_id)] = []
+        if len(hits) < group_size:
+            hits.append(point)
+    return list(grouped.items())
+
+
+def _batch_hydration_ids(
+    items: List[_BatchItem],
+    grouped_per_item: List[List[Tuple[str, List[ScoredPoint]]]],
+) -> Tuple[List[str], List[str]]:
+    """Union of document ids and returned chunk ids over the whole batch."""
+    doc_ids = dict.fromkeys(doc_id for grouped in grouped_per_item for doc_id, _ in grouped)
+    chunk_ids = dict.fromkeys(
+        chunk_id
+        for item, grouped in zip(items, grouped_per_item)
+        for chunk_id in _chunk_ids_of(grouped, item.chunks)
+    )
+    return list(doc_ids), list(chunk_ids)
+
+
+def _batch_responses(
+    items: List[_BatchItem],
+    grouped_per_item: List[List[Tuple[str, List[ScoredPoint]]]],
+    meta_by_doc: Dict[str, dict],
+    text_by_chunk: Dict[str, str],
+    timer: StageTimer,
+    opening_rows: Sequence[Sequence[Any]] = (),
+) -> BatchSearchResponse:
+    """
+    Assemble one SearchResponse per entry, in request order. Each entry's
+    timings carry the shared batch stages plus its own assembly time; its
+    total is the batch time elapsed when that entry was ready. Citation
+    entries are built from `opening_rows` (_OPENING_CHUNKS_SQL).
+    """
+    shared = timer.stages_ms()
+    responses: List[SearchResponse] = []
+    with timer.stage("assemble"):
+        for item, grouped in zip(items, grouped_per_item):
+            started = time.perf_counter()
+            if item.cited:
+                results = _build_name_results(
+                    item.cited, meta_by_doc, opening_rows, text_by_chunk, item.chunks, item.snippet_length
+                )
+            else:
+                results = _build_case_results(
+                    grouped, meta_by_doc, text_by_chunk, item.chunks, item.snippet_length
+                )
+            assemble_ms = round((time.perf_counter() - started) * 1000, 2)
+            total_ms = timer.total_ms
+            timings: Dict[str, Any] = {"stages": {**shared, "assemble": assemble_ms}, "total_ms": total_ms}
+            if item.plan is not None and not item.cited:
+                timings["plan"] = item.plan.as_dict()
+            responses.append(
+                SearchResponse(
+                    query=item.query,
+                    total_results=len(results),
+                    results=results,
+                    search_time_ms=total_ms,
+                    timings=timings,
+                )
+            )
+
+    timings = timer.finish().as_dict()
+    return BatchSearchResponse(
+        total_queries=len(responses),
+        responses=responses,
+        search_time_ms=timings["total_ms"],
+        timings=timings,
+    )
+
+
 # ── Public service class ───────────────────────────────────────────────────────
 
 class QdrantSearchService:
@@ -323,8 +1055,8 @@ class QdrantSearchService:
         # BM25 is lazy-loaded on first keyword search (~1s load, ~50MB) to avoid RAM
         # pressure with the Celery document-processing worker which also loads this model.
         try:
-            _get_embedding_model()
-            _get_qdrant_client()
+            get_model()
+            verify_collection(_get_qdrant_client(), QDRANT_COLLECTION)
         except Exception as exc:
             logger.warning("Could not pre-warm search service singletons: %s", exc)
 
@@ -341,11 +1073,19 @@ class QdrantSearchService:
         state: Optional[str] = None,
         case_type: Optional[str] = None,
         section_type: Optional[str] = None,
+        statute: Optional[str] = None,
         top_k: int = 10,
         search_mode: str = "hybrid",
+        chunks: str = "all",
+        snippet_length: Optional[int] = None,
     ) -> SearchResponse:
         """
-        Corpus search with two strategies controlled by `search_mode`:
+        Corpus search. A query that is nothing but a reporter citation
+        ("AIR 1973 SC 1461", "(2017) 10 SCC 1") is first resolved exactly from
+        the citation index — score 1.0, the judgment's opening chunks under
+        `chunks`, filters applied to the documents (not with a `section_type`
+        or `statute` filter). Otherwise, or when no cited judgment passes the
+        filters, two strategies controlled by `search_mode`:
 
         - **hybrid** (default): Dense (semantic) + BM25 (keyword) combined via
           Reciprocal Rank Fusion. Best for concept / topic queries.
@@ -353,18 +1093,41 @@ class QdrantSearchService:
           act sections (e.g. "Puttaswamy vs Union of India", "AIR 1973 SC 461").
 
         Steps (both modes):
-          1. Build optional Qdrant payload filter.
+          1. Build optional Qdrant payload filter; for hybrid, plan the dense
+             prefetch from the filter's estimated selectivity (exact search,
+             or the hnsw_ef to use — see search_planner.py).
           2. Embed query into dense and/or sparse vectors.
-          3. Fetch top_k × MULTIPLIER chunk hits from Qdrant.
-          4. Group by document, keeping top top_k unique cases.
-          5. Hydrate with PostgreSQL metadata.
+          3. Group-by query on document_id: Qdrant returns exactly top_k
+             unique cases with their best chunks (QDRANT_GROUP_SIZE each).
+          4. Hydrate with PostgreSQL metadata, and chunk texts for the chunks
+             returned under `chunks` ("all" / "top" / "none"), cut to
+             `snippet_length` characters when given.
+
+        Per-stage timings are returned in `timings` (see app/core/timing.py).
         """
-        t0 = time.perf_counter()
+        timer = StageTimer("search")
 
         query = query.strip()
         if not query:
             return SearchResponse(query=query, total_results=0, results=[], search_time_ms=0.0)
 
+        with timer.stage("citation"):
+            cited = _cited_documents(query, section_type, statute)
+        if cited:
+            with timer.stage("metadata"):
+                meta_by_doc = _fetch_metadata_batch(db, cited)
+            hits = _cited_hits(cited, meta_by_doc, top_k, court, year_min, year_max, state, case_type)
+            if hits:
+                results = _index_hit_results(db, hits, meta_by_doc, timer, chunks, snippet_length)
+                timings = timer.finish().as_dict()
+                return SearchResponse(
+                    query=query,
+                    total_results=len(results),
+                    results=results,
+                    search_time_ms=timings["total_ms"],
+                    timings=timings,
+                )
+
         qdrant_filter = _build_filter(
             court=court,
             year_min=year_min,
@@ -372,61 +1135,95 @@ class QdrantSearchService:
             state=state,
             case_type=case_type,
             section_type=section_type,
+            statute=statute,
         )
+        plan = None
+        if search_mode != "keyword":
+            plan = search_planner.plan(
+                top_k, court=court, year_min=year_min, year_max=year_max, state=state,
+                case_type=case_type, section_type=section_type, statute=statute,
+            )
+            timer.plan = plan.as_dict()
 
         client = _get_qdrant_client()
-        limit = top_k * _CHUNK_FETCH_MULTIPLIER
 
         try:
-            if search_mode == "keyword":
-                # ── BM25 sparse-only path ──────────────────────────────────────
-                sparse_vec = _embed_sparse(query)
-                raw = client.query_points(
-                    collection_name=QDRANT_COLLECTION,
-                    query=sparse_vec,
-                    using="sparse",
-                    query_filter=qdrant_filter,
-                    limit=limit,
-                    with_payload=True,
-                ).points
-            else:
-                # ── Hybrid RRF path (default) ──────────────────────────────────
-                dense_vec = _embed(query)
+            dense_vec = None
+            if search_mode != "keyword":
+                with timer.stage("dense_encode"):
+                    dense_vec = _embed(query)
+            with timer.stage("sparse_encode"):
                 sparse_vec = _embed_sparse(query)
-                raw = client.query_points(
-                    collection_name=QDRANT_COLLECTION,
-                    prefetch=[
-                        Prefetch(
-                            query=dense_vec,
-                            using="dense",
-                            filter=qdrant_filter,
-                            limit=limit,
-                        ),
-                        Prefetch(
-                            query=sparse_vec,
-                            using="sparse",
-                            filter=qdrant_filter,
-                            limit=limit,
-                        ),
-                    ],
-                    query=FusionQuery(fusion=Fusion.RRF),
-                    limit=limit,
-                    with_payload=True,
-                ).points
+            with timer.stage("qdrant"):
+                groups = client.query_points_groups(
+                    **_search_query(search_mode, dense_vec, sparse_vec, qdrant_filter, top_k, chunks, plan)
+                ).groups
         except Exception as exc:
             logger.error("Qdrant search failed (mode=%s): %s", search_mode, exc)
             raise
 
-        results = _qdrant_hits_to_case_results(raw, db, top_k=top_k)
-        elapsed_ms = (time.perf_counter() - t0) * 1000
+        results = _groups_to_case_results(groups, db, timer, chunks, snippet_length)
+        timings = timer.finish().as_dict()
 
         return SearchResponse(
             query=query,
             total_results=len(results),
             results=results,
-            search_time_ms=round(elapsed_ms, 2),
+            search_time_ms=timings["total_ms"],
+            timings=timings,
         )
 
+    # ── search_batch ───────────────────────────────────────────────────────────
+
+    def search_batch(self, db: Session, requests: Sequence[SearchRequest]) -> BatchSearchResponse:
+        """
+        Run many searches as one: a single dense and a single BM25 encoding
+        pass for all queries, one query_batch_points() call, and one metadata
+        and one chunk-text fetch for the union of all hits. Citation-only
+        queries are answered from the citation index as in search(). Responses
+        come back in request order, each with its own timings.
+        """
+        timer = StageTimer("search_batch")
+        items = _batch_items(requests)
+        meta_by_doc: Dict[str, dict] = {}
+        cited_ids = _batch_cited_ids(items)
+        if cited_ids:
+            with timer.stage("metadata"):
+                meta_by_doc = _fetch_metadata_batch(db, cited_ids)
+            _apply_citations(items, meta_by_doc)
+        active = [i for i, item in enumerate(items) if item.query and not item.cited]
+        dense_idx = [i for i in active if items[i].search_mode != "keyword"]
+
+        with timer.stage("dense_encode"):
+            dense_by_idx = dict(zip(dense_idx, _embed_many([items[i].query for i in dense_idx])))
+        with timer.stage("sparse_encode"):
+            sparse_by_idx = dict(zip(active, _embed_sparse_many([items[i].query for i in active])))
+
+        grouped_per_item: List[List[Tuple[str, List[ScoredPoint]]]] = [[] for _ in items]
+        if active:
+            try:
+                with timer.stage("qdrant"):
+                    batch = _get_qdrant_client().query_batch_points(
+                        collection_name=QDRANT_COLLECTION,
+                        requests=[
+                            _batch_query_request(items[i], dense_by_idx.get(i), sparse_by_idx[i])
+                            for i in active
+                        ],
+                    )
+            except Exception as exc:
+                logger.error("Qdrant batch search failed (%d queries): %s", len(active), exc)
+                raise
+            for i, response in zip(active, batch):
+                grouped_per_item[i] = _group_points(response.points, items[i].top_k, items[i].chunks)
+
+        doc_ids, chunk_ids = _batch_hydration_ids(items, grouped_per_item)
+        with timer.stage("metadata"):
+            meta_by_doc.update(_fetch_metadata_batch(db, [doc_id for doc_id in doc_ids if doc_id not in meta_by_doc]))
+        with timer.stage("chunk_text"):
+            opening_rows = _fetch_opening_chunks(db, *_batch_opening_chunk_request(items))
+            text_by_chunk = _fetch_chunk_texts_batch(db, chunk_ids + [row[1] for row in opening_rows])
+        return _batch_responses(items, grouped_per_item, meta_by_doc, text_by_chunk, timer, opening_rows)
+
     # ── search_by_case_name ────────────────────────────────────────────────────
 
     def search_by_case_name(
@@ -435,52 +1232,65 @@ class QdrantSearchService:
         case_name: str,
         *,
         top_k: int = 10,
+        chunks: str = "all",
+        snippet_length: Optional[int] = None,
     ) -> SearchResponse:
         """
-        Payload-based title search using Qdrant's MatchText filter.
-        Does a semantic search *and* pre-filters to documents whose title
-        contains the case_name substring.
+        Case-name lookup.
+
+        First the in-process case_name_index (fuzzy token/trigram match on
+        title, petitioner and respondent — no embedding, no Qdrant); its
+        results carry metadata, the name-match score and, under `chunks`,
+        each document's opening chunks (cause title and parties). Only if
+        it finds nothing: payload-based title search using Qdrant's MatchText
+        filter — a semantic search pre-filtered to documents whose title
+        contains the case_name tokens.
         """
-        t0 = time.perf_counter()
+        timer = StageTimer("search_by_case_name")
 
         case_name = case_name.strip()
         if not case_name:
             return SearchResponse(query=case_name, total_results=0, results=[], search_time_ms=0.0)
 
+        with timer.stage("name_index"):
+            matches = case_name_index.search(case_name, top_k)
+        if matches:
+            doc_ids = [doc_id for doc_id, _ in matches]
+            with timer.stage("metadata"):
+                meta_by_doc = _fetch_metadata_batch(db, doc_ids)
+            results = _index_hit_results(db, matches, meta_by_doc, timer, chunks, snippet_length)
+            timings = timer.finish().as_dict()
+            return SearchResponse(
+                query=case_name,
+                total_results=len(results),
+                results=results,
+                search_time_ms=timings["total_ms"],
+                timings=timings,
+            )
+
         # Semantic vector for the name (works even for partial names)
-        vec = _embed(case_name)
-
-        # Filter: title payload must contain the query text
-        qdrant_filter = Filter(
-            must=[
-                FieldCondition(
-                    key="title",
-                    match=MatchText(text=case_name),
-                )
-            ]
-        )
+        with timer.stage("dense_encode"):
+            vec = _embed(case_name)
 
         client = _get_qdrant_client()
         try:
-            raw = client.query_points(
-                collection_name=QDRANT_COLLECTION,
-                query=vec,
-                query_filter=qdrant_filter,
-                limit=top_k * _CHUNK_FETCH_MULTIPLIER,
-                with_payload=True,
-            ).points
+            with timer.stage("qdrant"):
+                groups = client.query_points_groups(
+                    **_dense_groups_query(vec, _case_name_filter(case_name), top_k, chunks)
+                ).groups
         except Exception as exc:
             logger.error("Qdrant case-name search failed: %s", exc)
             raise
 
-        results = _qdrant_hits_to_case_results(raw, db, top_k=top_k)
-        elapsed_ms = (time.perf_counter() - t0) * 1000
+        results = _groups_to_case_results(groups, db, timer, chunks, snippet_length)
+        timings = timer.finish().as_dict()
 
         return SearchResponse(
             query=case_name,
             total_results=len(results),
             results=results,
-            search_time_ms=round(elapsed_ms, 2),
+            search_time_ms=timings["total_ms"],
+            timings=timings,
         )
 
     # ── get_similar_cases ──────────────────────────────────────────────────────
@@ -495,85 +1305,138 @@ class QdrantSearchService:
         """
         Find cases similar to a given document.
 
+        Served from the precomputed similar graph (similar_graph.py) when it
+        covers the document — centroid-to-centroid score, and each neighbour's
+        opening chunks in place of the chunks nearest the centroid (no query
+        vector is run against the graph). Otherwise:
+
         Strategy:
-          1. Retrieve *all* Qdrant points whose payload.document_id == document_id.
-          2. Average their vectors (centroid).
-          3. Search Qdrant for the nearest neighbours to that centroid.
-          4. Exclude the source document from results.
+          1. Fetch the document's precomputed centroid from QDRANT_DOC_COLLECTION.
+             Documents ingested since the last centroid build fall back to
+             scrolling *all* their chunk vectors and averaging them here.
+          2. Group-by query for the top_k documents nearest to that centroid,
+             with the source document excluded by a must_not filter.
         """
+        timer = StageTimer("similar_cases")
+
+        graph = get_similar_graph()
+        if graph is not None:
+            with timer.stage("graph"):
+                neighbours = graph.neighbours(document_id, top_k)
+            if neighbours is not None:
+                with timer.stage("metadata"):
+                    meta_by_doc = _fetch_metadata_batch(db, [doc_id for doc_id, _ in neighbours])
+                results = _index_hit_results(db, neighbours, meta_by_doc, timer)
+                return SimilarCasesResponse(
+                    source_document_id=document_id,
+                    total_results=len(results),
+                    results=results,
+                    timings=timer.finish().as_dict(),
+                )
+
         client = _get_qdrant_client()
 
-        # Step 1: Scroll all chunk point vectors for this document ─────────────
-        doc_filter = Filter(
-            must=[
-                FieldCondition(
-                    key="document_id",
-                    match=MatchValue(value=document_id),
-                )
-            ]
+        # Step 1: Precomputed centroid, else the live chunk average ────────────
+        with timer.stage("centroid_fetch"):
+            centroid = self._stored_centroid(client, document_id)
+        if centroid is None:
+            centroid = self._live_centroid(client, document_id, timer)
+        if centroid is None:
+            logger.warning("No vectors found in Qdrant for document_id=%s", document_id)
+            return SimilarCasesResponse(
+                source_document_id=document_id,
+                total_results=0,
+                results=[],
+                timings=timer.finish().as_dict(),
+            )
+
+        # Step 2: Search Qdrant for similar cases ──────────────────────────────
+        try:
+            with timer.stage("qdrant"):
+                groups = client.query_points_groups(
+                    **_dense_groups_query(centroid, _exclude_document_filter(document_id), top_k)
+                ).groups
+        except Exception as exc:
+            logger.error("Qdrant similar-cases search failed: %s", exc)
+            raise
+
+        # Step 3: Hydrate ──────────────────────────────────────────────────────
+        results = _groups_to_case_results(groups, db, timer)
+
+        return SimilarCasesResponse(
+            source_document_id=document_id,
+            total_results=len(results),
+            results=results,
+            timings=timer.finish().as_dict(),
         )
 
+    @staticmethod
+    def _stored_centroid(client: QdrantClient, document_id: str) -> Optional[List[float]]:
+        """The precomputed centroid, or None (not built yet / collection missing)."""
+        try:
+            points = client.retrieve(**_stored_centroid_query(document_id))
+        except Exception as exc:
+            logger.debug("No stored centroid for document %s: %s", document_id, exc)
+            return None
+        return _dense_vector_of(points[0]) if points else None
+
+    @staticmethod
+    def _live_centroid(client: QdrantClient, document_id: str, timer: StageTimer) -> Optional[List[float]]:
+        """Scroll every chunk vector of the document and average them."""
         all_vectors: List[List[float]] = []
         next_offset = None
-        page_size = 200
 
         while True:
             try:
-                result, next_offset = client.scroll(
-                    collection_name=QDRANT_COLLECTION,
-                    scroll_filter=doc_filter,
-                    limit=page_size,
-                    offset=next_offset,
-                    with_vectors=True,
-                    with_payload=False,
-                )
+                with timer.stage("scroll"):
+                    result, next_offset = client.scroll(**_scroll_vectors_query(document_id, next_offset))
             except Exception as exc:
                 logger.error("Qdrant scroll for document %s failed: %s", document_id, exc)
                 raise
 
             for point in result:
-                if point.vector is not None:
-                    all_vectors.append(point.vector)
+                vector = _dense_vector_of(point)
+                if vector is not None:
+                    all_vectors.append(vector)
 
             if next_offset is None:
                 break
 
-        if not all_vectors:
-            logger.warning("No vectors found in Qdrant for document_id=%s", document_id)
-            return SimilarCasesResponse(
-                source_document_id=document_id,
-                total_results=0,
-                results=[],
-            )
-
-        # Step 2: Compute centroid ─────────────────────────────────────────────
-        centroid = np.mean(all_vectors, axis=0)
-        # Re-normalise for cosine similarity
-        norm = np.linalg.norm(centroid)
-        if norm > 0:
-            centroid = centroid / norm
+        with timer.stage("centroid"):
+            return _centroid(all_vectors)
 
-        # Step 3: Search Qdrant for similar cases ──────────────────────────────
-        try:
-            raw = client.query_points(
-                collection_name=QDRANT_COLLECTION,
-                query=centroid.tolist(),
-                limit=(top_k + 1) * _CHUNK_FETCH_MULTIPLIER,
-                with_payload=True,
-            ).points
-        except Exception as exc:
-            logger.error("Qdrant similar-cases search failed: %s", exc)
-            raise
-
-        # Step 4: Group, exclude source, hydrate ───────────────────────────────
-        results = _qdrant_hits_to_case_results(
-            raw, db, exclude_document_id=document_id, top_k=top_k
-        )
+    # ── search_by_statute ──────────────────────────────────────────────────────
 
-        return SimilarCasesResponse(
-            source_document_id=document_id,
-            total_results=len(results),
+    def search_by_statute(
+        self,
+        db: Session,
+        statute_key: str,
+        *,
+        top_k: int = 20,
+        offset: int = 0,
+    ) -> StatuteSearchResponse:
+        """
+        Cases referring to one statute section (a parse_statute key such as
+        "IPC:302"), newest first — a GIN lookup on legal_documents.statute_keys,
+        no embedding or Qdrant call. Results are metadata-only with score 1.0;
+        `offset` pages through them.
+        """
+        timer = StageTimer("search_by_statute")
+        with timer.stage("statute"):
+            rows = db.execute(
+                STATUTE_DOCUMENTS_SQL, {"statute_key": statute_key, "limit": top_k, "offset": offset}
+            ).fetchall()
+        with timer.stage("metadata"):
+            meta_by_doc = _fetch_metadata_batch(db, [doc_id for doc_id, _ in rows])
+
+        results = _build_scored_results([(doc_id, 1.0) for doc_id, _ in rows], meta_by_doc)
+        timings = timer.finish().as_dict()
+        return StatuteSearchResponse(
+            statute=statute_key,
+            total_results=int(rows[0][1]) if rows else 0,
             results=results,
+            search_time_ms=timings["total_ms"],
+            timings=timings,
         )
 
     # ── get_case_detail ────────────────────────────────────────────────────────
@@ -583,58 +1446,12 @@ class QdrantSearchService:
         Return full metadata + all chunks for a specific document from PostgreSQL.
         No Qdrant call needed — this is a direct DB lookup.
         """
-        # Fetch document metadata
-        doc_row = db.execute(
-            text("""
-                SELECT
-                    id::text, title, petitioner, respondent, court, state,
-                    year, citation, judges, case_type, page_count, chunk_strategy
-                FROM legal_documents
-                WHERE id = CAST(:doc_id AS uuid)
-            """),
-            {"doc_id": document_id},
-        ).fetchone()
-
+        doc_row = db.execute(_CASE_DETAIL_SQL, {"doc_id": document_id}).fetchone()
         if not doc_row:
             return None  # Caller raises 404
 
-        # Fetch all chunks ordered by index
-        chunk_rows = db.execute(
-            text("""
-                SELECT id::text, chunk_text, chunk_index, section_type
-                FROM legal_chunks
-                WHERE document_id = CAST(:doc_id AS uuid)
-                ORDER BY chunk_index
-            """),
-            {"doc_id": document_id},
-        ).fetchall()
-
-        chunks = [
-            ChunkResult(
-                chunk_id=row[0],
-                chunk_text=row[1],
-                chunk_index=row[2],
-                section_type=row[3] or "unknown",
-                score=1.0,  # Not a search result — full doc fetch
-            )
-            for row in chunk_rows
-        ]
-
-        return CaseDetailResponse(
-            document_id=doc_row[0],
-            title=doc_row[1],
-            petitioner=doc_row[2],
-            respondent=doc_row[3],
-            court=doc_row[4],
-            state=doc_row[5],
-            year=doc_row[6],
-            citation=doc_row[7],
-            judges=doc_row[8] or [],
-            case_type=doc_row[9],
-            page_count=doc_row[10],
-            chunk_strategy=doc_row[11],
-            chunks=chunks,
-        )
+        chunk_rows = db.execute(_CASE_CHUNKS_SQL, {"doc_id": document_id}).fetchall()
+        return _build_case_detail(doc_row, chunk_rows)
 
     # ── ask (RAG context fetch) ────────────────────────────────────────────────
 
@@ -659,68 +1476,42 @@ class QdrantSearchService:
           2. Prefetch from both vector slots filtered by document_id.
           3. Fuse with RRF and return top_k chunks as LLM context.
         """
+        timer = StageTimer("ask")
         question = question.strip()
 
-        doc_filter = Filter(
-            must=[
-                FieldCondition(
-                    key="document_id",
-                    match=MatchValue(value=document_id),
-                )
-            ]
-        )
-
-        dense_vec = _embed(question)
-        sparse_vec = _embed_sparse(question)
+        with timer.stage("dense_encode"):
+            dense_vec = _embed(question)
+        with timer.stage("sparse_encode"):
+            sparse_vec = _embed_sparse(question)
 
         client = _get_qdrant_client()
         try:
-            raw = client.query_points(
-                collection_name=QDRANT_COLLECTION,
-                prefetch=[
-                    Prefetch(
-                        query=dense_vec,
-                        using="dense",
-                        filter=doc_filter,
-                        limit=top_k * 3,
-                    ),
-                    Prefetch(
-                        query=sparse_vec,
-                        using="sparse",
-                        filter=doc_filter,
-                        limit=top_k * 3,
-                    ),
-                ],
-                query=FusionQuery(fusion=Fusion.RRF),
-                limit=top_k,
-                with_payload=True,
-            ).points
+            with timer.stage("qdrant"):
+                raw = client.query_points(
+                    **_hybrid_query(
+                        dense_vec,
+                        sparse_vec,
+                        _document_filter(document_id),
+                        prefetch_limit=top_k * 3,
+                        limit=top_k,
+                    )
+                ).points
         except Exception as exc:
             logger.error("Qdrant ask() hybrid search failed: %s", exc)
             raise
 
-        chunk_ids = [
-            (hit.payload or {}).get("chunk_id", str(hit.id))
-            for hit in raw
-        ]
-        text_by_chunk = _fetch_chunk_texts_batch(db, chunk_ids)
-
-        context_chunks = [
-            ChunkResult(
-                chunk_id=cid,
-                chunk_text=text_by_chunk.get(cid, (hit.payload or {}).get("chunk_text", "")),
-                chunk_index=(hit.payload or {}).get("chunk_index", 0),
-                section_type=(hit.payload or {}).get("section_type", "unknown"),
-                score=round(hit.score, 6),
-            )
-            for cid, hit in zip(chunk_ids, raw)
-        ]
+        chunk_ids = _ask_chunk_ids(raw)
+        with timer.stage("chunk_text"):
+            text_by_chunk = _fetch_chunk_texts_batch(db, chunk_ids)
+        with timer.stage("assemble"):
+            context_chunks = _build_context_chunks(raw, chunk_ids, text_by_chunk)
 
         return AskResponse(
             document_id=document_id,
             question=question,
             context_chunks=context_chunks,
             total_chunks=len(context_chunks),
+            timings=timer.finish().as_dict(),
         )
 
 
@@ -0,0 +1,243 @@
+"""
+Query Vector Cache — two-level cache in front of the dense and BM25 embedders.
+
+The same questions ("right to privacy", "Article 21") arrive all day, and a
+single chat turn used to embed its question up to three times (search
+service, document_chat, corpus_search). Both embedders now sit behind:
+
+  L1  per-turn memo      — a plain dict bound to the current chat turn via a
+                           ContextVar (see turn_scope()). Entries are pinned
+                           for the whole turn, so nothing evicted from L2 in
+                           the meantime can cause a re-embed within one turn.
+  L2  process-wide LRU   — bounded by entry count AND bytes, with a TTL.
+                           Shared by every request in the worker process.
+
+Keys are normalised query text (normalize_query). The embedders also encode
+the normalised text, so a cached vector is exactly what a fresh encode of
+any equivalent spelling would produce.
+"""
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.metrics import QUERY_CACHE_BYTES, QUERY_CACHE_ENTRIES, QUERY_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "10000"))
+_MAX_BYTES = int(float(os.getenv("QUERY_CACHE_MAX_MB", "64")) * 1024 * 1024)
+_TTL_SECONDS = float(os.getenv("QUERY_CACHE_TTL_SECONDS", "3600"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT = " ?!.,;:"
+
+# L1: {cache name: {key: value}} for the current chat turn, or None outside a turn
+_turn_memo: contextvars.ContextVar[Optional[Dict[str, Dict[str, Any]]]] = contextvars.ContextVar(
+    "jurisfind_turn_vector_memo", default=None
+)
+
+
+def normalize_query(text: str) -> str:
+    """
+    Canonical cache key for a query: NFKC, case-folded, whitespace collapsed,
+    trailing punctuation dropped ("Right to  Privacy?" → "right to privacy").
+    """
+    text = unicodedata.normalize("NFKC", text or "")
+    text = _WHITESPACE_RE.sub(" ", text.casefold()).strip()
+    return text.rstrip(_TRAILING_PUNCT)
+
+
+@contextmanager
+def turn_scope():
+    """
+    Bind a fresh L1 memo to the current context for the duration of one turn.
+
+    Sync LangGraph nodes run in executor threads with a copy of this context;
+    the copy points at the same dict, so every node in the turn shares it.
+    Nested scopes reuse the outer memo.
+    """
+    if _turn_memo.get() is not None:
+        yield
+        return
+    token = _turn_memo.set({})
+    try:
+        yield
+    finally:
+        _turn_memo.reset(token)
+
+
+class VectorCache:
+    """Thread-safe LRU with TTL and byte-size accounting (the L2 level)."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int = _MAX_ENTRIES,
+        max_bytes: int = _MAX_BYTES,
+        ttl_seconds: float = _TTL_SECONDS,
+    ) -> None:
+        self.name = name
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.ttl_seconds = ttl_seconds
+
+        # key → (value, nbytes, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ── L2 primitives ─────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, nbytes, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any, nbytes: int) -> None:
+        nbytes += len(key)
+        if nbytes > self.max_bytes:
+            return  # never cache something that would flush the whole cache
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, nbytes, time.monotonic() + self.ttl_seconds)
+            self._bytes += nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            self._publish()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._publish()
+
+    def _remove(self, key: str) -> None:
+        _, nbytes, _ = self._entries.pop(key)
+        self._bytes -= nbytes
+        self._publish()
+
+    def _publish(self) -> None:
+        QUERY_CACHE_ENTRIES.labels(self.name).set(len(self._entries))
+        QUERY_CACHE_BYTES.labels(self.name).set(self._bytes)
+
+    # ── Two-level lookup ──────────────────────────────────────────────────────
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[str], Any],
+        sizeof: Callable[[Any], int],
+    ) -> Any:
+        """
+        Return the vector for `key`: L1 (current turn) → L2 (process) → compute(key).
+
+        A computed value is stored in both levels.
+        """
+        memo = _turn_memo.get()
+        level_memo = memo.setdefault(self.name, {}) if memo is not None else None
+
+        if level_memo is not None and key in level_memo:
+            QUERY_CACHE_REQUESTS.labels(self.name, "l1", "hit").inc()
+            return level_memo[key]
+
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            QUERY_CACHE_REQUESTS.labels(self.name, "l2", "hit").inc()
+        else:
+            self.misses += 1
+            QUERY_CACHE_REQUESTS.labels(self.name, "l2", "miss").inc()
+            value = compute(key)
+            self.put(key, value, sizeof(value))
+
+        if level_memo is not None:
+            level_memo[key] = value
+        return value
+
+    def get_or_compute_many(
+        self,
+        keys: Sequence[str],
+        compute_many: Callable[[List[str]], Sequence[Any]],
+        sizeof: Callable[[Any], int],
+    ) -> List[Any]:
+        """
+        Batch form of get_or_compute: values for `keys`, in order.
+
+        Every key missing from both levels is computed by ONE compute_many()
+        call (deduplicated, in first-seen order), so a batch of queries costs
+        at most one encoder pass.
+        """
+        memo = _turn_memo.get()
+        level_memo = memo.setdefault(self.name, {}) if memo is not None else None
+
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            if level_memo is not None and key in level_memo:
+                QUERY_CACHE_REQUESTS.labels(self.name, "l1", "hit").inc()
+                found[key] = level_memo[key]
+                continue
+            value = self.get(key)
+            if value is not None:
+                self.hits += 1
+                QUERY_CACHE_REQUESTS.labels(self.name, "l2", "hit").inc()
+                found[key] = value
+            else:
+                self.misses += 1
+                QUERY_CACHE_REQUESTS.labels(self.name, "l2", "miss").inc()
+                missing.append(key)
+
+        if missing:
+            for key, value in zip(missing, compute_many(missing)):
+                self.put(key, value, sizeof(value))
+                found[key] = value
+
+        if level_memo is not None:
+            level_memo.update(found)
+        return [found[key] for key in keys]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Module-level singletons — one per embedder
+dense_cache = VectorCache("dense")
+sparse_cache = VectorCache("sparse")
+
+
+def cache_stats() -> list:
+    return [dense_cache.stats(), sparse_cache.stats()]
@@ -0,0 +1,135 @@
+"""
+Search Coalescer — singleflight plus a short-lived result cache for searches.
+
+A shared link to a popular query ("GET /api/cases/search?q=...") brings
+dozens of identical requests within a second, and each used to run the
+whole embed → Qdrant → PostgreSQL pipeline. Searches now go through
+search_coalescer.run(key, compute):
+
+  hit        a result for `key` finished less than SEARCH_RESULT_CACHE_SECONDS
+             ago and the corpus has not changed since — returned as is
+  coalesced  the same search is already running — wait for it and share
+             its result
+  miss       run compute() as a task of its own; every caller waits on it
+             through asyncio.shield, so a caller that disconnects does not
+             cancel the search the others are waiting for
+
+Keys are built by the caller from the normalised query text
+(query_vector_cache.normalize_query) plus every parameter that changes the
+result (filters, mode, top_k, ...). Entries are tagged with the corpus
+metadata version and the search index version (index_generation: the
+ingestion scripts' generation counter plus the collection's point count),
+and the whole cache is dropped whenever either changes, so neither an
+ingestion nor a re-embed or re-upsert of existing points is answered from
+before it. Failures are shared with waiting callers but never cached.
+
+Coalescing is per API worker process; the cache is a bounded LRU.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from app.core.metrics import SEARCH_RESULT_CACHE_REQUESTS
+from app.services.corpus_metadata_store import corpus_metadata
+from app.services.index_generation import index_generation
+
+_ENABLED = os.getenv("SEARCH_COALESCING", "true").lower() == "true"
+_TTL_SECONDS = float(os.getenv("SEARCH_RESULT_CACHE_SECONDS", "30"))
+_MAX_ENTRIES = int(os.getenv("SEARCH_RESULT_CACHE_MAX_ENTRIES", "1000"))
+
+T = TypeVar("T")
+
+
+def _versions() -> Tuple[int, int]:
+    return corpus_metadata.version, index_generation.version
+
+
+class SearchCoalescer:
+    """Process-wide singleflight + TTL cache keyed by search parameters."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = _ENABLED,
+        ttl_seconds: float = _TTL_SECONDS,
+        max_entries: int = _MAX_ENTRIES,
+    ) -> None:
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        # (metadata version, index version, key) → (expires at, result);
+        # cleared from the metadata refresh and index polling threads
+        self._results: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def invalidate(self) -> None:
+        """Drop every cached result (metadata store and index generation listener)."""
+        with self._lock:
+            self._results.clear()
+
+    def _cached(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return False, None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._results[key]
+                return False, None
+            self._results.move_to_end(key)
+            return True, result
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._results[key] = (time.monotonic() + self.ttl_seconds, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> Tuple[T, str]:
+        """
+        (result, "hit" | "coalesced" | "miss") of the search identified by
+        `key`. compute() runs only on a miss; the result is shared, so
+        callers must not mutate it.
+        """
+        if not self.enabled:
+            return await compute(), "miss"
+
+        key = (*_versions(), key)
+        found, result = self._cached(key)
+        if found:
+            SEARCH_RESULT_CACHE_REQUESTS.labels("hit").inc()
+            return result, "hit"
+
+        task = self._inflight.get(key)
+        status = "coalesced"
+        if task is None:
+            status = "miss"
+            task = asyncio.ensure_future(self._compute(key, compute))
+            self._inflight[key] = task
+        SEARCH_RESULT_CACHE_REQUESTS.labels(status).inc()
+        return await asyncio.shield(task), status
+
+    async def _compute(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        try:
+            result = await compute()
+            if key[:2] == _versions():
+                self._store(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+
+# Module-level singleton, emptied whenever the corpus or the search index changes
+search_coalescer = SearchCoalescer()
+corpus_metadata.add_listener(search_coalescer.invalidate)
+index_generation.add_listener(search_coalescer.invalidate)
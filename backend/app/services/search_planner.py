@@ -0,0 +1,227 @@
+"""
+Search Planner — Qdrant search parameters chosen from filter selectivity.
+
+_build_filter used to hand the same filter to the dense HNSW prefetch
+whether it kept 40k judgments or 12. Filtered HNSW traversal gets slow and
+loses recall as the filter narrows — the graph walk keeps reaching points
+the filter rejects — while a brute-force scan of a few hundred documents'
+chunks is both exact and cheap. The planner estimates how many documents a
+filter keeps and picks, per query:
+
+    exact     estimate ≤ SEARCH_EXACT_MAX_DOCUMENTS — SearchParams(exact=True)
+    filtered  estimate under 5% of the corpus, or a statute filter —
+              hnsw_ef = QDRANT_HNSW_EF_FILTERED
+    hnsw      everything else — hnsw_ef = QDRANT_HNSW_EF
+
+hnsw_ef never drops below the prefetch limit, which scales with top_k
+(top_k × 10, clamped to 50..1000) so RRF always has candidates to fuse.
+On a quantized collection every plan also carries the oversampling and
+rescore settings of vector_quantization.py. Once a "dense_small" projection
+is verified (dense_projection.py) the strategy applies to that first stage,
+which shortlists prefetch_limit × DENSE_SMALL_SHORTLIST_FACTOR candidates
+(at most 2000) for the full dense vector to rescore.
+
+Estimates come from facet counts cached per corpus metadata snapshot:
+document counts per court, state and case type, and sorted years per court,
+so "court + year range" — the common narrow case — is counted exactly and
+state / case type are folded in assuming independence. statute and
+section_type are not counted; the estimate is then an upper bound, which
+is still safe for choosing exact search.
+
+The plan is reported as `timings.plan` of the response.
+"""
+import bisect
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from qdrant_client.models import QuantizationSearchParams, SearchParams
+
+from app.services.corpus_metadata_store import corpus_metadata
+from app.services.dense_projection import SMALL_VECTOR, active_projection
+from app.services.vector_quantization import OVERSAMPLING, RESCORE
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.getenv("SEARCH_PLANNER", "true").lower() == "true"
+_EXACT_MAX_DOCUMENTS = int(os.getenv("SEARCH_EXACT_MAX_DOCUMENTS", "200"))
+_HNSW_EF = int(os.getenv("QDRANT_HNSW_EF", "128"))
+_HNSW_EF_FILTERED = int(os.getenv("QDRANT_HNSW_EF_FILTERED", "256"))
+_SHORTLIST_FACTOR = int(os.getenv("DENSE_SMALL_SHORTLIST_FACTOR", "4"))
+
+_SELECTIVE_SHARE = 0.05
+_PREFETCH_MULTIPLIER = 10
+_MIN_PREFETCH = 50
+_MAX_PREFETCH = 1000
+_MAX_SHORTLIST = 2000
+_FACET_COLUMNS = ("court", "state", "case_type", "year")
+
+
+@dataclass(frozen=True)
+class SearchPlan:
+    """How the dense prefetch of one search runs."""
+
+    strategy: str                              # "exact" | "filtered" | "hnsw" | "default"
+    prefetch_limit: int
+    hnsw_ef: Optional[int] = None
+    estimated_documents: Optional[int] = None
+    oversampling: Optional[float] = None       # set on quantized collections only
+    rescore: Optional[bool] = None
+    first_stage: str = "dense"                 # "dense_small": shortlist, then rescore with "dense"
+    shortlist_limit: Optional[int] = None
+
+    @property
+    def search_params(self) -> Optional[SearchParams]:
+        """`params` of the dense Prefetch (None leaves the collection defaults)."""
+        quantization = None
+        if self.oversampling is not None:
+            quantization = QuantizationSearchParams(oversampling=self.oversampling, rescore=self.rescore)
+        if self.strategy == "exact":
+            return SearchParams(exact=True, quantization=quantization)
+        if self.hnsw_ef is not None or quantization is not None:
+            return SearchParams(hnsw_ef=self.hnsw_ef, quantization=quantization)
+        return None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def prefetch_limit(top_k: int) -> int:
+    """Candidates per prefetch for top_k documents."""
+    return max(_MIN_PREFETCH, min(top_k * _PREFETCH_MULTIPLIER, _MAX_PREFETCH))
+
+
+class _FacetCounts:
+    """Document counts per filter value, from one metadata snapshot."""
+
+    def __init__(self, rows: Iterable[Sequence]) -> None:
+        self.total = 0
+        self.counts: Dict[str, Dict[str, int]] = {"court": {}, "state": {}, "case_type": {}}
+        years: Dict[Optional[str], List[int]] = {None: []}
+        for _, court, state, case_type, year in rows:
+            self.total += 1
+            for column, value in (("court", court), ("state", state), ("case_type", case_type)):
+                if value is not None:
+                    self.counts[column][value] = self.counts[column].get(value, 0) + 1
+            if year is not None:
+                years[None].append(year)
+                if court is not None:
+                    years.setdefault(court, []).append(year)
+        self.years = {court: sorted(values) for court, values in years.items()}
+
+    def _court_years(self, court: Optional[str], year_min: Optional[int], year_max: Optional[int]) -> int:
+        if year_min is None and year_max is None:
+            return self.total if court is None else self.counts["court"].get(court, 0)
+        years = self.years.get(court, [])
+        lo = 0 if year_min is None else bisect.bisect_left(years, year_min)
+        hi = len(years) if year_max is None else bisect.bisect_right(years, year_max)
+        return max(0, hi - lo)
+
+    def estimate(
+        self,
+        court: Optional[str],
+        year_min: Optional[int],
+        year_max: Optional[int],
+        state: Optional[str],
+        case_type: Optional[str],
+    ) -> int:
+        """Documents expected to pass the filter (court × year exact, the rest independent)."""
+        estimate = float(self._court_years(court, year_min, year_max))
+        for column, value in (("state", state), ("case_type", case_type)):
+            if value is not None:
+                estimate *= self.counts[column].get(value, 0) / max(1, self.total)
+        return int(round(estimate))
+
+
+class SearchPlanner:
+    """Process-wide planner, its facet counts kept in step with corpus_metadata."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = _ENABLED,
+        exact_max_documents: int = _EXACT_MAX_DOCUMENTS,
+        hnsw_ef: int = _HNSW_EF,
+        hnsw_ef_filtered: int = _HNSW_EF_FILTERED,
+        oversampling: Optional[float] = OVERSAMPLING,
+        rescore: bool = RESCORE,
+        shortlist_factor: int = _SHORTLIST_FACTOR,
+    ) -> None:
+        self.enabled = enabled
+        self.exact_max_documents = exact_max_documents
+        self.hnsw_ef = hnsw_ef
+        self.hnsw_ef_filtered = hnsw_ef_filtered
+        self.oversampling = oversampling
+        self.rescore = rescore
+        self.shortlist_factor = shortlist_factor
+        self._facets: Optional[_FacetCounts] = None
+        self._version = -1
+
+    def build(self, rows: Iterable[Sequence]) -> None:
+        """Replace the facet counts with ones built from (document_id, court, state, case_type, year) rows."""
+        t0 = time.perf_counter()
+        self._facets = _FacetCounts(rows)
+        logger.info(
+            "Search planner facets built: %d documents in %.2fs",
+            self._facets.total, time.perf_counter() - t0,
+        )
+
+    def rebuild(self) -> None:
+        """Rebuild from the current metadata snapshot (metadata store listener)."""
+        if not self.enabled or not corpus_metadata.ready:
+            return
+        version = corpus_metadata.version
+        if version != self._version:
+            self.build(corpus_metadata.iter_columns(*_FACET_COLUMNS))
+            self._version = version
+
+    def plan(
+        self,
+        top_k: int,
+        *,
+        court: Optional[str] = None,
+        year_min: Optional[int] = None,
+        year_max: Optional[int] = None,
+        state: Optional[str] = None,
+        case_type: Optional[str] = None,
+        section_type: Optional[str] = None,
+        statute: Optional[str] = None,
+    ) -> SearchPlan:
+        """The plan for one hybrid search with the given filters."""
+        limit = prefetch_limit(top_k)
+        if not self.enabled:
+            return self._plan("default", top_k * _PREFETCH_MULTIPLIER)
+
+        filtered = any(v is not None for v in (court, year_min, year_max, state, case_type, section_type, statute))
+        facets = self._facets
+        estimate = None
+        if facets is not None and facets.total:
+            estimate = facets.estimate(court, year_min, year_max, state, case_type)
+            if filtered and estimate <= self.exact_max_documents:
+                return self._plan("exact", limit, estimated_documents=estimate)
+
+        selective = bool(statute) or (
+            estimate is not None and estimate < _SELECTIVE_SHARE * facets.total
+        ) or (filtered and estimate is None)
+        if selective:
+            return self._plan("filtered", limit, max(self.hnsw_ef_filtered, limit), estimate)
+        return self._plan("hnsw", limit, max(self.hnsw_ef, limit), estimate)
+
+    def _plan(self, strategy: str, limit: int, hnsw_ef: Optional[int] = None,
+              estimated_documents: Optional[int] = None) -> SearchPlan:
+        rescore = self.rescore if self.oversampling is not None else None
+        if active_projection() is None:
+            return SearchPlan(strategy, limit, hnsw_ef, estimated_documents, self.oversampling, rescore)
+        shortlist = min(max(limit, limit * self.shortlist_factor), _MAX_SHORTLIST)
+        if hnsw_ef is not None:
+            hnsw_ef = max(hnsw_ef, shortlist)
+        return SearchPlan(
+            strategy, limit, hnsw_ef, estimated_documents, self.oversampling, rescore, SMALL_VECTOR, shortlist
+        )
+
+
+# Module-level singleton, rebuilt after every metadata refresh
+search_planner = SearchPlanner()
+corpus_metadata.add_listener(search_planner.rebuild)
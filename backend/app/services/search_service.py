@@ -2,7 +2,6 @@ import os
 import json
 import numpy as np
 import faiss
-from sentence_transformers import SentenceTransformer
 import tempfile
 import sys
 
@@ -11,6 +10,9 @@ _API_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if _API_DIR not in sys.path:
     sys.path.insert(0, _API_DIR)
 
+from app.services.embedding_service import embed_query, l2_normalize
+from app.services.model_registry import get_sentence_transformer
+
 class LegalCaseSearcher:
     def __init__(self):
         self.model = None
@@ -74,9 +76,9 @@ class LegalCaseSearcher:
     
     def _load_model_and_index(self, index_path, id2name_path):
         """Load the model, index, and mapping from file paths."""
-        # Load the sentence transformer model
+        # Shared sentence transformer — same instance as the Qdrant search path
         print("🤖 Loading sentence transformer model...")
-        self.model = SentenceTransformer("sentence-transformers/all-mpnet-base-v2")
+        self.model = get_sentence_transformer()
         
         # Load FAISS index with MEMORY MAPPING to prevent Windows Pagefile exhaustion (os error 1455)
         print("🔍 Loading FAISS index...")
@@ -93,9 +95,8 @@ class LegalCaseSearcher:
             raise RuntimeError("Search index not properly loaded. Please check if embeddings have been generated.")
         
         try:
-            # Encode and normalize query
-            query_vec = self.model.encode([query_text])
-            query_vec = query_vec / np.linalg.norm(query_vec)
+            # Encode (micro-batched with the other query paths) and normalize
+            query_vec = l2_normalize(embed_query(query_text))[np.newaxis, :]
             
             # Search in FAISS index
             D, I = self.index.search(query_vec.astype('float32'), top_k)
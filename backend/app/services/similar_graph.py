@@ -0,0 +1,195 @@
+"""
+Similar Graph — precomputed top-N similar documents for every judgment.
+
+The corpus only changes at ingestion time, so "cases similar to X" is the
+same answer on every request. scripts/centroids/build_similar_graph.py
+computes it once for all documents from the centroid collection (blocked
+matrix multiplication over the unit-normalised centroids, see build_knn)
+and writes a directory:
+
+    manifest.json   format version, document count, k, build time
+    keys.npy        (N,) S16     — document UUID bytes, sorted
+    neighbors.npy   (N, k) int32 — row indices into keys, best first
+    scores.npy      (N, k) float16 — cosine similarity of each neighbour
+
+The arrays are memory-mapped; a lookup is one binary search over keys and
+one row read. Documents ingested after the build are not in the graph and
+get_similar_cases falls back to the live centroid query.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.metrics import SIMILAR_GRAPH_LOOKUPS
+from app.services.chunk_text_store import _key, _remove_tree
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+_DEFAULT_DIR = Path(__file__).resolve().parents[2] / "data" / "similar_graph"
+SIMILAR_GRAPH_DIR = Path(os.getenv("SIMILAR_GRAPH_DIR", str(_DEFAULT_DIR)))
+
+
+class SimilarGraph:
+    """Read-only view over one built similar-documents graph."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path / "manifest.json") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"unsupported similar graph version {self.manifest.get('version')}")
+
+        self._keys = np.load(self.path / "keys.npy", mmap_mode="r")
+        self._neighbors = np.load(self.path / "neighbors.npy", mmap_mode="r")
+        self._scores = np.load(self.path / "scores.npy", mmap_mode="r")
+        self.k = int(self._neighbors.shape[1]) if self._neighbors.ndim == 2 else 0
+
+    def __len__(self) -> int:
+        return int(self._keys.shape[0])
+
+    def _row(self, document_id: str) -> Optional[int]:
+        key = _key(document_id)
+        if key is None or len(self) == 0:
+            return None
+        idx = int(np.searchsorted(self._keys, np.bytes_(key)))
+        # numpy drops trailing NUL bytes when reading an S16 element back
+        if idx < len(self) and self._keys[idx] == key.rstrip(b"\x00"):
+            return idx
+        return None
+
+    def neighbours(self, document_id: str, top_k: int) -> Optional[List[Tuple[str, float]]]:
+        """
+        [(document_id, score)] of the top_k most similar documents, or None
+        when the document is unknown or top_k exceeds the stored k.
+        """
+        row = self._row(document_id) if top_k <= self.k else None
+        if row is None:
+            SIMILAR_GRAPH_LOOKUPS.labels("miss").inc()
+            return None
+        SIMILAR_GRAPH_LOOKUPS.labels("hit").inc()
+        return [
+            (str(uuid.UUID(bytes=self._keys[int(n)].ljust(16, b"\x00"))), round(float(s), 6))
+            for n, s in zip(self._neighbors[row, :top_k], self._scores[row, :top_k])
+        ]
+
+
+# ── Builder (used by scripts/centroids/build_similar_graph.py) ─────────────────
+
+def build_knn(
+    vectors: np.ndarray,
+    k: int,
+    *,
+    block_size: int = 2048,
+    workers: int = 4,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact top-k cosine neighbours of every row of `vectors` (self excluded).
+
+    Rows are unit-normalised, then processed in blocks of `block_size`: one
+    (block × N) matmul per block, argpartition for the top k, sort. Blocks run
+    on `workers` threads (BLAS releases the GIL). Peak extra memory is about
+    workers × block_size × N × 4 bytes.
+    """
+    x = np.ascontiguousarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    x = np.divide(x, norms, out=np.zeros_like(x), where=norms > 0)
+    n = x.shape[0]
+    k = max(0, min(k, n - 1))
+
+    neighbors = np.zeros((n, k), dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        return neighbors, scores
+
+    def run_block(start: int) -> None:
+        stop = min(start + block_size, n)
+        sims = x[start:stop] @ x.T
+        sims[np.arange(stop - start), np.arange(start, stop)] = -np.inf  # never yourself
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(sims, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        neighbors[start:stop] = np.take_along_axis(top, order, axis=1)
+        scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(run_block, range(0, n, block_size)))
+    return neighbors, scores
+
+
+def write_similar_graph(
+    path: Path,
+    document_ids: Sequence[str],
+    neighbors: np.ndarray,
+    scores: np.ndarray,
+) -> int:
+    """
+    Write a graph for `document_ids` (sorted by UUID; neighbors index into
+    this same order). Built in `<path>.tmp` and renamed into place. Returns
+    the number of documents.
+    """
+    keys = [uuid.UUID(d).bytes for d in document_ids]
+    if any(a >= b for a, b in zip(keys, keys[1:])):
+        raise ValueError("document_ids must be unique and sorted by UUID")
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        _remove_tree(tmp)
+    tmp.mkdir(parents=True)
+
+    np.save(tmp / "keys.npy", np.frombuffer(b"".join(keys), dtype="S16"))
+    np.save(tmp / "neighbors.npy", np.asarray(neighbors, dtype=np.int32))
+    np.save(tmp / "scores.npy", np.asarray(scores, dtype=np.float16))
+    with open(tmp / "manifest.json", "w") as f:
+        json.dump({
+            "version": FORMAT_VERSION,
+            "count": len(keys),
+            "k": int(neighbors.shape[1]) if neighbors.ndim == 2 else 0,
+            "built_at": int(time.time()),
+        }, f, indent=2)
+
+    if path.exists():
+        old = path.with_name(path.name + ".old")
+        if old.exists():
+            _remove_tree(old)
+        path.rename(old)
+        tmp.rename(path)
+        _remove_tree(old)
+    else:
+        tmp.rename(path)
+    return len(keys)
+
+
+# ── Singleton accessor ─────────────────────────────────────────────────────────
+
+_graph: Optional[SimilarGraph] = None
+_graph_checked = False
+_graph_lock = threading.Lock()
+
+
+def get_similar_graph() -> Optional[SimilarGraph]:
+    """Return the graph at SIMILAR_GRAPH_DIR, or None when none was built. Opened once per process."""
+    global _graph, _graph_checked
+    if _graph_checked:
+        return _graph
+    with _graph_lock:
+        if not _graph_checked:
+            if (SIMILAR_GRAPH_DIR / "manifest.json").exists():
+                try:
+                    _graph = SimilarGraph(SIMILAR_GRAPH_DIR)
+                    logger.info("Similar graph opened: %d documents, k=%d", len(_graph), _graph.k)
+                except Exception as exc:
+                    logger.warning("Similar graph at %s unusable: %s", SIMILAR_GRAPH_DIR, exc)
+            else:
+                logger.info("No similar graph at %s — similar cases are computed live", SIMILAR_GRAPH_DIR)
+            _graph_checked = True
+    return _graph
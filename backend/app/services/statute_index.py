@@ -0,0 +1,156 @@
+"""
+Statute Index — canonical keys for "Section X of Act Y" references.
+
+Queries like "Section 302 IPC" used to depend on BM25 happening to rank the
+right chunks. At ingestion every judgment's statute references are now
+normalised into canonical keys and stored twice:
+
+  - legal_documents.statute_keys (text[], GIN index) — exact lookup for
+    GET /api/search/statute
+  - the `statute_keys` keyword payload of every chunk point in Qdrant — the
+    `statute` filter of POST /api/search
+
+Key format:
+    "IPC:302"            section 302 of the Indian Penal Code
+    "CRPC:482", "IEA:27", "NDPS:37", "CONSTITUTION:21" (Article 21), ...
+    "IPC"                act-level key: the judgment refers to the act
+    "COMPANIES_ACT:241"  acts without a short name: slug of the act name
+
+"Section 302 of the Indian Penal Code", "S. 302 IPC", "u/s 302 I.P.C.",
+"Sections 302/34 IPC" and "section 302 read with section 34 of the IPC" all
+produce IPC:302 (and IPC:34). Sub-clauses are dropped ("13(1)(e)" → "13").
+A section number without a named act is ambiguous and is not indexed.
+"""
+import re
+from collections import Counter
+from typing import Iterable, List, Optional
+
+from sqlalchemy import text
+
+# Short names of the acts Indian judgments cite most; order matters where one
+# alias is a prefix of another (Cr.P.C. before C.P.C.)
+_ACT_ALIASES = [
+    ("CRPC", r"Code\s+of\s+Criminal\s+Procedure|Criminal\s+Procedure\s+Code|\bCr\.?\s?P\.?\s?C\b\.?"),
+    ("CPC", r"Code\s+of\s+Civil\s+Procedure|Civil\s+Procedure\s+Code|\bC\.?\s?P\.?\s?C\b\.?"),
+    ("IPC", r"(?:Indian\s+)?Penal\s+Code|\bI\.?\s?P\.?\s?C\b\.?"),
+    ("BNSS", r"Bharatiya\s+Nagarik\s+Suraksha\s+Sanhita|\bBNSS\b"),
+    ("BNS", r"Bharatiya\s+Nyaya\s+Sanhita|\bBNS\b"),
+    ("BSA", r"Bharatiya\s+Sakshya\s+Adhiniyam|\bBSA\b"),
+    ("IEA", r"(?:Indian\s+)?Evidence\s+Act"),
+    ("NDPS", r"Narcotic\s+Drugs\s+and\s+Psychotropic\s+Substances\s+Act|\bN\.?D\.?P\.?S\.?\s+Act"),
+    ("NIA", r"Negotiable\s+Instruments\s+Act|\bN\.?I\.?\s+Act"),
+    ("PCA", r"Prevention\s+of\s+Corruption\s+Act|\bP\.?C\.?\s+Act"),
+    ("POCSO", r"Protection\s+of\s+Children\s+from\s+Sexual\s+Offences\s+Act|\bPOCSO(?:\s+Act)?"),
+    ("MVA", r"Motor\s+Vehicles\s+Act|\bM\.?V\.?\s+Act"),
+    ("IDA", r"Industrial\s+Disputes\s+Act|\bI\.?D\.?\s+Act"),
+    ("ITA", r"Income[\s-]+tax\s+Act"),
+    ("ARBITRATION", r"Arbitration\s+(?:and\s+Conciliation\s+)?Act"),
+    ("HMA", r"Hindu\s+Marriage\s+Act"),
+    ("TPA", r"Transfer\s+of\s+Property\s+Act|\bT\.?P\.?\s+Act"),
+    ("SRA", r"Specific\s+Relief\s+Act"),
+    ("LIMITATION", r"Limitation\s+Act"),
+    ("CONSTITUTION", r"Constitution(?:\s+of\s+India)?"),
+]
+_ALIAS_RES = [(key, re.compile(rf"(?:{alias})", re.I)) for key, alias in _ACT_ALIASES]
+
+# Any other act: capitalised words ending in "Act" ("Companies Act, 2013",
+# "Prevention of Money Laundering Act")
+_GENERIC_ACT = r"(?-i:(?:[A-Z][A-Za-z]*\s+(?:(?:of|and|for|the)\s+)?){1,8}Act)(?:,?\s*\d{4})?"
+_ACT = "|".join(f"(?:{alias})" for _, alias in _ACT_ALIASES) + f"|{_GENERIC_ACT}"
+
+_SUBCLAUSES = r"(?:\s*\(\s*[0-9A-Za-z]{1,4}\s*\))*"
+_NUMBER = r"\d{1,4}(?:-?[A-Za-z]{1,2})?(?![\dA-Za-z])"
+_ITEM = _NUMBER + _SUBCLAUSES
+_SEP = r"\s*(?:,|/|&|\band\b|\bor\b|\bread\s+with\b)\s*(?:(?:sections?|secs?\.?|s\.)\s*)?"
+_LIST = rf"{_ITEM}(?:{_SEP}{_ITEM})*"
+
+_SECTION_RE = re.compile(
+    rf"(?:\bsections?|\bsecs?\.|\bsec\b|\bss?\.|\bu/ss?\.?)\s*(?P<list>{_LIST})\s*,?\s*"
+    rf"(?:of\s+(?:the\s+)?(?:said\s+)?)?(?P<act>{_ACT})",
+    re.I,
+)
+_ARTICLE_RE = re.compile(rf"(?:\barticles?|\barts?\.)\s*(?P<list>{_LIST})", re.I)
+_NUMBER_RE = re.compile(r"\d{1,4}(?:-?[A-Za-z]{1,2})?")
+_SUBCLAUSE_RE = re.compile(r"\(\s*[0-9A-Za-z]{1,4}\s*\)")
+_CANONICAL_RE = re.compile(r"[A-Z][A-Z0-9_]*(?::\d{1,4}[A-Z]{0,2})?")
+
+MAX_KEYS_PER_DOCUMENT = 300
+
+# Lookup for GET /api/search/statute — GIN containment on legal_documents.statute_keys
+STATUTE_DOCUMENTS_SQL = text("""
+    SELECT id::text, COUNT(*) OVER ()
+    FROM legal_documents
+    WHERE statute_keys @> ARRAY[CAST(:statute_key AS text)]
+    ORDER BY year DESC NULLS LAST, id
+    LIMIT :limit OFFSET :offset
+""")
+
+
+def act_key(name: Optional[str]) -> Optional[str]:
+    """Canonical key of an act name ("Indian Penal Code, 1860" → "IPC"), or None."""
+    name = re.sub(r"\s+", " ", name or "").strip()
+    if not name:
+        return None
+    for key, alias_re in _ALIAS_RES:
+        m = alias_re.match(name)
+        if m and not re.sub(r"[\s,.\d]", "", name[m.end():]):
+            return key
+    words = [w for w in re.findall(r"[A-Za-z]+", name) if w.lower() != "the"]
+    if len(words) < 2 or words[-1].lower() != "act":
+        return None
+    return "_".join(w.upper() for w in words)
+
+
+def _numbers(section_list: str) -> List[str]:
+    bare = _SUBCLAUSE_RE.sub(" ", section_list)
+    return [n.replace("-", "").upper() for n in _NUMBER_RE.findall(bare)]
+
+
+def _mentions(text: Optional[str]) -> List[str]:
+    """Section-level key of every statute reference in `text`, in text order, repeats included."""
+    found = []
+    for m in _SECTION_RE.finditer(text or ""):
+        act = act_key(m.group("act"))
+        if act:
+            found.extend((m.start(), f"{act}:{number}") for number in _numbers(m.group("list")))
+    for m in _ARTICLE_RE.finditer(text or ""):
+        found.extend((m.start(), f"CONSTITUTION:{number}") for number in _numbers(m.group("list")))
+    found.sort(key=lambda item: item[0])  # stable: a list keeps its own order
+    return [key for _, key in found]
+
+
+def extract_statutes(text: Optional[str]) -> List[str]:
+    """Section-level keys ("IPC:302") of every statute reference in `text`, in order, without duplicates."""
+    return list(dict.fromkeys(_mentions(text)))
+
+
+def document_statute_keys(full_text: Optional[str], acts_referred: Iterable[str] = ()) -> List[str]:
+    """
+    Sorted statute keys of one judgment: its section references plus act-level
+    keys. Beyond MAX_KEYS_PER_DOCUMENT the act-level keys are kept, then the
+    most-mentioned sections (first mentioned on ties).
+    """
+    counts = Counter(_mentions(full_text))
+    sections = sorted(counts, key=lambda key: -counts[key])  # Counter keeps first-mention order
+    acts = [key.split(":", 1)[0] for key in sections]
+    acts.extend(filter(None, (act_key(act) for act in acts_referred or ())))
+    ranked = list(dict.fromkeys(acts + sections))
+    return sorted(ranked[:MAX_KEYS_PER_DOCUMENT])
+
+
+def parse_statute(query: Optional[str]) -> Optional[str]:
+    """
+    The one statute key `query` names — "Section 302 IPC", "Article 21",
+    "Indian Penal Code" or an already canonical "IPC:302" — else None.
+    """
+    query = (query or "").strip()
+    if not query:
+        return None
+    if ":" in query and _CANONICAL_RE.fullmatch(query.upper()):
+        return query.upper()
+    keys = extract_statutes(query)
+    if len(keys) == 1:
+        return keys[0]
+    if not keys:
+        return act_key(query)
+    return None
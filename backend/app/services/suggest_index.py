@@ -0,0 +1,199 @@
+"""
+Suggest Index — typeahead prefix lookup over case titles, parties and citations.
+
+Backs GET /api/search/suggest. Every keystroke of the search box is a prefix
+lookup, not a search, so it is answered from memory without the embedding
+model, Qdrant or PostgreSQL:
+
+  - keys are normalised strings (ASCII-folded, lower-case, punctuation
+    collapsed to single spaces — "(2017) 10 SCC 1" → "2017 10 scc 1"):
+      title     the title from each of its first words, so "puttas" finds
+                "Justice K.S. Puttaswamy (Retd.) v. Union of India"
+      party     petitioner and respondent, unless a title key covers them
+      citation  the reported citation
+  - all keys live in one sorted list with parallel numpy arrays (document
+    row, matched field); a prefix is two binary searches (bisect)
+  - the matching range is ordered by document popularity with argpartition,
+    so a one-letter-longer prefix never costs more than the range it selects
+
+There is no usage data in the corpus yet, so popularity is a static prior:
+log(1 + page_count) — reported, landmark judgments run long, interim orders
+are a page or two. Suggestions are deduplicated per document and bounded by
+`limit`.
+
+The index is rebuilt (off the request path) whenever the corpus metadata
+store swaps in a new snapshot.
+"""
+import bisect
+import logging
+import math
+import os
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.metrics import SUGGEST_LOOKUPS
+from app.core.timing import StageTimer
+from app.schemas.search_schemas import Suggestion, SuggestResponse
+from app.services.case_name_index import _STOPWORDS, words
+from app.services.corpus_metadata_store import corpus_metadata
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.getenv("SEARCH_SUGGEST", "true").lower() == "true"
+
+MIN_PREFIX_CHARS = 2
+_KEY_CHARS = 64            # keys (and queries) are cut to this many characters
+_TITLE_POSITIONS = 12      # title keys start at most at this many words
+_FIELDS = ("title", "party", "citation")
+_TITLE, _PARTY, _CITATION = range(len(_FIELDS))
+_SOURCE_COLUMNS = ("title", "petitioner", "respondent", "citation", "page_count")
+
+
+def normalize(text: Optional[str]) -> str:
+    """Lower-case ASCII words of `text` joined by single spaces."""
+    return " ".join(words(text))
+
+
+class _SuggestState:
+    """Immutable sorted keys built from one metadata snapshot."""
+
+    def __init__(self, rows: Iterable[Sequence]) -> None:
+        entries: List[Tuple[str, int, int]] = []
+        self.doc_ids: List[str] = []
+        popularity: List[float] = []
+
+        for doc_id, title, petitioner, respondent, citation, page_count in rows:
+            row = len(self.doc_ids)
+            self.doc_ids.append(doc_id)
+            popularity.append(math.log1p(page_count or 0))
+
+            title_words = words(title)
+            starts = [i for i, w in enumerate(title_words) if i == 0 or w not in _STOPWORDS]
+            title_keys = {" ".join(title_words[i:])[:_KEY_CHARS] for i in starts[:_TITLE_POSITIONS]}
+            entries.extend((key, row, _TITLE) for key in title_keys)
+            for name in (petitioner, respondent):
+                key = normalize(name)[:_KEY_CHARS]
+                # A party name some title key starts with adds no new prefixes
+                if key and not any(t.startswith(key) for t in title_keys):
+                    title_keys.add(key)
+                    entries.append((key, row, _PARTY))
+            key = normalize(citation)[:_KEY_CHARS]
+            if key:
+                entries.append((key, row, _CITATION))
+
+        entries.sort()
+        self.keys: List[str] = [key for key, _, _ in entries]
+        self.rows = np.fromiter((row for _, row, _ in entries), dtype=np.int32, count=len(entries))
+        self.fields = np.fromiter((field for _, _, field in entries), dtype=np.int8, count=len(entries))
+        self.popularity = np.asarray(popularity, dtype=np.float32)
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[str, str]]:
+        """[(document_id, matched field)] for keys starting with `prefix`, most popular first."""
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\x7f", lo)  # keys are [a-z0-9 ] only
+        if lo == hi:
+            return []
+
+        rows = self.rows[lo:hi]
+        fields = self.fields[lo:hi]
+        popularity = self.popularity[rows]
+        # A document can own several keys in the range; over-fetch, then dedupe
+        take = min(len(rows), limit * 4)
+        while True:
+            if take < len(rows):
+                candidates = np.argpartition(-popularity, take - 1)[:take]
+            else:
+                candidates = np.arange(len(rows))
+            candidates = candidates[np.lexsort((candidates, -popularity[candidates]))]
+
+            results: List[Tuple[str, str]] = []
+            seen = set()
+            for i in candidates:
+                row = int(rows[i])
+                if row not in seen:
+                    seen.add(row)
+                    results.append((self.doc_ids[row], _FIELDS[fields[i]]))
+                    if len(results) == limit:
+                        return results
+            if take >= len(rows):
+                return results
+            take = len(rows)
+
+
+class SuggestIndex:
+    """Process-wide typeahead index, kept in step with corpus_metadata."""
+
+    def __init__(self, *, enabled: bool = _ENABLED) -> None:
+        self.enabled = enabled
+        self._state: Optional[_SuggestState] = None
+        self._version = -1
+
+    def build(self, rows: Iterable[Sequence]) -> None:
+        """Replace the index with one built from (document_id, title, petitioner, respondent, citation, page_count) rows."""
+        t0 = time.perf_counter()
+        self._state = _SuggestState(rows)
+        logger.info(
+            "Suggest index built: %d documents, %d keys in %.2fs",
+            len(self._state.doc_ids), len(self._state.keys), time.perf_counter() - t0,
+        )
+
+    def rebuild(self) -> None:
+        """Rebuild from the current metadata snapshot (metadata store listener)."""
+        if not self.enabled or not corpus_metadata.ready:
+            return
+        version = corpus_metadata.version
+        if version != self._version:
+            self.build(corpus_metadata.iter_columns(*_SOURCE_COLUMNS))
+            self._version = version
+
+    def search(self, query: str, limit: int = 8) -> List[Tuple[str, str]]:
+        """
+        [(document_id, matched field)] for `query` as a prefix, at most
+        `limit`, most popular first. Empty for prefixes shorter than
+        MIN_PREFIX_CHARS or before the index is built.
+        """
+        state = self._state
+        if state is None:
+            SUGGEST_LOOKUPS.labels("unavailable").inc()
+            return []
+
+        prefix = normalize(query)[:_KEY_CHARS]
+        if len(prefix) < MIN_PREFIX_CHARS:
+            return []
+        results = state.search(prefix, limit)
+        SUGGEST_LOOKUPS.labels("hit" if results else "miss").inc()
+        return results
+
+    def suggest(self, query: str, limit: int = 8) -> SuggestResponse:
+        """search() hydrated with display metadata from the corpus metadata store."""
+        timer = StageTimer("suggest")
+        with timer.stage("prefix"):
+            matches = self.search(query, limit)
+        with timer.stage("metadata"):
+            meta_by_doc, _ = corpus_metadata.get_many(doc_id for doc_id, _ in matches)
+
+        suggestions = []
+        for doc_id, field in matches:
+            meta = meta_by_doc.get(doc_id, {})
+            suggestions.append(Suggestion(
+                document_id=doc_id,
+                title=meta.get("title"),
+                citation=meta.get("citation"),
+                court=meta.get("court"),
+                year=meta.get("year"),
+                matched=field,
+            ))
+        timings = timer.finish().as_dict()
+        return SuggestResponse(
+            query=query,
+            suggestions=suggestions,
+            search_time_ms=timings["total_ms"],
+            timings=timings,
+        )
+
+
+# Module-level singleton, rebuilt after every metadata refresh
+suggest_index = SuggestIndex()
+corpus_metadata.add_listener(suggest_index.rebuild)
@@ -0,0 +1,103 @@
+"""
+Vector Quantization — storage and query settings for the "dense" vector.
+
+Stored as float32 in RAM, the 1.1M × 768 dense vectors of legal_corpus need
+~3.4 GB before HNSW overhead, which sizes the Qdrant VM. With
+QDRANT_QUANTIZATION set, collections are created (scripts/hybrid/
+recreate_collection.py, qdrant_ingestor.py) with:
+
+  - original float32 vectors on disk (VectorParams(on_disk=True))
+  - a quantized copy pinned in RAM (always_ram=True) that HNSW walks:
+      scalar  int8 per dimension, 0.99 quantile clipping — 4× smaller
+      binary  1 bit per dimension — 32× smaller, coarser
+  - at query time the quantized search fetches oversampling × limit
+    candidates, then rescores them against the originals on disk
+
+QDRANT_QUANTIZATION_OVERSAMPLING / QDRANT_QUANTIZATION_RESCORE tune the
+query side (defaults: 2.0 for scalar, 3.0 for binary; rescore on). The
+search planner puts them into every dense prefetch; they are reported in
+`timings.plan`. scripts/hybrid/benchmark_quantization.py measures recall and
+latency of each setting against the float32 baseline.
+"""
+import os
+from typing import Any, Optional
+
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    QuantizationConfig,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
+
+QUANTIZATION_MODES = ("none", "scalar", "binary")
+_DEFAULT_OVERSAMPLING = {"none": None, "scalar": 2.0, "binary": 3.0}
+
+QUANTIZATION: str = os.getenv("QDRANT_QUANTIZATION", "none").lower()
+if QUANTIZATION not in QUANTIZATION_MODES:
+    raise ValueError(f"QDRANT_QUANTIZATION must be one of {QUANTIZATION_MODES}, got {QUANTIZATION!r}")
+
+_oversampling = os.getenv("QDRANT_QUANTIZATION_OVERSAMPLING")
+OVERSAMPLING: Optional[float] = float(_oversampling) if _oversampling else _DEFAULT_OVERSAMPLING[QUANTIZATION]
+RESCORE: bool = os.getenv("QDRANT_QUANTIZATION_RESCORE", "true").lower() == "true"
+
+
+def quantization_config(mode: str = QUANTIZATION) -> Optional[QuantizationConfig]:
+    """Collection-side quantization for `mode` (None for "none"); quantized vectors stay in RAM."""
+    if mode == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    if mode == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    if mode == "none":
+        return None
+    raise ValueError(f"Unknown quantization mode {mode!r} (expected one of {QUANTIZATION_MODES})")
+
+
+def dense_vector_params(size: int, mode: str = QUANTIZATION) -> VectorParams:
+    """VectorParams of the dense slot: float32 in RAM, or originals on disk plus a quantized copy."""
+    quantization = quantization_config(mode)
+    return VectorParams(
+        size=size,
+        distance=Distance.COSINE,
+        on_disk=quantization is not None,
+        quantization_config=quantization,
+    )
+
+
+def collection_quantization(info: Any, vector_name: str = "dense") -> str:
+    """Quantization mode of a collection's dense vector, from get_collection()."""
+    quantization = info.config.quantization_config
+    vectors = info.config.params.vectors
+    if isinstance(vectors, dict):
+        vectors = vectors.get(vector_name)
+    if vectors is not None and vectors.quantization_config is not None:
+        quantization = vectors.quantization_config
+    if isinstance(quantization, ScalarQuantization):
+        return "scalar"
+    if isinstance(quantization, BinaryQuantization):
+        return "binary"
+    return "none" if quantization is None else type(quantization).__name__
+
+
+def quantization_search_params(
+    mode: str = QUANTIZATION,
+    *,
+    oversampling: Optional[float] = None,
+    rescore: Optional[bool] = None,
+) -> Optional[QuantizationSearchParams]:
+    """Query-side settings for `mode` (env defaults unless overridden); None without quantization."""
+    if mode == "none":
+        return None
+    if oversampling is None:
+        oversampling = OVERSAMPLING if mode == QUANTIZATION else _DEFAULT_OVERSAMPLING[mode]
+    return QuantizationSearchParams(
+        ignore=False,
+        rescore=RESCORE if rescore is None else rescore,
+        oversampling=oversampling,
+    )
@@ -0,0 +1,192 @@
+"""
+JurisFind — Document Centroid Build
+====================================
+Computes one unit-normalised centroid (mean of the "dense" chunk vectors) per
+legal_documents row and stores it in the document-level Qdrant collection
+QDRANT_DOC_COLLECTION (default "legal_corpus_docs"), point id = document_id.
+
+GET /api/search/similar/{document_id} then needs a single point fetch instead
+of scrolling every chunk vector of the source judgment on each request.
+
+Incremental: every centroid carries a fingerprint of its document's chunk
+set (chunk count + md5 over the sorted chunk ids). Only documents that are
+new or were re-chunked since the last run are recomputed; centroids of
+documents that no longer have chunks are deleted.
+
+Run from backend/ after every ingestion:
+    python scripts/centroids/build_doc_centroids.py
+    python scripts/centroids/build_doc_centroids.py --full --workers 16
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv(BASE_DIR / ".env")
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointIdsList, PointStruct, VectorParams
+from sqlalchemy import create_engine, text
+
+from app.services.qdrant_search_service import (
+    QDRANT_COLLECTION,
+    QDRANT_DOC_COLLECTION,
+    _centroid,
+    _dense_vector_of,
+    _scroll_vectors_query,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+QDRANT_HOST  = os.getenv("QDRANT_HOST", "localhost")
+QDRANT_PORT  = int(os.getenv("QDRANT_PORT", "6333"))
+DENSE_DIM    = 768
+UPSERT_SIZE  = 256
+
+FINGERPRINT_SQL = text("""
+    SELECT document_id::text,
+           COUNT(*),
+           md5(string_agg(id::text, ',' ORDER BY id))
+    FROM legal_chunks
+    GROUP BY document_id
+""")
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def ensure_collection(client: QdrantClient) -> None:
+    if client.collection_exists(QDRANT_DOC_COLLECTION):
+        return
+    print(f"  Creating collection '{QDRANT_DOC_COLLECTION}' ({DENSE_DIM}d COSINE)")
+    client.create_collection(
+        collection_name=QDRANT_DOC_COLLECTION,
+        vectors_config=VectorParams(size=DENSE_DIM, distance=Distance.COSINE),
+    )
+
+
+def current_fingerprints(engine) -> dict:
+    """{document_id: "count:md5"} for every document that has chunks."""
+    with engine.connect() as conn:
+        return {doc_id: f"{count}:{digest}" for doc_id, count, digest in conn.execute(FINGERPRINT_SQL)}
+
+
+def stored_fingerprints(client: QdrantClient) -> dict:
+    """{document_id: fingerprint} already in the centroid collection."""
+    stored = {}
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=QDRANT_DOC_COLLECTION,
+            limit=1000,
+            offset=offset,
+            with_payload=["fingerprint"],
+            with_vectors=False,
+        )
+        for point in points:
+            stored[str(point.id)] = (point.payload or {}).get("fingerprint")
+        if offset is None:
+            return stored
+
+
+def pending_documents(current: dict, stored: dict) -> tuple[list, list]:
+    """(documents to recompute — new or re-chunked, centroids to delete — no chunks left)."""
+    todo = [doc_id for doc_id, fp in current.items() if stored.get(doc_id) != fp]
+    gone = [doc_id for doc_id in stored if doc_id not in current]
+    return todo, gone
+
+
+def document_centroid(client: QdrantClient, document_id: str):
+    """Scroll the document's chunk vectors from the chunk collection and average them."""
+    vectors = []
+    offset = None
+    while True:
+        points, offset = client.scroll(**_scroll_vectors_query(document_id, offset))
+        for point in points:
+            vector = _dense_vector_of(point)
+            if vector is not None:
+                vectors.append(vector)
+        if offset is None:
+            return _centroid(vectors), len(vectors)
+
+
+def upsert(client: QdrantClient, points: list) -> None:
+    for i in range(0, len(points), UPSERT_SIZE):
+        client.upsert(collection_name=QDRANT_DOC_COLLECTION, points=points[i:i + UPSERT_SIZE], wait=True)
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Build per-document centroids for similar-case search")
+    parser.add_argument("--full", action="store_true", help="recompute every centroid, ignoring fingerprints")
+    parser.add_argument("--workers", type=int, default=8, help="parallel Qdrant scroll workers")
+    parser.add_argument("--limit", type=int, default=None, help="recompute at most N documents")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  JurisFind — Document Centroid Build")
+    print("=" * 60)
+
+    if not DATABASE_URL:
+        print("\n❌  DATABASE_URL is not set in .env")
+        sys.exit(1)
+
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    client = QdrantClient(host=QDRANT_HOST, port=QDRANT_PORT, timeout=60)
+    ensure_collection(client)
+
+    print(f"\n  Source      : {QDRANT_COLLECTION}")
+    print(f"  Target      : {QDRANT_DOC_COLLECTION}")
+
+    current = current_fingerprints(engine)
+    stored = {} if args.full else stored_fingerprints(client)
+    todo, gone = pending_documents(current, stored)
+    if args.limit:
+        todo = todo[:args.limit]
+
+    print(f"  Documents   : {len(current):,} with chunks, {len(stored):,} centroids stored")
+    print(f"  To compute  : {len(todo):,}   To delete: {len(gone):,}")
+
+    if gone:
+        client.delete(collection_name=QDRANT_DOC_COLLECTION, points_selector=PointIdsList(points=gone), wait=True)
+
+    t0 = time.time()
+    batch, done, empty = [], 0, 0
+
+    def compute(doc_id):
+        return doc_id, document_centroid(client, doc_id)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for doc_id, (centroid, n_vectors) in pool.map(compute, todo):
+            done += 1
+            if centroid is None:
+                empty += 1  # chunks in PostgreSQL but not (yet) in Qdrant
+            else:
+                batch.append(PointStruct(
+                    id=doc_id,
+                    vector=centroid,
+                    payload={"document_id": doc_id, "fingerprint": current[doc_id], "chunk_count": n_vectors},
+                ))
+            if len(batch) >= UPSERT_SIZE:
+                upsert(client, batch)
+                batch = []
+            if done % 1000 == 0:
+                print(f"      {done:,}/{len(todo):,} documents ...")
+    if batch:
+        upsert(client, batch)
+
+    print(f"\n  ✓ {done - empty:,} centroids written in {time.time() - t0:.1f}s")
+    if empty:
+        print(f"  ⚠  {empty:,} documents have no vectors in '{QDRANT_COLLECTION}' — skipped")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+JurisFind — Similar Cases Graph Build
+======================================
+Precomputes the top-N most similar documents for every judgment and writes
+the memory-mapped adjacency table served by app/services/similar_graph.py.
+
+Input is the document centroid collection (run build_doc_centroids.py
+first). All centroids are loaded into one (N × 768) matrix and compared
+exactly with blocked matrix multiplication: each block of rows is multiplied
+against the whole matrix on a worker thread and reduced to its top N with
+argpartition, so memory stays at workers × block × N floats.
+
+Re-run after build_doc_centroids.py on every ingestion, then restart the API
+workers. Documents added since the last build are served by the live
+similar-case query.
+
+Run from backend/:
+    python scripts/centroids/build_similar_graph.py
+    python scripts/centroids/build_similar_graph.py --k 100 --workers 8 --block-size 1024
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv(BASE_DIR / ".env")
+
+import numpy as np
+from qdrant_client import QdrantClient
+
+from app.services.qdrant_search_service import QDRANT_DOC_COLLECTION, _dense_vector_of
+from app.services.similar_graph import SIMILAR_GRAPH_DIR, build_knn, write_similar_graph
+
+# ── Config ────────────────────────────────────────────────────────────────────
+QDRANT_HOST = os.getenv("QDRANT_HOST", "localhost")
+QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
+SCROLL_SIZE = 1000
+
+
+def load_centroids(client: QdrantClient):
+    """All (document_id, centroid) pairs, sorted by document UUID."""
+    rows = []
+    offset = None
+    pages = 0
+    while True:
+        points, offset = client.scroll(
+            collection_name=QDRANT_DOC_COLLECTION,
+            limit=SCROLL_SIZE,
+            offset=offset,
+            with_payload=False,
+            with_vectors=True,
+        )
+        for point in points:
+            vector = _dense_vector_of(point)
+            if vector is not None:
+                rows.append((str(point.id), vector))
+        pages += 1
+        if pages % 10 == 0:
+            print(f"      {len(rows):,} centroids loaded ...")
+        if offset is None:
+            break
+
+    rows.sort(key=lambda r: uuid.UUID(r[0]).bytes)
+    ids = [doc_id for doc_id, _ in rows]
+    matrix = np.asarray([vector for _, vector in rows], dtype=np.float32)
+    return ids, matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed similar-cases graph")
+    parser.add_argument("--out", default=str(SIMILAR_GRAPH_DIR), help="graph directory")
+    parser.add_argument("--k", type=int, default=50, help="neighbours stored per document")
+    parser.add_argument("--block-size", type=int, default=2048, help="rows per matmul block")
+    parser.add_argument("--workers", type=int, default=4, help="parallel block workers")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  JurisFind — Similar Cases Graph Build")
+    print("=" * 60)
+
+    client = QdrantClient(host=QDRANT_HOST, port=QDRANT_PORT, timeout=60)
+    if not client.collection_exists(QDRANT_DOC_COLLECTION):
+        print(f"\n❌  Collection '{QDRANT_DOC_COLLECTION}' not found — run build_doc_centroids.py first")
+        sys.exit(1)
+
+    t0 = time.time()
+    ids, matrix = load_centroids(client)
+    print(f"\n  Centroids   : {len(ids):,} × {matrix.shape[1] if matrix.ndim == 2 else 0} "
+          f"({time.time() - t0:.1f}s)")
+    if len(ids) < 2:
+        print("\n❌  Need at least two documents")
+        sys.exit(1)
+
+    t1 = time.time()
+    neighbors, scores = build_knn(matrix, args.k, block_size=args.block_size, workers=args.workers)
+    print(f"  kNN         : k={neighbors.shape[1]} in {time.time() - t1:.1f}s "
+          f"({args.workers} workers, blocks of {args.block_size})")
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    count = write_similar_graph(out, ids, neighbors, scores)
+    size = sum(f.stat().st_size for f in out.iterdir())
+
+    print(f"\n  ✓ {count:,} documents written to {out} ({size / 1024 / 1024:.1f} MB)")
+    print("\n  Restart the API workers to pick up the new graph.\n")
+
+
+if __name__ == "__main__":
+    main()
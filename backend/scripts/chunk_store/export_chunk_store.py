@@ -0,0 +1,102 @@
+"""
+JurisFind — Chunk Text Store Export
+====================================
+Exports legal_chunks (id, chunk_text) into the read-only, memory-mapped
+chunk text store served by app/services/chunk_text_store.py.
+
+Rows are streamed from PostgreSQL in id order (server-side cursor) and
+written straight to disk; each chunk is zstd-compressed on its own with a
+shared dictionary trained on the first rows. The new store is built next to
+the old one and swapped in with a rename.
+
+Re-run after every ingestion. Running API workers keep the store they opened;
+chunks added since are served from PostgreSQL until the workers restart.
+
+Run from backend/:
+    python scripts/chunk_store/export_chunk_store.py
+    python scripts/chunk_store/export_chunk_store.py --no-compress
+    python scripts/chunk_store/export_chunk_store.py --out /mnt/fast/chunk_store --level 6
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv(BASE_DIR / ".env")
+
+from sqlalchemy import create_engine, text
+
+from app.services.chunk_text_store import CHUNK_STORE_DIR, write_chunk_store, zstandard
+
+# ── Config ────────────────────────────────────────────────────────────────────
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+FETCH_SIZE   = 5_000
+
+
+def stream_chunks(engine, limit=None):
+    """Yield (chunk_id, chunk_text) ordered by id, printing progress."""
+    sql = "SELECT id::text, chunk_text FROM legal_chunks ORDER BY id"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+
+    with engine.connect().execution_options(stream_results=True, yield_per=FETCH_SIZE) as conn:
+        done = 0
+        for chunk_id, chunk_text in conn.execute(text(sql)):
+            yield chunk_id, chunk_text
+            done += 1
+            if done % 100_000 == 0:
+                print(f"      {done:,} chunks written ...")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export legal_chunks to the chunk text store")
+    parser.add_argument("--out", default=str(CHUNK_STORE_DIR), help="store directory")
+    parser.add_argument("--no-compress", action="store_true", help="store raw UTF-8 (no zstd)")
+    parser.add_argument("--level", type=int, default=3, help="zstd compression level")
+    parser.add_argument("--dict-size", type=int, default=112_640, help="zstd dictionary bytes")
+    parser.add_argument("--limit", type=int, default=None, help="export only the first N chunks")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  JurisFind — Chunk Text Store Export")
+    print("=" * 60)
+
+    if not DATABASE_URL:
+        print("\n❌  DATABASE_URL is not set in .env")
+        sys.exit(1)
+
+    compression = "none" if args.no_compress else "zstd"
+    if compression == "zstd" and zstandard is None:
+        print("\n❌  zstandard is not installed. pip install zstandard, or pass --no-compress")
+        sys.exit(1)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    print(f"\n  Output      : {out}")
+    print(f"  Compression : {compression}" + (f" (level {args.level})" if compression == "zstd" else ""))
+
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    t0 = time.time()
+    count = write_chunk_store(
+        out,
+        stream_chunks(engine, args.limit),
+        compression=compression,
+        level=args.level,
+        dict_size=args.dict_size,
+    )
+    elapsed = time.time() - t0
+
+    size = sum(f.stat().st_size for f in out.iterdir())
+    print(f"\n  ✓ {count:,} chunks exported in {elapsed:.1f}s")
+    print(f"  ✓ Store size: {size / 1024 / 1024:.1f} MB")
+    print("\n  Restart the API workers to pick up the new store.\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+JurisFind — Citation Index Build
+=================================
+Back-fills legal_citations (migration 0005) for documents ingested before
+metadata_extractor.py wrote citations itself: every judgment's citation
+column and full-text header are parsed into canonical citation keys
+(app/services/citation_resolver.py).
+
+By default only documents without any legal_citations row are parsed;
+--full re-parses the whole corpus (e.g. after the parser learns a new
+reporter). The API picks the rows up on its next metadata refresh.
+
+Run from backend/ after `alembic upgrade head`:
+    python scripts/citations/build_citation_index.py
+    python scripts/citations/build_citation_index.py --full
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv(BASE_DIR / ".env")
+
+from sqlalchemy import create_engine, text
+
+from app.services.citation_resolver import HEADER_CHARS, write_document_citations
+
+# ── Config ────────────────────────────────────────────────────────────────────
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+BATCH_SIZE   = 500
+
+DOCUMENTS_SQL = """
+    SELECT d.id::text, d.citation, left(d.full_text, :header_chars)
+    FROM legal_documents d
+"""
+MISSING_FILTER = """
+    WHERE NOT EXISTS (SELECT 1 FROM legal_citations c WHERE c.document_id = d.id)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Back-fill legal_citations from the corpus")
+    parser.add_argument("--full", action="store_true", help="re-parse every document, not only unindexed ones")
+    parser.add_argument("--limit", type=int, default=None, help="parse at most N documents")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  JurisFind — Citation Index Build")
+    print("=" * 60)
+
+    if not DATABASE_URL:
+        print("\n❌  DATABASE_URL is not set in .env")
+        sys.exit(1)
+
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    sql = DOCUMENTS_SQL + ("" if args.full else MISSING_FILTER) + " ORDER BY d.id"
+    if args.limit:
+        sql += f" LIMIT {int(args.limit)}"
+
+    with engine.connect() as conn:
+        documents = conn.execute(text(sql), {"header_chars": HEADER_CHARS}).fetchall()
+    print(f"\n  Documents   : {len(documents):,} to parse ({'full' if args.full else 'unindexed only'})")
+
+    t0 = time.time()
+    written, without = 0, 0
+    for start in range(0, len(documents), BATCH_SIZE):
+        with engine.begin() as conn:
+            for doc_id, citation, header in documents[start:start + BATCH_SIZE]:
+                count = write_document_citations(conn, doc_id, citation, header)
+                written += count
+                without += count == 0
+        print(f"      {min(start + BATCH_SIZE, len(documents)):,}/{len(documents):,} documents ...")
+
+    print(f"\n  ✓ {written:,} citations written in {time.time() - t0:.1f}s")
+    if without:
+        print(f"  ⚠  {without:,} documents have no recognisable citation")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+JurisFind — Dense Quantization Benchmark
+=========================================
+Measures recall and latency of the quantized "dense" vector of legal_corpus
+against the float32 originals, on the live collection.
+
+Ground truth per query is an exact float32 scan (quantization ignored). Each
+configuration is then timed with the same queries:
+
+    float32 hnsw            HNSW over the originals (quantization ignored)
+    quantized               HNSW over the quantized copy, no rescoring
+    rescore ×N              quantized HNSW, oversampling N, rescored on originals
+
+Queries are dense vectors of randomly sampled chunks (the chunk itself is
+dropped from its results), or --queries-file with one query text per line,
+embedded with the API's model. Run it after creating the collection with
+--quantization (or applying it with --update) — see
+app/services/vector_quantization.py. Rows to compare against the current
+QDRANT_QUANTIZATION_OVERSAMPLING / _RESCORE settings are marked "◀".
+
+Output:
+  scripts/hybrid/quantization_benchmark.json   ← per-configuration results
+
+Run from backend/:
+    python scripts/hybrid/benchmark_quantization.py
+    python scripts/hybrid/benchmark_quantization.py --queries 500 --k 20 --oversampling 1.5,2,3,4
+    python scripts/hybrid/benchmark_quantization.py --queries-file queries.txt
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv(BASE_DIR / ".env")
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import QuantizationSearchParams, Sample, SampleQuery, SearchParams
+
+from app.services.qdrant_search_service import QDRANT_COLLECTION, _dense_vector_of
+from app.services.vector_quantization import OVERSAMPLING, RESCORE, collection_quantization
+
+# ── Config ────────────────────────────────────────────────────────────────────
+QDRANT_HOST = os.getenv("QDRANT_HOST", "localhost")
+QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
+HNSW_EF     = int(os.getenv("QDRANT_HNSW_EF", "128"))
+OUT_JSON    = BASE_DIR / "scripts" / "hybrid" / "quantization_benchmark.json"
+
+_ORIGINALS = QuantizationSearchParams(ignore=True)
+
+
+def sample_queries(client: QdrantClient, n: int):
+    """[(point id, dense vector)] of n random chunks."""
+    points = client.query_points(
+        collection_name=QDRANT_COLLECTION,
+        query=SampleQuery(sample=Sample.RANDOM),
+        limit=n,
+        with_payload=False,
+        with_vectors=["dense"],
+    ).points
+    return [(str(p.id), v) for p in points if (v := _dense_vector_of(p)) is not None]
+
+
+def text_queries(path: Path):
+    """[(None, dense vector)] of the query texts in `path`, one per line."""
+    from app.services.embedding_service import embed_texts
+
+    texts = [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [(None, v.tolist()) for v in embed_texts(texts)]
+
+
+def run(client: QdrantClient, queries, k: int, params: SearchParams):
+    """(result ids per query, latency ms per query) for one configuration."""
+    results, latencies = [], []
+    for own_id, vector in queries:
+        t0 = time.perf_counter()
+        points = client.query_points(
+            collection_name=QDRANT_COLLECTION,
+            query=vector,
+            using="dense",
+            limit=k + 1,
+            search_params=params,
+            with_payload=False,
+        ).points
+        latencies.append((time.perf_counter() - t0) * 1000)
+        ids = [str(p.id) for p in points if str(p.id) != own_id]
+        results.append(ids[:k])
+    return results, latencies
+
+
+def recall(results, truth, k: int) -> float:
+    return float(np.mean([len(set(r) & set(t[:k])) / max(1, min(k, len(t))) for r, t in zip(results, truth)]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dense quantization against float32")
+    parser.add_argument("--queries", type=int, default=200, help="random chunk vectors to query with")
+    parser.add_argument("--queries-file", default=None, help="query texts, one per line (instead of sampling)")
+    parser.add_argument("--k", type=int, default=10, help="neighbours compared per query")
+    parser.add_argument("--hnsw-ef", type=int, default=HNSW_EF, help="hnsw_ef of every HNSW configuration")
+    parser.add_argument("--oversampling", default="1.5,2,3", help="comma-separated oversampling factors to rescore with")
+    parser.add_argument("--out", default=str(OUT_JSON), help="JSON report path")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  JurisFind — Dense Quantization Benchmark")
+    print("=" * 60)
+
+    client = QdrantClient(host=QDRANT_HOST, port=QDRANT_PORT, timeout=120)
+    if not client.collection_exists(QDRANT_COLLECTION):
+        print(f"\n❌  Collection '{QDRANT_COLLECTION}' not found")
+        sys.exit(1)
+    info = client.get_collection(QDRANT_COLLECTION)
+    mode = collection_quantization(info)
+    print(f"\n  Collection   : {QDRANT_COLLECTION} ({info.points_count:,} points)")
+    print(f"  Quantization : {mode}")
+    if mode == "none":
+        print("\n⚠  The dense vector is not quantized — quantized rows equal float32.")
+        print("   Run scripts/hybrid/recreate_collection.py --quantization scalar --update first.")
+
+    if args.queries_file:
+        queries = text_queries(Path(args.queries_file))
+    else:
+        queries = sample_queries(client, args.queries)
+    if not queries:
+        print("\n❌  No queries")
+        sys.exit(1)
+    print(f"  Queries      : {len(queries)}  (k={args.k}, hnsw_ef={args.hnsw_ef})")
+
+    print("\n  Exact float32 ground truth ...")
+    truth, exact_ms = run(client, queries, args.k, SearchParams(exact=True, quantization=_ORIGINALS))
+
+    configs = [
+        ("float32 hnsw", None, None, SearchParams(hnsw_ef=args.hnsw_ef, quantization=_ORIGINALS)),
+        ("quantized", 1.0, False, SearchParams(
+            hnsw_ef=args.hnsw_ef, quantization=QuantizationSearchParams(rescore=False, oversampling=1.0))),
+    ]
+    for factor in (float(f) for f in args.oversampling.split(",") if f.strip()):
+        configs.append((f"rescore ×{factor:g}", factor, True, SearchParams(
+            hnsw_ef=args.hnsw_ef, quantization=QuantizationSearchParams(rescore=True, oversampling=factor))))
+
+    rows = [{
+        "name": "float32 exact", "oversampling": None, "rescore": None, "recall": 1.0,
+        "p50_ms": float(np.percentile(exact_ms, 50)), "p95_ms": float(np.percentile(exact_ms, 95)),
+    }]
+    for name, oversampling, rescore, params in configs:
+        print(f"  {name} ...")
+        results, latencies = run(client, queries, args.k, params)
+        rows.append({
+            "name": name,
+            "oversampling": oversampling,
+            "rescore": rescore,
+            "recall": recall(results, truth, args.k),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+        })
+
+    print("\n" + "=" * 60)
+    print(f"  {'Configuration':<18}{'Recall@' + str(args.k):>10}{'p50 ms':>10}{'p95 ms':>10}")
+    print("  " + "-" * 48)
+    for row in rows:
+        current = " ◀" if row["oversampling"] == OVERSAMPLING and row["rescore"] == RESCORE else ""
+        print(f"  {row['name']:<18}{row['recall']:>10.4f}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{current}")
+    print("=" * 60)
+
+    out = Path(args.out)
+    out.write_text(json.dumps({
+        "collection": QDRANT_COLLECTION,
+        "points": info.points_count,
+        "quantization": mode,
+        "queries": len(queries),
+        "k": args.k,
+        "hnsw_ef": args.hnsw_ef,
+        "results": rows,
+    }, indent=2), encoding="utf-8")
+    print(f"\n  ✓ Report written to {out}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+JurisFind — Fit the dense_small Projection
+===========================================
+Fits the PCA projection (768 → 256 by default) behind the "dense_small"
+first-stage vector on a random sample of embeddings.npy, writes it to
+DENSE_PROJECTION_DIR (see app/services/dense_projection.py) and reports how
+well the projected first stage shortlists the true full-dimension
+neighbours.
+
+Order of a (re)build — the projection id is tied to the collection:
+    1. python scripts/hybrid/fit_projection.py
+    2. python scripts/hybrid/recreate_collection.py    (adds dense_small + projection id)
+    3. python scripts/hybrid/hybrid_ingestor.py        (writes dense_small vectors)
+    4. restart the API workers
+
+Refitting without steps 2-3 leaves the old collection in place; the API then
+keeps using the full dense vector until the collection is rebuilt.
+
+Run from backend/:
+    python scripts/hybrid/fit_projection.py
+    python scripts/hybrid/fit_projection.py --dim 192 --sample 300000
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv(BASE_DIR / ".env")
+
+import numpy as np
+
+from app.services.dense_projection import (
+    DENSE_PROJECTION_DIR,
+    DenseProjection,
+    _unit_rows,
+    fit_projection,
+    write_projection,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+DEFAULT_EMB_PATH = Path(
+    os.getenv("EMBEDDINGS_PATH", str(BASE_DIR / "scripts" / "qdrant_ingestion" / "embeddings.npy"))
+)
+SEED = 42
+
+
+def shortlist_recall(full: np.ndarray, small: np.ndarray, queries: int, k: int, factor: int) -> float:
+    """Share of each query's exact top-k (full vectors) found in the top k × factor of the projection."""
+    rng = np.random.default_rng(SEED + 1)
+    picks = rng.choice(len(full), size=min(queries, len(full)), replace=False)
+    hits = 0
+    for i in picks:
+        truth = np.argsort(-(full @ full[i]))[1:k + 1]
+        shortlist = np.argsort(-(small @ small[i]))[1:k * factor + 1]
+        hits += len(set(truth.tolist()) & set(shortlist.tolist()))
+    return hits / (len(picks) * k)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit the dense_small PCA projection")
+    parser.add_argument("--embeddings", default=str(DEFAULT_EMB_PATH), help="path to embeddings.npy")
+    parser.add_argument("--dim", type=int, default=256, help="projected dimensions")
+    parser.add_argument("--sample", type=int, default=200_000, help="rows sampled for the fit")
+    parser.add_argument("--check-queries", type=int, default=200, help="queries for the shortlist recall check")
+    parser.add_argument("--check-pool", type=int, default=20_000, help="rows searched by the recall check")
+    parser.add_argument("--factor", type=int, default=4, help="shortlist factor of the recall check")
+    parser.add_argument("--out", default=str(DENSE_PROJECTION_DIR), help="projection directory")
+    args = parser.parse_args()
+
+    emb_path = Path(args.embeddings)
+    if not emb_path.exists():
+        print(f"\n❌  embeddings.npy not found: {emb_path}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("  JurisFind — Fit dense_small Projection")
+    print("=" * 60)
+
+    embeddings = np.load(str(emb_path), mmap_mode="r")
+    print(f"\n  Embeddings : {embeddings.shape[0]:,} × {embeddings.shape[1]}")
+    if args.dim >= embeddings.shape[1]:
+        print(f"\n❌  --dim must be below {embeddings.shape[1]}")
+        sys.exit(1)
+
+    rng = np.random.default_rng(SEED)
+    rows = np.sort(rng.choice(embeddings.shape[0], size=min(args.sample, embeddings.shape[0]), replace=False))
+    t0 = time.time()
+    sample = np.asarray(embeddings[rows], dtype=np.float32)
+    print(f"  Sample     : {len(sample):,} rows ({time.time() - t0:.1f}s)")
+
+    t1 = time.time()
+    mean, components, explained = fit_projection(sample, args.dim)
+    print(f"  PCA        : {args.dim} components, {explained.sum():.1%} of variance ({time.time() - t1:.1f}s)")
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    pid = write_projection(out, mean, components, explained, len(sample))
+    projection = DenseProjection(out)
+
+    pool = _unit_rows(sample[: args.check_pool])
+    recall = shortlist_recall(pool, projection.project(pool), args.check_queries, 10, args.factor)
+    print(f"  Check      : recall@10 of a {args.factor}× shortlist = {recall:.3f} "
+          f"({args.check_queries} queries over {len(pool):,} rows)")
+
+    print(f"\n  ✓ Projection {pid} written to {out}")
+    print("\n  Next: python scripts/hybrid/recreate_collection.py, then hybrid_ingestor.py\n")
+
+
+if __name__ == "__main__":
+    main()
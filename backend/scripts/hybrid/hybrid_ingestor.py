@@ -10,6 +10,8 @@ For each batch:
        - Point ID     = chunk_id (Postgres UUID) — 1:1, no translation needed
        - vector.dense  = 768-dim float vector from embeddings.npy
        - vector.sparse = BM25 sparse vector from FastEmbed
+       - vector.dense_small = PCA projection of the dense vector, when the
+         collection has that slot (projection id must match its metadata)
        - payload       = metadata (chunk_text is NEVER stored in Qdrant)
   5. Skips chunks already present in Qdrant (idempotent / crash-resumable)
 
@@ -52,6 +54,10 @@ from qdrant_client.models import (
 
 from fastembed import SparseTextEmbedding
 
+from app.services.dense_projection import SMALL_VECTOR, collection_projection_id, get_dense_projection
+from app.services.index_generation import bump_index_generation
+from app.services.vector_quantization import QUANTIZATION, collection_quantization
+
 # ── Config ────────────────────────────────────────────────────────────────────
 DATABASE_URL    = os.getenv("DATABASE_URL", "")
 QDRANT_HOST     = os.getenv("QDRANT_HOST", "localhost")
@@ -98,7 +104,8 @@ BATCH_SQL = text("""
         ld.state             AS state,
         ld.year              AS year,
         ld.citation          AS citation,
-        ld.case_type         AS case_type
+        ld.case_type         AS case_type,
+        ld.statute_keys      AS statute_keys
     FROM legal_chunks lc
     JOIN legal_documents ld ON lc.document_id = ld.id
     WHERE ld.quality_flag IN ('clean', 'encoding_fixed')
@@ -194,11 +201,13 @@ def build_points(
     rows: list,
     dense_vectors: list,
     sparse_vectors: list[dict],
+    projection=None,
 ) -> list[PointStruct]:
     """
     Construct Qdrant PointStruct objects from parallel lists.
     Point ID === Postgres chunk_id (UUID string) — always, non-negotiable.
     chunk_text is NEVER included in the payload.
+    With `projection`, each point also gets its "dense_small" vector.
     """
     points = []
     for row, dense_vec, sparse_vec in zip(rows, dense_vectors, sparse_vectors):
@@ -212,16 +221,20 @@ def build_points(
             logger.warning(f"Chunk {chunk_id}: empty sparse vector (blank text?) — using zero-index fallback")
             sparse_vec = {"indices": [0], "values": [0.0]}
 
+        vectors = {
+            "dense": dense_vec.tolist(),
+            "sparse": SparseVector(
+                indices=sparse_vec["indices"],
+                values=sparse_vec["values"],
+            ),
+        }
+        if projection is not None:
+            vectors[SMALL_VECTOR] = projection.project(dense_vec).tolist()
+
         points.append(
             PointStruct(
                 id=chunk_id,          # ← Qdrant Point ID = Postgres chunk_id
-                vector={
-                    "dense": dense_vec.tolist(),
-                    "sparse": SparseVector(
-                        indices=sparse_vec["indices"],
-                        values=sparse_vec["values"],
-                    ),
-                },
+                vector=vectors,
                 payload={
                     # IDs
                     "document_id":  row["document_id"],
@@ -239,6 +252,7 @@ def build_points(
                     "year":         row["year"],
                     "citation":     row["citation"],
                     "case_type":    row["case_type"],
+                    "statute_keys": row["statute_keys"] or [],
                     # chunk_text is intentionally OMITTED — lives only in Postgres
                 },
             )
@@ -317,6 +331,25 @@ def main():
         coll_info = client.get_collection(COLLECTION_NAME)
         existing_count = coll_info.points_count
         logger.info(f"Collection '{COLLECTION_NAME}' has {existing_count:,} existing points.")
+        dense_quantization = collection_quantization(coll_info)
+        logger.info(f"Dense vector quantization: {dense_quantization}")
+        if dense_quantization != QUANTIZATION:
+            logger.warning(
+                f"QDRANT_QUANTIZATION={QUANTIZATION} but the collection uses '{dense_quantization}' — "
+                "recreate it (or apply with recreate_collection.py --update) so search settings match."
+            )
+        projection = None
+        stored_projection = collection_projection_id(coll_info)
+        if stored_projection is not None:
+            projection = get_dense_projection()
+            if projection is None or projection.id != stored_projection:
+                logger.error(
+                    f"Collection has '{SMALL_VECTOR}' built with projection {stored_projection}, "
+                    f"but the fitted projection is {projection.id if projection else 'missing'}. "
+                    "Restore that projection or recreate the collection."
+                )
+                sys.exit(1)
+            logger.info(f"Writing '{SMALL_VECTOR}' vectors (projection {projection.id}).")
     except Exception as e:
         logger.error(f"Cannot access collection '{COLLECTION_NAME}': {e}")
         logger.error("Did you run recreate_collection.py first?")
@@ -419,7 +452,7 @@ def main():
                 continue
 
             # ── 5. Build PointStructs ──────────────────────────────────────────
-            points = build_points(valid_rows, valid_dense, sparse_vectors)
+            points = build_points(valid_rows, valid_dense, sparse_vectors, projection)
 
             # ── 6. Upsert to Qdrant ────────────────────────────────────────────
             upserted = upsert_batch(client, points)
@@ -443,6 +476,11 @@ def main():
                     f"failed={total_failed:,} | {rate:.0f} chunks/s | ETA {eta_s/60:.0f}m"
                 )
 
+    if total_ingested:
+        # API workers drop their cached search results
+        with engine.begin() as conn:
+            bump_index_generation(conn, COLLECTION_NAME)
+
     # ── Final summary ──────────────────────────────────────────────────────────
     elapsed  = time.time() - t_start
     try:
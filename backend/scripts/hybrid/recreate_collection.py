@@ -7,12 +7,27 @@ recreates it with TWO named vector slots:
     "dense"  → 768-dim COSINE float vector  (sentence-transformers/all-mpnet-base-v2)
     "sparse" → BM25 sparse vector           (fastembed BM25)
 
+plus, when a projection has been fitted (scripts/hybrid/fit_projection.py):
+
+    "dense_small" → 256-dim COSINE PCA projection of "dense" — first-stage
+                    shortlist; its projection id is stored in the collection
+                    metadata ("dense_small_projection")
+
 All payload indexes are also recreated.
 
+With --quantization scalar|binary (default: QDRANT_QUANTIZATION) the dense
+originals are stored on disk and an int8 / 1-bit copy is kept in RAM — see
+app/services/vector_quantization.py. --update applies a quantization mode
+to the existing collection in place (Qdrant rebuilds the quantized copy in
+the background) instead of deleting it.
+
 Run from backend/:
     python scripts/hybrid/recreate_collection.py
+    python scripts/hybrid/recreate_collection.py --quantization scalar
+    python scripts/hybrid/recreate_collection.py --quantization binary --update
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -25,13 +40,22 @@ load_dotenv(BASE_DIR / ".env")
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
-    Distance,
+    Disabled,
     HnswConfigDiff,
     OptimizersConfigDiff,
     PayloadSchemaType,
     SparseIndexParams,
     SparseVectorParams,
-    VectorParams,
+    VectorParamsDiff,
+)
+
+from app.services.dense_projection import METADATA_KEY, SMALL_VECTOR, get_dense_projection
+from app.services.vector_quantization import (
+    QUANTIZATION,
+    QUANTIZATION_MODES,
+    collection_quantization,
+    dense_vector_params,
+    quantization_config,
 )
 
 # ── Config ────────────────────────────────────────────────────────────────────
@@ -48,6 +72,8 @@ PAYLOAD_INDEXES = [
     ("section_type", PayloadSchemaType.KEYWORD),
     ("filename",     PayloadSchemaType.KEYWORD),
     ("document_id",  PayloadSchemaType.KEYWORD),
+    ("title",        PayloadSchemaType.TEXT),     # MatchText filter of case-name search
+    ("statute_keys", PayloadSchemaType.KEYWORD),  # "IPC:302" — statute filter
 ]
 
 
@@ -77,7 +103,11 @@ def print_collection_info(client: QdrantClient, collection_name: str):
             sp = cfg.params.sparse_vectors
             if isinstance(vp, dict):
                 for name, v in vp.items():
-                    print(f"  Dense vector   : '{name}' — {v.size}d {v.distance.value}")
+                    print(f"  Dense vector   : '{name}' — {v.size}d {v.distance.value}"
+                          f"{' (on disk)' if v.on_disk else ''}")
+            quantization = collection_quantization(info)
+            if quantization != "none":
+                print(f"  Quantization   : {quantization} (in RAM)")
             if sp:
                 for name in sp:
                     print(f"  Sparse vector  : '{name}' — BM25")
@@ -86,9 +116,32 @@ def print_collection_info(client: QdrantClient, collection_name: str):
         print(f"  Could not fetch collection info: {e}")
 
 
+def update_quantization(client: QdrantClient, collection_name: str, mode: str):
+    """Switch the dense vector of an existing collection to `mode` without re-ingesting."""
+    quantization = quantization_config(mode)
+    client.update_collection(
+        collection_name=collection_name,
+        vectors_config={
+            "dense": VectorParamsDiff(
+                on_disk=quantization is not None,
+                quantization_config=quantization or Disabled.DISABLED,
+            )
+        },
+    )
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 def main():
+    parser = argparse.ArgumentParser(description="JurisFind hybrid collection setup")
+    parser.add_argument("--quantization", choices=QUANTIZATION_MODES, default=QUANTIZATION,
+                        help="dense vector quantization (default: QDRANT_QUANTIZATION)")
+    parser.add_argument("--update", action="store_true",
+                        help="apply --quantization to the existing collection instead of recreating it")
+    parser.add_argument("--no-small-vector", action="store_true",
+                        help="do not add the dense_small vector even if a projection was fitted")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("  JurisFind — Hybrid Collection Setup")
     print("=" * 60)
@@ -105,6 +158,21 @@ def main():
 
     print("      Connected ✓")
 
+    if args.update:
+        if not client.collection_exists(COLLECTION_NAME):
+            print(f"\n❌  Collection '{COLLECTION_NAME}' not found — run without --update to create it.")
+            sys.exit(1)
+        print(f"\n  Applying quantization '{args.quantization}' to '{COLLECTION_NAME}' ...")
+        try:
+            update_quantization(client, COLLECTION_NAME, args.quantization)
+        except Exception as e:
+            print(f"\n❌  Collection update failed: {e}")
+            sys.exit(1)
+        print("  Updated ✓ — the optimizer rebuilds the dense storage in the background.")
+        print_collection_info(client, COLLECTION_NAME)
+        print(f"  Set QDRANT_QUANTIZATION={args.quantization} for the API workers.\n")
+        return
+
     # ── Delete existing collection ─────────────────────────────────────────────
     print(f"\n[2/3] Checking for existing collection '{COLLECTION_NAME}' ...")
 
@@ -128,17 +196,27 @@ def main():
         print(f"      Collection does not exist — will create fresh.")
 
     # ── Create collection with named vectors ──────────────────────────────────
-    print(f"\n[3/3] Creating '{COLLECTION_NAME}' with dense + sparse vectors ...")
+    print(f"\n[3/3] Creating '{COLLECTION_NAME}' with dense + sparse vectors "
+          f"(quantization: {args.quantization}) ...")
+
+    vectors_config = {
+        # float32 in RAM, or originals on disk + quantized copy in RAM
+        "dense": dense_vector_params(DENSE_DIM, args.quantization),
+    }
+    metadata = None
+    projection = None if args.no_small_vector else get_dense_projection()
+    if projection is not None:
+        # Small first-stage vector stays float32 in RAM
+        vectors_config[SMALL_VECTOR] = dense_vector_params(projection.dim, "none")
+        metadata = {METADATA_KEY: projection.id}
+        print(f"      + '{SMALL_VECTOR}' ({projection.dim}d, projection {projection.id})")
+    else:
+        print(f"      No projection fitted — no '{SMALL_VECTOR}' vector (see scripts/hybrid/fit_projection.py)")
 
     try:
         client.create_collection(
             collection_name=COLLECTION_NAME,
-            vectors_config={
-                "dense": VectorParams(
-                    size=DENSE_DIM,
-                    distance=Distance.COSINE,
-                )
-            },
+            vectors_config=vectors_config,
             sparse_vectors_config={
                 "sparse": SparseVectorParams(
                     index=SparseIndexParams(
@@ -153,6 +231,7 @@ def main():
             optimizers_config=OptimizersConfigDiff(
                 indexing_threshold=20_000,  # start HNSW indexing after 20k vectors
             ),
+            metadata=metadata,
         )
     except Exception as e:
         print(f"\n❌  Collection creation failed: {e}")
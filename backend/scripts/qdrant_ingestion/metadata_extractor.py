@@ -11,6 +11,11 @@ and chunks full text using a two-tier legal-aware strategy:
   Tier 2 — Sentence-Aware Fallback: Used when doc structure is not detectable.
                           Chunks by sentence boundary with word-count limit.
 
+Each judgment's own reporter citations (citation field + full-text header) are
+written to legal_citations (migration 0005) for the exact citation resolver,
+and its statute references ("Section 302 IPC") to legal_documents.statute_keys
+(migration 0006).
+
 Resume capability:
   - Default: skip PDFs already in legal_documents (their chunks are intact).
   - --rechunk: Wipe all legal_chunks for all docs and re-chunk with the new
@@ -46,6 +51,9 @@ import nltk
 from tqdm import tqdm
 from sqlalchemy import create_engine, text
 
+from app.services.citation_resolver import write_document_citations
+from app.services.statute_index import document_statute_keys
+
 # Download NLTK punkt tokenizer (silent if already present)
 nltk.download("punkt",          quiet=True)
 nltk.download("punkt_tab",      quiet=True)
@@ -616,14 +624,15 @@ def upsert_document(conn, doc: dict) -> Optional[str]:
                 (id, filename, title, petitioner, respondent, court, state,
                  year, date_of_judgment, judges, citation, acts_referred,
                  bench_strength, case_type, page_count, full_text,
-                 language, quality_flag, chunk_strategy, qdrant_synced)
+                 language, quality_flag, chunk_strategy, statute_keys, qdrant_synced)
             VALUES
                 (:id, :filename, :title, :petitioner, :respondent, :court, :state,
                  :year, :date_of_judgment, :judges, :citation, :acts_referred,
                  :bench_strength, :case_type, :page_count, :full_text,
-                 :language, :quality_flag, :chunk_strategy, false)
+                 :language, :quality_flag, :chunk_strategy, :statute_keys, false)
             ON CONFLICT (filename) DO UPDATE SET
                 chunk_strategy = EXCLUDED.chunk_strategy,
+                statute_keys   = EXCLUDED.statute_keys,
                 qdrant_synced  = false
         """),
         {
@@ -646,6 +655,7 @@ def upsert_document(conn, doc: dict) -> Optional[str]:
             "language":         doc["language"],
             "quality_flag":     doc["quality_flag"],
             "chunk_strategy":   doc["chunk_strategy"],
+            "statute_keys":     document_statute_keys(doc["full_text"], doc["acts_referred"]),
         },
     )
     row = conn.execute(
@@ -740,6 +750,7 @@ def main():
                     if args.rechunk:
                         delete_chunks_for_document(conn, doc_id)
                     insert_chunks(conn, doc_id, doc.get("chunks", []))
+                    write_document_citations(conn, doc_id, doc["citation"], doc["full_text"])
             except Exception as e:
                 logger.error(f"DB error for {doc['filename']}: {e}")
                 stats["failed"] += 1
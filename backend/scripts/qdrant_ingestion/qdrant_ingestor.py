@@ -14,6 +14,8 @@ Features:
   - Marks legal_documents.qdrant_synced = TRUE after all chunks done
   - Logs errors to scripts/qdrant_ingest_errors.log
   - Prints final summary with collection info
+  - New collections follow QDRANT_QUANTIZATION (originals on disk, quantized
+    copy in RAM — see app/services/vector_quantization.py)
 
 Run from backend/:
   python scripts/qdrant_ingestor.py
@@ -43,14 +45,15 @@ from sqlalchemy import create_engine, text
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
-    Distance,
     HnswConfigDiff,
     OptimizersConfigDiff,
     PayloadSchemaType,
     PointStruct,
-    VectorParams,
 )
 
+from app.services.index_generation import bump_index_generation
+from app.services.vector_quantization import QUANTIZATION, dense_vector_params
+
 # ── Config ────────────────────────────────────────────────────────────────────
 DATABASE_URL      = os.getenv("DATABASE_URL", "")
 QDRANT_HOST       = os.getenv("QDRANT_HOST", "localhost")
@@ -90,13 +93,10 @@ def setup_collection(client: QdrantClient, recreate: bool = False):
         existing = []
 
     if COLLECTION_NAME not in existing:
-        logger.info(f"Creating Qdrant collection '{COLLECTION_NAME}'...")
+        logger.info(f"Creating Qdrant collection '{COLLECTION_NAME}' (quantization: {QUANTIZATION})...")
         client.create_collection(
             collection_name=COLLECTION_NAME,
-            vectors_config=VectorParams(
-                size=VECTOR_SIZE,
-                distance=Distance.COSINE,
-            ),
+            vectors_config=dense_vector_params(VECTOR_SIZE),
             hnsw_config=HnswConfigDiff(
                 m=16,           # HNSW connections per node (higher = better recall, more RAM)
                 ef_construct=100,  # build quality vs speed tradeoff
@@ -114,6 +114,8 @@ def setup_collection(client: QdrantClient, recreate: bool = False):
         client.create_payload_index(COLLECTION_NAME, "case_type",    PayloadSchemaType.KEYWORD)
         client.create_payload_index(COLLECTION_NAME, "section_type", PayloadSchemaType.KEYWORD)
         client.create_payload_index(COLLECTION_NAME, "document_id",  PayloadSchemaType.KEYWORD)
+        client.create_payload_index(COLLECTION_NAME, "title",        PayloadSchemaType.TEXT)
+        client.create_payload_index(COLLECTION_NAME, "statute_keys", PayloadSchemaType.KEYWORD)
         logger.info("Collection and indexes ready.")
     else:
         info = client.get_collection(COLLECTION_NAME)
@@ -131,7 +133,8 @@ def fetch_chunk_metadata_batch(conn, chunk_ids: list[str]) -> dict:
     """
     Fetch metadata for a batch of chunk UUIDs.
     Returns dict: chunk_id → {document_id, chunk_index, court, year, state,
-                               case_type, title, petitioner, respondent, citation}
+                               case_type, title, petitioner, respondent, citation,
+                               statute_keys}
     """
     if not chunk_ids:
         return {}
@@ -151,7 +154,8 @@ def fetch_chunk_metadata_batch(conn, chunk_ids: list[str]) -> dict:
                 ld.year,
                 ld.citation,
                 ld.case_type,
-                ld.filename
+                ld.filename,
+                ld.statute_keys
             FROM legal_chunks lc
             JOIN legal_documents ld ON lc.document_id = ld.id
             WHERE lc.id = ANY(CAST(:ids AS uuid[]))
@@ -174,6 +178,7 @@ def fetch_chunk_metadata_batch(conn, chunk_ids: list[str]) -> dict:
             "citation":     row.citation,
             "case_type":    row.case_type,
             "filename":     row.filename,
+            "statute_keys": row.statute_keys or [],
         }
         for row in rows
     }
@@ -349,6 +354,7 @@ def main():
                             "year":         meta["year"],
                             "citation":     meta["citation"],
                             "case_type":    meta["case_type"],
+                            "statute_keys": meta["statute_keys"],
                         },
                     )
                 )
@@ -385,6 +391,10 @@ def main():
         logger.info(f"Marking {len(affected_document_ids):,} documents as qdrant_synced=TRUE ...")
         with engine.begin() as conn:
             mark_documents_synced(conn, list(affected_document_ids))
+    if total_upserted:
+        # API workers drop their cached search results
+        with engine.begin() as conn:
+            bump_index_generation(conn, COLLECTION_NAME)
 
     _print_final_stats(client, total_upserted, total_errors, t_start)
 
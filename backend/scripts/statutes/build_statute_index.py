@@ -0,0 +1,139 @@
+"""
+JurisFind — Statute Index Build
+================================
+Back-fills the statute/section inverted index (migration 0006) for documents
+ingested before metadata_extractor.py computed it:
+
+  1. every judgment's full text and acts_referred are parsed into canonical
+     statute keys ("IPC:302", "CONSTITUTION:21", "IPC" — see
+     app/services/statute_index.py) and written to legal_documents.statute_keys
+     (GIN-indexed; serves GET /api/search/statute)
+  2. the keys are copied into the `statute_keys` payload of every chunk point
+     of the document in Qdrant, and the keyword payload index is created
+     (serves the `statute` filter of POST /api/search)
+
+By default only documents whose statute_keys are still empty are parsed;
+--full re-parses the whole corpus. Documents that cite no statute are parsed
+again on every run.
+
+Run from backend/ after `alembic upgrade head`:
+    python scripts/statutes/build_statute_index.py
+    python scripts/statutes/build_statute_index.py --full --workers 16
+    python scripts/statutes/build_statute_index.py --skip-qdrant
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv(BASE_DIR / ".env")
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import PayloadSchemaType
+from sqlalchemy import create_engine, text
+
+from app.services.index_generation import bump_index_generation
+from app.services.qdrant_search_service import QDRANT_COLLECTION, _document_filter
+from app.services.statute_index import document_statute_keys
+
+# ── Config ────────────────────────────────────────────────────────────────────
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+QDRANT_HOST  = os.getenv("QDRANT_HOST", "localhost")
+QDRANT_PORT  = int(os.getenv("QDRANT_PORT", "6333"))
+FETCH_SIZE   = 200       # full texts held in memory at once
+
+DOCUMENTS_SQL = "SELECT id::text, acts_referred, full_text FROM legal_documents"
+EMPTY_FILTER  = " WHERE statute_keys = '{}'"
+UPDATE_SQL = text("UPDATE legal_documents SET statute_keys = :keys WHERE id = CAST(:id AS uuid)")
+
+
+def parse_documents(engine, full: bool, limit) -> dict:
+    """Parse and store statute keys; returns {document_id: keys} for documents that have any."""
+    sql = DOCUMENTS_SQL + ("" if full else EMPTY_FILTER) + " ORDER BY id"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+
+    found, parsed = {}, 0
+    with engine.connect() as reader, engine.connect() as writer:
+        result = reader.execution_options(stream_results=True).execute(text(sql))
+        while True:
+            rows = result.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            updates = []
+            for doc_id, acts_referred, full_text in rows:
+                keys = document_statute_keys(full_text, acts_referred or [])
+                updates.append({"id": doc_id, "keys": keys})
+                if keys:
+                    found[doc_id] = keys
+            with writer.begin():
+                writer.execute(UPDATE_SQL, updates)
+            parsed += len(rows)
+            if parsed % 5000 < FETCH_SIZE:
+                print(f"      {parsed:,} documents parsed ...")
+    print(f"  Parsed      : {parsed:,} documents, {len(found):,} cite a statute")
+    return found
+
+
+def push_payloads(client: QdrantClient, found: dict, workers: int) -> None:
+    """Set `statute_keys` on every chunk point of each document."""
+    try:
+        client.create_payload_index(QDRANT_COLLECTION, "statute_keys", PayloadSchemaType.KEYWORD)
+    except Exception as exc:
+        print(f"  ⚠  payload index on statute_keys not created: {exc}")
+
+    def push(item):
+        doc_id, keys = item
+        client.set_payload(
+            collection_name=QDRANT_COLLECTION,
+            payload={"statute_keys": keys},
+            points=_document_filter(doc_id),
+            wait=False,
+        )
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for _ in pool.map(push, found.items()):
+            done += 1
+            if done % 5000 == 0:
+                print(f"      {done:,}/{len(found):,} documents pushed to Qdrant ...")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Back-fill the statute/section index")
+    parser.add_argument("--full", action="store_true", help="re-parse every document, not only unparsed ones")
+    parser.add_argument("--limit", type=int, default=None, help="parse at most N documents")
+    parser.add_argument("--workers", type=int, default=8, help="parallel Qdrant set_payload calls")
+    parser.add_argument("--skip-qdrant", action="store_true", help="only update legal_documents")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  JurisFind — Statute Index Build")
+    print("=" * 60)
+
+    if not DATABASE_URL:
+        print("\n❌  DATABASE_URL is not set in .env")
+        sys.exit(1)
+
+    t0 = time.time()
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    found = parse_documents(engine, args.full, args.limit)
+
+    if not args.skip_qdrant and found:
+        client = QdrantClient(host=QDRANT_HOST, port=QDRANT_PORT, timeout=60)
+        push_payloads(client, found, args.workers)
+        with engine.begin() as conn:
+            bump_index_generation(conn, QDRANT_COLLECTION)
+
+    print(f"\n  ✓ Done in {time.time() - t0:.1f}s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import asyncio
+import threading
+
+from qdrant_client.models import PointGroup, ScoredPoint
+
+from app.services import async_qdrant_search_service as service_module
+from app.services.async_qdrant_search_service import AsyncQdrantSearchService
+from app.services.qdrant_search_service import _CHUNK_TEXTS_SQL, _METADATA_SQL, _OPENING_CHUNKS_SQL, citation_index
+from app.schemas.search_schemas import SearchRequest
+
+_META_ROW = ("d1", "K.S. Puttaswamy v. Union of India", "K.S. Puttaswamy", "Union of India",
+             "Supreme Court", None, 2017, "(2017) 10 SCC 1", ["D.Y. Chandrachud"], "Writ Petition", 547, "semantic")
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class _FakeAsyncSession:
+    """Answers the metadata, opening-chunk and chunk-text hydration queries."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, params):
+        self.statements.append(statement)
+        if statement is _METADATA_SQL:
+            return _Result([_META_ROW])
+        if statement is _CHUNK_TEXTS_SQL:
+            return _Result([(cid, f"text of {cid}") for cid in params["ids"]])
+        if statement is _OPENING_CHUNKS_SQL:
+            return _Result([(doc_id, f"{doc_id}-open{i}", i, "facts")
+                            for doc_id in params["ids"] for i in range(params["per_doc"])])
+        raise AssertionError(f"unexpected statement {statement}")
+
+
+class _FakeAsyncQdrant:
+    def __init__(self):
+        self.queries = []
+
+    async def query_points_groups(self, **kwargs):
+        self.queries.append(kwargs)
+        hits = [ScoredPoint(id=cid, version=0, score=score,
+                            payload={"document_id": "d1", "chunk_id": cid, "chunk_index": i, "section_type": "holding"})
+                for i, (cid, score) in enumerate([("c1", 0.9), ("c2", 0.7)])]
+        return type("Response", (), {"groups": [PointGroup(id="d1", hits=hits)]})()
+
+    async def query_batch_points(self, collection_name, requests):
+        self.queries.extend(requests)
+        hit = ScoredPoint(id="c1", version=0, score=0.9, payload={"document_id": "d1", "chunk_id": "c1", "chunk_index": 0})
+        return [type("Response", (), {"points": [hit]})() for _ in requests]
+
+
+def _fake_backends(monkeypatch, qdrant, loop_threads=None):
+    async def embed(query):
+        return [0.1] * 768
+
+    async def embed_sparse(query):
+        return None
+
+    def lookup(chunk_ids):
+        if loop_threads is not None:
+            loop_threads.append(threading.current_thread())
+        return {}, list(chunk_ids)
+
+    monkeypatch.setattr(service_module.search_coalescer, "enabled", False)
+    monkeypatch.setattr(service_module, "_embed_async", embed)
+    monkeypatch.setattr(service_module, "_embed_sparse_async", embed_sparse)
+    monkeypatch.setattr(service_module, "_embed_many", lambda queries: [[0.1] * 768 for _ in queries])
+    monkeypatch.setattr(service_module, "_embed_sparse_many", lambda queries: [None for _ in queries])
+    monkeypatch.setattr(service_module, "_get_async_qdrant_client", lambda: qdrant)
+    monkeypatch.setattr(service_module, "lookup_chunk_texts", lookup)
+    monkeypatch.setattr(service_module.corpus_metadata, "get_many", lambda ids: ({}, list(ids)))
+
+
+def test_search_runs_off_the_loop_and_hydrates(monkeypatch):
+    """search() embeds and reads chunk texts off the event loop, queries Qdrant async and hydrates from the session."""
+    qdrant = _FakeAsyncQdrant()
+    loop_threads = []
+    _fake_backends(monkeypatch, qdrant, loop_threads)
+
+    async def scenario():
+        db = _FakeAsyncSession()
+        response = await AsyncQdrantSearchService().search(db, "  right to privacy ", top_k=5, chunks="all")
+        return response, db, threading.current_thread()
+
+    response, db, loop_thread = asyncio.run(scenario())
+
+    assert response.query == "right to privacy" and response.total_results == 1
+    result = response.results[0]
+    assert result.title == "K.S. Puttaswamy v. Union of India" and result.score == 0.9
+    assert result.top_chunk.chunk_text == "text of c1"
+    assert [c.chunk_id for c in result.all_chunks] == ["c1", "c2"]
+    assert set(response.timings.stages) >= {"dense_encode", "sparse_encode", "qdrant", "metadata", "chunk_text"}
+    assert len(qdrant.queries) == 1 and qdrant.queries[0]["limit"] == 5
+    assert db.statements == [_METADATA_SQL, _CHUNK_TEXTS_SQL]
+    # The chunk text store is read on a worker thread, not the event loop
+    assert loop_threads and loop_threads[0] is not loop_thread
+
+
+def test_citation_hits_carry_opening_chunks(monkeypatch):
+    """A citation-only query skips Qdrant and returns the judgment's opening chunks; section_type goes to Qdrant."""
+    qdrant = _FakeAsyncQdrant()
+    _fake_backends(monkeypatch, qdrant)
+    monkeypatch.setattr(citation_index, "resolve", lambda query: ["d1"] if query == "(2017) 10 SCC 1" else None)
+    service = AsyncQdrantSearchService()
+
+    async def search(**kwargs):
+        db = _FakeAsyncSession()
+        return await service.search(db, "(2017) 10 SCC 1", **kwargs), db
+
+    response, db = asyncio.run(search(chunks="all", snippet_length=4))
+    result = response.results[0]
+    assert result.score == 1.0 and result.citation == "(2017) 10 SCC 1"
+    assert result.top_chunk.chunk_id == "d1-open0" and result.top_chunk.chunk_text == "text…"
+    assert len(result.all_chunks) > 1
+    assert db.statements == [_METADATA_SQL, _OPENING_CHUNKS_SQL, _CHUNK_TEXTS_SQL] and not qdrant.queries
+
+    response, db = asyncio.run(search(chunks="none"))
+    assert response.results[0].top_chunk is None and db.statements == [_METADATA_SQL]
+
+    response, _ = asyncio.run(search(section_type="holding"))
+    assert response.results[0].top_chunk.chunk_id == "c1" and len(qdrant.queries) == 1
+
+
+def test_batch_answers_citation_entries_from_the_index(monkeypatch):
+    """search_batch() sends only non-citation entries to Qdrant; citation entries get opening chunks."""
+    qdrant = _FakeAsyncQdrant()
+    _fake_backends(monkeypatch, qdrant)
+    monkeypatch.setattr(citation_index, "resolve", lambda query: ["d1"] if query == "(2017) 10 SCC 1" else None)
+
+    async def scenario():
+        return await AsyncQdrantSearchService().search_batch(_FakeAsyncSession(), [
+            SearchRequest(query="(2017) 10 SCC 1", chunks="top"),
+            SearchRequest(query="right to privacy", chunks="top"),
+        ])
+
+    batch = asyncio.run(scenario())
+    cited, searched = batch.responses
+    assert cited.results[0].score == 1.0 and cited.results[0].top_chunk.chunk_id == "d1-open0"
+    assert searched.results[0].top_chunk.chunk_id == "c1"
+    assert len(qdrant.queries) == 1
+
+
+def test_similar_graph_hits_carry_opening_chunks(monkeypatch):
+    """Neighbours from the similar graph are hydrated with their opening chunks, like the live query's chunks."""
+    qdrant = _FakeAsyncQdrant()
+    _fake_backends(monkeypatch, qdrant)
+
+    class Graph:
+        def neighbours(self, document_id, top_k):
+            return [("d1", 0.83)]
+
+    monkeypatch.setattr(service_module, "get_similar_graph", lambda: Graph())
+
+    async def scenario():
+        db = _FakeAsyncSession()
+        return await AsyncQdrantSearchService().get_similar_cases(db, "d0", top_k=5), db
+
+    response, db = asyncio.run(scenario())
+    result = response.results[0]
+    assert result.score == 0.83 and result.top_chunk.chunk_id == "d1-open0"
+    assert result.top_chunk.chunk_text == "text of d1-open0" and len(result.all_chunks) > 1
+    assert db.statements == [_METADATA_SQL, _OPENING_CHUNKS_SQL, _CHUNK_TEXTS_SQL] and not qdrant.queries
@@ -0,0 +1,36 @@
+from app.services.case_name_index import CaseNameIndex, tokenize
+
+ROWS = [
+    ("d1", "Justice K.S. Puttaswamy (Retd.) v. Union of India", "K.S. Puttaswamy", "Union of India"),
+    ("d2", "Kesavananda Bharati v. State of Kerala", "Kesavananda Bharati Sripadagalvaru", "State of Kerala"),
+    ("d3", "Maneka Gandhi v. Union of India and Anr.", "Maneka Gandhi", "Union of India"),
+    ("d4", "State of Kerala v. N.M. Thomas", "State of Kerala", "N.M. Thomas"),
+]
+
+
+def _index():
+    index = CaseNameIndex(enabled=True, min_score=0.6)
+    index.build(ROWS)
+    return index
+
+
+def test_tokenize_drops_connectives_and_folds_case():
+    """Title connectives are dropped; accents and case are folded."""
+    assert tokenize("Maneká Gandhi v. Union of India and Ors.") == ["maneka", "gandhi", "union", "india"]
+
+
+def test_exact_partial_and_misspelt_names():
+    """Exact, prefix and misspelt party names all rank the right judgment first."""
+    index = _index()
+    assert index.search("Kesavananda Bharati")[0][0] == "d2"
+    assert index.search("Kesavananda Bharati")[0][1] == 1.0
+    assert index.search("kesavanand")[0][0] == "d2"
+    assert index.search("Puttasway v Union of India")[0][0] == "d1"
+    assert index.search("N.M. Thomas")[0][0] == "d4"
+
+
+def test_unknown_name_falls_through():
+    """A name nobody in the corpus carries returns nothing (semantic fallback)."""
+    index = _index()
+    assert index.search("Vishaka v. State of Rajasthan") == []
+    assert CaseNameIndex(enabled=True).search("Puttaswamy") == []
@@ -0,0 +1,51 @@
+import uuid
+
+import pytest
+
+from app.services.chunk_text_store import ChunkTextStore, write_chunk_store
+
+
+def _rows(n):
+    ids = sorted((uuid.uuid4() for _ in range(n)), key=lambda u: u.bytes)
+    return [(str(u), f"Held: appeal {i} dismissed under Article 21. ✓") for i, u in enumerate(ids)]
+
+
+def test_roundtrip_uncompressed(tmp_path):
+    """Every exported chunk is found; unknown and malformed ids are misses."""
+    rows = _rows(50)
+    assert write_chunk_store(tmp_path / "store", rows, compression="none") == 50
+
+    store = ChunkTextStore(tmp_path / "store")
+    wanted = [rows[0][0], rows[49][0], str(uuid.uuid4()), "not-a-uuid"]
+    found, missing = store.get_many(wanted)
+
+    assert found == {rows[0][0]: rows[0][1], rows[49][0]: rows[49][1]}
+    assert missing == wanted[2:]
+
+
+def test_trailing_zero_bytes_in_uuid(tmp_path):
+    """UUIDs ending in NUL bytes survive numpy's S16 handling."""
+    ids = [uuid.UUID(bytes=b"\x01" * 14 + b"\x00\x00"), uuid.UUID(bytes=b"\x01" * 15 + b"\x02")]
+    write_chunk_store(tmp_path / "store", [(str(u), "x") for u in ids], compression="none")
+
+    found, missing = ChunkTextStore(tmp_path / "store").get_many([str(u) for u in ids])
+    assert len(found) == 2 and not missing
+
+
+def test_unsorted_rows_are_rejected(tmp_path):
+    """The writer refuses input that is not in chunk-id order."""
+    rows = _rows(3)
+    with pytest.raises(ValueError):
+        write_chunk_store(tmp_path / "store", list(reversed(rows)), compression="none")
+
+
+def test_roundtrip_zstd_with_dictionary(tmp_path):
+    """Dictionary-compressed records decode independently."""
+    pytest.importorskip("zstandard")
+    rows = _rows(500)
+    write_chunk_store(tmp_path / "store", rows, compression="zstd", dict_size=4096, dict_samples=200)
+
+    store = ChunkTextStore(tmp_path / "store")
+    found, missing = store.get_many([rows[123][0], rows[499][0]])
+    assert not missing
+    assert found[rows[123][0]] == rows[123][1]
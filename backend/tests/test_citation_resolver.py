@@ -0,0 +1,36 @@
+from app.services.citation_resolver import CitationIndex, document_citations, extract_citations, parse_citation
+
+
+def test_reporter_variants_share_one_key():
+    """Bracket, volume and punctuation variants of a citation normalise to the same key."""
+    assert {parse_citation(q) for q in ("(2017) 10 SCC 1", "2017 (10) SCC 1", "[2017] 10 S.C.C. 1")} == {"SCC 2017 10 1"}
+    assert {parse_citation(q) for q in ("AIR 1973 SC 1461", "1973 AIR 1461", "A.I.R. 1973 Supreme Court 1461")} == {
+        "AIR 1973 SC 1461"
+    }
+    assert {parse_citation(q) for q in ("[1973] Supp. SCR 1", "1973 SCR Supl. 1")} == {"SCR 1973 SUPP 1"}
+    assert parse_citation("1973 SCR (4) 1") == parse_citation("(1973) 4 SCR 1") == "SCR 1973 4 1"
+    assert parse_citation("JT 1993 (5) SC 1") == "JT 1993 5 1"
+    assert parse_citation("(2009) 3 SCC (Cri) 1") == "SCC (CRI) 2009 3 1"
+
+
+def test_non_citation_queries_are_left_to_search():
+    """Ordinary queries, and citations inside longer queries, are not short-circuited."""
+    for query in ("right to privacy", "Section 302 IPC", "Article 21 (2017)", "(2017) 10 SCC 1 privacy"):
+        assert parse_citation(query) is None
+
+
+def test_header_citations_are_indexed_and_resolved():
+    """Citations from the column and the text header resolve; ones deeper in the text do not."""
+    header = "Equivalent citations: 1973 AIR 1461, 1973 SCR Supl. 1"
+    body = " " * 3000 + "relied on (1980) 2 SCC 591"
+    assert extract_citations(header) == ["AIR 1973 SC 1461", "SCR 1973 SUPP 1"]
+    assert document_citations("AIR 1973 SC 1461", header + body) == [
+        ("AIR 1973 SC 1461", "metadata"),
+        ("SCR 1973 SUPP 1", "header"),
+    ]
+
+    index = CitationIndex(enabled=True)
+    index.build([("AIR 1973 SC 1461", "d1"), ("SCR 1973 SUPP 1", "d1")])
+    assert index.resolve("[1973] Supp. SCR 1") == ["d1"]
+    assert index.resolve("(1980) 2 SCC 591") == []
+    assert index.resolve("basic structure doctrine") is None
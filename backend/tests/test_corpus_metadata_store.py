@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from app.services.corpus_metadata_store import CorpusMetadataStore
+
+_T0 = datetime(2026, 1, 1)
+
+
+def _row(doc_id, title, minutes, court="Supreme Court", year=1994, synced=True):
+    return (doc_id, title, "A", "B", court, None, year, None, ["J1"],
+            "Civil Appeal", 10, "legal_aware", _T0 + timedelta(minutes=minutes), synced)
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0]
+
+
+class _FakeDb:
+    """Serves the three store queries from an in-memory legal_documents table."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, sql, params=None):
+        sql = str(sql)
+        if "COUNT(*)" in sql:
+            self.queries.append("signature")
+            return _Result([(
+                len(self.rows),
+                max(r[12] for r in self.rows),
+                sum(1 for r in self.rows if r[13]),
+            )])
+        if ":since" in sql:
+            self.queries.append("delta")
+            return _Result([r[:13] for r in self.rows if r[12] > params["since"]])
+        self.queries.append("full")
+        return _Result([r[:13] for r in self.rows])
+
+
+def test_lookup_decodes_columns_and_reports_misses():
+    """Stored rows decode to the _fetch_metadata_batch dict shape."""
+    store = CorpusMetadataStore(enabled=True)
+    store.refresh(_FakeDb([_row("d1", "Puttaswamy", 0, year=None)]))
+
+    found, missing = store.get_many(["d1", "unknown"])
+
+    assert missing == ["unknown"]
+    assert found["d1"]["title"] == "Puttaswamy"
+    assert found["d1"]["court"] == "Supreme Court"
+    assert found["d1"]["state"] is None
+    assert found["d1"]["year"] is None
+    assert found["d1"]["judges"] == ["J1"]
+
+
+def test_appended_rows_use_delta_refresh():
+    """New ingests are picked up without reloading the whole table."""
+    db = _FakeDb([_row("d1", "One", 0)])
+    store = CorpusMetadataStore(enabled=True)
+    store.refresh(db)
+
+    db.rows.append(_row("d2", "Two", 5, court="High Court"))
+    assert store.refresh(db) == "delta"
+    assert store.refresh(db) == "unchanged"
+
+    found, missing = store.get_many(["d1", "d2"])
+    assert not missing
+    assert found["d2"]["court"] == "High Court"
+
+
+def test_resync_of_existing_rows_forces_full_reload():
+    """A changed signature without new rows (re-ingest) reloads everything."""
+    db = _FakeDb([_row("d1", "One", 0), _row("d2", "Two", 1)])
+    store = CorpusMetadataStore(enabled=True)
+    store.refresh(db)
+
+    db.rows[1] = _row("d2", "Two (corrected)", 1, synced=False)
+    assert store.refresh(db) == "full"
+    assert store.get_many(["d2"])[0]["d2"]["title"] == "Two (corrected)"
+
+
+def test_disabled_store_defers_to_database():
+    """A disabled store reports every id as missing."""
+    store = CorpusMetadataStore(enabled=False)
+    assert store.get_many(["d1"]) == ({}, ["d1"])
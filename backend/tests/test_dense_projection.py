@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import numpy as np
+from qdrant_client.models import SparseVector
+
+from app.services import dense_projection
+from app.services.dense_projection import DenseProjection, fit_projection, write_projection
+
+
+def _vectors(n=2000, dim=64, rank=8, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.normal(size=(n, rank)) @ rng.normal(size=(rank, dim)) + 0.01 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def _projection(tmp_path):
+    vectors = _vectors()
+    mean, components, explained = fit_projection(vectors, 8)
+    write_projection(tmp_path / "projection", mean, components, explained, len(vectors))
+    return DenseProjection(tmp_path / "projection"), vectors, explained
+
+
+def test_fitted_projection_round_trips_and_keeps_neighbours(tmp_path):
+    """A written projection reloads under the same id, and low-rank structure survives projection."""
+    projection, vectors, explained = _projection(tmp_path)
+    assert projection.dim == 8 and explained.sum() > 0.99
+    assert projection.id == projection.manifest["id"]
+
+    small = projection.project(vectors)
+    assert small.shape == (2000, 8)
+    assert np.allclose(np.linalg.norm(small, axis=1), 1.0, atol=1e-5)
+    assert np.allclose(projection.project(vectors[0]), small[0], atol=1e-6)
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    truth = np.argsort(-(unit @ unit[0]))[1:11]
+    shortlist = np.argsort(-(small @ small[0]))[1:41]
+    assert len(set(truth) & set(shortlist)) >= 9
+
+
+def test_small_vector_first_stage_only_with_matching_collection(tmp_path, monkeypatch):
+    """dense_small is used only when the collection metadata names the loaded projection."""
+    from app.services.qdrant_search_service import _search_query
+    from app.services.search_planner import SearchPlanner
+
+    projection, vectors, _ = _projection(tmp_path)
+    monkeypatch.setattr(dense_projection, "_ENABLED", True)
+    monkeypatch.setattr(dense_projection, "_projection", projection)
+    monkeypatch.setattr(dense_projection, "_projection_checked", True)
+    monkeypatch.setattr(dense_projection, "_active", False)
+
+    def client(projection_id):
+        info = SimpleNamespace(config=SimpleNamespace(
+            metadata={"dense_small_projection": projection_id},
+            params=SimpleNamespace(vectors={"dense": None, "dense_small": None}),
+        ))
+        return SimpleNamespace(get_collection=lambda name: info)
+
+    assert not dense_projection.verify_collection(client("stale"), "legal_corpus")
+    assert SearchPlanner(enabled=False, oversampling=None).plan(10).first_stage == "dense"
+
+    assert dense_projection.verify_collection(client(projection.id), "legal_corpus")
+    plan = SearchPlanner(enabled=False, oversampling=None).plan(10)
+    assert plan.first_stage == "dense_small" and plan.shortlist_limit == 400
+
+    query = _search_query("hybrid", vectors[0].tolist(), SparseVector(indices=[1], values=[1.0]), None, 10, plan=plan)
+    dense = query["prefetch"][0]
+    assert dense.using == "dense" and dense.limit == 100
+    assert dense.prefetch.using == "dense_small" and dense.prefetch.limit == 400
+    assert len(dense.prefetch.query) == 8
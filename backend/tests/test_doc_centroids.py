@@ -0,0 +1,82 @@
+import importlib.util
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from app.services.qdrant_search_service import (
+    QDRANT_COLLECTION,
+    QDRANT_DOC_COLLECTION,
+    _dense_vector_of,
+    _stored_centroid_query,
+)
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "centroids" / "build_doc_centroids.py"
+
+
+@pytest.fixture(scope="module")
+def build():
+    spec = importlib.util.spec_from_file_location("build_doc_centroids", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _doc_id(n):
+    return str(uuid.UUID(int=n))
+
+
+def test_stored_centroid_round_trip():
+    """The precomputed centroid is fetched by document id and read from plain or named vectors."""
+    client = QdrantClient(":memory:")
+    client.create_collection(QDRANT_DOC_COLLECTION, vectors_config=VectorParams(size=3, distance=Distance.COSINE))
+    centroid = (np.array([1.0, 2.0, 2.0]) / 3).tolist()
+    client.upsert(QDRANT_DOC_COLLECTION, [PointStruct(id=_doc_id(1), vector=centroid)])
+
+    query = _stored_centroid_query(_doc_id(1))
+    assert query["collection_name"] == QDRANT_DOC_COLLECTION and query["with_vectors"] is True
+    points = client.retrieve(**query)
+    assert np.allclose(_dense_vector_of(points[0]), centroid, atol=1e-6)
+    assert client.retrieve(**_stored_centroid_query(_doc_id(2))) == []
+
+    named = type("Point", (), {"vector": {"dense": [0.1], "sparse": None}})()
+    assert _dense_vector_of(named) == [0.1]
+
+
+def test_centroid_is_the_normalised_mean_of_the_chunk_vectors(build):
+    """document_centroid() averages every dense chunk vector of the document, across scroll pages."""
+    client = QdrantClient(":memory:")
+    client.create_collection(QDRANT_COLLECTION, vectors_config={"dense": VectorParams(size=3, distance=Distance.DOT)})
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(250, 3))
+    client.upsert(QDRANT_COLLECTION, [
+        PointStruct(id=i, vector={"dense": v.tolist()}, payload={"document_id": _doc_id(1 if i < 210 else 2)})
+        for i, v in enumerate(vectors)
+    ])
+
+    centroid, n_vectors = build.document_centroid(client, _doc_id(1))
+    expected = vectors[:210].mean(axis=0)
+    assert n_vectors == 210
+    assert np.allclose(centroid, expected / np.linalg.norm(expected), atol=1e-5)
+    assert build.document_centroid(client, _doc_id(3)) == (None, 0)
+
+
+def test_fingerprints_select_new_rechunked_and_deleted_documents(build):
+    """Only new or re-chunked documents are recomputed; centroids without chunks are deleted."""
+    client = QdrantClient(":memory:")
+    client.create_collection(QDRANT_DOC_COLLECTION, vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+    client.upsert(QDRANT_DOC_COLLECTION, [
+        PointStruct(id=_doc_id(n), vector=[1.0, 0.0], payload={"fingerprint": fp})
+        for n, fp in [(1, "3:aaa"), (2, "5:bbb"), (4, "2:ddd")]
+    ])
+    stored = build.stored_fingerprints(client)
+    assert stored == {_doc_id(1): "3:aaa", _doc_id(2): "5:bbb", _doc_id(4): "2:ddd"}
+
+    current = {_doc_id(1): "3:aaa", _doc_id(2): "6:bbc", _doc_id(3): "1:ccc"}
+    todo, gone = build.pending_documents(current, stored)
+    assert sorted(todo) == [_doc_id(2), _doc_id(3)]
+    assert gone == [_doc_id(4)]
+    assert sorted(build.pending_documents(current, {})[0]) == sorted(current)
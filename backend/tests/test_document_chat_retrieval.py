@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from qdrant_client.models import ScoredPoint
+
+from app.agents.nodes import document_chat
+
+
+class _FakeQdrant:
+    """Answers each per-document request from that document's chunks only, like a filtered query."""
+
+    def __init__(self, chunks_by_doc):
+        self.chunks_by_doc = chunks_by_doc
+        self.calls = 0
+
+    def query_batch_points(self, collection_name, requests):
+        self.calls += 1
+        responses = []
+        for request in requests:
+            doc_id = request.prefetch[0].filter.must[0].match.value
+            hits = [
+                ScoredPoint(id=i, version=0, score=score,
+                            payload={"document_id": doc_id, "chunk_id": chunk_id, "title": doc_id})
+                for i, (chunk_id, score) in enumerate(self.chunks_by_doc[doc_id])
+            ]
+            responses.append(SimpleNamespace(points=hits[:request.limit]))
+        return responses
+
+
+def test_small_document_keeps_its_chunks_next_to_a_large_one(monkeypatch):
+    """A long judgment that matches well cannot crowd a short attachment out of its chunks."""
+    large = [(f"big-{i}", 0.9 - i * 0.001) for i in range(200)]
+    small = [("small-0", 0.2), ("small-1", 0.1)]
+    qdrant = _FakeQdrant({"large": large, "small": small})
+    monkeypatch.setattr(document_chat, "get_qdrant", lambda: qdrant)
+    monkeypatch.setattr(document_chat, "_embed_sparse", lambda question: None)
+    monkeypatch.setattr(document_chat, "_fetch_chunk_texts_batch",
+                        lambda db, ids: {cid: f"text of {cid}" for cid in ids})
+
+    by_doc = document_chat._search_qdrant_docs(None, ["large", "small"], "q", [0.0])
+
+    assert qdrant.calls == 1
+    assert len(by_doc["large"]) == document_chat.TOP_K_QDRANT
+    assert [c["chunk_id"] for c in by_doc["small"]] == ["small-0", "small-1"]
+    assert by_doc["small"][0]["chunk_text"] == "text of small-0"
@@ -0,0 +1,68 @@
+import threading
+
+import numpy as np
+import pytest
+
+from app.services.embedding_dispatcher import EmbeddingDispatcher
+
+
+class _RecordingEncoder:
+    """Fake encode function that records every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.batches.append(list(texts))
+        return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+
+
+def test_concurrent_requests_share_one_batch():
+    """Requests arriving inside the wait window are encoded together."""
+    encoder = _RecordingEncoder()
+    dispatcher = EmbeddingDispatcher(encoder, max_batch_size=16, max_wait_ms=200, name="test-batch")
+
+    futures = [dispatcher.submit("x" * n) for n in range(1, 6)]
+    vectors = [f.result(timeout=5) for f in futures]
+
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert sum(len(b) for b in encoder.batches) == 5
+    assert len(encoder.batches) < 5
+
+
+def test_batch_size_is_capped():
+    """No forward pass exceeds max_batch_size texts."""
+    encoder = _RecordingEncoder()
+    dispatcher = EmbeddingDispatcher(encoder, max_batch_size=2, max_wait_ms=100, name="test-cap")
+
+    futures = [dispatcher.submit(f"query {i}") for i in range(7)]
+    for f in futures:
+        f.result(timeout=5)
+
+    assert all(len(b) <= 2 for b in encoder.batches)
+
+
+def test_duplicate_texts_encoded_once():
+    """Identical strings in the same window share one row of the batch."""
+    encoder = _RecordingEncoder()
+    dispatcher = EmbeddingDispatcher(encoder, max_batch_size=8, max_wait_ms=200, name="test-dedup")
+
+    futures = [dispatcher.submit("article 21") for _ in range(4)]
+    results = [f.result(timeout=5) for f in futures]
+
+    assert all(np.array_equal(r, results[0]) for r in results)
+    assert sum(b.count("article 21") for b in encoder.batches) <= len(encoder.batches)
+
+
+def test_encode_errors_propagate_to_callers():
+    """A failing forward pass fails every caller in that batch."""
+
+    def boom(texts):
+        raise RuntimeError("model unavailable")
+
+    dispatcher = EmbeddingDispatcher(boom, max_batch_size=4, max_wait_ms=1, name="test-error")
+
+    with pytest.raises(RuntimeError, match="model unavailable"):
+        dispatcher.embed("habeas corpus", timeout=5)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("langgraph")
+
+from app.agents.nodes._intent_model import _TEMPERATURES, LABELS, IntentModel, IntentPrediction, load_examples
+
+
+def _model(temperature=0.05, noise_scale=0.05, per_label=5):
+    rng = np.random.default_rng(0)
+    axes = {label: np.eye(16, dtype=np.float32)[i] for i, label in enumerate(LABELS)}
+    examples = [{"text": f"{label} {i}", "label": label} for label in LABELS for i in range(per_label)]
+    noise = {e["text"]: noise_scale * rng.normal(size=16).astype(np.float32) for e in examples}
+    model = IntentModel(examples, lambda texts: [axes[t.split()[0]] + noise[t] for t in texts],
+                        temperature=temperature)
+    return model, axes
+
+
+def test_nearest_centroid_confidence_and_document_gate():
+    """Clear questions are confident; ambiguous ones are not; document_chat needs attached documents."""
+    model, axes = _model()
+    assert model.predict(axes["corpus_search"], has_documents=False) == ("corpus_search", pytest.approx(1.0, abs=1e-3))
+
+    between = axes["general"] + axes["corpus_search"]
+    assert model.predict(between, has_documents=False).confidence < 0.6
+
+    assert model.predict(axes["document_chat"], has_documents=True).label == "document_chat"
+    assert model.predict(axes["document_chat"], has_documents=False).label != "document_chat"
+
+
+def test_shipped_examples_cover_every_label():
+    """The labelled examples shipped with the repo load and cover all four labels."""
+    examples = load_examples()
+    assert {e["label"] for e in examples} == set(LABELS)
+    assert all(e["text"].strip() for e in examples)
+
+
+def test_temperature_is_fitted_on_held_out_examples():
+    """The softmax temperature comes from leave-one-out log loss, and held-out accuracy is reported."""
+    clean, _ = _model(temperature=None)
+    noisy, axes = _model(temperature=None, noise_scale=0.4, per_label=20)
+    assert clean.temperature in _TEMPERATURES and noisy.temperature in _TEMPERATURES
+    # Overlapping labels get a softer (less confident) softmax than separable ones
+    assert noisy.temperature > clean.temperature
+
+    accuracy, coverage = clean.held_out(0.8)
+    assert accuracy == 1.0 and coverage > 0.9
+    _, noisy_coverage = noisy.held_out(0.8)
+    assert noisy_coverage < 1.0 and noisy.held_out(0.8, label="not_legal")[1] <= noisy_coverage
+
+    # A label with a single example cannot be held out
+    single = IntentModel([{"text": "corpus_search 0", "label": "corpus_search"}], lambda texts: [axes["corpus_search"]])
+    assert single.held_out(0.8) == (1.0, 0.0)
+
+
+def test_confident_local_not_legal_still_asks_the_llm(monkeypatch):
+    """A borderline legal question the local model calls not_legal is not blocked without the LLM."""
+    from app.agents.nodes import classifier
+
+    llm_calls = []
+    monkeypatch.setattr(classifier, "_local_classify",
+                        lambda question, has_documents: IntentPrediction("not_legal", 0.99))
+    monkeypatch.setattr(classifier._speculation, "start", lambda question: None)
+
+    def llm(question, has_documents, operation="classifier"):
+        llm_calls.append(question)
+        return True, "general", "stamp duty on a lease deed is a legal question"
+
+    monkeypatch.setattr(classifier, "_llm_classify", llm)
+    state = {"question": "Is stamp duty payable on a leave and licence agreement?", "explicit_mode": "auto"}
+
+    result = classifier.classifier_node(state)
+    assert llm_calls and result["is_legal"] is True
+    assert classifier.route_after_classifier(result) == "general"
+
+    # With the LLM down, the local not_legal hint still does not block
+    def down(*args, **kwargs):
+        raise RuntimeError("groq unavailable")
+
+    monkeypatch.setattr(classifier, "_llm_classify", down)
+    result = classifier.classifier_node(state)
+    assert result["is_legal"] is True and result["intent"] == "general"
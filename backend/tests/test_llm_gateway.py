@@ -0,0 +1,128 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("groq")
+
+from app.services.llm_gateway import LLMGateway, LLMUnavailableError
+
+_COMPLETION = {
+    "id": "c1", "object": "chat.completion", "created": 0, "model": "fake",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Article 21"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+}
+
+
+def _chunk(content, usage=None):
+    chunk = {
+        "id": "c1", "object": "chat.completion.chunk", "created": 0, "model": "fake",
+        "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}],
+    }
+    if usage:
+        chunk["x_groq"] = {"id": "c1", "usage": usage}
+    return chunk
+
+
+class _FakeGroq(BaseHTTPRequestHandler):
+    """OpenAI-compatible /chat/completions; answers the queued statuses first, then 200."""
+
+    statuses: list = []
+    requests = 0
+    stream_error = False  # break streams off with an error event after the first chunk
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps({"error": {"message": "busy"}}).encode())
+            return
+        self.send_response(200)
+        if body.get("stream"):
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            chunks = [_chunk("Article"), _chunk(" 21", _COMPLETION["usage"])]
+            if self.stream_error:
+                chunks[1:] = [{"error": {"message": "overloaded"}}]
+            for chunk in chunks:
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+        else:
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps(_COMPLETION).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_groq():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGroq)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _FakeGroq.statuses, _FakeGroq.requests, _FakeGroq.stream_error = [], 0, False
+    yield _FakeGroq, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _gateway(base_url, **kwargs):
+    return LLMGateway(api_key="test", base_url=base_url, retry_base_seconds=0.01, timeout_seconds=5, **kwargs)
+
+
+def test_retries_transient_errors_and_streams(fake_groq):
+    """429 / 5xx are retried on the pooled client; chat and stream_chat both return the provider's answer."""
+    handler, url = fake_groq
+    gateway = _gateway(url, max_retries=2)
+
+    handler.statuses = [429, 503]
+    response = gateway.chat(operation="test", model="fake", messages=[{"role": "user", "content": "q"}])
+    assert response.choices[0].message.content == "Article 21"
+    assert handler.requests == 3
+
+    chunks = list(gateway.stream_chat(operation="test", model="fake", messages=[{"role": "user", "content": "q"}]))
+    assert "".join(c.choices[0].delta.content for c in chunks) == "Article 21"
+    assert gateway.client is gateway.client
+
+
+def test_circuit_opens_after_consecutive_failures(fake_groq):
+    """Failed calls open the circuit; further calls fail fast without reaching the provider."""
+    handler, url = fake_groq
+    gateway = _gateway(url, max_retries=0, circuit_failures=2, circuit_reset_seconds=60)
+    handler.statuses = [500, 500]
+    messages = [{"role": "user", "content": "q"}]
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            gateway.chat(operation="test", model="fake", messages=messages)
+    with pytest.raises(LLMUnavailableError):
+        gateway.chat(operation="test", model="fake", messages=messages)
+    assert handler.requests == 2
+
+    # The breaker is per model
+    assert gateway.chat(operation="test", model="other", messages=messages).choices
+
+
+def test_stream_failing_after_the_first_chunk_counts_as_a_failure(fake_groq):
+    """A stream that breaks off part-way feeds the breaker; one closed early by its reader does not."""
+    handler, url = fake_groq
+    gateway = _gateway(url, max_retries=0, circuit_failures=1, circuit_reset_seconds=60)
+    messages = [{"role": "user", "content": "q"}]
+
+    stream = gateway.stream_chat(operation="test", model="fake", messages=messages)
+    assert next(stream).choices[0].delta.content == "Article"
+    stream.close()
+    assert gateway.chat(operation="test", model="fake", messages=messages).choices
+
+    handler.stream_error = True
+    received = []
+    with pytest.raises(Exception, match="overloaded"):
+        for chunk in gateway.stream_chat(operation="test", model="fake", messages=messages):
+            received.append(chunk.choices[0].delta.content)
+    assert received == ["Article"]
+    with pytest.raises(LLMUnavailableError):
+        gateway.chat(operation="test", model="fake", messages=messages)
@@ -0,0 +1,40 @@
+import threading
+import time
+
+from app.services.model_registry import ModelRegistry
+
+
+def test_concurrent_get_loads_once():
+    """Many threads asking for the same model trigger exactly one load."""
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("mpnet", loader)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_report_lists_loaded_models():
+    """The memory report includes every loaded model with its kind."""
+    registry = ModelRegistry()
+    registry.get("bm25", lambda: {"vocab": 1}, kind="sparse")
+
+    report = registry.report()
+
+    assert [m["name"] for m in report] == ["bm25"]
+    assert report[0]["kind"] == "sparse"
+    assert report[0]["tensor_bytes"] is None
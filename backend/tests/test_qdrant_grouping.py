@@ -0,0 +1,53 @@
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from app.services.qdrant_search_service import (
+    _GROUP_SIZE,
+    QDRANT_COLLECTION,
+    _build_case_results,
+    _dense_groups_query,
+    _groups_to_grouped,
+    _search_query,
+)
+
+
+def test_grouped_request_builders_ask_for_top_k_documents():
+    """Search requests group by document_id: top_k groups, _GROUP_SIZE hits each only for chunks="all"."""
+    dense = _dense_groups_query([0.1, 0.2], None, 7)
+    assert dense["group_by"] == "document_id" and dense["limit"] == 7
+    assert dense["group_size"] == _GROUP_SIZE and dense["using"] == "dense"
+
+    assert _dense_groups_query([0.1, 0.2], None, 7, "top")["group_size"] == 1
+    assert _dense_groups_query([0.1, 0.2], None, 7, "none")["group_size"] == 1
+
+    keyword = _search_query("keyword", None, None, None, 4, "top")
+    assert (keyword["group_by"], keyword["group_size"], keyword["limit"], keyword["using"]) == ("document_id", 1, 4, "sparse")
+
+
+def test_qdrant_returns_exactly_top_k_unique_cases():
+    """One long judgment with many close chunks cannot fill the result page: top_k distinct documents come back."""
+    client = QdrantClient(":memory:")
+    client.create_collection(QDRANT_COLLECTION, vectors_config={"dense": VectorParams(size=4, distance=Distance.COSINE)})
+    rng = np.random.default_rng(0)
+    points = [
+        # d0 owns 40 chunks right next to the query; d1..d5 one or two each
+        PointStruct(id=i, vector={"dense": ([1.0, 0, 0, 0] + 0.01 * rng.normal(size=4)).tolist()},
+                    payload={"document_id": "d0", "chunk_id": f"d0-{i}", "chunk_index": i})
+        for i in range(40)
+    ] + [
+        PointStruct(id=100 + i, vector={"dense": [1.0, 0.5 + i, 0.0, 0.0]},
+                    payload={"document_id": f"d{1 + i // 2}", "chunk_id": f"x-{i}", "chunk_index": i})
+        for i in range(10)
+    ]
+    client.upsert(QDRANT_COLLECTION, points)
+
+    groups = client.query_points_groups(**_dense_groups_query([1.0, 0, 0, 0], None, 4)).groups
+    grouped = _groups_to_grouped(groups)
+    assert len(grouped) == 4
+    assert len({doc_id for doc_id, _ in grouped}) == 4
+    assert grouped[0][0] == "d0" and len(grouped[0][1]) == _GROUP_SIZE
+
+    results = _build_case_results(grouped, {}, {}, "all")
+    assert [r.document_id for r in results] == [doc_id for doc_id, _ in grouped]
+    assert all(len(r.all_chunks) <= _GROUP_SIZE for r in results)
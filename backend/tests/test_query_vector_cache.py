@@ -0,0 +1,90 @@
+import time
+
+import numpy as np
+
+from app.services.query_vector_cache import VectorCache, normalize_query, turn_scope
+
+
+def _counting_encoder():
+    calls = []
+
+    def compute(key):
+        calls.append(key)
+        return np.full(4, len(key), dtype=np.float32)
+
+    return compute, calls
+
+
+def test_normalize_query_collapses_equivalent_spellings():
+    """Case, spacing and trailing punctuation do not change the key."""
+    assert normalize_query("  Right to   Privacy? ") == "right to privacy"
+    assert normalize_query("ARTICLE 21") == normalize_query("article 21.")
+
+
+def test_hits_and_misses_are_counted():
+    """The second lookup of a key is served from the cache."""
+    cache = VectorCache("test-counts", max_entries=10, max_bytes=10_000, ttl_seconds=60)
+    compute, calls = _counting_encoder()
+
+    cache.get_or_compute("article 21", compute, lambda v: v.nbytes)
+    cache.get_or_compute("article 21", compute, lambda v: v.nbytes)
+
+    assert calls == ["article 21"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_respects_byte_budget():
+    """Oldest entries are evicted once the byte budget is exceeded."""
+    cache = VectorCache("test-bytes", max_entries=100, max_bytes=60, ttl_seconds=60)
+    compute, _ = _counting_encoder()
+
+    for key in ("a", "b", "c", "d"):
+        cache.get_or_compute(key, compute, lambda v: v.nbytes)  # 16 + 1 bytes each
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 60
+    assert cache.get("a") is None
+    assert cache.get("d") is not None
+
+
+def test_entries_expire_after_ttl():
+    """Expired entries are treated as misses."""
+    cache = VectorCache("test-ttl", max_entries=10, max_bytes=10_000, ttl_seconds=0.01)
+    compute, calls = _counting_encoder()
+
+    cache.get_or_compute("habeas corpus", compute, lambda v: v.nbytes)
+    time.sleep(0.02)
+    cache.get_or_compute("habeas corpus", compute, lambda v: v.nbytes)
+
+    assert len(calls) == 2
+
+
+def test_turn_scope_pins_vectors_for_the_whole_turn():
+    """Within one turn a key is embedded once even if L2 drops it."""
+    cache = VectorCache("test-turn", max_entries=10, max_bytes=10_000, ttl_seconds=60)
+    compute, calls = _counting_encoder()
+
+    with turn_scope():
+        cache.get_or_compute("section 302 ipc", compute, lambda v: v.nbytes)
+        cache.clear()
+        cache.get_or_compute("section 302 ipc", compute, lambda v: v.nbytes)
+
+    assert calls == ["section 302 ipc"]
+
+
+def test_batch_lookup_computes_all_misses_in_one_call():
+    """get_or_compute_many encodes only uncached, de-duplicated keys, once."""
+    cache = VectorCache("test-many", max_entries=10, max_bytes=10_000, ttl_seconds=60)
+    compute, _ = _counting_encoder()
+    cache.get_or_compute("a", compute, lambda v: v.nbytes)
+    batches = []
+
+    def compute_many(keys):
+        batches.append(keys)
+        return [compute(k) for k in keys]
+
+    values = cache.get_or_compute_many(["bb", "a", "bb", "ccc"], compute_many, lambda v: v.nbytes)
+
+    assert batches == [["bb", "ccc"]]
+    assert [v[0] for v in values] == [2, 1, 2, 3]
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from app.services.search_coalescer import SearchCoalescer
+
+
+def test_identical_concurrent_searches_run_once_and_cache():
+    """Concurrent identical keys share one computation; the next call is a cache hit."""
+    coalescer = SearchCoalescer(enabled=True, ttl_seconds=30, max_entries=10)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["result"]
+
+    async def scenario():
+        first = await asyncio.gather(*(coalescer.run(("q", 10), compute) for _ in range(20)))
+        again = await coalescer.run(("q", 10), compute)
+        other = await coalescer.run(("q", 20), compute)
+        return first, again, other
+
+    first, again, other = asyncio.run(scenario())
+    assert len(calls) == 2
+    assert sorted(status for _, status in first) == ["coalesced"] * 19 + ["miss"]
+    assert all(value is first[0][0] for value, _ in first)
+    assert again == (first[0][0], "hit") and other[1] == "miss"
+
+    coalescer.invalidate()
+    assert len(coalescer) == 0
+
+
+def test_cancelled_leader_does_not_cancel_followers_and_errors_are_not_cached():
+    """A disconnecting caller leaves the shared search running; failures are retried next time."""
+    coalescer = SearchCoalescer(enabled=True, ttl_seconds=30, max_entries=10)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("qdrant down")
+        return "ok"
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await asyncio.gather(coalescer.run("k", flaky), coalescer.run("k", flaky))
+        leader = asyncio.ensure_future(coalescer.run("k", flaky))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalescer.run("k", flaky))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == ("ok", "coalesced")
+    assert len(attempts) == 2
+
+
+def test_index_generation_change_drops_cached_results(monkeypatch):
+    """A re-upsert seen by the index poller (same corpus metadata) invalidates cached results."""
+    from app.services import search_coalescer as module
+    from app.services.index_generation import IndexGeneration
+
+    generation = IndexGeneration()
+    monkeypatch.setattr(module, "index_generation", generation)
+    coalescer = SearchCoalescer(enabled=True, ttl_seconds=30, max_entries=10)
+    generation.add_listener(coalescer.invalidate)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert generation.update(((), 100))
+    assert asyncio.run(coalescer.run("q", compute)) == (1, "miss")
+    assert not generation.update(((), 100))
+    assert asyncio.run(coalescer.run("q", compute)) == (1, "hit")
+
+    # Same point count, but the ingestor bumped the collection's generation
+    assert generation.update(((("legal_corpus", 1),), 100))
+    assert len(coalescer) == 0
+    assert asyncio.run(coalescer.run("q", compute)) == (2, "miss")
@@ -0,0 +1,54 @@
+from qdrant_client.models import SparseVector
+
+from app.core.timing import StageTimer, server_timing_header
+from app.services.search_planner import SearchPlanner, prefetch_limit
+
+# 3000 Supreme Court judgments over 1990-2019, 20 from a small High Court in 2015-2016
+_ROWS = [(f"sc{i}", "Supreme Court", None, "Civil Appeal", 1990 + i % 30) for i in range(3000)] + [
+    (f"hc{i}", "Sikkim High Court", "Sikkim", "Writ Petition", 2015 + i % 2) for i in range(20)
+]
+
+
+def _planner():
+    planner = SearchPlanner(enabled=True, exact_max_documents=50, hnsw_ef=128, hnsw_ef_filtered=256)
+    planner.build(_ROWS)
+    return planner
+
+
+def test_narrow_court_and_year_filter_uses_exact_search():
+    """Court + year range is counted exactly; a handful of documents means brute force."""
+    plan = _planner().plan(10, court="Sikkim High Court", year_min=2016, year_max=2016)
+    assert plan.strategy == "exact" and plan.estimated_documents == 10
+    assert plan.search_params.exact is True
+
+
+def test_broad_and_selective_filters_tune_hnsw_ef():
+    """Broad filters keep the base ef, selective ones get the wider ef, never below the prefetch limit."""
+    planner = _planner()
+
+    broad = planner.plan(10, court="Supreme Court", year_min=2000)
+    assert broad.strategy == "hnsw" and broad.hnsw_ef == 128 and broad.prefetch_limit == 100
+
+    selective = planner.plan(10, court="Supreme Court", year_min=2019, year_max=2019, case_type="Civil Appeal")
+    assert selective.strategy == "filtered" and selective.hnsw_ef == 256
+
+    assert planner.plan(10, statute="IPC:302").strategy == "filtered"
+    assert planner.plan(50).hnsw_ef == prefetch_limit(50) == 500
+    assert prefetch_limit(1) == 50
+
+
+def test_plan_reaches_dense_prefetch_and_timings():
+    """Only the dense prefetch carries the plan's params; timings and Server-Timing report it."""
+    from app.services.qdrant_search_service import _search_query
+
+    plan = _planner().plan(5, court="Sikkim High Court")
+    query = _search_query("hybrid", [0.0] * 4, SparseVector(indices=[1], values=[1.0]), None, 5, plan=plan)
+    dense, sparse = query["prefetch"]
+    assert dense.params.exact is True and sparse.params is None
+    assert dense.limit == sparse.limit == 50
+
+    timer = StageTimer("test_plan")
+    timer.plan = plan.as_dict()
+    timings = timer.finish().as_dict()
+    assert timings["plan"]["strategy"] == "exact"
+    assert server_timing_header(timings).endswith('plan;desc="exact", total;dur=' + str(timings["total_ms"]))
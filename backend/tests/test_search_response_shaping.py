@@ -0,0 +1,74 @@
+from qdrant_client.models import ScoredPoint
+
+from app.services.qdrant_search_service import _build_case_results, _chunk_ids_of, _passes_filters, _snippet
+
+
+def _hit(chunk_id, score):
+    return ScoredPoint(id=chunk_id, version=0, score=score,
+                       payload={"document_id": "d1", "chunk_id": chunk_id, "chunk_index": 0})
+
+
+_GROUPED = [("d1", [_hit("c2", 0.4), _hit("c1", 0.9)])]
+_TEXTS = {"c1": "best chunk", "c2": "second chunk"}
+
+
+def test_chunk_modes_limit_returned_and_fetched_chunks():
+    """'top' keeps only the best chunk, 'none' fetches and returns no text."""
+    assert _chunk_ids_of(_GROUPED, "all") == ["c1", "c2"]
+    assert _chunk_ids_of(_GROUPED, "top") == ["c1"]
+    assert _chunk_ids_of(_GROUPED, "none") == []
+
+    top = _build_case_results(_GROUPED, {}, _TEXTS, "top")[0]
+    assert top.top_chunk.chunk_text == "best chunk" and top.all_chunks == []
+
+    none = _build_case_results(_GROUPED, {}, {}, "none")[0]
+    assert none.top_chunk is None and none.score == 0.9
+
+
+def test_snippet_cuts_on_word_boundary():
+    """Snippets stop at the last space inside the limit and mark the cut."""
+    assert _snippet("short", 100) == "short"
+    assert _snippet("the appeal is dismissed with costs", 20) == "the appeal is…"
+
+
+def test_batch_hits_are_grouped_client_side():
+    """Ranked batch hits become top_k documents with at most group_size chunks."""
+    from app.services.qdrant_search_service import _group_points
+
+    def hit(doc, chunk, score):
+        return ScoredPoint(id=chunk, version=0, score=score,
+                           payload={"document_id": doc, "chunk_id": chunk})
+
+    points = [hit("d1", "a", 0.9), hit("d2", "b", 0.8), hit("d1", "c", 0.7), hit("d3", "d", 0.6)]
+
+    assert _group_points(points, 2, "top") == [("d1", [points[0]]), ("d2", [points[1]])]
+    assert _group_points(points, 2, "all")[0] == ("d1", [points[0], points[2]])
+
+
+def test_document_filters_for_index_results():
+    """Citation hits honour court, state, case type and year range like the Qdrant filter."""
+    meta = {"court": "Supreme Court", "state": None, "case_type": "Writ Petition", "year": 2017}
+    assert _passes_filters(meta)
+    assert _passes_filters(meta, court="Supreme Court", year_min=2010, year_max=2017)
+    assert not _passes_filters(meta, year_min=2018)
+    assert not _passes_filters(meta, case_type="Criminal Appeal")
+    assert not _passes_filters({}, year_max=2000)
+
+
+def test_name_index_hits_carry_opening_chunks():
+    """Case-name index hits get their opening chunks as snippets, like the semantic path."""
+    from app.services.qdrant_search_service import _build_name_results
+
+    matches = [("d1", 1.0), ("d2", 0.7)]
+    rows = [("d1", "c2", 1, "facts"), ("d1", "c1", 0, None), ("d2", "c3", 0, "header")]
+    texts = {"c1": "Puttaswamy v. Union of India", "c2": "The petitioner", "c3": "Kesavananda Bharati"}
+
+    results = _build_name_results(matches, {}, rows, texts, "all", snippet_length=10)
+    assert [r.document_id for r in results] == ["d1", "d2"]
+    assert results[0].top_chunk.chunk_id == "c1" and results[0].top_chunk.section_type == "unknown"
+    assert results[0].top_chunk.chunk_text == "Puttaswamy…" and results[0].top_chunk.score == 1.0
+    assert [c.chunk_id for c in results[0].all_chunks] == ["c1", "c2"]
+
+    top = _build_name_results(matches, {}, rows, texts, "top")
+    assert top[1].top_chunk.chunk_text == "Kesavananda Bharati" and top[1].all_chunks == []
+    assert _build_name_results(matches, {}, [], {}, "none")[0].top_chunk is None
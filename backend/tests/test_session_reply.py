@@ -0,0 +1,68 @@
+import asyncio
+import json
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("jose")
+
+from app.api import sessions
+
+
+def _reply(monkeypatch, events):
+    """Run send_message() over a faked graph turn; (content chunks sent, assistant message persisted)."""
+    persisted = []
+
+    async def fake_turn(graph, state):
+        for event in events:
+            yield event
+
+    @contextmanager
+    def fake_db():
+        yield None
+
+    session = SimpleNamespace(id=uuid.uuid4(), title="Existing")
+    monkeypatch.setattr(sessions, "stream_turn", fake_turn)
+    monkeypatch.setattr(sessions, "DatabaseSession", fake_db)
+    monkeypatch.setattr(sessions.session_repo, "get_session_for_user", lambda db, sid, uid: session)
+    monkeypatch.setattr(sessions.session_repo, "touch_session", lambda db, s: None)
+    monkeypatch.setattr(sessions.message_repo, "get_recent_messages", lambda db, sid, n: [])
+    monkeypatch.setattr(sessions.sd_repo, "get_attached_document_ids", lambda db, sid: [])
+    monkeypatch.setattr(
+        sessions.message_repo, "append_message",
+        lambda db, sid, role, text, citations=None: persisted.append(text) if role == "assistant" else None,
+    )
+
+    async def collect():
+        response = await sessions.send_message(
+            session.id, SimpleNamespace(content="What is Article 21?"), db=None, user_id=str(uuid.uuid4())
+        )
+        return [chunk async for chunk in response.body_iterator]
+
+    lines = asyncio.run(collect())
+    sent = [json.loads(line[6:])["content"] for line in lines if line.startswith("data: {")]
+    return sent, persisted
+
+
+def test_classifier_error_does_not_repeat_a_streamed_answer(monkeypatch):
+    """An `error` left by the classifier on a successful turn sends and stores the answer once."""
+    sent, persisted = _reply(monkeypatch, [
+        ("token", "Art"), ("token", "icle 21"),
+        ("end", {"answer": "Article 21", "citations": [], "error": "Classifier failed: timeout", "stream_failed": False}),
+    ])
+    assert sent == ["Art", "icle 21"]
+    assert persisted == ["Article 21"]
+
+
+def test_failed_stream_appends_and_stores_the_fallback(monkeypatch):
+    """An LLM failure after some tokens adds the node's notice, and the partial answer is stored with it."""
+    notice = "The AI encountered an error. Please try again."
+    sent, persisted = _reply(monkeypatch, [
+        ("token", "Art"),
+        ("end", {"answer": notice, "citations": [], "error": "503", "stream_failed": True}),
+    ])
+    assert sent == ["Art", "\n\n" + notice]
+    assert persisted == ["Art\n\n" + notice]
@@ -0,0 +1,33 @@
+import uuid
+
+import numpy as np
+
+from app.services.similar_graph import SimilarGraph, build_knn, write_similar_graph
+
+
+def test_blocked_knn_matches_brute_force():
+    """Blocked, threaded top-k equals a full similarity sort (self excluded)."""
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(37, 8)).astype(np.float32)
+
+    neighbors, scores = build_knn(vectors, 5, block_size=6, workers=3)
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    sims = unit @ unit.T
+    np.fill_diagonal(sims, -np.inf)
+    expected = np.argsort(-sims, axis=1)[:, :5]
+    assert (neighbors == expected).all()
+    assert np.allclose(scores, np.take_along_axis(sims, expected, axis=1), atol=1e-5)
+
+
+def test_graph_roundtrip_and_misses(tmp_path):
+    """Stored neighbours map back to document ids; unknown ids and large k miss."""
+    ids = sorted((str(uuid.uuid4()) for _ in range(4)), key=lambda d: uuid.UUID(d).bytes)
+    neighbors = np.array([[1, 2], [0, 3], [3, 0], [2, 1]], dtype=np.int32)
+    scores = np.full((4, 2), 0.5, dtype=np.float32)
+    write_similar_graph(tmp_path / "graph", ids, neighbors, scores)
+
+    graph = SimilarGraph(tmp_path / "graph")
+    assert graph.neighbours(ids[0], 2) == [(ids[1], 0.5), (ids[2], 0.5)]
+    assert graph.neighbours(str(uuid.uuid4()), 2) is None
+    assert graph.neighbours(ids[0], 3) is None
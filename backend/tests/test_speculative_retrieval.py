@@ -0,0 +1,84 @@
+import time
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from app.agents.nodes import _speculation, classifier, corpus_search
+
+_CHUNKS = [{"document_id": "d1", "chunk_id": "c1", "title": "K.S. Puttaswamy v. Union of India",
+            "court": "SC", "year": 2017, "citation": "(2017) 10 SCC 1", "score": 0.9, "chunk_text": "privacy"}]
+
+
+def _state(question):
+    return {"question": question, "history": [], "explicit_mode": "auto", "document_ids": []}
+
+
+def _setup(monkeypatch, intent):
+    monkeypatch.setattr(classifier, "_LOCAL_ENABLED", False)
+    monkeypatch.setattr(_speculation, "ENABLED", True)
+
+    def slow_retrieval(question):
+        time.sleep(0.2)
+        return _CHUNKS
+
+    def slow_llm(question, has_documents, operation="classifier"):
+        time.sleep(0.2)
+        return True, intent, "test"
+
+    monkeypatch.setattr(_speculation, "retrieve_corpus_chunks", slow_retrieval)
+    monkeypatch.setattr(classifier, "_llm_classify", slow_llm)
+
+
+def test_corpus_intent_reuses_retrieval_run_alongside_the_classifier(monkeypatch):
+    """Retrieval overlaps the LLM call, and corpus_search answers from its chunks without searching again."""
+    _setup(monkeypatch, "corpus_search")
+    started = time.perf_counter()
+    state = classifier.classifier_node(_state("How has the Supreme Court ruled on privacy?"))
+    assert time.perf_counter() - started < 0.35
+    assert state["intent"] == "corpus_search" and state["speculative_chunks"] == _CHUNKS
+
+    def no_search(question):
+        raise AssertionError("retrieved twice")
+
+    monkeypatch.setattr(corpus_search, "retrieve_corpus_chunks", no_search)
+    monkeypatch.setattr(corpus_search, "stream_completion", lambda **kwargs: "Answer")
+    answer = corpus_search.corpus_search_node(state)
+    assert answer["answer"] == "Answer" and answer["retrieved_chunks"] == _CHUNKS
+
+
+def test_other_intents_discard_the_speculation(monkeypatch):
+    """A non-corpus intent drops the speculative chunks."""
+    _setup(monkeypatch, "general")
+    state = classifier.classifier_node(_state("What is Article 21?"))
+    assert state["intent"] == "general" and "speculative_chunks" not in state
+
+
+def test_queued_or_slow_speculations_fall_back_to_inline_retrieval(monkeypatch):
+    """A speculation stuck behind a busy pool, or running past the wait limit, is not waited on."""
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Event
+
+    monkeypatch.setattr(_speculation, "ENABLED", True)
+    began, release = Event(), Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(_speculation, "_pool", pool)
+    monkeypatch.setattr(_speculation, "_WAIT_SECONDS", 0.05)
+
+    def blocked_retrieval(question):
+        began.set()
+        release.wait(5)
+        return _CHUNKS
+
+    monkeypatch.setattr(_speculation, "retrieve_corpus_chunks", blocked_retrieval)
+
+    running = _speculation.start("first")
+    queued = _speculation.start("second")
+    assert began.wait(5)
+    assert _speculation.resolve(queued) is None and queued.cancelled()
+
+    started = time.perf_counter()
+    assert _speculation.resolve(running) is None
+    assert time.perf_counter() - started < 1
+    release.set()
+    pool.shutdown(wait=True)
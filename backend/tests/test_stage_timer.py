@@ -0,0 +1,33 @@
+from app.core.metrics import SEARCH_STAGE_SECONDS
+from app.core.timing import StageTimer, server_timing_header
+
+
+def _observations(operation, stage):
+    for metric in SEARCH_STAGE_SECONDS.collect():
+        for sample in metric.samples:
+            if (sample.name.endswith("_count")
+                    and sample.labels == {"operation": operation, "stage": stage}):
+                return sample.value
+    return 0.0
+
+
+def test_repeated_stage_accumulates_and_exports_once():
+    """A stage entered twice is one entry, observed once on finish()."""
+    before = _observations("test_op", "scroll")
+    timer = StageTimer("test_op")
+    with timer.stage("scroll"):
+        pass
+    with timer.stage("scroll"):
+        pass
+
+    timer.finish()
+    timer.finish()
+
+    assert list(timer.as_dict()["stages"]) == ["scroll"]
+    assert _observations("test_op", "scroll") == before + 1
+
+
+def test_server_timing_header_format():
+    """Stages render as `name;dur=ms` entries followed by the total."""
+    header = server_timing_header({"stages": {"qdrant": 12.5, "metadata": 0.4}, "total_ms": 14.1})
+    assert header == "qdrant;dur=12.5, metadata;dur=0.4, total;dur=14.1"
@@ -0,0 +1,52 @@
+from app.services.qdrant_search_service import _build_filter
+from app.services.statute_index import (
+    MAX_KEYS_PER_DOCUMENT,
+    act_key,
+    document_statute_keys,
+    extract_statutes,
+    parse_statute,
+)
+
+TEXT = """
+The appellant was convicted under Section 302 read with Section 34 of the Indian Penal Code
+and u/s 498-A I.P.C.; bail was refused under S. 439 Cr.P.C. and Section 37 of the NDPS Act.
+The charge under Section 13(1)(e) of the Prevention of Corruption Act and Section 241 of the
+Companies Act, 2013 was dropped. Articles 14 and 21 of the Constitution. Section 5 of the Act.
+"""
+
+
+def test_section_references_normalise_to_canonical_keys():
+    """Spelling variants, lists and sub-clauses collapse to ACT:SECTION; act-less sections are skipped."""
+    assert extract_statutes(TEXT) == [
+        "IPC:302", "IPC:34", "IPC:498A", "CRPC:439", "NDPS:37", "PCA:13",
+        "COMPANIES_ACT:241", "CONSTITUTION:14", "CONSTITUTION:21",
+    ]
+    keys = document_statute_keys(TEXT, ["Indian Penal Code, 1860", "Hindu Succession Act, 1956"])
+    assert {"IPC", "CRPC", "HINDU_SUCCESSION_ACT", "IPC:302"} <= set(keys)
+    assert act_key("Code of Criminal Procedure, 1973") == "CRPC"
+
+
+def test_truncation_keeps_acts_and_most_mentioned_sections():
+    """Past MAX_KEYS_PER_DOCUMENT, act keys and frequently cited sections survive, not the alphabetically first."""
+    filler = " ".join(f"Section {n} of the Companies Act." for n in range(100, 100 + MAX_KEYS_PER_DOCUMENT))
+    text = f"Section 302 IPC. {filler} Sections 302 and 34 IPC. Sections 302 and 34 IPC."
+    keys = document_statute_keys(text)
+    assert len(keys) == MAX_KEYS_PER_DOCUMENT
+    assert {"IPC", "COMPANIES_ACT", "IPC:302", "IPC:34", "COMPANIES_ACT:100"} <= set(keys)
+    assert "COMPANIES_ACT:399" not in keys and keys == sorted(keys)
+
+
+def test_queries_parse_to_one_key():
+    """Endpoint / filter input accepts prose, canonical keys and bare acts, but not lists."""
+    assert parse_statute("Section 302 IPC") == parse_statute("ipc:302") == "IPC:302"
+    assert parse_statute("Article 21") == "CONSTITUTION:21"
+    assert parse_statute("Indian Penal Code") == "IPC"
+    assert parse_statute("Sections 302/34 IPC") is None
+    assert parse_statute("right to privacy") is None
+
+
+def test_statute_filter_matches_payload_keys():
+    """The search filter targets the statute_keys payload with the canonical key."""
+    condition = _build_filter(statute="Section 302 IPC").must[0]
+    assert condition.key == "statute_keys"
+    assert condition.match.value == "IPC:302"
@@ -0,0 +1,39 @@
+from app.services.suggest_index import SuggestIndex, normalize
+
+ROWS = [
+    ("d1", "Justice K.S. Puttaswamy (Retd.) v. Union of India", "K.S. Puttaswamy", "Union of India", "(2017) 10 SCC 1", 547),
+    ("d2", "Kesavananda Bharati v. State of Kerala", "Kesavananda Bharati", "State of Kerala", "AIR 1973 SC 1461", 703),
+    ("d3", "State of Kerala v. N.M. Thomas", "State of Kerala", "N.M. Thomas", "(1976) 2 SCC 310", 90),
+    ("d4", "State of Punjab v. Baldev Singh", "State of Punjab", "Baldev Singh", None, 40),
+]
+
+
+def _index():
+    index = SuggestIndex(enabled=True)
+    index.build(ROWS)
+    return index
+
+
+def test_normalize_collapses_punctuation():
+    """Citations and titles normalise to lower-case words separated by single spaces."""
+    assert normalize("(2017) 10 SCC 1") == "2017 10 scc 1"
+    assert normalize("K.S. Puttaswamy (Retd.)") == "k s puttaswamy retd"
+
+
+def test_prefixes_match_title_words_parties_and_citations():
+    """Prefixes match from any leading title word, party names and citations."""
+    index = _index()
+    assert index.search("puttas") == [("d1", "title")]
+    assert index.search("Kesavananda Bh") == [("d2", "title")]
+    assert index.search("(2017) 10 SC") == [("d1", "citation")]
+    assert index.search("AIR 1973") == [("d2", "citation")]
+    assert index.search("x") == []
+    assert index.search("vishaka") == []
+
+
+def test_results_are_deduplicated_bounded_and_popularity_ordered():
+    """Each case appears once, longest judgments first, at most `limit` of them."""
+    index = _index()
+    assert [doc for doc, _ in index.search("state of")] == ["d2", "d3", "d4"]
+    assert [doc for doc, _ in index.search("state of", limit=2)] == ["d2", "d3"]
+    assert SuggestIndex(enabled=True).search("state") == []
@@ -0,0 +1,50 @@
+import asyncio
+from types import SimpleNamespace
+from typing import TypedDict
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from langgraph.graph import END, StateGraph
+
+from app.agents import streaming
+from app.agents.streaming import emit, stream_completion, stream_turn
+
+
+def _fake_stream_chat(deltas):
+    chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))]) for d in deltas]
+    return lambda **kwargs: iter(chunks)
+
+
+def _graph():
+    """One sync node, compiled by LangGraph — it runs in an executor thread with a copied context."""
+    class State(TypedDict):
+        question: str
+        answer: str
+
+    def node(state):
+        emit("citations", [{"document_id": "d1"}])
+        return {"answer": stream_completion(node="test", messages=[])}
+
+    graph = StateGraph(State)
+    graph.add_node("answer", node)
+    graph.set_entry_point("answer")
+    graph.add_edge("answer", END)
+    return graph.compile()
+
+
+def test_node_events_arrive_in_order_before_the_end_state(monkeypatch):
+    """Citations and token deltas emitted on the node's thread stream out ahead of the final state."""
+    monkeypatch.setattr(streaming.llm_gateway, "stream_chat", _fake_stream_chat(["Art", None, "icle 21"]))
+
+    async def collect():
+        return [event async for event in stream_turn(_graph(), {"question": "q"})]
+
+    events = asyncio.run(collect())
+    assert events[:3] == [("citations", [{"document_id": "d1"}]), ("token", "Art"), ("token", "icle 21")]
+    assert events[3] == ("end", {"question": "q", "answer": "Article 21"})
+
+    # Outside a streaming turn emit() is a no-op
+    monkeypatch.setattr(streaming.llm_gateway, "stream_chat", _fake_stream_chat(["ok"]))
+    assert stream_completion(node="test", messages=[]) == "ok"
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+from qdrant_client.models import BinaryQuantization, ScalarQuantization, ScalarType
+
+from app.services.search_planner import SearchPlanner
+from app.services.vector_quantization import collection_quantization, dense_vector_params
+
+
+def test_quantized_dense_vectors_keep_originals_on_disk():
+    """Quantized modes put float32 originals on disk and the quantized copy in RAM."""
+    plain = dense_vector_params(768, "none")
+    assert plain.on_disk is False and plain.quantization_config is None
+
+    scalar = dense_vector_params(768, "scalar")
+    assert scalar.on_disk is True
+    assert scalar.quantization_config.scalar.type == ScalarType.INT8
+    assert scalar.quantization_config.scalar.always_ram is True
+
+    binary = dense_vector_params(768, "binary")
+    assert isinstance(binary.quantization_config, BinaryQuantization)
+
+    info = SimpleNamespace(config=SimpleNamespace(
+        quantization_config=None, params=SimpleNamespace(vectors={"dense": scalar}),
+    ))
+    assert collection_quantization(info) == "scalar"
+    assert isinstance(scalar.quantization_config, ScalarQuantization)
+
+
+def test_plans_carry_oversampling_and_rescore():
+    """On a quantized collection every dense prefetch oversamples and rescores."""
+    planner = SearchPlanner(enabled=True, oversampling=3.0, rescore=True)
+    params = planner.plan(10).search_params
+    assert params.quantization.oversampling == 3.0 and params.quantization.rescore is True
+    assert planner.plan(10).as_dict()["oversampling"] == 3.0
+
+    unquantized = SearchPlanner(enabled=False, oversampling=None)
+    assert unquantized.plan(10).search_params is None
@@ -65,9 +65,14 @@ export const casesApi = {
   search: (query, token, top_k = 10, search_mode = 'hybrid') =>
     request('/api/search', {
       method: 'POST',
-      body: JSON.stringify({ query, top_k, search_mode }),
+      // The results list shows a clamped top_chunk only — skip all_chunks
+      body: JSON.stringify({ query, top_k, search_mode, chunks: 'top', snippet_length: 600 }),
     }, token),
 
+  // Typeahead — prefix match on titles, parties and citations
+  suggest: (q, token, limit = 8) =>
+    request(`/api/search/suggest?q=${encodeURIComponent(q)}&limit=${limit}`, {}, token),
+
   get: (caseId) =>
     request(`/api/cases/${encodeURIComponent(caseId)}`),
     